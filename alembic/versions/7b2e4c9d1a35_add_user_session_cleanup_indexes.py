@@ -0,0 +1,37 @@
+"""add_user_session_cleanup_indexes
+
+Revision ID: 7b2e4c9d1a35
+Revises: c86602d2c47a
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4c9d1a35'
+down_revision: Union[str, None] = 'c86602d2c47a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Session cleanup (expires_at < cutoff) and active-session counts
+    op.create_index(
+        'ix_user_sessions_expires_at_is_active',
+        'user_sessions',
+        ['expires_at', 'is_active'],
+    )
+    # Per-user trimming keeps the newest sessions by created_at
+    op.create_index(
+        'ix_user_sessions_user_id_created_at',
+        'user_sessions',
+        ['user_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_sessions_user_id_created_at', table_name='user_sessions')
+    op.drop_index('ix_user_sessions_expires_at_is_active', table_name='user_sessions')
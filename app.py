@@ -48,8 +48,62 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"🏥 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info("Healthcare AI assistant - Educational use only, no PHI stored")
+
+    # Background job queue worker (disable on API-only instances)
+    job_worker_started = False
+    try:
+        from utils.background_tasks import start_worker
+        from utils.config import settings as job_settings
+
+        if job_settings.JOB_WORKER_ENABLED:
+            await start_worker()
+            job_worker_started = True
+    except Exception as e:
+        logger.warning(f"Background job worker unavailable: {e}")
+
+    # Warm PDF/DOCX rendering workers before the first request needs them
+    try:
+        from services.document_rendering_service import get_document_renderer
+
+        await get_document_renderer().start()
+    except Exception as e:
+        logger.warning(f"Document rendering pool unavailable: {e}")
+
+    # Retention sweep for content-addressed generated documents
+    try:
+        from services.generated_document_store import (
+            get_document_store,
+            get_sweep_interval_seconds,
+        )
+
+        await get_document_store().start_sweeper(get_sweep_interval_seconds())
+    except Exception as e:
+        logger.warning(f"Generated document sweeper unavailable: {e}")
+
     yield
     # Shutdown
+    if job_worker_started:
+        from utils.background_tasks import stop_worker
+
+        await stop_worker()
+    try:
+        from services.document_rendering_service import get_document_renderer
+
+        get_document_renderer().shutdown()
+    except Exception:
+        pass
+    try:
+        from services.generated_document_store import get_document_store
+
+        await get_document_store().stop_sweeper()
+    except Exception:
+        pass
+    try:
+        from src.services.claude_service import claude_service
+
+        await claude_service.aclose()
+    except Exception:
+        pass
     logger.info(f"Shutting down {settings.APP_NAME}")
 
 
@@ -71,14 +125,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Rate limiting middleware
+# Security headers, request IDs, request logging and rate limiting
+# (single pure-ASGI pass - see src/utils/middleware.py)
 try:
-    from src.utils.rate_limit import RateLimitMiddleware
+    from src.utils.middleware import RequestContextMiddleware
 
-    app.add_middleware(RateLimitMiddleware)
-    logger.info("Rate limiting enabled: 60 requests per minute")
+    app.add_middleware(RequestContextMiddleware)
+    if getattr(settings, "RATE_LIMIT_ENABLED", False):
+        logger.info(
+            f"Rate limiting enabled: {settings.RATE_LIMIT_PER_MINUTE} requests per minute"
+        )
 except Exception as e:
-    logger.warning(f"Rate limiting unavailable: {e}")
+    logger.warning(f"Request context middleware unavailable: {e}")
+
+# Prometheus /metrics (no-op unless ENABLE_METRICS)
+try:
+    from src.utils.metrics import setup_metrics
+
+    setup_metrics(app)
+except Exception as e:
+    logger.warning(f"Metrics setup unavailable: {e}")
 
 # Load routers following Router Organization pattern
 try:
@@ -211,6 +277,17 @@ except Exception as e:
     logger.warning(f"Failed to register webhooks router: {e}")
     ROUTERS_LOADED["webhooks"] = False
 
+# Background job status router - queue state shared across workers
+try:
+    from routers.tasks import router as tasks_router
+
+    api_router.include_router(tasks_router)
+    logger.info("Background job status router registered successfully")
+    ROUTERS_LOADED["tasks"] = True
+except Exception as e:
+    logger.warning(f"Background job status router unavailable: {e}")
+    ROUTERS_LOADED["tasks"] = False
+
 # Content Settings Router - Diagnosis autocomplete and content management
 try:
     from routers.content_settings import router as content_settings_router
@@ -146,7 +146,7 @@ class DiagnosisSearchResponse(BaseModel):
 
 
 @router.get("/facility/{facility_id}", response_model=FacilitySettingsResponse)
-async def get_facility_settings(facility_id: str, db: Session = Depends(get_db)):
+def get_facility_settings(facility_id: str, db: Session = Depends(get_db)):
     """
     Get facility settings by ID
 
@@ -164,7 +164,7 @@ async def get_facility_settings(facility_id: str, db: Session = Depends(get_db))
 
 
 @router.put("/facility", response_model=FacilitySettingsResponse)
-async def create_or_update_facility_settings(
+def create_or_update_facility_settings(
     settings: FacilitySettingsCreate, db: Session = Depends(get_db)
 ):
     """
@@ -205,7 +205,7 @@ async def create_or_update_facility_settings(
 
 
 @router.get("/work-preset/{work_setting}", response_model=WorkSettingPresetResponse)
-async def get_work_setting_preset(work_setting: str, db: Session = Depends(get_db)):
+def get_work_setting_preset(work_setting: str, db: Session = Depends(get_db)):
     """
     Get work setting preset by name
 
@@ -224,7 +224,7 @@ async def get_work_setting_preset(work_setting: str, db: Session = Depends(get_d
 
 
 @router.get("/work-presets", response_model=List[WorkSettingPresetResponse])
-async def list_work_setting_presets(db: Session = Depends(get_db)):
+def list_work_setting_presets(db: Session = Depends(get_db)):
     """
     List all available work setting presets
 
@@ -240,7 +240,7 @@ async def list_work_setting_presets(db: Session = Depends(get_db)):
 
 
 @router.get("/personal/{user_id}", response_model=PersonalContentResponse)
-async def get_personal_content_library(user_id: str, db: Session = Depends(get_db)):
+def get_personal_content_library(user_id: str, db: Session = Depends(get_db)):
     """
     Get user's personal content library
 
@@ -272,7 +272,7 @@ async def get_personal_content_library(user_id: str, db: Session = Depends(get_d
 
 
 @router.put("/personal/{user_id}", response_model=PersonalContentResponse)
-async def update_personal_content_library(
+def update_personal_content_library(
     user_id: str, updates: PersonalContentUpdate, db: Session = Depends(get_db)
 ):
     """
@@ -304,7 +304,7 @@ async def update_personal_content_library(
 
 
 @router.post("/personal/{user_id}/favorite")
-async def add_to_favorites(
+def add_to_favorites(
     user_id: str, category: str, content: str, db: Session = Depends(get_db)
 ):
     """
@@ -346,7 +346,7 @@ async def add_to_favorites(
 
 
 @router.delete("/personal/{user_id}/favorite")
-async def remove_from_favorites(
+def remove_from_favorites(
     user_id: str, category: str, content: str, db: Session = Depends(get_db)
 ):
     """Remove item from user's favorites"""
@@ -388,7 +388,7 @@ async def remove_from_favorites(
 
 
 @router.get("/diagnosis/search", response_model=List[DiagnosisSearchResponse])
-async def search_diagnoses(q: str, limit: int = 20, db: Session = Depends(get_db)):
+def search_diagnoses(q: str, limit: int = 20, db: Session = Depends(get_db)):
     """
     Search diagnoses by name or alias
 
@@ -405,7 +405,7 @@ async def search_diagnoses(q: str, limit: int = 20, db: Session = Depends(get_db
 
 
 @router.get("/diagnosis/icd10/{icd10_code}", response_model=DiagnosisSearchResponse)
-async def get_diagnosis_by_icd10(icd10_code: str, db: Session = Depends(get_db)):
+def get_diagnosis_by_icd10(icd10_code: str, db: Session = Depends(get_db)):
     """
     Get diagnosis by ICD-10 code
 
@@ -423,7 +423,7 @@ async def get_diagnosis_by_icd10(icd10_code: str, db: Session = Depends(get_db))
 
 
 @router.get("/diagnosis/autocomplete")
-async def autocomplete_diagnosis(q: str, limit: int = 10):
+def autocomplete_diagnosis(q: str, limit: int = 10):
     """
     Autocomplete for diagnosis search using comprehensive ICD-10 2025 codes.
 
@@ -489,7 +489,7 @@ async def debug_icd10_status():
 
 
 @router.get("/diagnosis/{diagnosis_id}", response_model=DiagnosisSearchResponse)
-async def get_diagnosis_by_id(diagnosis_id: str, db: Session = Depends(get_db)):
+def get_diagnosis_by_id(diagnosis_id: str, db: Session = Depends(get_db)):
     """Get diagnosis content by ID"""
     diagnosis = db.query(DiagnosisContentMap).filter_by(id=diagnosis_id).first()
 
@@ -508,7 +508,7 @@ async def get_diagnosis_by_id(diagnosis_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/medication/rxnorm/{rxnorm_code}")
-async def get_medication_by_rxnorm(rxnorm_code: str, db: Session = Depends(get_db)):
+def get_medication_by_rxnorm(rxnorm_code: str, db: Session = Depends(get_db)):
     """Get medication by RxNorm code"""
     medication = search_medication_by_rxnorm(db, rxnorm_code)
 
@@ -522,7 +522,7 @@ async def get_medication_by_rxnorm(rxnorm_code: str, db: Session = Depends(get_d
 
 
 @router.get("/medication/search")
-async def search_medications(q: str, limit: int = 20, db: Session = Depends(get_db)):
+def search_medications(q: str, limit: int = 20, db: Session = Depends(get_db)):
     """Search medications by name"""
     search_pattern = f"%{q.lower()}%"
     results = (
@@ -536,7 +536,7 @@ async def search_medications(q: str, limit: int = 20, db: Session = Depends(get_
 
 
 @router.get("/medication/autocomplete")
-async def autocomplete_medication(
+def autocomplete_medication(
     q: str, limit: int = 10, db: Session = Depends(get_db)
 ):
     """
@@ -570,7 +570,7 @@ async def autocomplete_medication(
 
 
 @router.post("/track-usage/{user_id}")
-async def track_content_usage(
+def track_content_usage(
     user_id: str,
     content_type: str,  # "diagnosis" or "medication"
     content_id: str,
@@ -63,7 +63,7 @@ class PromotionRequest(BaseModel):
 
 
 @router.get("/search", response_model=DiseaseSearchResponse)
-async def search_disease_reference(
+def search_disease_reference(
     q: str = Query(
         ..., min_length=2, description="Search query (disease name or ICD-10 code)"
     ),
@@ -131,7 +131,7 @@ async def search_disease_reference(
 
 
 @router.get("/by-icd10/{icd10_code}", response_model=DiseaseReferenceResponse)
-async def get_disease_by_icd10(icd10_code: str, db: Session = Depends(get_db)):
+def get_disease_by_icd10(icd10_code: str, db: Session = Depends(get_db)):
     """
     Get disease info by exact ICD-10 code.
 
@@ -159,7 +159,7 @@ async def get_disease_by_icd10(icd10_code: str, db: Session = Depends(get_db)):
 
 
 @router.get("/categories", response_model=List[str])
-async def get_disease_categories(db: Session = Depends(get_db)):
+def get_disease_categories(db: Session = Depends(get_db)):
     """
     Get list of all disease categories in reference database.
 
@@ -173,7 +173,7 @@ async def get_disease_categories(db: Session = Depends(get_db)):
 
 
 @router.get("/stats")
-async def get_database_stats(db: Session = Depends(get_db)):
+def get_database_stats(db: Session = Depends(get_db)):
     """
     Get statistics about the reference database.
 
@@ -220,7 +220,7 @@ async def get_database_stats(db: Session = Depends(get_db)):
 
 
 @router.post("/promote")
-async def request_promotion_to_full_library(
+def request_promotion_to_full_library(
     request: PromotionRequest, db: Session = Depends(get_db)
 ):
     """
@@ -295,7 +295,7 @@ async def request_promotion_to_full_library(
 
 
 @router.get("/promotion-queue")
-async def get_promotion_queue(
+def get_promotion_queue(
     status: Optional[str] = Query(
         None, description="Filter by status (pending, in_review, approved, rejected)"
     ),
@@ -336,7 +336,7 @@ async def get_promotion_queue(
 
 # Health check
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     """Health check for disease reference API"""
     try:
         count = db.query(DiseaseReference).count()
@@ -33,7 +33,7 @@ class MedlinePlusContentResponse(BaseModel):
 
 
 @router.get("/by-icd10/{icd10_code}", response_model=MedlinePlusContentResponse)
-async def get_medlineplus_by_icd10(
+def get_medlineplus_by_icd10(
     icd10_code: str,
     language: str = Query("en", regex="^(en|es)$", description="Language: en or es"),
     force_refresh: bool = Query(False, description="Force refresh from API"),
@@ -78,7 +78,7 @@ async def get_medlineplus_by_icd10(
 
 
 @router.get("/cache/stats")
-async def get_cache_stats(db: Session = Depends(get_db)):
+def get_cache_stats(db: Session = Depends(get_db)):
     """Get MedlinePlus cache statistics"""
     from sqlalchemy import func
 
@@ -96,7 +96,7 @@ async def get_cache_stats(db: Session = Depends(get_db)):
 
 
 @router.get("/health")
-async def health_check():
+def health_check():
     """Health check for MedlinePlus API"""
     client = MedlinePlusClient()
     try:
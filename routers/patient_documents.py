@@ -3,6 +3,7 @@ Patient Documents API - PDF Generation for Patient Education Materials
 Generates discharge instructions, medication guides, and disease education materials
 """
 
+import asyncio
 import logging
 from datetime import datetime
 
@@ -10,13 +11,7 @@ import httpx
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
-from services.pdf_generation_service import (
-    generate_discharge_instructions,
-    generate_discharge_instructions_docx,
-    generate_discharge_instructions_text,
-    generate_disease_education,
-    generate_medication_guide,
-)
+from services.document_rendering_service import render_document
 from src.models.patient_document_schemas import (
     BatchDocumentRequest,
     BatchDocumentResponse,
@@ -101,22 +96,19 @@ async def create_discharge_instructions(request: DischargeInstructionsRequest):
 
         # Generate document based on format
         if request.format == DocumentFormat.PDF:
-            doc_buffer = generate_discharge_instructions(doc_data)
-            doc_bytes = doc_buffer.getvalue()
+            doc_bytes = await render_document("discharge_instructions", doc_data)
             filename = f"discharge_instructions_{timestamp}.pdf"
             media_type = "application/pdf"
             content_type = "application/pdf"
 
         elif request.format == DocumentFormat.DOCX:
-            doc_buffer = generate_discharge_instructions_docx(doc_data)
-            doc_bytes = doc_buffer.getvalue()
+            doc_bytes = await render_document("discharge_instructions_docx", doc_data)
             filename = f"discharge_instructions_{timestamp}.docx"
             media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
         elif request.format == DocumentFormat.TEXT:
-            doc_buffer = generate_discharge_instructions_text(doc_data)
-            doc_bytes = doc_buffer.getvalue()
+            doc_bytes = await render_document("discharge_instructions_text", doc_data)
             filename = f"discharge_instructions_{timestamp}.txt"
             media_type = "text/plain"
             content_type = "text/plain; charset=utf-8"
@@ -137,6 +129,8 @@ async def create_discharge_instructions(request: DischargeInstructionsRequest):
             },
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -235,8 +229,7 @@ async def create_medication_guide(request: MedicationGuideRequest):
         }
 
         # Generate PDF
-        pdf_buffer = generate_medication_guide(pdf_data)
-        pdf_bytes = pdf_buffer.getvalue()
+        pdf_bytes = await render_document("medication_guide", pdf_data)
 
         # Generate filename
         med_name_safe = request.medication_name.replace(" ", "_").lower()
@@ -259,6 +252,8 @@ async def create_medication_guide(request: MedicationGuideRequest):
                 detail=f"Format {request.format} not yet supported. Please use PDF.",
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to generate medication guide: {str(e)}"
@@ -363,8 +358,7 @@ async def create_disease_education(request: DiseaseEducationRequest):
         }
 
         # Generate PDF
-        pdf_buffer = generate_disease_education(pdf_data)
-        pdf_bytes = pdf_buffer.getvalue()
+        pdf_bytes = await render_document("disease_education", pdf_data)
 
         # Generate filename
         disease_name_safe = request.disease_name.replace(" ", "_").lower()
@@ -387,6 +381,8 @@ async def create_disease_education(request: DiseaseEducationRequest):
                 detail=f"Format {request.format} not yet supported. Please use PDF.",
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -430,8 +426,8 @@ async def batch_generate_documents(request: BatchDocumentRequest):
     ```
     """
     try:
-        documents_generated = 0
-        individual_pdfs = []
+        # (document info, render coroutine) pairs, rendered in parallel below
+        render_jobs = []
 
         # Generate discharge instructions if provided
         if request.discharge_instructions:
@@ -454,11 +450,12 @@ async def batch_generate_documents(request: BatchDocumentRequest):
                 "home_care_services": discharge_req.home_care_services,
             }
 
-            pdf_buffer = generate_discharge_instructions(pdf_data)
-            individual_pdfs.append(
-                {"type": "discharge_instructions", "buffer": pdf_buffer}
+            render_jobs.append(
+                (
+                    {"type": "discharge_instructions"},
+                    render_document("discharge_instructions", pdf_data),
+                )
             )
-            documents_generated += 1
 
         # Generate medication guides
         for med_req in request.medication_guides:
@@ -482,15 +479,12 @@ async def batch_generate_documents(request: BatchDocumentRequest):
                 "data_sources": [],
             }
 
-            pdf_buffer = generate_medication_guide(pdf_data)
-            individual_pdfs.append(
-                {
-                    "type": "medication_guide",
-                    "name": med_req.medication_name,
-                    "buffer": pdf_buffer,
-                }
+            render_jobs.append(
+                (
+                    {"type": "medication_guide", "name": med_req.medication_name},
+                    render_document("medication_guide", pdf_data),
+                )
             )
-            documents_generated += 1
 
         # Generate disease education materials
         for disease_req in request.disease_education:
@@ -516,22 +510,25 @@ async def batch_generate_documents(request: BatchDocumentRequest):
                 "data_sources": [],
             }
 
-            pdf_buffer = generate_disease_education(pdf_data)
-            individual_pdfs.append(
-                {
-                    "type": "disease_education",
-                    "name": disease_req.disease_name,
-                    "buffer": pdf_buffer,
-                }
+            render_jobs.append(
+                (
+                    {"type": "disease_education", "name": disease_req.disease_name},
+                    render_document("disease_education", pdf_data),
+                )
             )
-            documents_generated += 1
 
-        if documents_generated == 0:
+        if not render_jobs:
             raise HTTPException(
                 status_code=400,
                 detail="No documents requested. Please provide at least one document type.",
             )
 
+        rendered = await asyncio.gather(*(job for _, job in render_jobs))
+        individual_pdfs = [
+            {**info, "bytes": pdf_bytes}
+            for (info, _), pdf_bytes in zip(render_jobs, rendered)
+        ]
+
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         patient_name_safe = (
@@ -544,7 +541,7 @@ async def batch_generate_documents(request: BatchDocumentRequest):
             # TODO: Implement PDF merging using PyPDF2 or similar
             # For now, return the first PDF
             filename = f"patient_packet_{patient_name_safe}_{timestamp}.pdf"
-            pdf_bytes = individual_pdfs[0]["buffer"].getvalue()
+            pdf_bytes = individual_pdfs[0]["bytes"]
 
             return StreamingResponse(
                 iter([pdf_bytes]),
@@ -557,7 +554,7 @@ async def batch_generate_documents(request: BatchDocumentRequest):
         else:
             # Return first PDF (in future, could return as ZIP)
             filename = f"patient_documents_{patient_name_safe}_{timestamp}.pdf"
-            pdf_bytes = individual_pdfs[0]["buffer"].getvalue()
+            pdf_bytes = individual_pdfs[0]["bytes"]
 
             return StreamingResponse(
                 iter([pdf_bytes]),
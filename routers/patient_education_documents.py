@@ -7,30 +7,45 @@ Generate patient-friendly education materials with:
 - MedlinePlus resource integration
 - FHIR-compliant coding
 - PDF generation
+- Batch packets (ZIP) for several patients with shared content lookups
 """
 
+import asyncio
+import io
+import json
+import re
+import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from src.database import get_db
+from services.document_rendering_service import get_document_renderer, render_document
+from services.generated_document_store import cache_key, get_document_store
+from src.database import SessionLocal, get_db, run_db
 from src.integrations.medlineplus import MedlinePlusClient
 from src.models.content_settings import DiagnosisContentMap
 from src.services.claude_service import claude_service
 from src.utils.html_generator import generate_patient_education_html
+from utils.background_tasks import enqueue_job
 
 router = APIRouter(prefix="/documents", tags=["Patient Education Documents"])
 
+# Patients per batch packet request
+MAX_BATCH_PATIENTS = 200
+
+# Media types for files served from the generated document store
+_DOWNLOAD_MEDIA_TYPES = {
+    ".pdf": "application/pdf",
+    ".html": "text/html",
+    ".zip": "application/zip",
+}
+
 
 class PatientEducationRequest(BaseModel):
     """Request model for patient education document generation"""
@@ -119,8 +134,10 @@ async def generate_patient_education_document(
         )
 
         # Get diagnosis from content library (required for evidence-based content)
-        diagnosis = (
-            db.query(DiagnosisContentMap).filter_by(id=request.diagnosis_id).first()
+        diagnosis = await run_db(
+            lambda: db.query(DiagnosisContentMap)
+            .filter_by(id=request.diagnosis_id)
+            .first()
         )
 
         if not diagnosis:
@@ -139,8 +156,10 @@ async def generate_patient_education_document(
         if request.include_medlineplus:
             try:
                 medlineplus_client = MedlinePlusClient()
-                medlineplus_content = medlineplus_client.fetch_content(
-                    icd10_code=request.icd10_code, language=request.preferred_language
+                medlineplus_content = await run_in_threadpool(
+                    medlineplus_client.fetch_content,
+                    icd10_code=request.icd10_code,
+                    language=request.preferred_language,
                 )
                 logger.info("MedlinePlus content fetched successfully")
             except Exception as e:
@@ -160,7 +179,7 @@ async def generate_patient_education_document(
 
         # Generate PDF
         logger.info("Generating PDF...")
-        pdf_path = _generate_pdf(
+        pdf_path = await _generate_pdf(
             content=document_content,
             patient_name=request.patient_name,
             language=request.preferred_language,
@@ -169,7 +188,7 @@ async def generate_patient_education_document(
 
         # Generate HTML preview
         logger.info("Generating HTML preview...")
-        html_path = _generate_html(
+        html_path = await _generate_html(
             content=document_content,
             patient_name=request.patient_name,
             language=request.preferred_language,
@@ -200,12 +219,243 @@ async def generate_patient_education_document(
         )
 
 
+class PatientEducationBatchRequest(BaseModel):
+    """Request model for a patient education packet covering several patients"""
+
+    patients: List[PatientEducationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_PATIENTS,
+        description="One entry per patient; diagnoses may repeat",
+    )
+    delivery: Literal["zip", "job"] = Field(
+        default="zip",
+        description="zip: stream the packet now; job: queue it and return a task ID",
+    )
+
+
+@router.post("/patient-education/batch")
+async def generate_patient_education_batch(
+    batch: PatientEducationBatchRequest, db: Session = Depends(get_db)
+):
+    """
+    Generate patient education documents for several patients as one ZIP packet.
+
+    Diagnosis content is loaded once per distinct diagnosis, MedlinePlus once per
+    ICD-10 code and language, and AI text once per diagnosis, reading level,
+    care setting and language. PDFs render in parallel on the document pool.
+
+    With ``delivery="job"`` the packet is built by a background worker; poll
+    ``status_url`` for the result, which carries the ZIP download URL.
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+    if batch.delivery == "job":
+        queued = await enqueue_job(
+            generate_patient_education_packet_job,
+            batch.model_dump(mode="json")["patients"],
+        )
+        return JSONResponse(
+            status_code=202,
+            content={
+                **queued,
+                "status_url": f"/api/v1/tasks/{queued['task_id']}",
+            },
+        )
+
+    try:
+        packet, manifest = await _build_packet(batch.patients, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating patient education packet: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to generate packet: {str(e)}"
+        )
+
+    filename = f"patient_education_packet_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return StreamingResponse(
+        _iter_bytes(packet),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(len(packet)),
+            "X-Documents-Generated": str(manifest["generated"]),
+            "X-Documents-Failed": str(manifest["failed"]),
+        },
+    )
+
+
+async def generate_patient_education_packet_job(patients: List[dict]) -> dict:
+    """Background job: build a packet and keep it in the generated document store"""
+    requests = [PatientEducationRequest(**patient) for patient in patients]
+    db = SessionLocal()
+    try:
+        packet, manifest = await _build_packet(requests, db)
+    finally:
+        db.close()
+
+    store = get_document_store()
+    path = await run_in_threadpool(
+        store.store, "patient_education_packet", cache_key({"patients": patients}), "zip", packet
+    )
+    return {
+        "zip_url": f"/api/v1/documents/download/{path.name}",
+        "generated": manifest["generated"],
+        "failed": manifest["failed"],
+        "errors": [entry for entry in manifest["documents"] if "error" in entry],
+    }
+
+
+async def _build_packet(
+    requests: List[PatientEducationRequest], db: Session
+) -> Tuple[bytes, dict]:
+    """Build every document of a batch, sharing lookups, and return (zip bytes, manifest)"""
+    # One query for all distinct diagnoses
+    diagnosis_ids = sorted({r.diagnosis_id for r in requests})
+    diagnoses = await run_db(
+        lambda: db.query(DiagnosisContentMap)
+        .filter(DiagnosisContentMap.id.in_(diagnosis_ids))
+        .all()
+    )
+    diagnoses_by_id = {diagnosis.id: diagnosis for diagnosis in diagnoses}
+
+    # MedlinePlus once per (ICD-10 code, language)
+    medlineplus_keys = sorted(
+        {
+            (r.icd10_code, r.preferred_language)
+            for r in requests
+            if r.include_medlineplus and r.diagnosis_id in diagnoses_by_id
+        }
+    )
+    medlineplus_results = await asyncio.gather(
+        *(_fetch_medlineplus(code, language) for code, language in medlineplus_keys)
+    )
+    medlineplus = dict(zip(medlineplus_keys, medlineplus_results))
+
+    ai_memo: Dict[tuple, asyncio.Future] = {}
+    renderer = get_document_renderer()
+    # Stay well inside the renderer's queue so single requests still get through
+    render_slots = asyncio.Semaphore(
+        max(1, min(max(renderer.max_workers, 1) * 2, renderer.max_queue // 2))
+    )
+
+    async def build_one(index: int, request: PatientEducationRequest) -> dict:
+        entry = {
+            "patient_name": request.patient_name,
+            "diagnosis_id": request.diagnosis_id,
+            "language": request.preferred_language,
+        }
+        diagnosis = diagnoses_by_id.get(request.diagnosis_id)
+        if diagnosis is None:
+            entry["error"] = f"Diagnosis '{request.diagnosis_id}' not found in content library"
+            return entry
+        try:
+            content = await _build_document_content(
+                request=request,
+                diagnosis=diagnosis,
+                medlineplus_content=medlineplus.get(
+                    (request.icd10_code, request.preferred_language)
+                ),
+                ai_memo=ai_memo,
+            )
+            async with render_slots:
+                pdf_path = await _generate_pdf(
+                    content=content,
+                    patient_name=request.patient_name,
+                    language=request.preferred_language,
+                )
+        except HTTPException as e:
+            entry["error"] = str(e.detail)
+            return entry
+        except Exception as e:
+            entry["error"] = f"Failed to generate document: {str(e)}"
+            return entry
+
+        entry["filename"] = (
+            f"{index + 1:03d}_{_safe_filename_part(request.patient_name)}"
+            f"_{_safe_filename_part(request.diagnosis_id)}.pdf"
+        )
+        entry["path"] = pdf_path
+        return entry
+
+    entries = await asyncio.gather(
+        *(build_one(index, request) for index, request in enumerate(requests))
+    )
+
+    generated = [entry for entry in entries if "path" in entry]
+    if not generated:
+        raise HTTPException(
+            status_code=404,
+            detail="No documents could be generated for this batch. Please select diagnoses from the available options.",
+        )
+
+    manifest = {
+        "generated_at": datetime.now().isoformat(),
+        "generated": len(generated),
+        "failed": len(entries) - len(generated),
+        "unique_diagnoses": len(diagnoses_by_id),
+        "medlineplus_lookups": len(medlineplus_keys),
+        "ai_generations": len(ai_memo),
+        "documents": [
+            {key: value for key, value in entry.items() if key != "path"}
+            for entry in entries
+        ],
+    }
+    packet = await run_in_threadpool(_write_packet, generated, manifest)
+    return packet, manifest
+
+
+async def _fetch_medlineplus(icd10_code: str, language: str) -> Optional[dict]:
+    """MedlinePlus content for a code, or ``None`` if the lookup fails"""
+    try:
+        return await run_in_threadpool(
+            MedlinePlusClient().fetch_content, icd10_code=icd10_code, language=language
+        )
+    except Exception:
+        return None
+
+
+def _write_packet(documents: List[dict], manifest: dict) -> bytes:
+    """ZIP the rendered PDFs plus a manifest.json describing every patient"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for document in documents:
+            # PDF streams are already compressed; store them as-is
+            archive.write(
+                document["path"], document["filename"], compress_type=zipfile.ZIP_STORED
+            )
+        archive.writestr(
+            "manifest.json",
+            json.dumps(manifest, indent=2, ensure_ascii=False),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+    return buffer.getvalue()
+
+
+def _safe_filename_part(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", value).strip("_")[:40] or "patient"
+
+
+def _iter_bytes(data: bytes, chunk_size: int = 64 * 1024):
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
 async def _build_document_content(
     request: PatientEducationRequest,
     diagnosis: DiagnosisContentMap,
     medlineplus_content: Optional[dict],
+    ai_memo: Optional[Dict[tuple, asyncio.Future]] = None,
 ) -> dict:
-    """Build structured content for the document with AI-enhanced content generation"""
+    """
+    Build structured content for the document with AI-enhanced content generation
+
+    ``ai_memo`` shares AI generations between documents of one batch; see
+    ``_generate_ai_education``.
+    """
 
     content = {
         "title": _translate("Patient Education", request.preferred_language),
@@ -221,14 +471,8 @@ async def _build_document_content(
         # If no patient-friendly description, generate one with Claude AI
         if not description:
             try:
-                ai_content = await claude_service.generate_patient_education(
-                    condition=diagnosis.diagnosis_display,
-                    patient_context={
-                        "reading_level": request.reading_level,
-                        "care_setting": request.care_setting,
-                        "patient_name": request.patient_name,
-                    },
-                    language=request.preferred_language,
+                ai_content = await _generate_ai_education(
+                    request, diagnosis, context=None, ai_memo=ai_memo
                 )
                 # Use AI response if available and not empty, otherwise fallback
                 ai_response = ai_content.get("response", "")
@@ -316,15 +560,11 @@ async def _build_document_content(
         # If no specific follow-up instructions, generate personalized ones with AI
         if not follow_up_text:
             try:
-                ai_followup = await claude_service.generate_patient_education(
-                    condition=diagnosis.diagnosis_display,
-                    patient_context={
-                        "reading_level": request.reading_level,
-                        "care_setting": request.care_setting,
-                        "patient_name": request.patient_name,
-                        "context": "follow-up care instructions",
-                    },
-                    language=request.preferred_language,
+                ai_followup = await _generate_ai_education(
+                    request,
+                    diagnosis,
+                    context="follow-up care instructions",
+                    ai_memo=ai_memo,
                 )
                 follow_up_text = ai_followup.get(
                     "response",
@@ -367,173 +607,80 @@ async def _build_document_content(
     return content
 
 
-def _generate_pdf(content: dict, patient_name: str, language: str) -> Path:
-    """Generate PDF from document content"""
-
-    # Create output directory if it doesn't exist
-    # Use /app/data for persistence on Railway, or local data/ directory for development
-    import logging
-    import os
-
-    logger = logging.getLogger(__name__)
-
-    # Detect Railway environment by checking for RAILWAY_ENVIRONMENT variable
-    is_railway = (
-        os.getenv("RAILWAY_ENVIRONMENT") is not None
-        or os.getenv("RAILWAY_SERVICE_ID") is not None
-    )
+async def _generate_ai_education(
+    request: PatientEducationRequest,
+    diagnosis: DiagnosisContentMap,
+    context: Optional[str],
+    ai_memo: Optional[Dict[tuple, asyncio.Future]],
+) -> dict:
+    """
+    Claude patient-education text for a diagnosis.
 
-    if is_railway:
-        # Railway environment with persistent volume
-        output_dir = Path("/app/data/generated_documents")
-        logger.info(
-            f"Railway environment detected, using persistent volume: {output_dir}"
+    Single documents personalise the prompt with the patient name. In a batch
+    (``ai_memo`` given) the name is left out so patients sharing a diagnosis,
+    reading level, care setting and language share one generation; concurrent
+    callers await the same in-flight task.
+    """
+    patient_context = {
+        "reading_level": request.reading_level,
+        "care_setting": request.care_setting,
+    }
+    if ai_memo is None:
+        patient_context["patient_name"] = request.patient_name
+    if context:
+        patient_context["context"] = context
+
+    def generate():
+        return claude_service.generate_patient_education(
+            condition=diagnosis.diagnosis_display,
+            patient_context=patient_context,
+            language=request.preferred_language,
         )
-    else:
-        # Local development environment
-        output_dir = Path("data/generated_documents")
-        logger.info(f"Local environment detected, using local directory: {output_dir}")
 
-    try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Output directory ready: {output_dir}")
-    except Exception as e:
-        logger.error(f"Failed to create output directory {output_dir}: {e}")
-        raise
+    if ai_memo is None:
+        return await generate()
 
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"patient_education_{timestamp}.pdf"
-    filepath = output_dir / filename
-
-    # Create PDF
-    doc = SimpleDocTemplate(
-        str(filepath),
-        pagesize=letter,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72,
+    key = (
+        diagnosis.id,
+        request.reading_level,
+        request.care_setting,
+        request.preferred_language,
+        context,
     )
+    if key not in ai_memo:
+        ai_memo[key] = asyncio.ensure_future(generate())
+    return await asyncio.shield(ai_memo[key])
 
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#1E40AF"),
-        spaceAfter=30,
-    )
-    heading_style = ParagraphStyle(
-        "CustomHeading",
-        parent=styles["Heading2"],
-        fontSize=16,
-        textColor=colors.HexColor("#2563EB"),
-        spaceAfter=12,
-        spaceBefore=20,
-    )
-    body_style = ParagraphStyle(
-        "CustomBody", parent=styles["BodyText"], fontSize=12, leading=18, spaceAfter=12
-    )
-    warning_style = ParagraphStyle(
-        "Warning",
-        parent=styles["BodyText"],
-        fontSize=12,
-        leading=18,
-        textColor=colors.HexColor("#DC2626"),
-        leftIndent=20,
-        spaceAfter=12,
-    )
 
-    # Build PDF content
-    story = []
-
-    # Header
-    story.append(Paragraph(content["title"], title_style))
-    story.append(Paragraph(f"<b>Patient:</b> {patient_name}", body_style))
-    story.append(
-        Paragraph(f"<b>Diagnosis:</b> {content['diagnosis_name']}", body_style)
+async def _generate_pdf(content: dict, patient_name: str, language: str) -> Path:
+    """Generate PDF from document content, reusing a stored copy of identical input"""
+    store = get_document_store()
+    key = cache_key(
+        {"content": content, "patient_name": patient_name, "language": language}
     )
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Sections
-    for section in content["sections"]:
-        # Section title
-        story.append(Paragraph(section["title"], heading_style))
-
-        # Section content
-        if section.get("content"):
-            style = warning_style if section.get("style") == "warning" else body_style
-            story.append(Paragraph(section["content"], style))
-
-        # Bullet points
-        if section.get("bullet_points"):
-            for point in section["bullet_points"]:
-                story.append(Paragraph(f"• {point}", body_style))
-
-        # Resources
-        if section.get("resources"):
-            for resource in section["resources"]:
-                story.append(
-                    Paragraph(
-                        f"• <b>{resource['title']}</b><br/>"
-                        f"  {resource['url']}<br/>"
-                        f"  <i>Source: {resource['source']}</i>",
-                        body_style,
-                    )
-                )
 
-        story.append(Spacer(1, 0.2 * inch))
+    cached = await run_in_threadpool(store.lookup, "patient_education", key, "pdf")
+    if cached is not None:
+        return cached
 
-    # Footer
-    story.append(Spacer(1, 0.5 * inch))
-    story.append(
-        Paragraph(
-            f"<i>Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</i>",
-            styles["Normal"],
-        )
+    # Render in the document worker pool; layout is CPU-bound
+    pdf_bytes = await render_document(
+        "patient_education",
+        {"content": content, "patient_name": patient_name, "language": language},
     )
+    return await run_in_threadpool(store.store, "patient_education", key, "pdf", pdf_bytes)
 
-    # Build PDF
-    doc.build(story)
-
-    return filepath
-
-
-def _generate_html(content: dict, patient_name: str, language: str) -> Path:
-    """Generate HTML preview from document content"""
-    import logging
-    import os
-
-    logger = logging.getLogger(__name__)
 
-    # Detect Railway environment
-    is_railway = (
-        os.getenv("RAILWAY_ENVIRONMENT") is not None
-        or os.getenv("RAILWAY_SERVICE_ID") is not None
+async def _generate_html(content: dict, patient_name: str, language: str) -> Path:
+    """Generate HTML preview from document content, reusing a stored copy of identical input"""
+    store = get_document_store()
+    key = cache_key(
+        {"content": content, "patient_name": patient_name, "language": language}
     )
 
-    if is_railway:
-        output_dir = Path("/app/data/generated_documents")
-        logger.info(
-            f"Railway environment detected, using persistent volume: {output_dir}"
-        )
-    else:
-        output_dir = Path("data/generated_documents")
-        logger.info(f"Local environment detected, using local directory: {output_dir}")
-
-    try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Output directory ready: {output_dir}")
-    except Exception as e:
-        logger.error(f"Failed to create output directory {output_dir}: {e}")
-        raise
-
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"patient_education_{timestamp}.html"
-    filepath = output_dir / filename
+    cached = await run_in_threadpool(store.lookup, "patient_education", key, "html")
+    if cached is not None:
+        return cached
 
     # Extract sections into dict for HTML generator
     sections = {}
@@ -560,12 +707,9 @@ def _generate_html(content: dict, patient_name: str, language: str) -> Path:
         follow_up_date=None,  # Already in sections if present
     )
 
-    # Write HTML to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    logger.info(f"HTML preview generated: {filepath}")
-    return filepath
+    return await run_in_threadpool(
+        store.store, "patient_education", key, "html", html_content.encode("utf-8")
+    )
 
 
 def _format_medications(medications: List[dict], language: str) -> str:
@@ -585,6 +729,235 @@ def _format_medications(medications: List[dict], language: str) -> str:
     return "<br/><br/>".join(formatted)
 
 
+# Common translations for medical education materials (built once at import)
+_PHRASE_TRANSLATIONS = {
+    "es": {  # Spanish
+        "Patient Education": "Educación del Paciente",
+        "What is this condition?": "¿Qué es esta condición?",
+        "When to seek immediate help": "Cuándo buscar ayuda inmediata",
+        "Call 911 or go to the emergency room if you have:": "Llame al 911 o vaya a la sala de emergencias si tiene:",
+        "Your Medications": "Sus Medicamentos",
+        "Diet and Lifestyle": "Dieta y Estilo de Vida",
+        "Learn More": "Aprenda Más",
+        "For more information, visit these trusted resources:": "Para más información, visite estos recursos confiables:",
+        "Follow-up Care": "Cuidado de Seguimiento",
+        "Follow up with your healthcare provider as directed.": "Haga seguimiento con su proveedor de salud según las indicaciones.",
+        "Your follow-up appointment:": "Su cita de seguimiento:",
+        "Special Instructions for You": "Instrucciones Especiales Para Usted",
+        "No medications prescribed.": "No se recetaron medicamentos.",
+        "Take": "Tome",
+    },
+    "zh": {  # Chinese
+        "Patient Education": "患者教育",
+        "What is this condition?": "这是什么病症?",
+        "When to seek immediate help": "何时寻求紧急帮助",
+        "Call 911 or go to the emergency room if you have:": "如果您有以下情况，请拨打911或去急诊室:",
+        "Your Medications": "您的药物",
+        "Diet and Lifestyle": "饮食和生活方式",
+        "Learn More": "了解更多",
+        "For more information, visit these trusted resources:": "欲了解更多信息，请访问这些可信资源:",
+        "Follow-up Care": "后续护理",
+        "Follow up with your healthcare provider as directed.": "按照指示与您的医疗保健提供者进行随访。",
+        "Your follow-up appointment:": "您的随访预约:",
+        "Special Instructions for You": "为您的特别说明",
+        "No medications prescribed.": "未开处方药。",
+        "Take": "服用",
+    },
+    "fr": {  # French
+        "Patient Education": "Éducation du Patient",
+        "What is this condition?": "Qu'est-ce que cette condition?",
+        "When to seek immediate help": "Quand chercher une aide immédiate",
+        "Call 911 or go to the emergency room if you have:": "Appelez le 911 ou allez aux urgences si vous avez:",
+        "Your Medications": "Vos Médicaments",
+        "Diet and Lifestyle": "Régime et Mode de Vie",
+        "Learn More": "En Savoir Plus",
+        "For more information, visit these trusted resources:": "Pour plus d'informations, visitez ces ressources fiables:",
+        "Follow-up Care": "Suivi des Soins",
+        "Follow up with your healthcare provider as directed.": "Suivez avec votre fournisseur de soins comme indiqué.",
+        "Your follow-up appointment:": "Votre rendez-vous de suivi:",
+        "Special Instructions for You": "Instructions Spéciales Pour Vous",
+        "No medications prescribed.": "Aucun médicament prescrit.",
+        "Take": "Prendre",
+    },
+    "de": {  # German
+        "Patient Education": "Patientenaufklärung",
+        "What is this condition?": "Was ist diese Erkrankung?",
+        "When to seek immediate help": "Wann sofortige Hilfe suchen",
+        "Call 911 or go to the emergency room if you have:": "Rufen Sie 911 an oder gehen Sie zur Notaufnahme, wenn Sie haben:",
+        "Your Medications": "Ihre Medikamente",
+        "Diet and Lifestyle": "Ernährung und Lebensstil",
+        "Learn More": "Mehr Erfahren",
+        "For more information, visit these trusted resources:": "Für weitere Informationen besuchen Sie diese vertrauenswürdigen Ressourcen:",
+        "Follow-up Care": "Nachsorge",
+        "Follow up with your healthcare provider as directed.": "Folgen Sie den Anweisungen Ihres Gesundheitsdienstleisters.",
+        "Your follow-up appointment:": "Ihr Folgetermin:",
+        "Special Instructions for You": "Spezielle Anweisungen Für Sie",
+        "No medications prescribed.": "Keine Medikamente verschrieben.",
+        "Take": "Nehmen",
+    },
+    "pt": {  # Portuguese
+        "Patient Education": "Educação do Paciente",
+        "What is this condition?": "O que é esta condição?",
+        "When to seek immediate help": "Quando procurar ajuda imediata",
+        "Call 911 or go to the emergency room if you have:": "Ligue para o 911 ou vá ao pronto-socorro se tiver:",
+        "Your Medications": "Seus Medicamentos",
+        "Diet and Lifestyle": "Dieta e Estilo de Vida",
+        "Learn More": "Saiba Mais",
+        "For more information, visit these trusted resources:": "Para mais informações, visite estes recursos confiáveis:",
+        "Follow-up Care": "Cuidados de Acompanhamento",
+        "Follow up with your healthcare provider as directed.": "Acompanhe com seu profissional de saúde conforme orientado.",
+        "Your follow-up appointment:": "Sua consulta de acompanhamento:",
+        "Special Instructions for You": "Instruções Especiais Para Você",
+        "No medications prescribed.": "Nenhum medicamento prescrito.",
+        "Take": "Tomar",
+    },
+    "ar": {  # Arabic
+        "Patient Education": "تثقيف المريض",
+        "What is this condition?": "ما هي هذه الحالة؟",
+        "When to seek immediate help": "متى تطلب المساعدة الفورية",
+        "Call 911 or go to the emergency room if you have:": "اتصل بالرقم 911 أو اذهب إلى غرفة الطوارئ إذا كان لديك:",
+        "Your Medications": "أدويتك",
+        "Diet and Lifestyle": "النظام الغذائي ونمط الحياة",
+        "Learn More": "تعلم المزيد",
+        "For more information, visit these trusted resources:": "لمزيد من المعلومات، قم بزيارة هذه الموارد الموثوقة:",
+        "Follow-up Care": "الرعاية المتابعة",
+        "Follow up with your healthcare provider as directed.": "تابع مع مقدم الرعاية الصحية الخاص بك حسب التوجيهات.",
+        "Your follow-up appointment:": "موعد المتابعة الخاص بك:",
+        "Special Instructions for You": "تعليمات خاصة لك",
+        "No medications prescribed.": "لا توجد أدوية موصوفة.",
+        "Take": "خذ",
+    },
+    "ru": {  # Russian
+        "Patient Education": "Обучение Пациентов",
+        "What is this condition?": "Что это за состояние?",
+        "When to seek immediate help": "Когда обращаться за немедленной помощью",
+        "Call 911 or go to the emergency room if you have:": "Звоните 911 или обратитесь в отделение неотложной помощи, если у вас:",
+        "Your Medications": "Ваши Лекарства",
+        "Diet and Lifestyle": "Диета и Образ Жизни",
+        "Learn More": "Узнать Больше",
+        "For more information, visit these trusted resources:": "Для получения дополнительной информации посетите эти надежные ресурсы:",
+        "Follow-up Care": "Последующий Уход",
+        "Follow up with your healthcare provider as directed.": "Наблюдайтесь у своего врача согласно указаниям.",
+        "Your follow-up appointment:": "Ваш повторный прием:",
+        "Special Instructions for You": "Специальные Инструкции Для Вас",
+        "No medications prescribed.": "Лекарства не назначены.",
+        "Take": "Принимать",
+    },
+    "hi": {  # Hindi
+        "Patient Education": "रोगी शिक्षा",
+        "What is this condition?": "यह स्थिति क्या है?",
+        "When to seek immediate help": "तत्काल मदद कब लेनी है",
+        "Call 911 or go to the emergency room if you have:": "यदि आपके पास है तो 911 पर कॉल करें या आपातकालीन कक्ष में जाएं:",
+        "Your Medications": "आपकी दवाएं",
+        "Diet and Lifestyle": "आहार और जीवनशैली",
+        "Learn More": "और जानें",
+        "For more information, visit these trusted resources:": "अधिक जानकारी के लिए, इन विश्वसनीय संसाधनों पर जाएं:",
+        "Follow-up Care": "अनुवर्ती देखभाल",
+        "Follow up with your healthcare provider as directed.": "निर्देशानुसार अपने स्वास्थ्य सेवा प्रदाता के साथ फॉलो-अप करें।",
+        "Your follow-up appointment:": "आपकी फॉलो-अप अपॉइंटमेंट:",
+        "Special Instructions for You": "आपके लिए विशेष निर्देश",
+        "No medications prescribed.": "कोई दवा निर्धारित नहीं।",
+        "Take": "लें",
+    },
+    "ja": {  # Japanese
+        "Patient Education": "患者教育",
+        "What is this condition?": "この状態は何ですか？",
+        "When to seek immediate help": "緊急の助けを求めるべき時",
+        "Call 911 or go to the emergency room if you have:": "次の症状がある場合は911に電話するか救急室に行ってください：",
+        "Your Medications": "あなたの薬",
+        "Diet and Lifestyle": "食事とライフスタイル",
+        "Learn More": "詳しく学ぶ",
+        "For more information, visit these trusted resources:": "詳細については、これらの信頼できるリソースをご覧ください：",
+        "Follow-up Care": "フォローアップケア",
+        "Follow up with your healthcare provider as directed.": "指示に従って医療提供者とフォローアップしてください。",
+        "Your follow-up appointment:": "あなたのフォローアップ予約：",
+        "Special Instructions for You": "あなたのための特別な指示",
+        "No medications prescribed.": "処方された薬はありません。",
+        "Take": "服用",
+    },
+    "ko": {  # Korean
+        "Patient Education": "환자 교육",
+        "What is this condition?": "이 상태는 무엇입니까?",
+        "When to seek immediate help": "즉시 도움을 구해야 할 때",
+        "Call 911 or go to the emergency room if you have:": "다음 증상이 있으면 911에 전화하거나 응급실로 가십시오:",
+        "Your Medications": "귀하의 약물",
+        "Diet and Lifestyle": "식단 및 생활 방식",
+        "Learn More": "더 알아보기",
+        "For more information, visit these trusted resources:": "자세한 내용은 다음 신뢰할 수 있는 리소스를 방문하십시오:",
+        "Follow-up Care": "후속 관리",
+        "Follow up with your healthcare provider as directed.": "지시에 따라 의료 서비스 제공자와 후속 조치를 취하십시오.",
+        "Your follow-up appointment:": "귀하의 후속 예약:",
+        "Special Instructions for You": "귀하를 위한 특별 지침",
+        "No medications prescribed.": "처방된 약이 없습니다.",
+        "Take": "복용",
+    },
+    "vi": {  # Vietnamese
+        "Patient Education": "Giáo Dục Bệnh Nhân",
+        "What is this condition?": "Tình trạng này là gì?",
+        "When to seek immediate help": "Khi nào cần tìm kiếm sự giúp đỡ ngay lập tức",
+        "Call 911 or go to the emergency room if you have:": "Gọi 911 hoặc đến phòng cấp cứu nếu bạn có:",
+        "Your Medications": "Thuốc Của Bạn",
+        "Diet and Lifestyle": "Chế Độ Ăn Uống và Lối Sống",
+        "Learn More": "Tìm Hiểu Thêm",
+        "For more information, visit these trusted resources:": "Để biết thêm thông tin, hãy truy cập các nguồn đáng tin cậy này:",
+        "Follow-up Care": "Chăm Sóc Tiếp Theo",
+        "Follow up with your healthcare provider as directed.": "Theo dõi với nhà cung cấp dịch vụ chăm sóc sức khỏe của bạn theo hướng dẫn.",
+        "Your follow-up appointment:": "Cuộc hẹn theo dõi của bạn:",
+        "Special Instructions for You": "Hướng Dẫn Đặc Biệt Cho Bạn",
+        "No medications prescribed.": "Không có thuốc được kê đơn.",
+        "Take": "Uống",
+    },
+    "tl": {  # Tagalog
+        "Patient Education": "Edukasyon ng Pasyente",
+        "What is this condition?": "Ano ang kondisyon na ito?",
+        "When to seek immediate help": "Kailan humingi ng agarang tulong",
+        "Call 911 or go to the emergency room if you have:": "Tumawag sa 911 o pumunta sa emergency room kung mayroon ka:",
+        "Your Medications": "Ang Iyong mga Gamot",
+        "Diet and Lifestyle": "Diyeta at Pamumuhay",
+        "Learn More": "Matuto Pa",
+        "For more information, visit these trusted resources:": "Para sa higit pang impormasyon, bisitahin ang mga pinagkakatiwalaang mapagkukunan na ito:",
+        "Follow-up Care": "Subaybayan ang Pag-aalaga",
+        "Follow up with your healthcare provider as directed.": "Subaybayan ang iyong tagapagbigay ng pangangalagang pangkalusugan ayon sa itinuro.",
+        "Your follow-up appointment:": "Ang iyong follow-up na appointment:",
+        "Special Instructions for You": "Mga Espesyal na Tagubilin Para sa Iyo",
+        "No medications prescribed.": "Walang inireresetang gamot.",
+        "Take": "Uminom",
+    },
+    "it": {  # Italian
+        "Patient Education": "Educazione del Paziente",
+        "What is this condition?": "Cos'è questa condizione?",
+        "When to seek immediate help": "Quando cercare aiuto immediato",
+        "Call 911 or go to the emergency room if you have:": "Chiama il 911 o vai al pronto soccorso se hai:",
+        "Your Medications": "I Tuoi Farmaci",
+        "Diet and Lifestyle": "Dieta e Stile di Vita",
+        "Learn More": "Scopri di Più",
+        "For more information, visit these trusted resources:": "Per ulteriori informazioni, visita queste risorse affidabili:",
+        "Follow-up Care": "Assistenza di Follow-up",
+        "Follow up with your healthcare provider as directed.": "Fai il follow-up con il tuo operatore sanitario come indicato.",
+        "Your follow-up appointment:": "Il tuo appuntamento di follow-up:",
+        "Special Instructions for You": "Istruzioni Speciali Per Te",
+        "No medications prescribed.": "Nessun farmaco prescritto.",
+        "Take": "Prendere",
+    },
+    "pl": {  # Polish
+        "Patient Education": "Edukacja Pacjenta",
+        "What is this condition?": "Co to za schorzenie?",
+        "When to seek immediate help": "Kiedy szukać natychmiastowej pomocy",
+        "Call 911 or go to the emergency room if you have:": "Zadzwoń pod 911 lub udaj się na izbę przyjęć, jeśli masz:",
+        "Your Medications": "Twoje Leki",
+        "Diet and Lifestyle": "Dieta i Styl Życia",
+        "Learn More": "Dowiedz Się Więcej",
+        "For more information, visit these trusted resources:": "Aby uzyskać więcej informacji, odwiedź te zaufane zasoby:",
+        "Follow-up Care": "Opieka Kontynuacyjna",
+        "Follow up with your healthcare provider as directed.": "Skontaktuj się z lekarzem zgodnie z zaleceniami.",
+        "Your follow-up appointment:": "Twoja wizyta kontrolna:",
+        "Special Instructions for You": "Specjalne Instrukcje Dla Ciebie",
+        "No medications prescribed.": "Nie przepisano leków.",
+        "Take": "Przyjmować",
+    },
+}
+
+
 def _translate(text: str, language: str) -> str:
     """
     Translate text to specified language.
@@ -592,290 +965,53 @@ def _translate(text: str, language: str) -> str:
     Note: For production, integrate with Google Translate API or similar service.
     This provides basic common medical phrases for 15 languages.
     """
-
-    # Common translations for medical education materials
-    translations = {
-        "es": {  # Spanish
-            "Patient Education": "Educación del Paciente",
-            "What is this condition?": "¿Qué es esta condición?",
-            "When to seek immediate help": "Cuándo buscar ayuda inmediata",
-            "Call 911 or go to the emergency room if you have:": "Llame al 911 o vaya a la sala de emergencias si tiene:",
-            "Your Medications": "Sus Medicamentos",
-            "Diet and Lifestyle": "Dieta y Estilo de Vida",
-            "Learn More": "Aprenda Más",
-            "For more information, visit these trusted resources:": "Para más información, visite estos recursos confiables:",
-            "Follow-up Care": "Cuidado de Seguimiento",
-            "Follow up with your healthcare provider as directed.": "Haga seguimiento con su proveedor de salud según las indicaciones.",
-            "Your follow-up appointment:": "Su cita de seguimiento:",
-            "Special Instructions for You": "Instrucciones Especiales Para Usted",
-            "No medications prescribed.": "No se recetaron medicamentos.",
-            "Take": "Tome",
-        },
-        "zh": {  # Chinese
-            "Patient Education": "患者教育",
-            "What is this condition?": "这是什么病症?",
-            "When to seek immediate help": "何时寻求紧急帮助",
-            "Call 911 or go to the emergency room if you have:": "如果您有以下情况，请拨打911或去急诊室:",
-            "Your Medications": "您的药物",
-            "Diet and Lifestyle": "饮食和生活方式",
-            "Learn More": "了解更多",
-            "For more information, visit these trusted resources:": "欲了解更多信息，请访问这些可信资源:",
-            "Follow-up Care": "后续护理",
-            "Follow up with your healthcare provider as directed.": "按照指示与您的医疗保健提供者进行随访。",
-            "Your follow-up appointment:": "您的随访预约:",
-            "Special Instructions for You": "为您的特别说明",
-            "No medications prescribed.": "未开处方药。",
-            "Take": "服用",
-        },
-        "fr": {  # French
-            "Patient Education": "Éducation du Patient",
-            "What is this condition?": "Qu'est-ce que cette condition?",
-            "When to seek immediate help": "Quand chercher une aide immédiate",
-            "Call 911 or go to the emergency room if you have:": "Appelez le 911 ou allez aux urgences si vous avez:",
-            "Your Medications": "Vos Médicaments",
-            "Diet and Lifestyle": "Régime et Mode de Vie",
-            "Learn More": "En Savoir Plus",
-            "For more information, visit these trusted resources:": "Pour plus d'informations, visitez ces ressources fiables:",
-            "Follow-up Care": "Suivi des Soins",
-            "Follow up with your healthcare provider as directed.": "Suivez avec votre fournisseur de soins comme indiqué.",
-            "Your follow-up appointment:": "Votre rendez-vous de suivi:",
-            "Special Instructions for You": "Instructions Spéciales Pour Vous",
-            "No medications prescribed.": "Aucun médicament prescrit.",
-            "Take": "Prendre",
-        },
-        "de": {  # German
-            "Patient Education": "Patientenaufklärung",
-            "What is this condition?": "Was ist diese Erkrankung?",
-            "When to seek immediate help": "Wann sofortige Hilfe suchen",
-            "Call 911 or go to the emergency room if you have:": "Rufen Sie 911 an oder gehen Sie zur Notaufnahme, wenn Sie haben:",
-            "Your Medications": "Ihre Medikamente",
-            "Diet and Lifestyle": "Ernährung und Lebensstil",
-            "Learn More": "Mehr Erfahren",
-            "For more information, visit these trusted resources:": "Für weitere Informationen besuchen Sie diese vertrauenswürdigen Ressourcen:",
-            "Follow-up Care": "Nachsorge",
-            "Follow up with your healthcare provider as directed.": "Folgen Sie den Anweisungen Ihres Gesundheitsdienstleisters.",
-            "Your follow-up appointment:": "Ihr Folgetermin:",
-            "Special Instructions for You": "Spezielle Anweisungen Für Sie",
-            "No medications prescribed.": "Keine Medikamente verschrieben.",
-            "Take": "Nehmen",
-        },
-        "pt": {  # Portuguese
-            "Patient Education": "Educação do Paciente",
-            "What is this condition?": "O que é esta condição?",
-            "When to seek immediate help": "Quando procurar ajuda imediata",
-            "Call 911 or go to the emergency room if you have:": "Ligue para o 911 ou vá ao pronto-socorro se tiver:",
-            "Your Medications": "Seus Medicamentos",
-            "Diet and Lifestyle": "Dieta e Estilo de Vida",
-            "Learn More": "Saiba Mais",
-            "For more information, visit these trusted resources:": "Para mais informações, visite estes recursos confiáveis:",
-            "Follow-up Care": "Cuidados de Acompanhamento",
-            "Follow up with your healthcare provider as directed.": "Acompanhe com seu profissional de saúde conforme orientado.",
-            "Your follow-up appointment:": "Sua consulta de acompanhamento:",
-            "Special Instructions for You": "Instruções Especiais Para Você",
-            "No medications prescribed.": "Nenhum medicamento prescrito.",
-            "Take": "Tomar",
-        },
-        "ar": {  # Arabic
-            "Patient Education": "تثقيف المريض",
-            "What is this condition?": "ما هي هذه الحالة؟",
-            "When to seek immediate help": "متى تطلب المساعدة الفورية",
-            "Call 911 or go to the emergency room if you have:": "اتصل بالرقم 911 أو اذهب إلى غرفة الطوارئ إذا كان لديك:",
-            "Your Medications": "أدويتك",
-            "Diet and Lifestyle": "النظام الغذائي ونمط الحياة",
-            "Learn More": "تعلم المزيد",
-            "For more information, visit these trusted resources:": "لمزيد من المعلومات، قم بزيارة هذه الموارد الموثوقة:",
-            "Follow-up Care": "الرعاية المتابعة",
-            "Follow up with your healthcare provider as directed.": "تابع مع مقدم الرعاية الصحية الخاص بك حسب التوجيهات.",
-            "Your follow-up appointment:": "موعد المتابعة الخاص بك:",
-            "Special Instructions for You": "تعليمات خاصة لك",
-            "No medications prescribed.": "لا توجد أدوية موصوفة.",
-            "Take": "خذ",
-        },
-        "ru": {  # Russian
-            "Patient Education": "Обучение Пациентов",
-            "What is this condition?": "Что это за состояние?",
-            "When to seek immediate help": "Когда обращаться за немедленной помощью",
-            "Call 911 or go to the emergency room if you have:": "Звоните 911 или обратитесь в отделение неотложной помощи, если у вас:",
-            "Your Medications": "Ваши Лекарства",
-            "Diet and Lifestyle": "Диета и Образ Жизни",
-            "Learn More": "Узнать Больше",
-            "For more information, visit these trusted resources:": "Для получения дополнительной информации посетите эти надежные ресурсы:",
-            "Follow-up Care": "Последующий Уход",
-            "Follow up with your healthcare provider as directed.": "Наблюдайтесь у своего врача согласно указаниям.",
-            "Your follow-up appointment:": "Ваш повторный прием:",
-            "Special Instructions for You": "Специальные Инструкции Для Вас",
-            "No medications prescribed.": "Лекарства не назначены.",
-            "Take": "Принимать",
-        },
-        "hi": {  # Hindi
-            "Patient Education": "रोगी शिक्षा",
-            "What is this condition?": "यह स्थिति क्या है?",
-            "When to seek immediate help": "तत्काल मदद कब लेनी है",
-            "Call 911 or go to the emergency room if you have:": "यदि आपके पास है तो 911 पर कॉल करें या आपातकालीन कक्ष में जाएं:",
-            "Your Medications": "आपकी दवाएं",
-            "Diet and Lifestyle": "आहार और जीवनशैली",
-            "Learn More": "और जानें",
-            "For more information, visit these trusted resources:": "अधिक जानकारी के लिए, इन विश्वसनीय संसाधनों पर जाएं:",
-            "Follow-up Care": "अनुवर्ती देखभाल",
-            "Follow up with your healthcare provider as directed.": "निर्देशानुसार अपने स्वास्थ्य सेवा प्रदाता के साथ फॉलो-अप करें।",
-            "Your follow-up appointment:": "आपकी फॉलो-अप अपॉइंटमेंट:",
-            "Special Instructions for You": "आपके लिए विशेष निर्देश",
-            "No medications prescribed.": "कोई दवा निर्धारित नहीं।",
-            "Take": "लें",
-        },
-        "ja": {  # Japanese
-            "Patient Education": "患者教育",
-            "What is this condition?": "この状態は何ですか？",
-            "When to seek immediate help": "緊急の助けを求めるべき時",
-            "Call 911 or go to the emergency room if you have:": "次の症状がある場合は911に電話するか救急室に行ってください：",
-            "Your Medications": "あなたの薬",
-            "Diet and Lifestyle": "食事とライフスタイル",
-            "Learn More": "詳しく学ぶ",
-            "For more information, visit these trusted resources:": "詳細については、これらの信頼できるリソースをご覧ください：",
-            "Follow-up Care": "フォローアップケア",
-            "Follow up with your healthcare provider as directed.": "指示に従って医療提供者とフォローアップしてください。",
-            "Your follow-up appointment:": "あなたのフォローアップ予約：",
-            "Special Instructions for You": "あなたのための特別な指示",
-            "No medications prescribed.": "処方された薬はありません。",
-            "Take": "服用",
-        },
-        "ko": {  # Korean
-            "Patient Education": "환자 교육",
-            "What is this condition?": "이 상태는 무엇입니까?",
-            "When to seek immediate help": "즉시 도움을 구해야 할 때",
-            "Call 911 or go to the emergency room if you have:": "다음 증상이 있으면 911에 전화하거나 응급실로 가십시오:",
-            "Your Medications": "귀하의 약물",
-            "Diet and Lifestyle": "식단 및 생활 방식",
-            "Learn More": "더 알아보기",
-            "For more information, visit these trusted resources:": "자세한 내용은 다음 신뢰할 수 있는 리소스를 방문하십시오:",
-            "Follow-up Care": "후속 관리",
-            "Follow up with your healthcare provider as directed.": "지시에 따라 의료 서비스 제공자와 후속 조치를 취하십시오.",
-            "Your follow-up appointment:": "귀하의 후속 예약:",
-            "Special Instructions for You": "귀하를 위한 특별 지침",
-            "No medications prescribed.": "처방된 약이 없습니다.",
-            "Take": "복용",
-        },
-        "vi": {  # Vietnamese
-            "Patient Education": "Giáo Dục Bệnh Nhân",
-            "What is this condition?": "Tình trạng này là gì?",
-            "When to seek immediate help": "Khi nào cần tìm kiếm sự giúp đỡ ngay lập tức",
-            "Call 911 or go to the emergency room if you have:": "Gọi 911 hoặc đến phòng cấp cứu nếu bạn có:",
-            "Your Medications": "Thuốc Của Bạn",
-            "Diet and Lifestyle": "Chế Độ Ăn Uống và Lối Sống",
-            "Learn More": "Tìm Hiểu Thêm",
-            "For more information, visit these trusted resources:": "Để biết thêm thông tin, hãy truy cập các nguồn đáng tin cậy này:",
-            "Follow-up Care": "Chăm Sóc Tiếp Theo",
-            "Follow up with your healthcare provider as directed.": "Theo dõi với nhà cung cấp dịch vụ chăm sóc sức khỏe của bạn theo hướng dẫn.",
-            "Your follow-up appointment:": "Cuộc hẹn theo dõi của bạn:",
-            "Special Instructions for You": "Hướng Dẫn Đặc Biệt Cho Bạn",
-            "No medications prescribed.": "Không có thuốc được kê đơn.",
-            "Take": "Uống",
-        },
-        "tl": {  # Tagalog
-            "Patient Education": "Edukasyon ng Pasyente",
-            "What is this condition?": "Ano ang kondisyon na ito?",
-            "When to seek immediate help": "Kailan humingi ng agarang tulong",
-            "Call 911 or go to the emergency room if you have:": "Tumawag sa 911 o pumunta sa emergency room kung mayroon ka:",
-            "Your Medications": "Ang Iyong mga Gamot",
-            "Diet and Lifestyle": "Diyeta at Pamumuhay",
-            "Learn More": "Matuto Pa",
-            "For more information, visit these trusted resources:": "Para sa higit pang impormasyon, bisitahin ang mga pinagkakatiwalaang mapagkukunan na ito:",
-            "Follow-up Care": "Subaybayan ang Pag-aalaga",
-            "Follow up with your healthcare provider as directed.": "Subaybayan ang iyong tagapagbigay ng pangangalagang pangkalusugan ayon sa itinuro.",
-            "Your follow-up appointment:": "Ang iyong follow-up na appointment:",
-            "Special Instructions for You": "Mga Espesyal na Tagubilin Para sa Iyo",
-            "No medications prescribed.": "Walang inireresetang gamot.",
-            "Take": "Uminom",
-        },
-        "it": {  # Italian
-            "Patient Education": "Educazione del Paziente",
-            "What is this condition?": "Cos'è questa condizione?",
-            "When to seek immediate help": "Quando cercare aiuto immediato",
-            "Call 911 or go to the emergency room if you have:": "Chiama il 911 o vai al pronto soccorso se hai:",
-            "Your Medications": "I Tuoi Farmaci",
-            "Diet and Lifestyle": "Dieta e Stile di Vita",
-            "Learn More": "Scopri di Più",
-            "For more information, visit these trusted resources:": "Per ulteriori informazioni, visita queste risorse affidabili:",
-            "Follow-up Care": "Assistenza di Follow-up",
-            "Follow up with your healthcare provider as directed.": "Fai il follow-up con il tuo operatore sanitario come indicato.",
-            "Your follow-up appointment:": "Il tuo appuntamento di follow-up:",
-            "Special Instructions for You": "Istruzioni Speciali Per Te",
-            "No medications prescribed.": "Nessun farmaco prescritto.",
-            "Take": "Prendere",
-        },
-        "pl": {  # Polish
-            "Patient Education": "Edukacja Pacjenta",
-            "What is this condition?": "Co to za schorzenie?",
-            "When to seek immediate help": "Kiedy szukać natychmiastowej pomocy",
-            "Call 911 or go to the emergency room if you have:": "Zadzwoń pod 911 lub udaj się na izbę przyjęć, jeśli masz:",
-            "Your Medications": "Twoje Leki",
-            "Diet and Lifestyle": "Dieta i Styl Życia",
-            "Learn More": "Dowiedz Się Więcej",
-            "For more information, visit these trusted resources:": "Aby uzyskać więcej informacji, odwiedź te zaufane zasoby:",
-            "Follow-up Care": "Opieka Kontynuacyjna",
-            "Follow up with your healthcare provider as directed.": "Skontaktuj się z lekarzem zgodnie z zaleceniami.",
-            "Your follow-up appointment:": "Twoja wizyta kontrolna:",
-            "Special Instructions for You": "Specjalne Instrukcje Dla Ciebie",
-            "No medications prescribed.": "Nie przepisano leków.",
-            "Take": "Przyjmować",
-        },
-    }
-
     # Get translation for the specified language, fallback to English
-    lang_dict = translations.get(language, {})
-    return lang_dict.get(text, text)
+    return _PHRASE_TRANSLATIONS.get(language, {}).get(text, text)
+
+
+def _document_response(
+    request: Request, filename: str, media_type: str, not_found: str
+) -> Response:
+    """Serve a stored document with ETag revalidation and byte-range support"""
+    store = get_document_store()
+    filepath = store.resolve(filename)
+    if filepath is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    store.touch(filepath)
+
+    stat_result = filepath.stat()
+    response = FileResponse(
+        path=str(filepath),
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+        headers={"Cache-Control": "private, no-cache", "Accept-Ranges": "bytes"},
+    )
+    # FileResponse serves Range/If-Range itself; answer revalidation here
+    etag = response.headers["etag"]
+    if_none_match = {
+        tag.strip() for tag in request.headers.get("if-none-match", "").split(",")
+    }
+    if "*" in if_none_match or etag in if_none_match or f"W/{etag}" in if_none_match:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": response.headers["cache-control"]},
+        )
+    return response
 
 
 @router.get("/download/{filename}")
-async def download_document(filename: str):
+async def download_document(filename: str, request: Request):
     """Download generated document"""
-
-    import os
-
-    # Use same environment detection as _generate_pdf
-    is_railway = (
-        os.getenv("RAILWAY_ENVIRONMENT") is not None
-        or os.getenv("RAILWAY_SERVICE_ID") is not None
-    )
-
-    if is_railway:
-        base_dir = Path("/app/data/generated_documents")
-    else:
-        base_dir = Path("data/generated_documents")
-
-    filepath = base_dir / filename
-
-    if not filepath.exists():
-        raise HTTPException(status_code=404, detail="Document not found")
-
-    return FileResponse(
-        path=str(filepath), media_type="application/pdf", filename=filename
-    )
+    media_type = _DOWNLOAD_MEDIA_TYPES.get(Path(filename).suffix, "application/pdf")
+    return _document_response(request, filename, media_type, "Document not found")
 
 
 @router.get("/preview/{filename}")
-async def preview_document(filename: str):
+async def preview_document(filename: str, request: Request):
     """Preview generated document as HTML"""
-    import os
-
-    # Use same environment detection as _generate_pdf
-    is_railway = (
-        os.getenv("RAILWAY_ENVIRONMENT") is not None
-        or os.getenv("RAILWAY_SERVICE_ID") is not None
-    )
-
-    if is_railway:
-        base_dir = Path("/app/data/generated_documents")
-    else:
-        base_dir = Path("data/generated_documents")
-
-    filepath = base_dir / filename
-
-    if not filepath.exists():
-        raise HTTPException(status_code=404, detail="Document preview not found")
-
     # Verify it's an HTML file
     if not filename.endswith(".html"):
         raise HTTPException(status_code=400, detail="Invalid preview file format")
 
-    return FileResponse(path=str(filepath), media_type="text/html", filename=filename)
+    return _document_response(request, filename, "text/html", "Document preview not found")
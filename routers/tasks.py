@@ -0,0 +1,41 @@
+"""
+Background job status router.
+
+Reports the state of jobs queued through utils.background_tasks. Job state
+is shared through Redis, so any worker can answer for any task.
+"""
+from fastapi import APIRouter, status
+
+from utils.api_responses import create_success_response, create_error_response
+from utils.background_tasks import get_task_status
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.get("/{task_id}",
+    summary="Get background job status",
+    description="""
+    Retrieve the status of a queued background job.
+
+    Possible statuses are: queued, running, retrying, completed, failed.
+
+    Completed jobs include their result and failed jobs their last error until
+    the job's result TTL expires.
+    """
+)
+async def get_task(task_id: str):
+    """
+    GET /tasks/{task_id}
+
+    Returns:
+        A dictionary with task status information
+    """
+    task_status = await get_task_status(task_id)
+    if task_status["status"] == "not_found":
+        return create_error_response(
+            f"Task {task_id} not found",
+            status.HTTP_404_NOT_FOUND,
+            "task_not_found"
+        )
+
+    return create_success_response(task_status)
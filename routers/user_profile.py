@@ -7,6 +7,7 @@ import base64
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from src.models.user_profile_schemas import (
     DocumentPermissions,
@@ -211,8 +212,8 @@ async def upload_signature(signature: SignatureUploadRequest):
         signature_filename = f"{_current_user_id}_signature.{signature.format}"
         signature_path = signatures_dir / signature_filename
 
-        with open(signature_path, "wb") as f:
-            f.write(signature_bytes)
+        # Keep file I/O off the event loop
+        await run_in_threadpool(signature_path.write_bytes, signature_bytes)
 
         # Update profile
         profile = _user_profiles[_current_user_id]
@@ -10,12 +10,13 @@ from typing import Dict, Any, Optional, List
 
 from utils.api_responses import create_success_response, create_error_response
 from utils.logging import get_logger
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(prefix="/wizards/clinical-trials", tags=["wizards"])
 logger = get_logger(__name__)
 
-# In-memory storage for wizard state. In production, use Redis or a database.
-wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("clinical_trials_search")
 
 # --- Pydantic Models for Wizard Steps ---
 
@@ -43,7 +44,7 @@ async def start_wizard():
     """Initializes a new search wizard session."""
     import uuid
     wizard_id = str(uuid.uuid4())
-    wizard_sessions[wizard_id] = {}
+    await _sessions.create(wizard_id, {})
     logger.info(f"Started clinical trial search wizard session: {wizard_id}")
     
     return create_success_response({
@@ -55,10 +56,12 @@ async def start_wizard():
 async def add_condition(step1_input: Step1Input):
     """Adds the primary medical condition to the search criteria."""
     wizard_id = step1_input.wizard_id
-    if wizard_id not in wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         return create_error_response("Wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
     
-    wizard_sessions[wizard_id]["condition"] = step1_input.condition
+    session["condition"] = step1_input.condition
+    await _sessions.save(wizard_id, session)
     logger.info(f"Updated trial search session {wizard_id} with condition: {step1_input.condition}")
     
     return create_success_response({
@@ -73,10 +76,10 @@ async def search_trials(step2_input: Step2Input):
     against a clinical trials database.
     """
     wizard_id = step2_input.wizard_id
-    if wizard_id not in wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         return create_error_response("Wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
 
-    session = wizard_sessions[wizard_id]
     session.update(step2_input.dict(exclude_unset=True))
 
     # In a real application, you would call a service like ClinicalTrials.gov API
@@ -107,7 +110,7 @@ async def search_trials(step2_input: Step2Input):
     ]
     
     # Clean up the session
-    del wizard_sessions[wizard_id]
+    await _sessions.delete(wizard_id)
     
     return create_success_response({
         "search_summary": search_summary,
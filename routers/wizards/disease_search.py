@@ -6,18 +6,19 @@ report on a specific medical condition, acting as an "Advanced Search" feature.
 """
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import Optional, List
 import json
 
 from utils.api_responses import create_success_response, create_error_response
 from services.openai_client import get_client
 from utils.logging import get_logger
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(prefix="/wizards/disease-search", tags=["wizards"])
 logger = get_logger(__name__)
 
-# In-memory storage for wizard state. In production, use Redis or a database.
-wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("disease_search")
 
 # --- Pydantic Models for Wizard Steps ---
 
@@ -80,7 +81,7 @@ async def start_wizard(step_input: StartWizardInput):
         
         suggestions = json.loads(response.choices[0].message.content)
         
-        wizard_sessions[wizard_id] = {"topic": topic}
+        await _sessions.create(wizard_id, {"topic": topic})
         logger.info(f"Started disease report wizard session: {wizard_id} for topic: {topic}")
         
         return create_success_response({
@@ -106,10 +107,10 @@ async def generate_report(step_input: GenerateReportInput):
     optional patient context (age group, comorbidities).
     """
     wizard_id = step_input.wizard_id
-    if wizard_id not in wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response("Wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
 
-    session_data = wizard_sessions[wizard_id]
     topic = session_data["topic"]
     
     # Build the prompt for the LLM
@@ -177,7 +178,7 @@ async def generate_report(step_input: GenerateReportInput):
         next_steps_data = json.loads(next_steps_response.choices[0].message.content)
         
         # Clean up the session
-        del wizard_sessions[wizard_id]
+        await _sessions.delete(wizard_id)
         
         return create_success_response({
             "wizard_id": wizard_id,
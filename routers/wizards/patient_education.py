@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional, List
 from utils.api_responses import create_success_response, create_error_response
 from services.openai_client import get_client
 from utils.logging import get_logger
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(prefix="/wizards/patient-education", tags=["wizards"])
 logger = get_logger(__name__)
@@ -42,9 +43,10 @@ class GenerationResult(BaseModel):
     handout_text: Optional[str] = None
     error: Optional[str] = None
 
-# In-memory storage for wizard state and results.
-# In a production system, this would be replaced with a database or Redis.
-wizard_sessions: Dict[str, Any] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("patient_education_handout")
+
+# In-memory storage for generation results.
 generation_results: Dict[str, GenerationResult] = {}
 
 # --- Wizard Endpoints ---
@@ -71,10 +73,10 @@ async def start_wizard(step1_input: Step1Input):
         "When to see a doctor"
     ]
     
-    wizard_sessions[wizard_id] = {
+    await _sessions.create(wizard_id, {
         "topic": step1_input.topic,
         "suggested_sections": suggested_sections
-    }
+    })
     
     return create_success_response({
         "wizard_id": wizard_id,
@@ -91,20 +93,22 @@ async def generate_handout(step2_input: Step2Input):
     This will start the asynchronous generation of the handout.
     """
     wizard_id = step2_input.wizard_id
-    if wizard_id not in wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response("Wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
 
     import uuid
     task_id = str(uuid.uuid4())
     
     # Store generation parameters
-    wizard_sessions[wizard_id].update(step2_input.dict())
+    session_data.update(step2_input.dict())
+    await _sessions.save(wizard_id, session_data)
     generation_results[task_id] = GenerationResult(status="pending")
 
     # In a real app, this would be a background task
     # For simplicity, we'll run it synchronously here.
     try:
-        await _generate_handout_content(wizard_id, task_id)
+        await _generate_handout_content(session_data, task_id)
     except Exception as e:
         logger.error(f"Handout generation failed for task {task_id}: {e}", exc_info=True)
         generation_results[task_id] = GenerationResult(status="failed", error=str(e))
@@ -131,9 +135,8 @@ async def get_generation_result(task_id: str):
 
 # --- Helper Function ---
 
-async def _generate_handout_content(wizard_id: str, task_id: str):
+async def _generate_handout_content(session_data: Dict[str, Any], task_id: str):
     """Helper to generate the handout content using an LLM."""
-    session_data = wizard_sessions[wizard_id]
     topic = session_data["topic"]
     sections = session_data["selected_sections"] + (session_data.get("custom_sections") or [])
     
@@ -11,12 +11,13 @@ from typing import Dict, Optional
 from utils.api_responses import create_success_response, create_error_response
 from services import openai_client
 from utils.logging import get_logger
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(prefix="/wizards/treatment-plan", tags=["wizards"])
 logger = get_logger(__name__)
 
-# In-memory storage for wizard state. In production, use Redis or a database.
-treatment_wizard_sessions: Dict[str, Dict[str, str]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("treatment_plan")
 
 # --- Pydantic Models for Wizard Steps ---
 
@@ -72,7 +73,7 @@ async def start_treatment_wizard():
     """
     import uuid
     wizard_id = str(uuid.uuid4())
-    treatment_wizard_sessions[wizard_id] = {}
+    await _sessions.create(wizard_id, {})
     logger.info(f"Started Treatment Plan wizard session: {wizard_id}")
     
     return create_success_response({
@@ -81,12 +82,14 @@ async def start_treatment_wizard():
         "next_step": "assessment"
     })
 
-def _update_treatment_step(wizard_id: str, step_name: str, text: str, next_step_name: str, custom_message: Optional[str] = None):
+async def _update_treatment_step(wizard_id: str, step_name: str, text: str, next_step_name: str, custom_message: Optional[str] = None):
     """Helper function to update a step in the treatment wizard session."""
-    if wizard_id not in treatment_wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response("Treatment wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
     
-    treatment_wizard_sessions[wizard_id][step_name] = text
+    session_data[step_name] = text
+    await _sessions.save(wizard_id, session_data)
     logger.info(f"Updated Treatment Plan session {wizard_id} with step: {step_name}")
     
     default_message = f"'{step_name.replace('_', ' ').title()}' received. Please proceed to add the '{next_step_name.replace('_', ' ').title()}'."
@@ -109,7 +112,7 @@ async def add_patient_assessment(step_input: TreatmentStepInput):
     - Functional status and limitations
     - Psychosocial factors
     """
-    return _update_treatment_step(
+    return await _update_treatment_step(
         step_input.wizard_id, 
         "assessment", 
         step_input.text, 
@@ -129,7 +132,7 @@ async def add_treatment_goals(step_input: TreatmentStepInput):
     - Measurable objectives
     - Expected timeframes
     """
-    return _update_treatment_step(
+    return await _update_treatment_step(
         step_input.wizard_id, 
         "goals", 
         step_input.text, 
@@ -148,13 +151,14 @@ async def add_interventions(interventions_input: InterventionsInput):
     - Patient and family education plans
     """
     wizard_id = interventions_input.wizard_id
-    if wizard_id not in treatment_wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response("Treatment wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
     
-    session_data = treatment_wizard_sessions[wizard_id]
     session_data["nursing_interventions"] = interventions_input.nursing_interventions
     session_data["medications"] = interventions_input.medications
     session_data["patient_education"] = interventions_input.patient_education
+    await _sessions.save(wizard_id, session_data)
     
     logger.info(f"Updated Treatment Plan session {wizard_id} with interventions")
     
@@ -176,7 +180,7 @@ async def add_monitoring_plan(step_input: TreatmentStepInput):
     - Response to interventions
     - Safety parameters and alerts
     """
-    return _update_treatment_step(
+    return await _update_treatment_step(
         step_input.wizard_id, 
         "monitoring", 
         step_input.text, 
@@ -196,11 +200,12 @@ async def generate_treatment_plan(step_input: GenerateTreatmentInput):
     - Professional formatting suitable for clinical use
     """
     wizard_id = step_input.wizard_id
-    if wizard_id not in treatment_wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response("Treatment wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
 
-    session_data = treatment_wizard_sessions[wizard_id]
     session_data["evaluation_criteria"] = step_input.evaluation_criteria
+    await _sessions.save(wizard_id, session_data)
 
     # Verify all parts are present
     required_parts = ["assessment", "goals", "nursing_interventions", "medications", "patient_education", "monitoring", "evaluation_criteria"]
@@ -273,7 +278,7 @@ async def generate_treatment_plan(step_input: GenerateTreatmentInput):
         }
 
         # Clean up session
-        treatment_wizard_sessions.pop(wizard_id, None)
+        await _sessions.delete(wizard_id)
 
         return create_success_response({
             "wizard_id": wizard_id,
@@ -297,10 +302,10 @@ async def get_session_status(wizard_id: str):
     Returns the completed steps and what step is needed next.
     Useful for resuming interrupted sessions or checking progress.
     """
-    if wizard_id not in treatment_wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response("Treatment wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
     
-    session_data = treatment_wizard_sessions[wizard_id]
     completed_steps = list(session_data.keys())
     
     # Determine next step based on what's completed
@@ -335,10 +340,8 @@ async def cancel_session(wizard_id: str):
     Use this endpoint to clean up sessions that are no longer needed
     or to start over with a fresh session.
     """
-    if wizard_id not in treatment_wizard_sessions:
+    if not await _sessions.delete(wizard_id):
         return create_error_response("Treatment wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found")
-    
-    del treatment_wizard_sessions[wizard_id]
     logger.info(f"Cancelled treatment plan wizard session: {wizard_id}")
     
     return create_success_response({
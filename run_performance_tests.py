@@ -10,15 +10,36 @@ Usage:
     python run_performance_tests.py --test-type all
     python run_performance_tests.py --test-type api --endpoints /api/v1/disease-info
     python run_performance_tests.py --test-type cache --concurrent-users 50
+
+Reproducible scenario benchmarks (app + upstream stub started locally):
+    python run_performance_tests.py --test-type scenarios --local-stack
+    python run_performance_tests.py --test-type scenarios --local-stack \
+        --scenarios disease_lookup drug_interactions --report out.json
+    python run_performance_tests.py --test-type scenarios --local-stack --update-baseline
+
+With --local-stack the application runs under uvicorn from
+tests/benchmark_app.py, which routes its httpx and requests traffic to
+tests/mock_upstream_server.py. The stub replays recorded MyDisease, PubMed,
+MedlinePlus, FDA and ClinicalTrials.gov responses with fixed, seeded latency;
+calls to any other outbound host fail fast instead of reaching the network.
+Results are compared against benchmarks/baseline.json and the run fails when
+p95 latency or throughput regresses beyond --tolerance.
 """
 
 import asyncio
+import os
+import platform
+import socket
+import subprocess
+import tempfile
 import time
 import statistics
 import argparse
 import sys
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import logging
@@ -68,6 +89,65 @@ class PerformanceMetrics:
     total_duration: float
     memory_usage_mb: Optional[float] = None
     cpu_usage_percent: Optional[float] = None
+    peak_memory_mb: Optional[float] = None
+
+
+@dataclass
+class BenchmarkScenario:
+    """A request mix replayed against one endpoint."""
+    name: str
+    method: str
+    path: str
+    # Query parameters (GET) or JSON bodies (POST), used round-robin
+    payloads: List[Dict[str, Any]] = field(default_factory=list)
+    description: str = ""
+
+
+BENCHMARK_SCENARIOS: Dict[str, BenchmarkScenario] = {
+    "autocomplete": BenchmarkScenario(
+        name="autocomplete",
+        method="GET",
+        path="/api/v1/content-settings/diagnosis/autocomplete",
+        payloads=[{"q": q, "limit": 10} for q in ("hyp", "diab", "pneu", "sep", "copd", "hear")],
+        description="Diagnosis autocomplete over the local ICD-10 index",
+    ),
+    "disease_lookup": BenchmarkScenario(
+        name="disease_lookup",
+        method="GET",
+        path="/api/v1/disease/lookup",
+        payloads=[{"q": q} for q in ("hypertension", "diabetes", "pneumonia", "copd", "heart failure")],
+        description="Disease lookup (MyDisease, MedlinePlus and PubMed via the stub)",
+    ),
+    "drug_interactions": BenchmarkScenario(
+        name="drug_interactions",
+        method="POST",
+        path="/api/v1/drug-interactions/check",
+        payloads=[
+            {"drugs": ["warfarin", "aspirin"]},
+            {"drugs": ["lisinopril", "spironolactone", "ibuprofen"]},
+            {"drugs": ["metformin", "furosemide", "digoxin", "amiodarone"]},
+        ],
+        description="Drug interaction check (FDA labels via the stub)",
+    ),
+    "patient_education_pdf": BenchmarkScenario(
+        name="patient_education_pdf",
+        method="POST",
+        path="/api/v1/documents/patient-education",
+        payloads=[
+            {
+                "patient_name": "Benchmark Patient",
+                "diagnosis_id": diagnosis_id,
+                "icd10_code": icd10_code,
+                "include_medlineplus": True,
+            }
+            for diagnosis_id, icd10_code in (("hypertension", "I10"), ("diabetes_type2", "E11.9"))
+        ],
+        description="Patient education PDF + HTML generation "
+        "(needs scripts/populate_diagnosis_library.py data; seeded by --local-stack)",
+    ),
+}
+
+BASELINE_PATH = Path(__file__).parent / "benchmarks" / "baseline.json"
 
 
 @dataclass
@@ -203,6 +283,87 @@ class PerformanceTester:
         
         return response_times, successful, failed
     
+    async def run_scenario(
+        self, scenario: BenchmarkScenario, server_pid: Optional[int] = None
+    ) -> PerformanceMetrics:
+        """Replay a scenario with ``concurrent_users`` x ``requests_per_user`` requests.
+
+        RSS is sampled from ``server_pid`` (the application under test) when
+        known, otherwise from this process.
+        """
+        if not _has_httpx or httpx is None:
+            raise RuntimeError("httpx not available for API testing")
+
+        logger.info(
+            f"Running scenario '{scenario.name}' with {self.config.concurrent_users} concurrent users"
+        )
+        response_times: List[float] = []
+        successful = 0
+        failed = 0
+        peak_rss: List[float] = []
+
+        async def sample_rss(stop: asyncio.Event):
+            while not stop.is_set():
+                rss = self._get_memory_usage(server_pid)
+                if rss is not None:
+                    peak_rss.append(rss)
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=0.1)
+                except asyncio.TimeoutError:
+                    pass
+
+        async def user(client, user_id: int):
+            nonlocal successful, failed
+            for request_num in range(self.config.requests_per_user):
+                payload = scenario.payloads[
+                    (user_id + request_num) % len(scenario.payloads)
+                ] if scenario.payloads else {}
+                started = time.perf_counter()
+                try:
+                    if scenario.method == "GET":
+                        response = await client.get(scenario.path, params=payload)
+                    else:
+                        response = await client.request(scenario.method, scenario.path, json=payload)
+                    response_times.append((time.perf_counter() - started) * 1000)
+                    if response.status_code < 400:
+                        successful += 1
+                    else:
+                        failed += 1
+                        logger.debug(f"{scenario.name}: HTTP {response.status_code}")
+                except Exception as e:
+                    failed += 1
+                    response_times.append((time.perf_counter() - started) * 1000)
+                    logger.debug(f"{scenario.name}: request failed: {e}")
+
+        async with httpx.AsyncClient(
+            base_url=self.config.base_url, timeout=self.config.timeout_seconds
+        ) as client:
+            # One warm-up pass so imports, caches and connections are set up
+            await user(client, 0)
+            response_times.clear()
+            successful = failed = 0
+
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(sample_rss(stop))
+            start_time = time.perf_counter()
+            await asyncio.gather(
+                *(user(client, user_id) for user_id in range(self.config.concurrent_users))
+            )
+            duration = time.perf_counter() - start_time
+            stop.set()
+            await sampler
+
+        metrics = self._calculate_metrics(
+            scenario.name,
+            response_times,
+            successful,
+            failed,
+            duration,
+            self._get_memory_usage(server_pid),
+        )
+        metrics.peak_memory_mb = max(peak_rss) if peak_rss else None
+        return metrics
+
     async def run_cache_performance_test(self) -> PerformanceMetrics:
         """Run Redis cache performance tests."""
         if not _has_redis or get_redis_client is None:
@@ -402,13 +563,15 @@ class PerformanceTester:
             cpu_usage_percent=cpu_percent
         )
     
-    def _get_memory_usage(self) -> Optional[float]:
-        """Get current memory usage in MB."""
+    def _get_memory_usage(self, pid: Optional[int] = None) -> Optional[float]:
+        """Get current memory usage (RSS) in MB of this process, or of ``pid``
+        including its child processes (e.g. document rendering workers)."""
         if not _has_psutil or psutil is None:
             return None
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # Convert to MB
+            process = psutil.Process(pid)
+            processes = [process] + (process.children(recursive=True) if pid else [])
+            return sum(p.memory_info().rss for p in processes) / 1024 / 1024  # Convert to MB
         except Exception:
             return None
     
@@ -443,16 +606,220 @@ class PerformanceTester:
         if metrics.memory_usage_mb:
             print(f"\nSystem Resources:")
             print(f"  Memory Usage:        {metrics.memory_usage_mb:.2f} MB")
+        if metrics.peak_memory_mb:
+            print(f"  Peak Memory (RSS):   {metrics.peak_memory_mb:.2f} MB")
         if metrics.cpu_usage_percent:
             print(f"  CPU Usage:           {metrics.cpu_usage_percent:.2f}%")
         print(f"{'='*60}")
 
 
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 90.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Process for {url} exited with code {process.returncode}")
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+class LocalBenchmarkStack:
+    """Start the upstream stub and the application (uvicorn) as subprocesses."""
+
+    def __init__(self, stub_latency_ms: Optional[float] = None, stub_jitter_ms: float = 0.0, seed: int = 42):
+        self.stub_latency_ms = stub_latency_ms
+        self.stub_jitter_ms = stub_jitter_ms
+        self.seed = seed
+        self.processes: List[subprocess.Popen] = []
+        self.base_url = ""
+        self.app_pid: Optional[int] = None
+        self._workdir: Optional[tempfile.TemporaryDirectory] = None
+
+    async def __aenter__(self) -> "LocalBenchmarkStack":
+        try:
+            await self._start()
+        except BaseException:
+            await self.__aexit__()
+            raise
+        return self
+
+    async def _start(self) -> None:
+        root = Path(__file__).parent
+        stub_port, app_port = _free_port(), _free_port()
+
+        stub_cmd = [
+            sys.executable, str(root / "tests" / "mock_upstream_server.py"),
+            "--port", str(stub_port), "--jitter-ms", str(self.stub_jitter_ms), "--seed", str(self.seed),
+        ]
+        if self.stub_latency_ms is not None:
+            stub_cmd += ["--latency-ms", str(self.stub_latency_ms)]
+        stub = subprocess.Popen(stub_cmd, cwd=root, stdout=subprocess.DEVNULL)
+        self.processes.append(stub)
+        await _wait_until_ready(f"http://127.0.0.1:{stub_port}/health", stub)
+
+        # Isolated SQLite database seeded with the diagnosis library
+        self._workdir = tempfile.TemporaryDirectory(prefix="ai-nurse-bench-")
+        subprocess.run(
+            [sys.executable, str(root / "scripts" / "populate_diagnosis_library.py")],
+            cwd=self._workdir.name,
+            env={**os.environ, "PYTHONPATH": str(root)},
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+        env = dict(os.environ)
+        env.update({
+            "DATABASE_URL": f"sqlite:///{self._workdir.name}/ai_nurse_florence.db",
+            "BENCHMARK_UPSTREAM_STUB_URL": f"http://127.0.0.1:{stub_port}",
+            "PYTHON_ENV": "test",
+            "RATE_LIMIT_ENABLED": "false",
+            "LOG_LEVEL": "WARNING",
+        })
+        app = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "tests.benchmark_app:app", "--host", "127.0.0.1",
+             "--port", str(app_port), "--log-level", "warning", "--no-access-log"],
+            cwd=root, env=env, stdout=subprocess.DEVNULL,
+        )
+        self.processes.append(app)
+        self.app_pid = app.pid
+        self.base_url = f"http://127.0.0.1:{app_port}"
+        await _wait_until_ready(f"{self.base_url}/api/v1/health", app)
+
+    async def __aexit__(self, *exc) -> None:
+        for process in reversed(self.processes):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self._workdir is not None:
+            self._workdir.cleanup()
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def build_report(results: List[PerformanceMetrics], config: TestConfig, **extra: Any) -> Dict[str, Any]:
+    """JSON-serialisable benchmark report (milliseconds, requests/second, MB)."""
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "concurrent_users": config.concurrent_users,
+            "requests_per_user": config.requests_per_user,
+            **extra,
+        },
+        "scenarios": {result.test_name: asdict(result) for result in results},
+    }
+
+
+def compare_with_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25
+) -> List[str]:
+    """Regressions of ``report`` against ``baseline``: p95 latency up or throughput
+    down by more than ``tolerance`` (a fraction), or a higher error rate."""
+    regressions = []
+    for name, current in report.get("scenarios", {}).items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if previous["p95_response_time"] and (
+            current["p95_response_time"] > previous["p95_response_time"] * (1 + tolerance)
+        ):
+            regressions.append(
+                f"{name}: p95 {current['p95_response_time']:.1f}ms "
+                f"(baseline {previous['p95_response_time']:.1f}ms)"
+            )
+        if previous["requests_per_second"] and (
+            current["requests_per_second"] < previous["requests_per_second"] * (1 - tolerance)
+        ):
+            regressions.append(
+                f"{name}: {current['requests_per_second']:.1f} req/s "
+                f"(baseline {previous['requests_per_second']:.1f} req/s)"
+            )
+        if current["error_rate"] > previous["error_rate"] + 1.0:
+            regressions.append(
+                f"{name}: error rate {current['error_rate']:.1f}% "
+                f"(baseline {previous['error_rate']:.1f}%)"
+            )
+    return regressions
+
+
+async def run_scenarios(args, config: TestConfig) -> int:
+    """Run benchmark scenarios, write the report and compare with the baseline."""
+    names = args.scenarios or list(BENCHMARK_SCENARIOS)
+    unknown = [name for name in names if name not in BENCHMARK_SCENARIOS]
+    if unknown:
+        raise RuntimeError(f"Unknown scenarios: {', '.join(unknown)}")
+
+    results: List[PerformanceMetrics] = []
+
+    async def run_all(tester: PerformanceTester, server_pid: Optional[int]):
+        for name in names:
+            metrics = await tester.run_scenario(BENCHMARK_SCENARIOS[name], server_pid)
+            tester.print_results(metrics)
+            results.append(metrics)
+
+    if args.local_stack:
+        async with LocalBenchmarkStack(args.stub_latency_ms, args.stub_jitter_ms) as stack:
+            config.base_url = stack.base_url
+            await run_all(PerformanceTester(config), stack.app_pid)
+    else:
+        await run_all(PerformanceTester(config), None)
+
+    report = build_report(
+        results,
+        config,
+        local_stack=args.local_stack,
+        stub_latency_ms=args.stub_latency_ms,
+        stub_jitter_ms=args.stub_jitter_ms,
+    )
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n📝 Report written to {args.report}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"📌 Baseline updated: {baseline_path}")
+        return 0
+
+    if baseline_path.exists():
+        regressions = compare_with_baseline(report, json.loads(baseline_path.read_text()), args.tolerance)
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\n✅ No regressions against {baseline_path} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
 async def main():
     """Main function to run performance tests."""
     parser = argparse.ArgumentParser(description="AI Nurse Florence Performance Testing Suite")
     parser.add_argument("--test-type", 
-                       choices=["all", "api", "cache", "medical-query"],
+                       choices=["all", "api", "cache", "medical-query", "scenarios"],
                        default="all",
                        help="Type of performance test to run")
     parser.add_argument("--base-url", 
@@ -473,6 +840,33 @@ async def main():
     parser.add_argument("--endpoints", 
                        nargs="+",
                        help="Specific endpoints to test")
+    parser.add_argument("--scenarios",
+                       nargs="+",
+                       choices=sorted(BENCHMARK_SCENARIOS),
+                       help="Benchmark scenarios to run (default: all)")
+    parser.add_argument("--local-stack",
+                       action="store_true",
+                       help="Start the app and the upstream stub server locally")
+    parser.add_argument("--stub-latency-ms",
+                       type=float,
+                       default=None,
+                       help="Override the recorded upstream latency of the stub")
+    parser.add_argument("--stub-jitter-ms",
+                       type=float,
+                       default=0.0,
+                       help="Uniform jitter added by the stub (seeded)")
+    parser.add_argument("--report",
+                       help="Write a JSON report to this path")
+    parser.add_argument("--baseline",
+                       default=str(BASELINE_PATH),
+                       help="Baseline report to compare against")
+    parser.add_argument("--update-baseline",
+                       action="store_true",
+                       help="Write this run's report as the new baseline")
+    parser.add_argument("--tolerance",
+                       type=float,
+                       default=0.25,
+                       help="Allowed regression as a fraction (0.25 = 25%%)")
     
     args = parser.parse_args()
     
@@ -488,6 +882,10 @@ async def main():
     tester = PerformanceTester(config)
     
     try:
+        if args.test_type == "scenarios":
+            print("🏁 Running Benchmark Scenarios...")
+            sys.exit(await run_scenarios(args, config))
+
         if args.test_type in ["all", "api"]:
             print("🔍 Running API Performance Tests...")
             api_metrics = await tester.run_api_performance_test()
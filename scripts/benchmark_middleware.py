@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Before/after requests-per-second benchmark for the middleware stack.
+
+"before" reproduces the previous layout: four ``BaseHTTPMiddleware`` layers
+(security headers, request ID, logging/timing, rate limiting) doing the
+same header work. "after" is the single pure-ASGI
+``RequestContextMiddleware``. Both wrap the same trivial JSON endpoint and
+are driven in-process through ``httpx.ASGITransport``, so the numbers
+measure middleware overhead rather than network or server costs.
+
+Usage:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --requests 5000 --concurrency 50 --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Measure middleware overhead only - keep Redis out of the rate limit path
+os.environ.setdefault("AI_NURSE_DISABLE_REDIS", "1")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from src.utils.middleware import HSTS_HEADER, SECURITY_HEADERS, RequestContextMiddleware  # noqa: E402
+from src.utils.rate_limit import RateLimiter  # noqa: E402
+
+# A limit high enough never to trigger during the run
+REQUESTS_PER_MINUTE = 10_000_000
+
+
+class _SecurityHeaders(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers.update(SECURITY_HEADERS)
+        if request.url.hostname not in ["localhost", "127.0.0.1"]:
+            response.headers[HSTS_HEADER[0]] = HSTS_HEADER[1]
+        return response
+
+
+class _RequestId(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class _Logging(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(round(time.time() - start_time, 4))
+        logging.getLogger("benchmark").info("Request completed")
+        return response
+
+
+class _RateLimit(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        self.limiter = RateLimiter(None, requests_per_minute=REQUESTS_PER_MINUTE, exempt_paths=["/docs"])
+
+    async def dispatch(self, request, call_next):
+        headers, _ = await self.limiter.check(request.scope)
+        response = await call_next(request)
+        response.headers.update(headers)
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if stack == "before":
+        # add_middleware wraps outermost-last, so this is the original order
+        for middleware in (_RateLimit, _Logging, _RequestId, _SecurityHeaders):
+            app.add_middleware(middleware)
+    else:
+        app.add_middleware(
+            RequestContextMiddleware,
+            rate_limit_enabled=True,
+            requests_per_minute=REQUESTS_PER_MINUTE,
+            exempt_paths=["/docs"],
+        )
+    return app
+
+
+async def run_stack(stack: str, total_requests: int, concurrency: int) -> dict:
+    app = build_app(stack)
+    transport = httpx.ASGITransport(app=app)
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total_requests):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench.local") as client:
+        # Warm up routing, pydantic and the rate limiter state
+        for _ in range(50):
+            await client.get("/ping")
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                response = await client.get("/ping")
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "stack": stack,
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(total_requests / elapsed, 1),
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = [
+        await run_stack(stack, args.requests, args.concurrency) for stack in ("before", "after")
+    ]
+    speedup = results[1]["requests_per_second"] / results[0]["requests_per_second"]
+
+    if args.json:
+        print(json.dumps({"results": results, "speedup": round(speedup, 2)}, indent=2))
+    else:
+        for result in results:
+            print(
+                f"{result['stack']:>6}: {result['requests_per_second']:>9.1f} req/s "
+                f"({result['requests']} requests in {result['seconds']}s, "
+                f"concurrency {result['concurrency']})"
+            )
+        print(f"speedup: {speedup:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Before/after per-document render time for the patient PDF generators.
+
+"before" clears the compiled style/template registry ahead of every
+document, reproducing the previous behaviour of rebuilding
+``getSampleStyleSheet()``, the custom ParagraphStyles, table styles and
+footer paragraphs per PDF. "after" reuses the process-wide registry. Both
+render the same discharge instructions, medication guide, disease education
+and patient education documents in-process.
+
+Usage:
+    python scripts/benchmark_pdf_rendering.py
+    python scripts/benchmark_pdf_rendering.py --iterations 200 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services import pdf_generation_service as pdf  # noqa: E402
+
+DISCHARGE = {
+    "patient_name": "John Smith",
+    "primary_diagnosis": "Community-Acquired Pneumonia",
+    "medications": [
+        {"name": "Amoxicillin", "dosage": "500 mg", "frequency": "Three times daily",
+         "instructions": "Take with food."},
+        {"name": "Ibuprofen", "dosage": "400 mg", "frequency": "Every 6 hours as needed",
+         "instructions": "For fever or pain."},
+    ],
+    "follow_up_appointments": ["See your primary care doctor in 7-10 days"],
+    "activity_restrictions": ["Rest as needed", "No strenuous activity for 1 week"],
+    "warning_signs": ["Fever over 101°F", "Increasing cough"],
+    "emergency_criteria": ["Severe difficulty breathing", "Chest pain"],
+}
+
+MEDICATION_GUIDE = {
+    "medication_name": "Lisinopril",
+    "dosage": "10 mg",
+    "frequency": "Once daily",
+    "purpose": "Lowers blood pressure.",
+    "common_side_effects": ["Dry cough", "Dizziness"],
+    "serious_side_effects": ["Swelling of the face or throat"],
+    "storage_instructions": "Store at room temperature.",
+    "missed_dose_instructions": "Take it as soon as you remember.",
+}
+
+DISEASE_EDUCATION = {
+    "disease_name": "Type 2 Diabetes",
+    "what_it_is": "A condition where the body does not use insulin well.",
+    "symptoms": ["Increased thirst", "Frequent urination", "Fatigue"],
+    "self_care_tips": ["Check blood sugar daily", "Stay active"],
+    "warning_signs": ["Blood sugar over 300 mg/dL"],
+}
+
+PATIENT_EDUCATION = {
+    "patient_name": "Jane Doe",
+    "language": "en",
+    "content": {
+        "title": "Understanding Hypertension",
+        "diagnosis_name": "Hypertension",
+        "sections": [
+            {"title": "What is it?", "content": "High blood pressure."},
+            {"title": "Warning Signs", "bullet_points": ["Chest pain", "Severe headache"],
+             "style": "warning"},
+        ],
+    },
+}
+
+DOCUMENTS = {
+    "discharge_instructions": (pdf.generate_discharge_instructions, DISCHARGE),
+    "medication_guide": (pdf.generate_medication_guide, MEDICATION_GUIDE),
+    "disease_education": (pdf.generate_disease_education, DISEASE_EDUCATION),
+    "patient_education": (pdf.generate_patient_education, PATIENT_EDUCATION),
+}
+
+
+def run_mode(mode: str, iterations: int) -> dict:
+    results = {}
+    for name, (generate, data) in DOCUMENTS.items():
+        generate(data)  # warm imports and font metrics
+        timings = []
+        for _ in range(iterations):
+            if mode == "before":
+                pdf.clear_template_cache()
+            start = time.perf_counter()
+            generate(data)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        results[name] = {
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "p50_ms": round(timings[len(timings) // 2], 3),
+            "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    before = run_mode("before", args.iterations)
+    after = run_mode("after", args.iterations)
+    speedup = {
+        name: round(before[name]["mean_ms"] / after[name]["mean_ms"], 2) for name in DOCUMENTS
+    }
+
+    if args.json:
+        print(json.dumps({"before": before, "after": after, "speedup": speedup}, indent=2))
+    else:
+        print(f"{'document':<24}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+        for name in DOCUMENTS:
+            print(
+                f"{name:<24}{before[name]['mean_ms']:>12.2f}{after[name]['mean_ms']:>12.2f}"
+                f"{speedup[name]:>9.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+Document Rendering Service
+Runs ReportLab / python-docx layout in a pool of warm worker processes
+
+PDF and DOCX layout is pure CPU work; done inside an ``async def`` handler
+it blocks the event loop for every request on the worker, and in a thread it
+still holds the GIL. ``render_document(doc_type, data)`` ships the data to a
+process pool instead and returns the document bytes.
+
+- Workers start once (``start()`` from the app lifespan) and preload fonts,
+  style sheets and the DOCX template, so the first render isn't slow
+- At most ``max_queue`` renders may be pending; beyond that new ones fail
+  fast with 503 instead of piling up
+- Each render is bounded by ``timeout_seconds`` (504); a timed-out or crashed
+  pool is replaced so a stuck worker can't hold a slot forever
+- With ``DOCUMENT_RENDER_WORKERS=0`` (or if processes can't be started)
+  rendering falls back to a thread so the API keeps working
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+# Rendering defaults - will be loaded from settings
+DOCUMENT_RENDER_WORKERS = 2
+DOCUMENT_RENDER_MAX_QUEUE = 32
+DOCUMENT_RENDER_TIMEOUT_SECONDS = 30.0
+
+# Document type -> generator in services.pdf_generation_service (returns BytesIO)
+_RENDERERS = {
+    "discharge_instructions": "generate_discharge_instructions",
+    "discharge_instructions_docx": "generate_discharge_instructions_docx",
+    "discharge_instructions_text": "generate_discharge_instructions_text",
+    "medication_guide": "generate_medication_guide",
+    "disease_education": "generate_disease_education",
+    "patient_education": "generate_patient_education",
+}
+
+DOCUMENT_TYPES = frozenset(_RENDERERS)
+
+
+def render_sync(doc_type: str, data: Dict[str, Any]) -> bytes:
+    """Render a document in the current process (worker entry point)."""
+    if doc_type not in _RENDERERS:
+        raise ValueError(f"Unknown document type: {doc_type}")
+    from services import pdf_generation_service
+
+    return getattr(pdf_generation_service, _RENDERERS[doc_type])(data).getvalue()
+
+
+def _warm_worker() -> None:
+    """Process-pool initializer: import and prime ReportLab and python-docx."""
+    try:
+        from docx import Document
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.pdfbase import pdfmetrics
+
+        for font in ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Helvetica-BoldOblique"):
+            pdfmetrics.getFont(font)
+        getSampleStyleSheet()
+        Document()
+        # One throwaway render fills ReportLab's glyph-width and style caches
+        render_sync("disease_education", {"disease_name": "Warm-up"})
+    except Exception as e:
+        logger.warning(f"Document worker warm-up failed: {e}")
+
+
+def _ping() -> bool:
+    return True
+
+
+class DocumentRenderer:
+    """
+    Bounded, timed-out rendering on a process pool.
+
+    Mirrors ``PasswordHasher`` in ``src.utils.auth_enhanced``: ``max_workers``
+    processes, at most ``max_queue`` pending renders, 503 when full.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DOCUMENT_RENDER_WORKERS,
+        max_queue: int = DOCUMENT_RENDER_MAX_QUEUE,
+        timeout_seconds: float = DOCUMENT_RENDER_TIMEOUT_SECONDS,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._use_processes = max_workers > 0
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._pool_restarts = 0
+        self._peak_pending = 0
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._executor is None and self._use_processes:
+                try:
+                    # spawn: forking a process with a running event loop and
+                    # open DB/Redis connections is not safe
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_warm_worker,
+                    )
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"⚠️ Document worker processes unavailable, rendering on threads: {e}")
+                    self._use_processes = False
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a stuck or broken pool; the next render starts a fresh one."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._pool_restarts += 1
+        # Snapshot first: shutdown() drops the executor's process table
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    async def start(self) -> None:
+        """Start and warm every worker process (called at application startup)."""
+        executor = self._get_executor()
+        if executor is None:
+            return
+        loop = asyncio.get_running_loop()
+        # Concurrent no-op jobs make the pool spawn all of its workers now
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _ping) for _ in range(self.max_workers))
+        )
+        logger.info(f"✅ Document rendering pool ready ({self.max_workers} workers)")
+
+    async def render(self, doc_type: str, data: Dict[str, Any]) -> bytes:
+        """Render ``doc_type`` with ``data`` and return the document bytes."""
+        if doc_type not in DOCUMENT_TYPES:
+            raise ValueError(f"Unknown document type: {doc_type}")
+
+        with self._lock:
+            if self._pending >= self.max_queue:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Document rendering busy, please retry",
+                    headers={"Retry-After": "2"},
+                )
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            if executor is None:
+                job = asyncio.to_thread(render_sync, doc_type, data)
+            else:
+                job = loop.run_in_executor(executor, render_sync, doc_type, data)
+            document = await asyncio.wait_for(job, timeout=self.timeout_seconds)
+            with self._lock:
+                self._completed += 1
+            return document
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            logger.error(f"❌ Rendering {doc_type} timed out after {self.timeout_seconds}s")
+            if executor is not None:
+                self._discard_executor(executor)
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="Document rendering timed out",
+            )
+        except BrokenProcessPool as e:
+            logger.error(f"❌ Document worker pool broke while rendering {doc_type}: {e}")
+            self._discard_executor(executor)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Document rendering worker restarted, please retry",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue-depth metrics for monitoring."""
+        with self._lock:
+            return {
+                "mode": "process" if self._use_processes else "thread",
+                "workers": self.max_workers,
+                "pending": self._pending,
+                "peak_pending": self._peak_pending,
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "pool_restarts": self._pool_restarts,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_document_renderer: Optional[DocumentRenderer] = None
+_document_renderer_lock = threading.Lock()
+
+
+def get_document_renderer() -> DocumentRenderer:
+    """Return the process-wide document renderer."""
+    global _document_renderer
+    with _document_renderer_lock:
+        if _document_renderer is None:
+            workers = DOCUMENT_RENDER_WORKERS
+            max_queue = DOCUMENT_RENDER_MAX_QUEUE
+            timeout = DOCUMENT_RENDER_TIMEOUT_SECONDS
+            try:
+                from src.utils.config import get_settings
+
+                settings = get_settings()
+                workers = getattr(settings, "DOCUMENT_RENDER_WORKERS", workers)
+                max_queue = getattr(settings, "DOCUMENT_RENDER_MAX_QUEUE", max_queue)
+                timeout = getattr(settings, "DOCUMENT_RENDER_TIMEOUT_SECONDS", timeout)
+            except Exception as e:
+                logger.warning(f"Failed to load document rendering settings: {e}, using defaults")
+            _document_renderer = DocumentRenderer(workers, max_queue, timeout)
+        return _document_renderer
+
+
+def get_document_renderer_stats() -> Dict[str, Any]:
+    """Document rendering pool metrics."""
+    return get_document_renderer().stats()
+
+
+async def render_document(doc_type: str, data: Dict[str, Any]) -> bytes:
+    """Render a document off the event loop and return its bytes."""
+    return await get_document_renderer().render(doc_type, data)
@@ -0,0 +1,285 @@
+"""
+Generated Document Store
+Content-addressed storage for rendered patient documents
+
+Documents are named after a hash of their canonical render input, so the
+same content, patient name and language map to the same file. A lookup before
+rendering skips the PDF/HTML work entirely, and repeated requests stop
+adding files to ``data/generated_documents``.
+
+Retention is bounded two ways, enforced by a background sweeper:
+- TTL: files older than ``ttl_seconds`` (by creation) are removed
+- Size budget: past ``max_bytes`` the least recently used files go first;
+  ``touch()`` on every cache hit and download records use in the file's atime
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Retention defaults - will be loaded from settings
+GENERATED_DOCUMENTS_MAX_MB = 512
+GENERATED_DOCUMENTS_TTL_HOURS = 168
+GENERATED_DOCUMENTS_SWEEP_INTERVAL_SECONDS = 900
+
+# Bump when the layout changes so cached documents are re-rendered
+CACHE_KEY_VERSION = 1
+
+# Files being written; left alone by the sweeper unless clearly abandoned
+_TEMP_SUFFIX = ".tmp"
+_TEMP_MAX_AGE_SECONDS = 3600
+
+_SAFE_FILENAME = re.compile(r"^[A-Za-z0-9_\-]+\.(pdf|html|zip)$")
+
+
+def default_documents_dir() -> Path:
+    """``/app/data`` persistent volume on Railway, local ``data/`` otherwise."""
+    is_railway = (
+        os.getenv("RAILWAY_ENVIRONMENT") is not None
+        or os.getenv("RAILWAY_SERVICE_ID") is not None
+    )
+    if is_railway:
+        return Path("/app/data/generated_documents")
+    return Path("data/generated_documents")
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """Hash of the canonical JSON form of ``payload`` (key order independent)."""
+    canonical = json.dumps(
+        {"v": CACHE_KEY_VERSION, "input": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+class GeneratedDocumentStore:
+    """Content-addressed document files with TTL + LRU size budget."""
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        max_bytes: int = GENERATED_DOCUMENTS_MAX_MB * 1024 * 1024,
+        ttl_seconds: float = GENERATED_DOCUMENTS_TTL_HOURS * 3600,
+    ):
+        self.base_dir = Path(base_dir) if base_dir is not None else default_documents_dir()
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.last_sweep: Optional[Dict[str, Any]] = None
+        self._sweeper_task: Optional[asyncio.Task] = None
+
+    def path_for(self, prefix: str, key: str, extension: str) -> Path:
+        return self.base_dir / f"{prefix}_{key}.{extension}"
+
+    def resolve(self, filename: str) -> Optional[Path]:
+        """Path of a stored document by its public filename, or ``None``."""
+        if not _SAFE_FILENAME.match(filename):
+            return None
+        path = self.base_dir / filename
+        try:
+            if path.is_file() and not self._expired(path.stat()):
+                return path
+        except OSError:
+            pass
+        return None
+
+    def lookup(self, prefix: str, key: str, extension: str) -> Optional[Path]:
+        """Cached document for ``key``; records the hit for LRU eviction."""
+        path = self.path_for(prefix, key, extension)
+        try:
+            expired = self._expired(path.stat())
+        except OSError:
+            self.misses += 1
+            return None
+        if expired:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touch(path)
+        return path
+
+    def store(self, prefix: str, key: str, extension: str, data: bytes) -> Path:
+        """Write atomically so readers never see a partial document."""
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(prefix, key, extension)
+        # A unique temp file per call: concurrent writers of the same key
+        # (identical inputs rendered at once) never share one
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.base_dir, prefix=f"{path.name}.", suffix=_TEMP_SUFFIX
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                os.fchmod(tmp_file.fileno(), 0o644)
+                tmp_file.write(data)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return path
+
+    def touch(self, path: Path) -> None:
+        """Mark ``path`` as used now (atime) without changing its mtime/ETag."""
+        try:
+            stat_result = path.stat()
+            os.utime(path, (time.time(), stat_result.st_mtime))
+        except OSError:
+            pass
+
+    def _expired(self, stat_result: os.stat_result, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return self.ttl_seconds > 0 and now - stat_result.st_mtime > self.ttl_seconds
+
+    def sweep(self) -> Dict[str, Any]:
+        """Remove expired documents, then LRU documents beyond the size budget."""
+        now = time.time()
+        removed_expired = removed_lru = freed = 0
+        live = []
+
+        if not self.base_dir.exists():
+            return {"files": 0, "bytes": 0, "removed_expired": 0, "removed_lru": 0, "freed_bytes": 0}
+
+        for entry in os.scandir(self.base_dir):
+            if not entry.is_file():
+                continue
+            try:
+                stat_result = entry.stat()
+            except OSError:
+                continue
+            if entry.name.endswith(_TEMP_SUFFIX):
+                if now - stat_result.st_mtime > _TEMP_MAX_AGE_SECONDS:
+                    self._remove(entry.path)
+                continue
+            if self._expired(stat_result, now):
+                if self._remove(entry.path):
+                    removed_expired += 1
+                    freed += stat_result.st_size
+                continue
+            live.append((max(stat_result.st_atime, stat_result.st_mtime), stat_result.st_size, entry.path))
+
+        total = sum(size for _, size, _ in live)
+        if self.max_bytes > 0 and total > self.max_bytes:
+            live.sort()
+            while live and total > self.max_bytes:
+                _, size, path = live.pop(0)
+                if self._remove(path):
+                    removed_lru += 1
+                    freed += size
+                    total -= size
+
+        result = {
+            "files": len(live),
+            "bytes": total,
+            "removed_expired": removed_expired,
+            "removed_lru": removed_lru,
+            "freed_bytes": freed,
+        }
+        self.last_sweep = {**result, "at": now}
+        if removed_expired or removed_lru:
+            logger.info(
+                f"🧹 Generated documents: removed {removed_expired} expired and "
+                f"{removed_lru} LRU files ({freed / 1024 / 1024:.1f} MB)"
+            )
+        return result
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to remove generated document {path}: {e}")
+            return False
+
+    async def start_sweeper(self, interval_seconds: float = GENERATED_DOCUMENTS_SWEEP_INTERVAL_SECONDS) -> None:
+        """Start the background sweep loop (one per process)."""
+        if self._sweeper_task is not None and not self._sweeper_task.done():
+            return
+        self._sweeper_task = asyncio.create_task(self._sweep_loop(interval_seconds))
+        logger.info("Generated document sweeper started")
+
+    async def stop_sweeper(self) -> None:
+        if self._sweeper_task is None:
+            return
+        self._sweeper_task.cancel()
+        try:
+            await self._sweeper_task
+        except asyncio.CancelledError:
+            pass
+        self._sweeper_task = None
+
+    async def _sweep_loop(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.sweep)
+                await asyncio.sleep(interval_seconds)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Generated document sweep failed: {e}")
+                await asyncio.sleep(60)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "directory": str(self.base_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "last_sweep": self.last_sweep,
+        }
+
+
+_document_store: Optional[GeneratedDocumentStore] = None
+
+
+def get_document_store() -> GeneratedDocumentStore:
+    """Return the process-wide generated document store."""
+    global _document_store
+    if _document_store is None:
+        max_mb = GENERATED_DOCUMENTS_MAX_MB
+        ttl_hours = GENERATED_DOCUMENTS_TTL_HOURS
+        try:
+            from src.utils.config import get_settings
+
+            settings = get_settings()
+            max_mb = getattr(settings, "GENERATED_DOCUMENTS_MAX_MB", max_mb)
+            ttl_hours = getattr(settings, "GENERATED_DOCUMENTS_TTL_HOURS", ttl_hours)
+        except Exception as e:
+            logger.warning(f"Failed to load generated document settings: {e}, using defaults")
+        _document_store = GeneratedDocumentStore(
+            max_bytes=int(max_mb * 1024 * 1024), ttl_seconds=ttl_hours * 3600
+        )
+    return _document_store
+
+
+def get_sweep_interval_seconds() -> float:
+    try:
+        from src.utils.config import get_settings
+
+        return getattr(
+            get_settings(), "GENERATED_DOCUMENTS_SWEEP_INTERVAL_SECONDS", GENERATED_DOCUMENTS_SWEEP_INTERVAL_SECONDS
+        )
+    except Exception:
+        return GENERATED_DOCUMENTS_SWEEP_INTERVAL_SECONDS
@@ -15,8 +15,34 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from io import BytesIO
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from functools import lru_cache
+import copy
 import os
+import threading
+
+
+class BrandTemplates(NamedTuple):
+    """Compiled styles and static flowables shared by every document of a brand"""
+    styles: Any
+    warning_box: TableStyle
+    info_box: TableStyle
+    medication_table: TableStyle
+    disclaimer: Paragraph
+
+
+# Process-wide registry: brand (color palette) -> compiled templates
+_BRAND_TEMPLATES: Dict[Tuple[str, ...], BrandTemplates] = {}
+_BRAND_TEMPLATES_LOCK = threading.Lock()
+_FOOTER_CACHE: Dict[Tuple[Tuple[str, ...], str], Paragraph] = {}
+
+
+def clear_template_cache():
+    """Drop compiled styles and flowables (tests and benchmarks)"""
+    with _BRAND_TEMPLATES_LOCK:
+        _BRAND_TEMPLATES.clear()
+        _FOOTER_CACHE.clear()
+    _patient_education_styles.cache_clear()
 
 
 class PatientDocumentPDF:
@@ -40,9 +66,100 @@ class PatientDocumentPDF:
             leftMargin=0.75 * inch,
             rightMargin=0.75 * inch
         )
-        self.styles = self._create_styles()
+        self.templates = self._get_templates()
+        self.styles = self.templates.styles
         self.story = []
 
+    @classmethod
+    def _brand_key(cls) -> Tuple[str, ...]:
+        return tuple(
+            color.hexval() for color in (
+                cls.PRIMARY_COLOR, cls.SECONDARY_COLOR, cls.WARNING_COLOR,
+                cls.INFO_COLOR, cls.BACKGROUND_COLOR
+            )
+        )
+
+    def _get_templates(self) -> BrandTemplates:
+        """
+        Styles, table styles and the disclaimer are built once per brand and
+        shared; rebuilding getSampleStyleSheet() and a dozen ParagraphStyles
+        per document was a large share of small-document render time.
+        Styles and TableStyles are read-only during layout, so sharing is safe.
+        """
+        key = self._brand_key()
+        templates = _BRAND_TEMPLATES.get(key)
+        if templates is None:
+            with _BRAND_TEMPLATES_LOCK:
+                templates = _BRAND_TEMPLATES.get(key)
+                if templates is None:
+                    templates = self._compile_templates()
+                    _BRAND_TEMPLATES[key] = templates
+        return templates
+
+    def _compile_templates(self) -> BrandTemplates:
+        styles = self._create_styles()
+        box_padding = [
+            ('LEFTPADDING', (0, 0), (-1, -1), 10),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]
+        warning_box = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self.WARNING_COLOR),
+            ('TEXTCOLOR', (0, 0), (-1, 0), white),
+            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#FEE2E2')),
+            ('BOX', (0, 0), (-1, -1), 2, self.WARNING_COLOR),
+        ] + box_padding)
+        info_box = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self.INFO_COLOR),
+            ('TEXTCOLOR', (0, 0), (-1, 0), white),
+            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#FEF3C7')),
+            ('BOX', (0, 0), (-1, -1), 2, self.INFO_COLOR),
+        ] + box_padding)
+        medication_table = TableStyle([
+            # Header styling
+            ('BACKGROUND', (0, 0), (-1, 0), self.PRIMARY_COLOR),
+            ('TEXTCOLOR', (0, 0), (-1, 0), white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+
+            # Body styling
+            ('BACKGROUND', (0, 1), (-1, -1), white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 1, HexColor('#E5E7EB')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+
+            # Alternating row colors
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, HexColor('#F9FAFB')]),
+        ])
+        disclaimer = Paragraph(
+            "<i>This document is for educational purposes only and does not replace professional medical advice. "
+            "Always consult with your healthcare provider for medical questions or concerns.</i>",
+            styles['Footer']
+        )
+        return BrandTemplates(styles, warning_box, info_box, medication_table, disclaimer)
+
+    def _generation_info(self) -> Paragraph:
+        """Dated "Generated by" footer line, parsed once per brand per day"""
+        date = datetime.now().strftime('%B %d, %Y')
+        key = (self._brand_key(), date)
+        paragraph = _FOOTER_CACHE.get(key)
+        if paragraph is None:
+            paragraph = Paragraph(f"<i>Generated by AI Nurse Florence on {date}</i>", self.styles['Footer'])
+            with _BRAND_TEMPLATES_LOCK:
+                if len(_FOOTER_CACHE) > 64:
+                    _FOOTER_CACHE.clear()
+                _FOOTER_CACHE[key] = paragraph
+        return paragraph
+
     def _create_styles(self):
         """Create custom paragraph styles"""
         styles = getSampleStyleSheet()
@@ -171,16 +288,7 @@ class PatientDocumentPDF:
             data.append([Paragraph(f"• {item}", self.styles['CustomBody'])])
 
         table = Table(data, colWidths=[6.5 * inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.WARNING_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), white),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#FEE2E2')),
-            ('BOX', (0, 0), (-1, -1), 2, self.WARNING_COLOR),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        table.setStyle(self.templates.warning_box)
 
         self.story.append(table)
         self.story.append(Spacer(1, 0.2 * inch))
@@ -193,16 +301,7 @@ class PatientDocumentPDF:
         ]
 
         table = Table(data, colWidths=[6.5 * inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.INFO_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), white),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#FEF3C7')),
-            ('BOX', (0, 0), (-1, -1), 2, self.INFO_COLOR),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        table.setStyle(self.templates.info_box)
 
         self.story.append(table)
         self.story.append(Spacer(1, 0.2 * inch))
@@ -227,30 +326,7 @@ class PatientDocumentPDF:
             ])
 
         table = Table(data, colWidths=[2 * inch, 1.2 * inch, 1.5 * inch, 1.8 * inch])
-        table.setStyle(TableStyle([
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), self.PRIMARY_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-
-            # Body styling
-            ('BACKGROUND', (0, 1), (-1, -1), white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#E5E7EB')),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, HexColor('#F9FAFB')]),
-        ]))
+        table.setStyle(self.templates.medication_table)
 
         self.story.append(table)
         self.story.append(Spacer(1, 0.2 * inch))
@@ -259,14 +335,9 @@ class PatientDocumentPDF:
         """Add footer disclaimer"""
         self.story.append(Spacer(1, 0.3 * inch))
 
-        disclaimer = (
-            "<i>This document is for educational purposes only and does not replace professional medical advice. "
-            "Always consult with your healthcare provider for medical questions or concerns.</i>"
-        )
-        self.story.append(Paragraph(disclaimer, self.styles['Footer']))
-
-        generation_info = f"<i>Generated by AI Nurse Florence on {datetime.now().strftime('%B %d, %Y')}</i>"
-        self.story.append(Paragraph(generation_info, self.styles['Footer']))
+        # Shallow copies share the parsed text; layout state stays per document
+        self.story.append(copy.copy(self.templates.disclaimer))
+        self.story.append(copy.copy(self._generation_info()))
 
     def build_pdf(self) -> BytesIO:
         """Build the PDF and return as BytesIO"""
@@ -513,6 +584,118 @@ def generate_disease_education(data: Dict[str, Any]) -> BytesIO:
     return pdf.generate(data)
 
 
+@lru_cache(maxsize=1)
+def _patient_education_styles():
+    """Style sheet for generate_patient_education, built once per process"""
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontSize=24,
+        textColor=HexColor("#1E40AF"),
+        spaceAfter=30,
+    )
+    heading_style = ParagraphStyle(
+        "CustomHeading",
+        parent=styles["Heading2"],
+        fontSize=16,
+        textColor=HexColor("#2563EB"),
+        spaceAfter=12,
+        spaceBefore=20,
+    )
+    body_style = ParagraphStyle(
+        "CustomBody", parent=styles["BodyText"], fontSize=12, leading=18, spaceAfter=12
+    )
+    warning_style = ParagraphStyle(
+        "Warning",
+        parent=styles["BodyText"],
+        fontSize=12,
+        leading=18,
+        textColor=HexColor("#DC2626"),
+        leftIndent=20,
+        spaceAfter=12,
+    )
+    return styles, title_style, heading_style, body_style, warning_style
+
+
+def generate_patient_education(data: Dict[str, Any]) -> BytesIO:
+    """
+    Helper function to generate a content-library patient education PDF
+
+    ``data`` holds ``content`` (title, diagnosis_name, sections),
+    ``patient_name`` and ``language``.
+    """
+    content = data["content"]
+    patient_name = data.get("patient_name", "")
+
+    # Create PDF
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72,
+    )
+
+    styles, title_style, heading_style, body_style, warning_style = _patient_education_styles()
+
+    # Build PDF content
+    story = []
+
+    # Header
+    story.append(Paragraph(content["title"], title_style))
+    story.append(Paragraph(f"<b>Patient:</b> {patient_name}", body_style))
+    story.append(
+        Paragraph(f"<b>Diagnosis:</b> {content['diagnosis_name']}", body_style)
+    )
+    story.append(Spacer(1, 0.3 * inch))
+
+    # Sections
+    for section in content["sections"]:
+        # Section title
+        story.append(Paragraph(section["title"], heading_style))
+
+        # Section content
+        if section.get("content"):
+            style = warning_style if section.get("style") == "warning" else body_style
+            story.append(Paragraph(section["content"], style))
+
+        # Bullet points
+        if section.get("bullet_points"):
+            for point in section["bullet_points"]:
+                story.append(Paragraph(f"• {point}", body_style))
+
+        # Resources
+        if section.get("resources"):
+            for resource in section["resources"]:
+                story.append(
+                    Paragraph(
+                        f"• <b>{resource['title']}</b><br/>"
+                        f"  {resource['url']}<br/>"
+                        f"  <i>Source: {resource['source']}</i>",
+                        body_style,
+                    )
+                )
+
+        story.append(Spacer(1, 0.2 * inch))
+
+    # Footer
+    story.append(Spacer(1, 0.5 * inch))
+    story.append(
+        Paragraph(
+            f"<i>Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</i>",
+            styles["Normal"],
+        )
+    )
+
+    # Build PDF
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+
 # ============================================================================
 # Word (DOCX) and Text Generation Functions
 # ============================================================================
@@ -1,12 +1,18 @@
 """
 Database session management for synchronous database operations
 Used by routers that need SQLAlchemy ORM access
+
+The Session here is blocking. Routes that only touch the database should be
+plain ``def`` handlers so FastAPI runs them in its threadpool; routes that must
+stay ``async def`` (because they also await other services) should wrap their
+Session work in ``run_db`` instead of calling it on the event loop.
 """
 
 import os
-from typing import Generator
+from typing import Any, Callable, Generator, TypeVar
 
 from sqlalchemy import create_engine
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session, sessionmaker
 
 # Use DATABASE_URL from environment (PostgreSQL) or fall back to SQLite
@@ -35,6 +41,8 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+T = TypeVar("T")
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -52,4 +60,18 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-__all__ = ["get_db", "engine", "SessionLocal"]
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run blocking Session work in the threadpool from an async route.
+
+    Usage in FastAPI:
+        @router.post("/endpoint")
+        async def my_endpoint(db: Session = Depends(get_db)):
+            item = await run_db(lambda: db.query(Item).filter_by(id=1).first())
+            summary = await some_ai_service(item)
+            ...
+    """
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+__all__ = ["get_db", "run_db", "engine", "SessionLocal"]
@@ -11,11 +11,12 @@ from typing import Optional, List, Dict, Any, AsyncGenerator
 import uuid
 import os
 
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, JSON, Index
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func, case, and_, distinct
+from sqlalchemy.sql import Select
 from sqlalchemy.exc import IntegrityError
 
 logger = logging.getLogger(__name__)
@@ -25,8 +26,12 @@ Base = declarative_base()
 
 # Global database connection
 engine = None
+read_engine = None  # Optional read replica for reference lookups
 SessionLocal = None
 
+# Rows per bulk UPDATE/DELETE statement during session cleanup
+SESSION_CLEANUP_CHUNK_SIZE = 1000
+
 # Database Models
 class User(Base):
     """User model for authentication and profile management."""
@@ -94,6 +99,13 @@ class UserSession(Base):
     expires_at = Column(DateTime, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     
+    # Cleanup filters on expires_at (and is_active); per-user trimming orders
+    # by created_at. Created by alembic revision 7b2e4c9d1a35.
+    __table_args__ = (
+        Index("ix_user_sessions_expires_at_is_active", "expires_at", "is_active"),
+        Index("ix_user_sessions_user_id_created_at", "user_id", "created_at"),
+    )
+    
     def __repr__(self):
         return f"<UserSession(id={self.id}, user_id={self.user_id}, active={self.is_active})>"
 
@@ -315,37 +327,109 @@ class Medication(Base):
         return f"<Medication(name={self.name}, generic={self.generic_name}, is_brand={self.is_brand})>"
 
 # Database Connection Management
+
+# Read-only reference tables that may be served from the read replica
+READ_REPLICA_MODELS = (DiseaseAlias, DiseaseOntology, Medication)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reference-table SELECTs to the read replica.
+
+    Plain reads of READ_REPLICA_MODELS go to ``read_engine`` when one is
+    configured; everything else (writes, flushes, other tables, and reads in a
+    session with pending changes) stays on the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            read_engine is not None
+            and mapper is not None
+            and mapper.class_ in READ_REPLICA_MODELS
+            and isinstance(clause, Select)
+            and not self._flushing
+            and not (self.new or self.dirty or self.deleted)
+        ):
+            return read_engine.sync_engine
+        return engine.sync_engine
+
+
+def _to_async_url(database_url: str) -> str:
+    """Convert a sync database URL to its async driver equivalent."""
+    if database_url.startswith("sqlite:"):
+        return database_url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if database_url.startswith("postgresql:"):
+        return database_url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    if database_url.startswith("postgres:"):
+        return database_url.replace("postgres:", "postgresql+asyncpg:", 1)
+    return database_url
+
+
+def _engine_options(database_url: str, settings: Any = None) -> Dict[str, Any]:
+    """Build create_async_engine options from DB_* settings.
+
+    Pool sizing only applies to server databases; SQLite keeps SQLAlchemy's
+    default pool. asyncpg gets a prepared statement cache of
+    DB_STATEMENT_CACHE_SIZE (0 disables it, as pgbouncer transaction
+    pooling requires).
+    """
+    options: Dict[str, Any] = {"echo": False, "future": True}
+    if database_url.startswith("sqlite"):
+        return options
+
+    options.update(
+        pool_size=getattr(settings, "DB_POOL_SIZE", 5),
+        max_overflow=getattr(settings, "DB_MAX_OVERFLOW", 10),
+        pool_timeout=getattr(settings, "DB_POOL_TIMEOUT", 30),
+        pool_recycle=getattr(settings, "DB_POOL_RECYCLE", 1800),
+        pool_pre_ping=getattr(settings, "DB_POOL_PRE_PING", True),
+    )
+
+    if "+asyncpg" in database_url:
+        cache_size = getattr(settings, "DB_STATEMENT_CACHE_SIZE", 100)
+        connect_args: Dict[str, Any] = {"prepared_statement_cache_size": cache_size}
+        if cache_size == 0:
+            # Also disable asyncpg's own cache so pgbouncer never sees named statements
+            connect_args["statement_cache_size"] = 0
+        options["connect_args"] = connect_args
+
+    return options
+
+
 async def init_database():
     """Initialize database connection and create tables."""
-    global engine, SessionLocal
+    global engine, read_engine, SessionLocal
     
+    settings = None
     try:
         # Try to import config
         try:
             from src.utils.config import get_settings
             settings = get_settings()
             database_url = settings.DATABASE_URL
+            replica_url = settings.DATABASE_READ_REPLICA_URL
         except:
             # Fallback to environment variable or default
             database_url = os.getenv("DATABASE_URL", "sqlite:///./ai_nurse_florence.db")
+            replica_url = os.getenv("DATABASE_READ_REPLICA_URL")
         
         # Convert to async URLs
-        if database_url.startswith("sqlite:"):
-            database_url = database_url.replace("sqlite:", "sqlite+aiosqlite:")
-        elif database_url.startswith("postgresql:"):
-            database_url = database_url.replace("postgresql:", "postgresql+asyncpg:")
+        database_url = _to_async_url(database_url)
         
         logger.info(f"🔄 Initializing database...")
         
-        engine = create_async_engine(
-            database_url,
-            echo=False,
-            future=True
-        )
+        engine = create_async_engine(database_url, **_engine_options(database_url, settings))
+        
+        read_engine = None
+        if replica_url:
+            replica_url = _to_async_url(replica_url)
+            read_engine = create_async_engine(replica_url, **_engine_options(replica_url, settings))
+            logger.info("📖 Read replica configured for reference lookups")
         
         SessionLocal = async_sessionmaker(
             engine,
             class_=AsyncSession,
+            sync_session_class=RoutingSession,
             expire_on_commit=False
         )
         
@@ -362,7 +446,13 @@ async def init_database():
         try:
             database_url = "sqlite+aiosqlite:///./ai_nurse_florence.db"
             engine = create_async_engine(database_url, echo=False)
-            SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            read_engine = None
+            SessionLocal = async_sessionmaker(
+                engine,
+                class_=AsyncSession,
+                sync_session_class=RoutingSession,
+                expire_on_commit=False
+            )
             
             async with engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
@@ -392,7 +482,10 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 async def close_database():
     """Close database connections."""
-    global engine
+    global engine, read_engine
+    if read_engine:
+        await read_engine.dispose()
+        read_engine = None
     if engine:
         await engine.dispose()
         logger.info("Database connections closed")
@@ -630,93 +723,106 @@ class UserDatabase:
     # Phase 3.4.4: Session Cleanup Methods
     
     @staticmethod
-    async def cleanup_expired_sessions(cutoff_time: datetime) -> int:
+    async def cleanup_expired_sessions(cutoff_time: datetime, chunk_size: int = SESSION_CLEANUP_CHUNK_SIZE) -> int:
         """
         Clean up expired sessions from the database.
         
+        Deletes with set-based ``DELETE ... WHERE expires_at < :cutoff``
+        statements of at most ``chunk_size`` rows, committing between chunks
+        so a large backlog never holds one long write lock.
+        
         Args:
             cutoff_time: Sessions older than this will be removed
+            chunk_size: Maximum rows deleted per statement
             
         Returns:
             Number of sessions removed
         """
-        async for session in get_db_session():
-            try:
-                # Delete expired sessions
-                result = await session.execute(
-                    delete(UserSession).where(
-                        UserSession.expires_at < cutoff_time
-                    )
-                )
-                deleted_count = result.rowcount
-                await session.commit()
-                
-                logger.info(f"✅ Cleaned up {deleted_count} expired sessions")
-                return deleted_count
-                
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Failed to cleanup expired sessions: {e}")
-                return 0
+        expired_ids = (
+            select(UserSession.id)
+            .where(UserSession.expires_at < cutoff_time)
+            .limit(chunk_size)
+        )
+        statement = (
+            delete(UserSession)
+            .where(UserSession.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+        deleted_count = await _run_chunked(statement, chunk_size, "delete expired sessions")
+        if deleted_count:
+            logger.info(f"✅ Cleaned up {deleted_count} expired sessions")
+        return deleted_count
+    
+    @staticmethod
+    async def deactivate_expired_sessions(now: Optional[datetime] = None, chunk_size: int = SESSION_CLEANUP_CHUNK_SIZE) -> int:
+        """
+        Mark sessions past ``expires_at`` as inactive, in chunked bulk UPDATEs.
         
-        # Fallback return if no session available
-        return 0
+        Returns:
+            Number of sessions deactivated
+        """
+        now = now or datetime.utcnow()
+        stale_ids = (
+            select(UserSession.id)
+            .where(UserSession.expires_at < now, UserSession.is_active == True)
+            .limit(chunk_size)
+        )
+        statement = (
+            update(UserSession)
+            .where(UserSession.id.in_(stale_ids))
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        return await _run_chunked(statement, chunk_size, "deactivate expired sessions")
     
     @staticmethod
     async def get_session_stats() -> Dict[str, Any]:
         """
         Get comprehensive session statistics.
         
+        All counts come from a single aggregate query (conditional sums
+        over the table) instead of loading every session row.
+        
         Returns:
             Dictionary with session statistics
         """
+        stats: Optional[Dict[str, Any]] = None
         async for session in get_db_session():
             try:
-                # Total sessions
-                total_result = await session.execute(
-                    select(UserSession).where(UserSession.id.isnot(None))
-                )
-                total_sessions = len(total_result.scalars().all())
-                
-                # Active sessions (not expired and is_active=True)
-                active_result = await session.execute(
-                    select(UserSession).where(
-                        UserSession.is_active == True,
-                        UserSession.expires_at > datetime.utcnow()
-                    )
-                )
-                active_sessions = len(active_result.scalars().all())
-                
-                # Expired sessions
-                expired_result = await session.execute(
-                    select(UserSession).where(
-                        UserSession.expires_at <= datetime.utcnow()
+                now = datetime.utcnow()
+                is_live = and_(UserSession.is_active == True, UserSession.expires_at > now)
+                result = await session.execute(
+                    select(
+                        func.count(UserSession.id),
+                        func.sum(case((is_live, 1), else_=0)),
+                        func.sum(case((UserSession.expires_at <= now, 1), else_=0)),
+                        func.count(distinct(UserSession.user_id)),
                     )
                 )
-                expired_sessions = len(expired_result.scalars().all())
-                
-                # Sessions by user count
-                users_with_sessions_result = await session.execute(
-                    select(UserSession.user_id).distinct()
-                )
-                users_with_sessions = len(users_with_sessions_result.scalars().all())
+                total_sessions, active_sessions, expired_sessions, users_with_sessions = result.one()
+                total_sessions = total_sessions or 0
+                active_sessions = active_sessions or 0
                 
-                return {
+                stats = {
                     "total_sessions": total_sessions,
                     "active_sessions": active_sessions,
-                    "expired_sessions": expired_sessions,
+                    "expired_sessions": expired_sessions or 0,
                     "inactive_sessions": total_sessions - active_sessions,
-                    "users_with_sessions": users_with_sessions,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "users_with_sessions": users_with_sessions or 0,
+                    "timestamp": now.isoformat()
                 }
                 
             except Exception as e:
                 logger.error(f"Failed to get session statistics: {e}")
-                return {
+                stats = {
                     "error": str(e),
                     "timestamp": datetime.utcnow().isoformat()
                 }
         
+        # Returning after the loop lets get_db_session() close its session
+        if stats is not None:
+            return stats
+        
         # Fallback return if no session available
         return {
             "error": "Database session not available",
@@ -728,6 +834,9 @@ class UserDatabase:
         """
         Clean up excess sessions for a user, keeping only the most recent.
         
+        One DELETE keyed on the (user_id, created_at) index; no rows are
+        loaded into Python.
+        
         Args:
             user_id: User to clean up sessions for
             max_sessions: Maximum sessions to keep per user
@@ -735,39 +844,48 @@ class UserDatabase:
         Returns:
             Number of sessions removed
         """
+        deleted_count = 0
         async for session in get_db_session():
             try:
-                # Get all active sessions for user, ordered by creation time (newest first)
-                result = await session.execute(
-                    select(UserSession)
+                newest_ids = (
+                    select(UserSession.id)
                     .where(UserSession.user_id == user_id)
                     .order_by(UserSession.created_at.desc())
+                    .limit(max_sessions)
                 )
-                user_sessions = result.scalars().all()
-                
-                if len(user_sessions) <= max_sessions:
-                    return 0  # No cleanup needed
-                
-                # Keep the most recent sessions, delete the rest
-                sessions_to_delete = user_sessions[max_sessions:]
-                session_ids = [s.id for s in sessions_to_delete]
-                
                 delete_result = await session.execute(
-                    delete(UserSession).where(UserSession.id.in_(session_ids))
+                    delete(UserSession)
+                    .where(UserSession.user_id == user_id, UserSession.id.not_in(newest_ids))
+                    .execution_options(synchronize_session=False)
                 )
-                deleted_count = delete_result.rowcount
+                deleted_count = delete_result.rowcount or 0
                 await session.commit()
                 
-                logger.info(f"✅ Cleaned up {deleted_count} excess sessions for user {user_id}")
-                return deleted_count
-                
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Failed to cleanup excess sessions for user {user_id}: {e}")
-                return 0
         
-        # Fallback return if no session available
-        return 0
+        if deleted_count:
+            logger.info(f"✅ Cleaned up {deleted_count} excess sessions for user {user_id}")
+        return deleted_count
+
+
+async def _run_chunked(statement: Any, chunk_size: int, description: str) -> int:
+    """Execute a LIMIT-bounded bulk statement until it affects fewer than ``chunk_size`` rows."""
+    total = 0
+    async for session in get_db_session():
+        try:
+            while True:
+                result = await session.execute(statement)
+                await session.commit()
+                affected = result.rowcount or 0
+                total += affected
+                if affected < chunk_size:
+                    break
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Failed to {description}: {e}")
+    return total
 
 class SessionDatabase:
     """Database operations for user sessions."""
@@ -822,8 +940,16 @@ class SessionDatabase:
                 )
                 await session.commit()
                 logger.info(f"✅ Session invalidated: {session_token[:8]}...")
-                return True
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Failed to invalidate session: {e}")
                 return False
+
+            # Drop cached verified tokens for this session on every worker
+            try:
+                from src.utils.token_cache import revoke_session
+
+                await revoke_session(session_token)
+            except Exception as e:
+                logger.warning(f"⚠️ Session token revocation failed: {e}")
+            return True
@@ -15,8 +15,8 @@ from pydantic import BaseModel, EmailStr, Field
 # Import utilities following conditional imports pattern
 try:
     from src.utils.auth_enhanced import (
-        hash_password, verify_password, validate_password, 
-        create_user_session, refresh_access_token, extract_user_id_from_token
+        hash_password_async, verify_password_async, verify_and_update_password_async,
+        validate_password, create_user_session, refresh_access_token, extract_user_id_from_token
     )
     from src.utils.auth_dependencies import get_current_user, security
     from src.utils.api_responses import create_success_response, create_error_response
@@ -30,12 +30,15 @@ except ImportError as e:
     _has_database = False
     
     # Mock functions with proper signatures matching the real ones
-    def hash_password(password: str) -> str:
+    async def hash_password_async(password: str) -> str:
         return "mock_hash"
     
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
         return True
     
+    async def verify_and_update_password_async(plain_password: str, hashed_password: str):
+        return True, None
+    
     def validate_password(password: str) -> Dict[str, Any]:
         return {"is_valid": True, "errors": []}
     
@@ -263,12 +266,17 @@ async def login_user(user_data: UserLogin):
                     status_code=status.HTTP_401_UNAUTHORIZED
                 )
             
-            # Verify password 
-            if not verify_password(user_data.password, user_obj.password_hash):
+            # Verify password (off the event loop), upgrading outdated hashes
+            is_valid, new_hash = await verify_and_update_password_async(
+                user_data.password, user_obj.password_hash
+            )
+            if not is_valid:
                 return create_error_response(
                     message="Invalid credentials",
                     status_code=status.HTTP_401_UNAUTHORIZED
                 )
+            if new_hash:
+                await UserDatabase.update_user(user_obj.id, {"password_hash": new_hash})
             
             # Check if user is active
             if not user_obj.is_active:
@@ -424,7 +432,7 @@ async def change_password(
                 )
             
             # Verify current password
-            if not verify_password(password_data.current_password, user_obj.password_hash):
+            if not await verify_password_async(password_data.current_password, user_obj.password_hash):
                 return create_error_response(
                     message="Current password is incorrect",
                     status_code=status.HTTP_401_UNAUTHORIZED
@@ -440,7 +448,7 @@ async def change_password(
                 )
             
             # Update password in database
-            new_password_hash = hash_password(password_data.new_password)
+            new_password_hash = await hash_password_async(password_data.new_password)
             await UserDatabase.update_user(user_id, {
                 "password_hash": new_password_hash,
                 "password_changed_at": datetime.utcnow()
@@ -297,19 +297,12 @@ async def get_cache_performance(
         if _has_smart_cache and smart_cache_manager:
             # Get metrics from the specified time period
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-            recent_metrics = [
-                m for m in smart_cache_manager.metrics_history 
-                if m.timestamp > cutoff_time
-            ]
+            recent = smart_cache_manager.get_recent_performance(cutoff_time)
             
             performance = {
                 "time_period_hours": hours,
-                "total_requests": len(recent_metrics),
-                "cache_hits": sum(1 for m in recent_metrics if m.hit),
-                "cache_misses": sum(1 for m in recent_metrics if not m.hit),
-                "hit_rate": sum(1 for m in recent_metrics if m.hit) / len(recent_metrics) if recent_metrics else 0,
-                "avg_response_time_ms": sum(m.response_time_ms for m in recent_metrics) / len(recent_metrics) if recent_metrics else 0,
-                "metrics_count": len(recent_metrics)
+                **recent,
+                "metrics_count": recent["total_requests"]
             }
         else:
             # Mock performance data
@@ -389,6 +382,42 @@ async def clear_cache(
             details={"error": str(e)}
         )
 
+@router.delete(
+    "/ai-generations",
+    summary="Invalidate cached AI generations",
+    description="Retire cached AI generations for one prompt template (or all) after a prompt change"
+)
+async def invalidate_ai_generations(
+    template: Optional[str] = Query(
+        None,
+        description="Template to invalidate (patient_education, sbar_report, discharge_instructions, fda_label_simplification); all if omitted",
+    ),
+    current_user: Dict[str, Any] = Depends(require_admin_role)
+):
+    """
+    Invalidate the AI generation cache for a prompt template.
+    Requires admin role. Other workers pick the change up within a second.
+    """
+    try:
+        from src.utils.ai_generation_cache import get_ai_generation_cache
+
+        templates = await get_ai_generation_cache().invalidate_template(template)
+
+        return create_success_response({
+            "message": "AI generation cache invalidated",
+            "templates": templates,
+            "invalidated_by": current_user["user_id"],
+            "timestamp": datetime.utcnow().isoformat(),
+            "educational_notice": "For educational purposes only - not medical advice. No PHI stored."
+        })
+
+    except Exception as e:
+        return create_error_response(
+            message="AI generation cache invalidation failed",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            details={"error": str(e)}
+        )
+
 # Test endpoint for cache monitoring functionality
 @router.get(
     "/test",
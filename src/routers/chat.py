@@ -6,12 +6,14 @@ This router handles the main chat functionality for the frontend interface.
 """
 
 from datetime import datetime
-from typing import Optional
-from fastapi import APIRouter, HTTPException, status
+from typing import Any, AsyncIterator, Dict, Literal, Optional
+from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
+from src.utils.config import get_educational_banner
 from src.utils.logging import get_logger
 from src.utils.api_responses import create_success_response, create_error_response
+from src.utils.streaming import event_stream_response
 
 # Conditional imports pattern
 try:
@@ -38,11 +40,68 @@ except ImportError:
     async def translate_text(text: str, target_language: str, source_language: str = "en", context: str = "medical"):
         return {"translated_text": text, "success": False}
 
+try:
+    from src.services.ai_service import ai_service
+    _has_ai_service = True
+except ImportError:
+    _has_ai_service = False
+    ai_service = None
+
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="", tags=["chat"])  # No prefix so it's directly under /api/v1
 
 
+CLINICAL_SYSTEM_PROMPT = """You are AI Nurse Florence, a clinical decision support assistant for healthcare professionals.
+
+Provide evidence-based, educational responses that help with:
+- Clinical assessment and care planning
+- Medication safety and administration
+- Emergency protocols and procedures  
+- Patient education and communication
+- Documentation and reporting
+
+Always include:
+- Clear, actionable guidance
+- Evidence-based recommendations
+- Appropriate safety considerations
+- References to protocols when relevant"""
+
+
+def _fallback_response(message: str) -> str:
+    """Canned clinical guidance used when no AI provider is available."""
+    fallback_responses = {
+        "sepsis": "**Sepsis Recognition Protocol:**\n\n1. **Quick SOFA (qSOFA) Assessment:**\n   - Altered mental status (GCS < 15)\n   - Systolic BP ≤ 100 mmHg\n   - Respiratory rate ≥ 22/min\n\n2. **SIRS Criteria:**\n   - Temperature >38°C or <36°C\n   - Heart rate >90 bpm\n   - Respiratory rate >20/min\n   - WBC >12,000 or <4,000\n\n3. **Immediate Actions:**\n   - Obtain blood cultures before antibiotics\n   - Start broad-spectrum antibiotics within 1 hour\n   - Fluid resuscitation 30ml/kg crystalloid\n   - Reassess vital signs frequently\n\n**Always follow your institution's sepsis protocol and notify physician immediately.**",
+        
+        "medication": "**Medication Safety Guidelines:**\n\n1. **Five Rights:**\n   - Right patient\n   - Right medication\n   - Right dose\n   - Right route\n   - Right time\n\n2. **Before Administration:**\n   - Verify orders and allergies\n   - Check drug interactions\n   - Calculate doses carefully\n   - Use two patient identifiers\n\n3. **High-Alert Medications:**\n   - Double-check calculations\n   - Use smart pumps when available\n   - Have second nurse verify\n\n**Always consult pharmacy for complex calculations or unfamiliar medications.**",
+        
+        "assessment": "**Clinical Assessment Framework:**\n\n1. **Primary Survey (ABCDE):**\n   - Airway\n   - Breathing\n   - Circulation\n   - Disability (neurologic)\n   - Exposure/Environmental\n\n2. **Vital Signs:**\n   - Blood pressure\n   - Heart rate and rhythm\n   - Respiratory rate and quality\n   - Temperature\n   - Oxygen saturation\n   - Pain level\n\n3. **System-Specific Assessment:**\n   - Cardiovascular\n   - Pulmonary\n   - Neurologic\n   - Gastrointestinal\n   - Genitourinary\n   - Musculoskeletal\n\n**Document thoroughly and report significant changes immediately.**"
+    }
+    
+    # Simple keyword matching for fallback
+    message_lower = message.lower()
+    for keyword, response in fallback_responses.items():
+        if keyword in message_lower:
+            return response
+
+    return f"""**Clinical Guidance for: "{message}"**
+
+I'd be happy to help with your clinical question. For specific guidance, please provide more details about:
+
+- Patient population or scenario
+- Specific clinical concerns
+- Type of guidance needed (assessment, intervention, education)
+
+**Common Clinical Topics I Can Help With:**
+- Emergency assessment protocols
+- Medication safety and administration
+- Care planning and documentation
+- Patient education strategies
+- Clinical decision-making frameworks
+
+Always follow your institution's protocols and consult with physicians for patient-specific decisions."""
+
+
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
     message: str = Field(..., description="The clinical query or message", min_length=1, max_length=2000)
@@ -106,26 +165,10 @@ async def clinical_chat(request: ChatRequest) -> ChatResponse:
             client = get_openai_client()
             if client:
                 try:
-                    # Create clinical context prompt
-                    system_prompt = """You are AI Nurse Florence, a clinical decision support assistant for healthcare professionals.
-
-Provide evidence-based, educational responses that help with:
-- Clinical assessment and care planning
-- Medication safety and administration
-- Emergency protocols and procedures  
-- Patient education and communication
-- Documentation and reporting
-
-Always include:
-- Clear, actionable guidance
-- Evidence-based recommendations
-- Appropriate safety considerations
-- References to protocols when relevant"""
-
                     response = client.chat.completions.create(
                         model="gpt-4o-mini",
                         messages=[
-                            {"role": "system", "content": system_prompt},
+                            {"role": "system", "content": CLINICAL_SYSTEM_PROMPT},
                             {"role": "user", "content": enhanced_message}
                         ],
                         max_tokens=1000,
@@ -160,40 +203,7 @@ Always include:
                     # Fall through to fallback response
         
         # Fallback response for development/testing
-        fallback_responses = {
-            "sepsis": "**Sepsis Recognition Protocol:**\n\n1. **Quick SOFA (qSOFA) Assessment:**\n   - Altered mental status (GCS < 15)\n   - Systolic BP ≤ 100 mmHg\n   - Respiratory rate ≥ 22/min\n\n2. **SIRS Criteria:**\n   - Temperature >38°C or <36°C\n   - Heart rate >90 bpm\n   - Respiratory rate >20/min\n   - WBC >12,000 or <4,000\n\n3. **Immediate Actions:**\n   - Obtain blood cultures before antibiotics\n   - Start broad-spectrum antibiotics within 1 hour\n   - Fluid resuscitation 30ml/kg crystalloid\n   - Reassess vital signs frequently\n\n**Always follow your institution's sepsis protocol and notify physician immediately.**",
-            
-            "medication": "**Medication Safety Guidelines:**\n\n1. **Five Rights:**\n   - Right patient\n   - Right medication\n   - Right dose\n   - Right route\n   - Right time\n\n2. **Before Administration:**\n   - Verify orders and allergies\n   - Check drug interactions\n   - Calculate doses carefully\n   - Use two patient identifiers\n\n3. **High-Alert Medications:**\n   - Double-check calculations\n   - Use smart pumps when available\n   - Have second nurse verify\n\n**Always consult pharmacy for complex calculations or unfamiliar medications.**",
-            
-            "assessment": "**Clinical Assessment Framework:**\n\n1. **Primary Survey (ABCDE):**\n   - Airway\n   - Breathing\n   - Circulation\n   - Disability (neurologic)\n   - Exposure/Environmental\n\n2. **Vital Signs:**\n   - Blood pressure\n   - Heart rate and rhythm\n   - Respiratory rate and quality\n   - Temperature\n   - Oxygen saturation\n   - Pain level\n\n3. **System-Specific Assessment:**\n   - Cardiovascular\n   - Pulmonary\n   - Neurologic\n   - Gastrointestinal\n   - Genitourinary\n   - Musculoskeletal\n\n**Document thoroughly and report significant changes immediately.**"
-        }
-        
-        # Simple keyword matching for fallback
-        message_lower = request.message.lower()
-        response_text = None
-        
-        for keyword, response in fallback_responses.items():
-            if keyword in message_lower:
-                response_text = response
-                break
-        
-        if not response_text:
-            response_text = f"""**Clinical Guidance for: "{request.message}"**
-
-I'd be happy to help with your clinical question. For specific guidance, please provide more details about:
-
-- Patient population or scenario
-- Specific clinical concerns
-- Type of guidance needed (assessment, intervention, education)
-
-**Common Clinical Topics I Can Help With:**
-- Emergency assessment protocols
-- Medication safety and administration
-- Care planning and documentation
-- Patient education strategies
-- Clinical decision-making frameworks
-
-Always follow your institution's protocols and consult with physicians for patient-specific decisions."""
+        response_text = _fallback_response(request.message)
 
         # Translate fallback response if needed
         if request.language and request.language.lower() != "en":
@@ -222,6 +232,122 @@ Always follow your institution's protocols and consult with physicians for patie
         )
 
 
+@router.post("/chat/stream",
+    summary="Clinical Chat (streaming)",
+    description="""
+    Same as `/chat`, but sends the answer while it is being generated.
+
+    `format=sse` (default) returns server-sent events, `format=ndjson` one JSON
+    object per line. Events, in order:
+    - `start`: language, timestamp and educational banner
+    - `delta`: a chunk of response text (repeated)
+    - `done`: provider, model, token usage, time to first token and latency
+    - `error`: generation stopped early (replaces `done`)
+    """
+)
+async def clinical_chat_stream(
+    request: ChatRequest,
+    stream_format: Literal["sse", "ndjson"] = Query("sse", alias="format"),
+):
+    """Stream a clinical chat response token by token."""
+    logger.info(f"Clinical chat stream request: {request.message[:100]}...")
+    return event_stream_response(_chat_events(request), stream_format)
+
+
+async def _chat_events(request: ChatRequest) -> AsyncIterator[Dict[str, Any]]:
+    """Events for one streamed chat answer (see ``clinical_chat_stream``)."""
+    banner = get_educational_banner()
+    translate = bool(
+        request.language and request.language.lower() != "en" and _has_translation
+    )
+    yield {
+        "type": "start",
+        "language": request.language,
+        "timestamp": datetime.utcnow().isoformat(),
+        "educational_banner": banner,
+    }
+
+    # Vague queries get a clarification question instead of a generation
+    if _has_prompt_enhancement:
+        enhanced_message, needs_clarification, clarification_question = enhance_prompt(
+            request.message, request.context or "clinical"
+        )
+        if needs_clarification:
+            yield {
+                "type": "delta",
+                "text": f"I need a bit more information to provide the best clinical guidance. {clarification_question}",
+            }
+            yield {"type": "done", "provider_used": None, "educational_banner": banner}
+            return
+    else:
+        enhanced_message = request.message
+
+    if _has_ai_service:
+        events = ai_service.stream_response(enhanced_message, context=CLINICAL_SYSTEM_PROMPT)
+        if translate:
+            events = _translate_stream(events, request.language)
+        sent_text = False
+        providers_failed = False
+        async for event in events:
+            if event["type"] == "error" and not sent_text:
+                logger.warning(f"AI streaming unavailable: {event.get('error')}")
+                providers_failed = True
+                break
+            if event["type"] == "delta":
+                sent_text = True
+            else:
+                event["educational_banner"] = banner
+            yield event
+        if not providers_failed:
+            return
+
+    # Fallback response for development/testing
+    response_text = _fallback_response(request.message)
+    if translate:
+        translation_result = await translate_text(
+            response_text,
+            target_language=request.language,
+            source_language="en",
+            context="clinical"
+        )
+        if translation_result.get("success"):
+            response_text = translation_result.get("translated_text")
+    yield {"type": "delta", "text": response_text}
+    yield {"type": "done", "provider_used": "fallback", "educational_banner": banner}
+
+
+async def _translate_stream(
+    events: AsyncIterator[Dict[str, Any]], language: str
+) -> AsyncIterator[Dict[str, Any]]:
+    """Translate streamed text a paragraph at a time as each one completes."""
+    buffer = ""
+
+    async def translated(text: str) -> Dict[str, Any]:
+        # Keep the paragraph break out of the translated segment
+        segment = text.rstrip()
+        result = await translate_text(
+            segment, target_language=language, source_language="en", context="clinical"
+        )
+        if result.get("success"):
+            segment = result.get("translated_text")
+        return {"type": "delta", "text": segment + text[len(text.rstrip()):]}
+
+    async for event in events:
+        if event["type"] != "delta":
+            if buffer.strip():
+                yield await translated(buffer)
+            buffer = ""
+            yield event
+            continue
+        buffer += event["text"]
+        paragraph_end = buffer.rfind("\n\n")
+        if paragraph_end != -1:
+            paragraphs, buffer = buffer[: paragraph_end + 2], buffer[paragraph_end + 2 :]
+            yield await translated(paragraphs)
+    if buffer.strip():
+        yield await translated(buffer)
+
+
 @router.get("/chat/health",
     summary="Chat Health Check",
     description="Health check for chat functionality"
@@ -234,5 +360,6 @@ async def chat_health():
         "openai_available": _has_openai,
         "prompt_enhancement_available": _has_prompt_enhancement,
         "translation_available": _has_translation,
+        "streaming_available": _has_ai_service,
         "timestamp": datetime.utcnow().isoformat()
     }
@@ -7,7 +7,10 @@ from fastapi import APIRouter, Query, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 
-from ..services.clinical_trials_service import search_clinical_trials
+from ..services.clinical_trials_service import (
+    search_clinical_trials,
+    search_trials_near,
+)
 from ..utils.config import get_educational_banner
 
 router = APIRouter(
@@ -29,6 +32,7 @@ class ClinicalTrialsResponse(BaseModel):
     trials: Optional[List[Dict[str, Any]]] = None
     sources: Optional[List[str]] = None
     needs_clarification: Optional[bool] = False
+    next_page_token: Optional[str] = None
 
 @router.get("/search", response_model=ClinicalTrialsResponse)
 async def search_trials(
@@ -37,7 +41,8 @@ async def search_trials(
                           examples=["diabetes", "hypertension", "cancer treatment"]),
     q: Optional[str] = Query(None, description="Alias for condition"),
     status_filter: Optional[str] = Query(None, alias="status", description="Trial status filter (RECRUITING, ACTIVE_NOT_RECRUITING, COMPLETED, etc.)"),
-    max_studies: int = Query(10, ge=1, le=50, description="Maximum number of studies to return")
+    max_studies: int = Query(10, ge=1, le=50, description="Maximum number of studies to return"),
+    page_token: Optional[str] = Query(None, description="Cursor from a previous response's next_page_token")
 ):
     # Support 'q' query param as an alias for condition for backward compatibility
     if not condition and q:
@@ -51,7 +56,9 @@ async def search_trials(
     All responses include educational disclaimers per API Design Standards.
     """
     try:
-        result = await search_clinical_trials(condition, max_studies=max_studies, status=status_filter)
+        result = await search_clinical_trials(
+            condition, max_studies=max_studies, status=status_filter, page_token=page_token
+        )
         
         if result.get("needs_clarification"):
             raise HTTPException(
@@ -72,3 +79,35 @@ async def search_trials(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Clinical trials search failed: {str(e)}"
         )
+
+
+@router.get("/search/nearby", response_model=ClinicalTrialsResponse)
+async def search_trials_nearby(
+    condition: str = Query(..., description="Medical condition for clinical trials search"),
+    latitude: float = Query(..., ge=-90, le=90, description="Search center latitude"),
+    longitude: float = Query(..., ge=-180, le=180, description="Search center longitude"),
+    radius_miles: float = Query(50, gt=0, le=500, description="Search radius in miles"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Trial status filter (RECRUITING, COMPLETED, etc.)"),
+    max_studies: int = Query(10, ge=1, le=50, description="Maximum number of studies to return")
+):
+    """
+    Search clinical trials with a site within radius_miles of a location.
+
+    Results are ordered by nearest site and each trial includes nearest_site_miles.
+    """
+    try:
+        result = await search_trials_near(
+            condition,
+            latitude,
+            longitude,
+            radius_miles=radius_miles,
+            max_studies=max_studies,
+            status=status_filter,
+        )
+        return ClinicalTrialsResponse(query=condition, condition=condition, **result)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Nearby clinical trials search failed: {str(e)}"
+        )
@@ -16,12 +16,12 @@ from ..services.disease_service import lookup_disease_info
 
 # Conditional translation import
 try:
-    from src.services.translation_service import translate_text
+    from src.services.translation_service import translate_texts
     _has_translation = True
 except ImportError:
     _has_translation = False
-    async def translate_text(text: str, target_language: str, source_language: str = "en", context: str = "medical"):
-        return {"translated_text": text, "success": False}
+    async def translate_texts(texts: List[str], target_language: str, source_language: str = "en", context: str = "medical"):
+        return [{"translated_text": text, "success": False} for text in texts]
 
 logger = logging.getLogger(__name__)
 
@@ -92,44 +92,28 @@ async def lookup_disease(
                 }
             )
 
-        # Translate description and summary if needed
+        # Translate description, summary and symptoms in one request if needed
         if language and language.lower() != "en" and _has_translation:
-            if result.get("description"):
-                trans_result = await translate_text(
-                    result["description"],
-                    target_language=language,
-                    source_language="en",
-                    context="medical"
-                )
-                if trans_result.get("success"):
-                    result["description"] = trans_result.get("translated_text")
-                    logger.info(f"Translated description to {language}")
+            fields = [name for name in ("description", "summary") if result.get(name)]
+            symptoms = result.get("symptoms") if isinstance(result.get("symptoms"), list) else []
+            segments = [result[name] for name in fields] + symptoms
 
-            if result.get("summary"):
-                trans_result = await translate_text(
-                    result["summary"],
+            if segments:
+                translations = await translate_texts(
+                    segments,
                     target_language=language,
                     source_language="en",
                     context="medical"
                 )
-                if trans_result.get("success"):
-                    result["summary"] = trans_result.get("translated_text")
-
-            # Translate symptoms if available
-            if result.get("symptoms") and isinstance(result["symptoms"], list):
-                translated_symptoms = []
-                for symptom in result["symptoms"]:
-                    trans_result = await translate_text(
-                        symptom,
-                        target_language=language,
-                        source_language="en",
-                        context="medical"
-                    )
-                    if trans_result.get("success"):
-                        translated_symptoms.append(trans_result.get("translated_text"))
-                    else:
-                        translated_symptoms.append(symptom)
-                result["symptoms"] = translated_symptoms
+                translated = [
+                    trans_result.get("translated_text") if trans_result.get("success") else segment
+                    for segment, trans_result in zip(segments, translations)
+                ]
+                for name, text in zip(fields, translated):
+                    result[name] = text
+                if symptoms:
+                    result["symptoms"] = translated[len(fields):]
+                logger.info(f"Translated {len(segments)} disease segments to {language}")
 
         return DiseaseResponse(**result)
 
@@ -64,7 +64,7 @@ class GlossaryResponse(BaseModel):
 
 
 @router.get("/", response_model=GlossaryResponse)
-async def get_disease_glossary(
+def get_disease_glossary(
     search: Optional[str] = Query(None, description="Search term for disease name or synonym"),
     category: Optional[str] = Query(None, description="Filter by disease category"),
     rare_only: bool = Query(False, description="Show only rare diseases"),
@@ -151,7 +151,7 @@ async def get_disease_glossary(
 
 
 @router.get("/export")
-async def export_disease_glossary(
+def export_disease_glossary(
     format: str = Query("json", regex="^(json|csv)$", description="Export format: json or csv"),
     category: Optional[str] = Query(None, description="Filter by category"),
     rare_only: bool = Query(False, description="Export only rare diseases")
@@ -280,7 +280,7 @@ async def export_disease_glossary(
 
 
 @router.get("/stats")
-async def get_glossary_stats():
+def get_glossary_stats():
     """
     Get statistics about the disease glossary.
 
@@ -17,6 +17,11 @@ from typing import Any, Dict, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from src.utils.wizard_session_store import (
+    WizardSessionConflict,
+    get_wizard_session_store,
+)
+
 logger = logging.getLogger(__name__)
 
 # Lazy import of wizard agent
@@ -104,13 +109,14 @@ class WizardNavigationRequest(BaseModel):
 
 
 # =============================================================================
-# In-Memory Session Storage (Replace with Redis/Database in production)
+# Session Storage
 # =============================================================================
 
-wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("epic")
 
 
-def get_or_create_session(session_id: str = "default") -> Dict[str, Any]:
+async def get_or_create_session(session_id: str = "default") -> Dict[str, Any]:
     """Get existing wizard session or create new one"""
     epic_wizard_graph, create_initial_state, WizardState = get_wizard_imports()
 
@@ -120,14 +126,28 @@ def get_or_create_session(session_id: str = "default") -> Dict[str, Any]:
             detail="Epic wizard agent not available. LangChain dependencies may be missing.",
         )
 
-    if session_id not in wizard_sessions:
-        wizard_sessions[session_id] = {
-            "state": create_initial_state(),
-            "created_at": datetime.utcnow().isoformat(),
-            "last_updated": datetime.utcnow().isoformat(),
-        }
+    session = await _sessions.get(session_id)
+    if session is not None:
+        return session
 
-    return wizard_sessions[session_id]
+    try:
+        return await _sessions.create(
+            session_id,
+            {
+                "state": create_initial_state(),
+                "created_at": datetime.utcnow().isoformat(),
+                "last_updated": datetime.utcnow().isoformat(),
+            },
+        )
+    except WizardSessionConflict:
+        # Another request created it first
+        return await _sessions.get(session_id)
+
+
+async def save_session(session_id: str, session: Dict[str, Any]) -> None:
+    """Persist a mutated session (409 if another request changed it meanwhile)"""
+    session["last_updated"] = datetime.utcnow().isoformat()
+    await _sessions.save(session_id, session)
 
 
 # =============================================================================
@@ -145,10 +165,10 @@ async def start_wizard(request: WizardStartRequest):
     """
     session_id = "default"  # In production, use user-specific session ID
 
-    if request.reset_existing and session_id in wizard_sessions:
-        del wizard_sessions[session_id]
+    if request.reset_existing:
+        await _sessions.delete(session_id)
 
-    session = get_or_create_session(session_id)
+    session = await get_or_create_session(session_id)
     state = session["state"]
 
     # Run step 1 (prerequisites check) automatically
@@ -157,10 +177,12 @@ async def start_wizard(request: WizardStartRequest):
     try:
         result = await epic_wizard_graph.ainvoke(state)
         session["state"] = result
-        session["last_updated"] = datetime.utcnow().isoformat()
+        await save_session(session_id, session)
 
         return _build_state_response(result)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Wizard start failed: {e}", exc_info=True)
         raise HTTPException(
@@ -175,7 +197,7 @@ async def get_wizard_state():
 
     Returns current progress, completed steps, and next actions.
     """
-    session = get_or_create_session()
+    session = await get_or_create_session()
     state = session["state"]
 
     return _build_state_response(state)
@@ -194,7 +216,8 @@ async def submit_wizard_step(step_number: int, input_data: Dict[str, Any]):
     - Step 5 (Test Lookup): test_mrn (string)
     - Step 6 (Confirm): configuration_confirmed (boolean)
     """
-    session = get_or_create_session()
+    session_id = "default"
+    session = await get_or_create_session(session_id)
     state = session["state"]
 
     # Update state with input data
@@ -233,7 +256,7 @@ async def submit_wizard_step(step_number: int, input_data: Dict[str, Any]):
                 result["current_step"] = min(step_number + 1, 7)
 
             session["state"] = result
-            session["last_updated"] = datetime.utcnow().isoformat()
+            await save_session(session_id, session)
 
             return _build_state_response(result)
         else:
@@ -241,6 +264,8 @@ async def submit_wizard_step(step_number: int, input_data: Dict[str, Any]):
                 status_code=400, detail=f"Invalid step number: {step_number}"
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Step {step_number} processing failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Step processing failed: {str(e)}")
@@ -253,7 +278,8 @@ async def navigate_wizard(request: WizardNavigationRequest):
 
     Microsoft wizard pattern: Back button, Next button, or jump to completed step.
     """
-    session = get_or_create_session()
+    session_id = "default"
+    session = await get_or_create_session(session_id)
     state = session["state"]
 
     current_step = state.get("current_step", 1)
@@ -291,7 +317,7 @@ async def navigate_wizard(request: WizardNavigationRequest):
                 detail=f"Cannot jump to step {request.target_step}: not yet completed",
             )
 
-    session["last_updated"] = datetime.utcnow().isoformat()
+    await save_session(session_id, session)
 
     return _build_state_response(state)
 
@@ -304,10 +330,9 @@ async def reset_wizard():
     Clears all progress and starts over.
     """
     session_id = "default"
-    if session_id in wizard_sessions:
-        del wizard_sessions[session_id]
+    await _sessions.delete(session_id)
 
-    session = get_or_create_session(session_id)
+    session = await get_or_create_session(session_id)
     return {
         "message": "Wizard reset successfully",
         "state": _build_state_response(session["state"]),
@@ -321,7 +346,7 @@ async def get_wizard_progress():
 
     Returns progress percentage, completed steps, and estimated time remaining.
     """
-    session = get_or_create_session()
+    session = await get_or_create_session()
     state = session["state"]
 
     completed = len(state.get("completed_steps", []))
@@ -366,9 +391,11 @@ def _build_state_response(state: Dict[str, Any]) -> WizardStateResponse:
     # Determine if user can proceed
     can_proceed = current_step in completed_steps
 
-    # Format messages
+    # Format messages (stored sessions hold them as dumped dicts)
     messages = [
-        {
+        {"role": msg.get("type", "ai"), "content": msg.get("content", "")}
+        if isinstance(msg, dict)
+        else {
             "role": "ai" if hasattr(msg, "content") else "human",
             "content": msg.content if hasattr(msg, "content") else str(msg),
         }
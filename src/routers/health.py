@@ -182,6 +182,41 @@ async def monitoring_performance():
 
         metrics = performance_monitor.get_metrics()
 
+        try:
+            from src.utils.auth_enhanced import get_password_hasher_stats
+
+            metrics["password_hashing"] = get_password_hasher_stats()
+        except Exception:
+            pass
+
+        try:
+            from services.document_rendering_service import get_document_renderer_stats
+
+            metrics["document_rendering"] = get_document_renderer_stats()
+        except Exception:
+            pass
+
+        try:
+            from services.generated_document_store import get_document_store
+
+            metrics["generated_documents"] = get_document_store().stats()
+        except Exception:
+            pass
+
+        try:
+            from src.utils.translation_memory import get_translation_memory
+
+            metrics["translation_memory"] = get_translation_memory().stats()
+        except Exception:
+            pass
+
+        try:
+            from src.utils.ai_generation_cache import get_ai_generation_cache
+
+            metrics["ai_generation_cache"] = get_ai_generation_cache().stats()
+        except Exception:
+            pass
+
         return {
             "status": "ok",
             "timestamp": datetime.now().isoformat(),
@@ -45,7 +45,8 @@ async def get_performance_metrics():
         metrics = performance_monitor.get_metrics()
         return JSONResponse(content={
             "timestamp": datetime.now().isoformat(),
-            "performance": metrics
+            "performance": metrics,
+            "routes": performance_monitor.get_route_metrics()
         })
     except Exception as e:
         logger.error(f"Failed to get performance metrics: {e}")
@@ -9,7 +9,11 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from src.services.wizard_ai_service import WizardAIService, get_wizard_ai_service
+from src.services.wizard_ai_service import (
+    MAX_FIELDS_PER_BATCH,
+    WizardAIService,
+    get_wizard_ai_service,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +68,22 @@ class WizardFieldSuggestionRequest(BaseModel):
     current_wizard_data: Dict[str, Any] = Field(default_factory=dict)
 
 
+class WizardFieldBatchSuggestionRequest(BaseModel):
+    """Request for suggestions for several fields of one wizard step"""
+
+    wizard_type: str = Field(
+        ..., description="Type of wizard (sepsis, stroke, cardiac, etc.)"
+    )
+    field_names: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_FIELDS_PER_BATCH,
+        description="Names of the fields needing suggestions",
+    )
+    patient_context: PatientContext
+    current_wizard_data: Dict[str, Any] = Field(default_factory=dict)
+
+
 @router.post("/sepsis/suggest")
 async def suggest_sepsis_assessment(
     request: SepsisAssessmentRequest,
@@ -188,6 +208,36 @@ async def suggest_wizard_field(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/field/suggest-batch")
+async def suggest_wizard_fields(
+    request: WizardFieldBatchSuggestionRequest,
+    service: WizardAIService = Depends(get_wizard_ai_service),
+):
+    """
+    Get AI suggestions for several fields of a wizard step in one call
+
+    Returns:
+    - suggestions: suggested_value and reasoning for each requested field,
+      keyed by field name
+    """
+    try:
+        result = await service.suggest_wizard_fields(
+            wizard_type=request.wizard_type,
+            field_names=request.field_names,
+            patient_context=request.patient_context.dict(),
+            current_wizard_data=request.current_wizard_data,
+        )
+
+        return {
+            "success": True,
+            "suggestions": result,
+        }
+
+    except Exception as e:
+        logger.error(f"Error in batch field suggestion endpoint: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for wizard AI service"""
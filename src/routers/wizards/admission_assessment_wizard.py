@@ -8,7 +8,7 @@ Based on evidence-based nursing admission assessment standards.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, status
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, status
 from src.services import get_service
 from src.utils.api_responses import create_success_response
 from src.utils.config import get_settings
+from src.utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +50,8 @@ router = APIRouter(
     },
 )
 
-# Session storage (Redis in production, memory for development)
-try:
-    from src.utils.redis_cache import get_redis_client
-
-    _has_redis = True
-except ImportError:
-    _has_redis = False
-
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("admission_assessment")
 
 
 # Admission assessment wizard steps
@@ -160,48 +154,6 @@ Never rely solely on automated tools for clinical decision-making or documentati
 """
 
 
-async def _store_wizard_session(wizard_id: str, session_data: Dict[str, Any]) -> bool:
-    """Store wizard session in Redis (preferred) or memory (fallback)"""
-    try:
-        if _has_redis:
-            redis_client = await get_redis_client()
-            if redis_client:
-                cache_key = f"wizard:admission_assessment:{wizard_id}"
-                await redis_client.setex(
-                    cache_key, 7200, str(session_data)  # 2 hour TTL
-                )
-                logger.info(
-                    f"Stored admission assessment wizard session {wizard_id} in Redis"
-                )
-                return True
-    except Exception as e:
-        logger.warning(f"Failed to store session in Redis: {e}, using memory fallback")
-
-    # Memory fallback
-    _wizard_sessions[wizard_id] = session_data
-    logger.info(f"Stored admission assessment wizard session {wizard_id} in memory")
-    return True
-
-
-async def _get_wizard_session(wizard_id: str) -> Optional[Dict[str, Any]]:
-    """Retrieve wizard session from Redis (preferred) or memory (fallback)"""
-    try:
-        if _has_redis:
-            redis_client = await get_redis_client()
-            if redis_client:
-                cache_key = f"wizard:admission_assessment:{wizard_id}"
-                session_str = await redis_client.get(cache_key)
-                if session_str:
-                    import ast
-
-                    return ast.literal_eval(session_str)
-    except Exception as e:
-        logger.warning(f"Failed to retrieve session from Redis: {e}, checking memory")
-
-    # Memory fallback
-    return _wizard_sessions.get(wizard_id)
-
-
 def _get_step_data(step: int) -> Dict[str, Any]:
     """Get step configuration data"""
     if step not in ADMISSION_ASSESSMENT_STEPS:
@@ -321,7 +273,7 @@ async def start_admission_assessment_wizard():
         }
 
         # Store session
-        await _store_wizard_session(wizard_id, session_data)
+        await _sessions.create(wizard_id, session_data)
 
         # Get first step data
         step_data = _get_step_data(1)
@@ -357,7 +309,7 @@ async def submit_admission_assessment_step(wizard_id: str, step_data: Dict[str,
     """
     try:
         # Retrieve session
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -387,7 +339,7 @@ async def submit_admission_assessment_step(wizard_id: str, step_data: Dict[str,
             # Mark session as complete
             session["completed"] = True
             session["completed_at"] = datetime.now().isoformat()
-            await _store_wizard_session(wizard_id, session)
+            await _sessions.save(wizard_id, session)
 
             response_data = {
                 "wizard_session": session,
@@ -408,7 +360,7 @@ async def submit_admission_assessment_step(wizard_id: str, step_data: Dict[str,
         # Move to next step
         next_step = current_step + 1
         session["current_step"] = next_step
-        await _store_wizard_session(wizard_id, session)
+        await _sessions.save(wizard_id, session)
 
         # Get next step configuration
         next_step_data = _get_step_data(next_step)
@@ -450,7 +402,7 @@ async def enhance_admission_assessment_text(wizard_id: str, text_data: Dict[str,
     """
     try:
         # Verify wizard session exists
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -525,7 +477,7 @@ async def get_admission_assessment_report(wizard_id: str):
     """
     try:
         # Retrieve session
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -13,6 +13,7 @@ import logging
 
 from ...utils.config import get_educational_banner
 from ...services.openai_client import create_openai_service, clinical_decision_support
+from ...utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +26,8 @@ router = APIRouter(
     }
 )
 
-# Wizard session storage (Redis in production)
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("clinical_assessment")
 
 class AssessmentStepData(BaseModel):
     """Data model for assessment step submission."""
@@ -53,7 +54,7 @@ async def start_clinical_assessment():
         }
     }
 
-    _wizard_sessions[wizard_id] = session_data
+    await _sessions.create(wizard_id, session_data)
 
     return {
         "banner": get_educational_banner(),
@@ -79,11 +80,10 @@ async def start_clinical_assessment():
 async def get_clinical_assessment_status(wizard_id: str):
     """Get clinical assessment wizard status following Wizard Pattern Implementation."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     return {
         "banner": get_educational_banner(),
         "wizard_id": wizard_id,
@@ -104,11 +104,10 @@ async def submit_clinical_assessment_step(
 ):
     """Submit clinical assessment step data following Wizard Pattern Implementation."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     if step_number != session["current_step"]:
         raise HTTPException(
             status_code=422,
@@ -141,6 +140,8 @@ async def submit_clinical_assessment_step(
     else:
         next_step_info = None
 
+    await _sessions.save(wizard_id, session)
+
     return {
         "banner": get_educational_banner(),
         "wizard_id": wizard_id,
@@ -157,11 +158,10 @@ async def submit_clinical_assessment_step(
 async def get_clinical_assessment_step(wizard_id: str, step_number: int):
     """Get clinical assessment step information."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     if step_number < 1 or step_number > session["total_steps"]:
         raise HTTPException(status_code=422, detail="Invalid step number")
 
@@ -190,11 +190,9 @@ async def get_clinical_assessment_step(wizard_id: str, step_number: int):
 async def cancel_clinical_assessment(wizard_id: str):
     """Cancel and delete clinical assessment wizard session."""
 
-    if wizard_id not in _wizard_sessions:
+    if not await _sessions.delete(wizard_id):
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    del _wizard_sessions[wizard_id]
-
     return {
         "banner": get_educational_banner(),
         "message": "Clinical assessment wizard session cancelled",
@@ -4,11 +4,11 @@ Following Wizard Pattern Implementation from coding instructions
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
 from uuid import uuid4
 from datetime import datetime
 
 from ...utils.config import get_educational_banner
+from ...utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(
     prefix="/wizard/discharge-planning",
@@ -19,8 +19,8 @@ router = APIRouter(
     }
 )
 
-# Wizard session storage (Redis in production)
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("discharge_planning")
 
 @router.post("/start")
 async def start_discharge_planning():
@@ -37,7 +37,7 @@ async def start_discharge_planning():
         "data": {}
     }
     
-    _wizard_sessions[wizard_id] = session_data
+    await _sessions.create(wizard_id, session_data)
     
     return {
         "banner": get_educational_banner(),
@@ -53,11 +53,10 @@ async def start_discharge_planning():
 async def get_discharge_planning_status(wizard_id: str):
     """Get discharge planning wizard status following Wizard Pattern Implementation."""
     
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
     
-    session = _wizard_sessions[wizard_id]
-    
     return {
         "banner": get_educational_banner(),
         "wizard_id": wizard_id,
@@ -8,7 +8,7 @@ Based on evidence-based discharge planning and continuity of care standards.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, status
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, status
 from src.services import get_service
 from src.utils.api_responses import create_success_response
 from src.utils.config import get_settings
+from src.utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -48,14 +49,8 @@ router = APIRouter(
     },
 )
 
-try:
-    from src.utils.redis_cache import get_redis_client
-
-    _has_redis = True
-except ImportError:
-    _has_redis = False
-
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("discharge_summary")
 
 DISCHARGE_SUMMARY_STEPS = {
     1: {
@@ -137,38 +132,6 @@ All discharge documentation should be reviewed and validated by qualified provid
 """
 
 
-async def _store_wizard_session(wizard_id: str, session_data: Dict[str, Any]) -> bool:
-    try:
-        if _has_redis:
-            redis_client = await get_redis_client()
-            if redis_client:
-                await redis_client.setex(
-                    f"wizard:discharge_summary:{wizard_id}", 7200, str(session_data)
-                )
-                return True
-    except Exception:
-        pass
-    _wizard_sessions[wizard_id] = session_data
-    return True
-
-
-async def _get_wizard_session(wizard_id: str) -> Optional[Dict[str, Any]]:
-    try:
-        if _has_redis:
-            redis_client = await get_redis_client()
-            if redis_client:
-                session_str = await redis_client.get(
-                    f"wizard:discharge_summary:{wizard_id}"
-                )
-                if session_str:
-                    import ast
-
-                    return ast.literal_eval(session_str)
-    except Exception:
-        pass
-    return _wizard_sessions.get(wizard_id)
-
-
 def _get_step_data(step: int) -> Dict[str, Any]:
     if step not in DISCHARGE_SUMMARY_STEPS:
         raise HTTPException(
@@ -257,7 +220,7 @@ async def start_discharge_summary_wizard():
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
         }
-        await _store_wizard_session(wizard_id, session_data)
+        await _sessions.create(wizard_id, session_data)
         step_data = _get_step_data(1)
         response_data = {
             "wizard_session": session_data,
@@ -277,7 +240,7 @@ async def start_discharge_summary_wizard():
 @router.post("/{wizard_id}/step", summary="Submit discharge summary step")
 async def submit_discharge_summary_step(wizard_id: str, step_data: Dict[str, Any]):
     try:
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
@@ -288,7 +251,7 @@ async def submit_discharge_summary_step(wizard_id: str, step_data: Dict[str, Any
         if current_step >= session["total_steps"]:
             report = _generate_discharge_summary_report(session["collected_data"])
             session["completed"] = True
-            await _store_wizard_session(wizard_id, session)
+            await _sessions.save(wizard_id, session)
             return create_success_response(
                 data={
                     "wizard_session": session,
@@ -304,7 +267,7 @@ async def submit_discharge_summary_step(wizard_id: str, step_data: Dict[str, Any
             )
         next_step = current_step + 1
         session["current_step"] = next_step
-        await _store_wizard_session(wizard_id, session)
+        await _sessions.save(wizard_id, session)
         return create_success_response(
             data={
                 "wizard_session": session,
@@ -326,7 +289,7 @@ async def submit_discharge_summary_step(wizard_id: str, step_data: Dict[str, Any
 @router.post("/{wizard_id}/enhance", summary="Enhance discharge summary text")
 async def enhance_discharge_summary_text(wizard_id: str, text_data: Dict[str, Any]):
     try:
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
@@ -363,7 +326,7 @@ async def enhance_discharge_summary_text(wizard_id: str, text_data: Dict[str, An
 @router.get("/{wizard_id}/report", summary="Get discharge summary report")
 async def get_discharge_summary_report(wizard_id: str):
     try:
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
@@ -12,11 +12,12 @@ import math
 
 from src.utils.api_responses import create_success_response, create_error_response
 from src.utils.exceptions import ServiceException
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(prefix="/wizards/dosage-calculation", tags=["wizards", "dosage-calculation"])
 
-# In-memory session storage (use Redis in production)
-wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("dosage_calculation")
 
 class DosageCalculationStart(BaseModel):
     """Initial dosage calculation request"""
@@ -82,13 +83,13 @@ class DosageCalculationResponse(BaseModel):
     show_work: List[str]
 
 @router.post("/start", response_model=DosageCalculationResponse)
-def start_dosage_calculation(request: DosageCalculationStart):
+async def start_dosage_calculation(request: DosageCalculationStart):
     """Start a new dosage calculation wizard session"""
     try:
         wizard_id = str(uuid.uuid4())
         
         # Initialize session
-        wizard_sessions[wizard_id] = {
+        await _sessions.create(wizard_id, {
             "wizard_id": wizard_id,
             "calculation_type": request.calculation_type,
             "patient_weight": request.patient_weight,
@@ -96,7 +97,7 @@ def start_dosage_calculation(request: DosageCalculationStart):
             "created_at": datetime.utcnow().isoformat(),
             "current_step": "parameters",
             "completed_steps": []
-        }
+        })
         
         # Determine next steps based on calculation type
         next_steps = get_next_steps_for_type(request.calculation_type)
@@ -126,9 +127,9 @@ def start_dosage_calculation(request: DosageCalculationStart):
         )
 
 @router.post("/{wizard_id}/basic-dosage", response_model=DosageCalculationResponse)
-def calculate_basic_dosage(wizard_id: str, dosage_data: BasicDosageStep):
+async def calculate_basic_dosage(wizard_id: str, dosage_data: BasicDosageStep):
     """Calculate basic dosage using dose/strength formula"""
-    session = get_session(wizard_id)
+    session = await get_session(wizard_id)
     
     try:
         # Perform calculation
@@ -138,6 +139,7 @@ def calculate_basic_dosage(wizard_id: str, dosage_data: BasicDosageStep):
         session["basic_dosage_result"] = result
         session["completed_steps"].append("basic_dosage")
         session["current_step"] = "verification"
+        await _sessions.save(wizard_id, session)
         
         return create_success_response({
             "wizard_id": wizard_id,
@@ -158,6 +160,8 @@ def calculate_basic_dosage(wizard_id: str, dosage_data: BasicDosageStep):
             "show_work": result["show_work"]
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -165,9 +169,9 @@ def calculate_basic_dosage(wizard_id: str, dosage_data: BasicDosageStep):
         )
 
 @router.post("/{wizard_id}/weight-based", response_model=DosageCalculationResponse)
-def calculate_weight_based_dosage(wizard_id: str, dosage_data: WeightBasedDosageStep):
+async def calculate_weight_based_dosage(wizard_id: str, dosage_data: WeightBasedDosageStep):
     """Calculate weight-based dosage"""
-    session = get_session(wizard_id)
+    session = await get_session(wizard_id)
     
     try:
         result = perform_weight_based_calculation(dosage_data)
@@ -175,6 +179,7 @@ def calculate_weight_based_dosage(wizard_id: str, dosage_data: WeightBasedDosage
         session["weight_based_result"] = result
         session["completed_steps"].append("weight_based")
         session["current_step"] = "verification"
+        await _sessions.save(wizard_id, session)
         
         return create_success_response({
             "wizard_id": wizard_id,
@@ -196,6 +201,8 @@ def calculate_weight_based_dosage(wizard_id: str, dosage_data: WeightBasedDosage
             "show_work": result["show_work"]
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -203,9 +210,9 @@ def calculate_weight_based_dosage(wizard_id: str, dosage_data: WeightBasedDosage
         )
 
 @router.post("/{wizard_id}/iv-rate", response_model=DosageCalculationResponse)
-def calculate_iv_rate(wizard_id: str, rate_data: IVRateStep):
+async def calculate_iv_rate(wizard_id: str, rate_data: IVRateStep):
     """Calculate IV infusion rate"""
-    session = get_session(wizard_id)
+    session = await get_session(wizard_id)
     
     try:
         result = perform_iv_rate_calculation(rate_data)
@@ -213,6 +220,7 @@ def calculate_iv_rate(wizard_id: str, rate_data: IVRateStep):
         session["iv_rate_result"] = result
         session["completed_steps"].append("iv_rate")
         session["current_step"] = "verification"
+        await _sessions.save(wizard_id, session)
         
         return create_success_response({
             "wizard_id": wizard_id,
@@ -234,6 +242,8 @@ def calculate_iv_rate(wizard_id: str, rate_data: IVRateStep):
             "show_work": result["show_work"]
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -241,9 +251,9 @@ def calculate_iv_rate(wizard_id: str, rate_data: IVRateStep):
         )
 
 @router.post("/{wizard_id}/pediatric", response_model=DosageCalculationResponse)
-def calculate_pediatric_dosage(wizard_id: str, pediatric_data: PediatricDosageStep):
+async def calculate_pediatric_dosage(wizard_id: str, pediatric_data: PediatricDosageStep):
     """Calculate pediatric dosage using various methods"""
-    session = get_session(wizard_id)
+    session = await get_session(wizard_id)
     
     try:
         result = perform_pediatric_calculation(pediatric_data)
@@ -251,6 +261,7 @@ def calculate_pediatric_dosage(wizard_id: str, pediatric_data: PediatricDosageSt
         session["pediatric_result"] = result
         session["completed_steps"].append("pediatric")
         session["current_step"] = "verification"
+        await _sessions.save(wizard_id, session)
         
         return create_success_response({
             "wizard_id": wizard_id,
@@ -273,6 +284,8 @@ def calculate_pediatric_dosage(wizard_id: str, pediatric_data: PediatricDosageSt
             "show_work": result["show_work"]
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -280,9 +293,9 @@ def calculate_pediatric_dosage(wizard_id: str, pediatric_data: PediatricDosageSt
         )
 
 @router.get("/{wizard_id}/summary", response_model=Dict[str, Any])
-def get_calculation_summary(wizard_id: str):
+async def get_calculation_summary(wizard_id: str):
     """Get summary of all calculations performed"""
-    session = get_session(wizard_id)
+    session = await get_session(wizard_id)
     
     summary = {
         "wizard_id": wizard_id,
@@ -307,14 +320,15 @@ def get_calculation_summary(wizard_id: str):
     
     return create_success_response(summary)
 
-def get_session(wizard_id: str) -> Dict[str, Any]:
+async def get_session(wizard_id: str) -> Dict[str, Any]:
     """Get wizard session or raise error"""
-    if wizard_id not in wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wizard session not found"
         )
-    return wizard_sessions[wizard_id]
+    return session
 
 def get_next_steps_for_type(calculation_type: str) -> List[str]:
     """Get next steps based on calculation type"""
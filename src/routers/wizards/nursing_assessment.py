@@ -10,6 +10,7 @@ from uuid import uuid4
 from datetime import datetime
 
 from src.utils.config import get_educational_banner
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(
     prefix="/wizard/nursing-assessment",
@@ -20,8 +21,8 @@ router = APIRouter(
     }
 )
 
-# In-memory session storage (Redis in production)
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("nursing_assessment")
 
 class NursingAssessmentStep(BaseModel):
     """Pydantic model for nursing assessment step following API Design Standards."""
@@ -52,7 +53,7 @@ async def start_nursing_assessment():
     wizard_id = str(uuid4())
     
     # Initialize session following session state pattern
-    _wizard_sessions[wizard_id] = {
+    await _sessions.create(wizard_id, {
         "created_at": datetime.now().isoformat(),
         "current_step": 1,
         "total_steps": 5,
@@ -65,7 +66,7 @@ async def start_nursing_assessment():
             "Mobility & Safety Assessment",
             "Review & Documentation"
         ]
-    }
+    })
     
     return WizardResponse(
         wizard_id=wizard_id,
@@ -82,14 +83,13 @@ async def submit_assessment_step(wizard_id: str, step_data: NursingAssessmentSte
     Submit nursing assessment step following Wizard Pattern Implementation.
     Validates step data and advances wizard state.
     """
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wizard session not found"
         )
     
-    session = _wizard_sessions[wizard_id]
-    
     if session["completed"]:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -107,6 +107,7 @@ async def submit_assessment_step(wizard_id: str, step_data: NursingAssessmentSte
         # Mark as completed
         session["completed"] = True
         session["completed_at"] = datetime.now().isoformat()
+        await _sessions.save(wizard_id, session)
         
         return WizardResponse(
             wizard_id=wizard_id,
@@ -120,6 +121,7 @@ async def submit_assessment_step(wizard_id: str, step_data: NursingAssessmentSte
     
     # Continue to next step
     session["current_step"] = next_step
+    await _sessions.save(wizard_id, session)
     step_prompts = [
         "Enter vital signs (temperature, pulse, respirations, blood pressure, oxygen saturation)",
         "Assess pain level using appropriate pain scale and comfort measures",
@@ -139,13 +141,12 @@ async def submit_assessment_step(wizard_id: str, step_data: NursingAssessmentSte
 @router.get("/{wizard_id}/status", response_model=WizardResponse)
 async def get_assessment_status(wizard_id: str):
     """Get current wizard status following Wizard Pattern Implementation."""
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wizard session not found"
         )
-    
-    session = _wizard_sessions[wizard_id]
     current_step = session["current_step"]
     
     return WizardResponse(
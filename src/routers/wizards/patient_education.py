@@ -12,6 +12,7 @@ from datetime import datetime
 import logging
 
 from ...services.openai_client import create_openai_service
+from ...utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,8 @@ router = APIRouter(
     }
 )
 
-# Wizard session storage (Redis in production)
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("patient_education")
 
 class EducationStepData(BaseModel):
     """Data model for education step submission."""
@@ -58,7 +59,7 @@ async def start_patient_education(
         }
     }
 
-    _wizard_sessions[wizard_id] = session_data
+    await _sessions.create(wizard_id, session_data)
 
     return {
         "wizard_id": wizard_id,
@@ -81,11 +82,10 @@ async def start_patient_education(
 async def get_patient_education_status(wizard_id: str):
     """Get patient education wizard status following Wizard Pattern Implementation."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     return {
         "wizard_id": wizard_id,
         "wizard_type": session["wizard_type"],
@@ -105,11 +105,10 @@ async def submit_patient_education_step(
 ):
     """Submit patient education step data following Wizard Pattern Implementation."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     if step_number != session["current_step"]:
         raise HTTPException(
             status_code=422,
@@ -171,6 +170,8 @@ async def submit_patient_education_step(
     else:
         next_step_info = None
 
+    await _sessions.save(wizard_id, session)
+
     response = {
         "wizard_id": wizard_id,
         "step_completed": step_number,
@@ -193,11 +194,10 @@ async def submit_patient_education_step(
 async def get_patient_education_step(wizard_id: str, step_number: int):
     """Get patient education step information."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     if step_number < 1 or step_number > session["total_steps"]:
         raise HTTPException(status_code=422, detail="Invalid step number")
 
@@ -224,10 +224,9 @@ async def get_patient_education_step(wizard_id: str, step_number: int):
 async def get_education_materials(wizard_id: str):
     """Get recommended educational materials based on topic and learning style."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
-
-    session = _wizard_sessions[wizard_id]
     topic = session["data"].get("topic", "general")
     learning_style = session["data"].get("learning_assessment", {}).get("preferred_learning_style", "Mixed")
 
@@ -245,11 +244,9 @@ async def get_education_materials(wizard_id: str):
 async def cancel_patient_education(wizard_id: str):
     """Cancel and delete patient education wizard session."""
 
-    if wizard_id not in _wizard_sessions:
+    if not await _sessions.delete(wizard_id):
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    del _wizard_sessions[wizard_id]
-
     return {
         "message": "Patient education wizard session cancelled",
         "wizard_id": wizard_id
@@ -13,6 +13,7 @@ import logging
 
 from ...utils.config import get_educational_banner
 from ...services.openai_client import create_openai_service
+from ...utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +26,8 @@ router = APIRouter(
     }
 )
 
-# Wizard session storage (Redis in production)
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("quality_improvement")
 
 class QualityImprovementStepData(BaseModel):
     """Data model for quality improvement step submission."""
@@ -59,7 +60,7 @@ async def start_quality_improvement(
         }
     }
 
-    _wizard_sessions[wizard_id] = session_data
+    await _sessions.create(wizard_id, session_data)
 
     return {
         "banner": get_educational_banner(),
@@ -84,11 +85,10 @@ async def start_quality_improvement(
 async def get_quality_improvement_status(wizard_id: str):
     """Get quality improvement wizard status following Wizard Pattern Implementation."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     return {
         "banner": get_educational_banner(),
         "wizard_id": wizard_id,
@@ -109,11 +109,10 @@ async def submit_quality_improvement_step(
 ):
     """Submit quality improvement step data following Wizard Pattern Implementation."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     if step_number != session["current_step"]:
         raise HTTPException(
             status_code=422,
@@ -152,6 +151,8 @@ async def submit_quality_improvement_step(
     else:
         next_step_info = None
 
+    await _sessions.save(wizard_id, session)
+
     return {
         "banner": get_educational_banner(),
         "wizard_id": wizard_id,
@@ -168,11 +169,10 @@ async def submit_quality_improvement_step(
 async def get_quality_improvement_step(wizard_id: str, step_number: int):
     """Get quality improvement step information."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    session = _wizard_sessions[wizard_id]
-
     if step_number < 1 or step_number > session["total_steps"]:
         raise HTTPException(status_code=422, detail="Invalid step number")
 
@@ -201,10 +201,9 @@ async def get_quality_improvement_step(wizard_id: str, step_number: int):
 async def get_quality_metrics(wizard_id: str):
     """Get tracked quality metrics for the initiative."""
 
-    if wizard_id not in _wizard_sessions:
+    session = await _sessions.get(wizard_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Wizard session not found")
-
-    session = _wizard_sessions[wizard_id]
     metrics = session["data"].get("tracked_metrics", [])
 
     return {
@@ -219,11 +218,9 @@ async def get_quality_metrics(wizard_id: str):
 async def cancel_quality_improvement(wizard_id: str):
     """Cancel and delete quality improvement wizard session."""
 
-    if wizard_id not in _wizard_sessions:
+    if not await _sessions.delete(wizard_id):
         raise HTTPException(status_code=404, detail="Wizard session not found")
 
-    del _wizard_sessions[wizard_id]
-
     return {
         "banner": get_educational_banner(),
         "message": "Quality improvement wizard session cancelled",
@@ -6,7 +6,6 @@ which is a standard communication tool in healthcare settings.
 """
 
 from datetime import datetime
-from typing import Dict
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
@@ -14,12 +13,13 @@ from pydantic import BaseModel, Field
 from services.openai_client import get_client
 from utils.api_responses import create_error_response, create_success_response
 from utils.logging import get_logger
+from src.utils.wizard_session_store import get_wizard_session_store
 
 router = APIRouter(prefix="/wizards/sbar-report", tags=["wizards"])
 logger = get_logger(__name__)
 
-# In-memory storage for wizard state. In production, use Redis or a database.
-wizard_sessions: Dict[str, Dict[str, str]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("sbar_report")
 
 # --- Pydantic Models for Wizard Steps ---
 
@@ -78,7 +78,7 @@ async def start_sbar_wizard():
     import uuid
 
     wizard_id = str(uuid.uuid4())
-    wizard_sessions[wizard_id] = {}
+    await _sessions.create(wizard_id, {})
     logger.info(f"Started SBAR wizard session: {wizard_id}")
 
     return create_success_response(
@@ -90,14 +90,16 @@ async def start_sbar_wizard():
     )
 
 
-def _update_step(wizard_id: str, step_name: str, text: str, next_step_name: str):
+async def _update_step(wizard_id: str, step_name: str, text: str, next_step_name: str):
     """Helper function to update a step in the wizard session."""
-    if wizard_id not in wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response(
             "Wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found"
         )
 
-    wizard_sessions[wizard_id][step_name] = text
+    session_data[step_name] = text
+    await _sessions.save(wizard_id, session_data)
     logger.info(f"Updated SBAR session {wizard_id} with step: {step_name}")
 
     return create_success_response(
@@ -114,7 +116,7 @@ def _update_step(wizard_id: str, step_name: str, text: str, next_step_name: str)
 )
 async def add_situation(step_input: SbarStepInput):
     """Adds the **Situation** component to the SBAR report."""
-    return _update_step(
+    return await _update_step(
         step_input.wizard_id, "situation", step_input.text, "background"
     )
 
@@ -124,7 +126,7 @@ async def add_situation(step_input: SbarStepInput):
 )
 async def add_background(step_input: SbarStepInput):
     """Adds the **Background** component to the SBAR report."""
-    return _update_step(
+    return await _update_step(
         step_input.wizard_id, "background", step_input.text, "assessment"
     )
 
@@ -134,7 +136,7 @@ async def add_background(step_input: SbarStepInput):
 )
 async def add_assessment(step_input: SbarStepInput):
     """Adds the **Assessment** component to the SBAR report."""
-    return _update_step(
+    return await _update_step(
         step_input.wizard_id, "assessment", step_input.text, "recommendation"
     )
 
@@ -256,13 +258,14 @@ async def generate_sbar_report_wizard(step_input: GenerateSbarInput):
     formatted SBAR report using an AI model. (Wizard session-based flow)
     """
     wizard_id = step_input.wizard_id
-    if wizard_id not in wizard_sessions:
+    session_data = await _sessions.get(wizard_id)
+    if session_data is None:
         return create_error_response(
             "Wizard session not found.", status.HTTP_404_NOT_FOUND, "wizard_not_found"
         )
 
-    session_data = wizard_sessions[wizard_id]
     session_data["recommendation"] = step_input.recommendation
+    await _sessions.save(wizard_id, session_data)
 
     # Verify all parts are present
     required_parts = ["situation", "background", "assessment", "recommendation"]
@@ -310,7 +313,7 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Note: This report was generated without AI enhancement. Configure OPENAI_API_KEY for enhanced formatting.
 """
             # Clean up the session
-            del wizard_sessions[wizard_id]
+            await _sessions.delete(wizard_id)
 
             return {"wizard_id": wizard_id, "sbar_report": sbar_report}
 
@@ -328,7 +331,7 @@ Note: This report was generated without AI enhancement. Configure OPENAI_API_KEY
         logger.info(f"Successfully generated SBAR report for session {wizard_id}")
 
         # Clean up the session
-        del wizard_sessions[wizard_id]
+        await _sessions.delete(wizard_id)
 
         return {"wizard_id": wizard_id, "sbar_report": sbar_report}
     except Exception as e:
@@ -4,7 +4,7 @@ Following Wizard Pattern Implementation from copilot-instructions.md
 """
 
 from fastapi import APIRouter, HTTPException, status
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 from uuid import uuid4
 from datetime import datetime
 
@@ -16,6 +16,7 @@ from src.models.schemas import (
 from src.utils.api_responses import create_success_response
 from src.utils.exceptions import ServiceException
 from src.utils.config import get_settings
+from src.utils.wizard_session_store import get_wizard_session_store
 
 # Conditional translation import
 try:
@@ -39,15 +40,8 @@ router = APIRouter(
     }
 )
 
-# Session storage (Redis in production, memory for development)
-# Following Conditional Imports Pattern
-try:
-    from src.utils.redis_cache import get_redis_client
-    _has_redis = True
-except ImportError:
-    _has_redis = False
-
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("sbar", ttl_seconds=3600)
 
 @router.post(
     "/start",
@@ -71,7 +65,7 @@ async def start_sbar_wizard():
         }
         
         # Store session following Conditional Imports Pattern
-        await _store_wizard_session(wizard_id, session_data)
+        await _sessions.create(wizard_id, session_data)
         
         # Get first step prompt
         step_data = _get_step_data(1)
@@ -106,7 +100,7 @@ async def submit_wizard_step(
     """Submit wizard step following Wizard Pattern Implementation."""
     try:
         # Get session
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -131,7 +125,7 @@ async def submit_wizard_step(
         next_step = current_step + 1
         session["current_step"] = next_step
         
-        await _store_wizard_session(wizard_id, session)
+        await _sessions.save(wizard_id, session)
         
         if next_step <= session["total_steps"]:
             # Get next step data
@@ -172,7 +166,7 @@ async def submit_wizard_step(
 async def get_wizard_status(wizard_id: str):
     """Get wizard session status following Wizard Pattern Implementation."""
     
-    session = await _get_wizard_session(wizard_id)
+    session = await _sessions.get(wizard_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -190,32 +184,6 @@ async def get_wizard_status(wizard_id: str):
         }
     )
 
-async def _get_wizard_session(wizard_id: str) -> Optional[Dict[str, Any]]:
-    """Get wizard session from storage following Conditional Imports Pattern."""
-    if _has_redis:
-        try:
-            redis_client = get_redis_client()
-            if redis_client:
-                session_data = await redis_client.get(f"sbar_wizard:{wizard_id}")
-                return session_data if session_data else None
-        except Exception:
-            pass
-    
-    return _wizard_sessions.get(wizard_id)
-
-async def _store_wizard_session(wizard_id: str, session_data: Dict[str, Any]) -> None:
-    """Store wizard session following Conditional Imports Pattern."""
-    if _has_redis:
-        try:
-            redis_client = get_redis_client()
-            if redis_client:
-                await redis_client.setex(f"sbar_wizard:{wizard_id}", 3600, session_data)
-                return
-        except Exception:
-            pass
-    
-    _wizard_sessions[wizard_id] = session_data
-
 async def _complete_sbar_wizard(wizard_id: str, session: Dict[str, Any]) -> Dict[str, Any]:
     """Complete SBAR wizard and generate final report."""
     
@@ -234,7 +202,7 @@ async def _complete_sbar_wizard(wizard_id: str, session: Dict[str, Any]) -> Dict
         session["completed_at"] = datetime.now().isoformat()
         session["final_report"] = sbar_report
         
-        await _store_wizard_session(wizard_id, session)
+        await _sessions.save(wizard_id, session)
         
         return create_success_response(
             data={
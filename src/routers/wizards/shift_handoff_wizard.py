@@ -8,7 +8,7 @@ Based on best practices for bedside handoff communication.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, status
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, status
 from src.services import get_service
 from src.utils.api_responses import create_success_response
 from src.utils.config import get_settings
+from src.utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +50,8 @@ router = APIRouter(
     },
 )
 
-# Session storage (Redis in production, memory for development)
-try:
-    from src.utils.redis_cache import get_redis_client
-
-    _has_redis = True
-except ImportError:
-    _has_redis = False
-
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("shift_handoff", ttl_seconds=3600)
 
 
 # Shift handoff wizard steps
@@ -124,41 +118,6 @@ SHIFT_HANDOFF_STEPS = {
 }
 
 
-async def _store_wizard_session(wizard_id: str, session_data: Dict[str, Any]):
-    """Store wizard session in Redis or memory."""
-    if _has_redis:
-        try:
-            redis_client = await get_redis_client()
-            if redis_client:
-                await redis_client.setex(
-                    f"wizard_session:{wizard_id}",
-                    3600,  # 1 hour expiry
-                    str(session_data),
-                )
-                return
-        except Exception as e:
-            logger.warning(f"Failed to store session in Redis: {e}")
-
-    # Fallback to memory
-    _wizard_sessions[wizard_id] = session_data
-
-
-async def _get_wizard_session(wizard_id: str) -> Optional[Dict[str, Any]]:
-    """Retrieve wizard session from Redis or memory."""
-    if _has_redis:
-        try:
-            redis_client = await get_redis_client()
-            if redis_client:
-                data = await redis_client.get(f"wizard_session:{wizard_id}")
-                if data:
-                    return eval(data)  # Convert string back to dict
-        except Exception:
-            pass
-
-    # Fallback to memory
-    return _wizard_sessions.get(wizard_id)
-
-
 def _get_step_data(step_number: int) -> Dict[str, Any]:
     """Get step configuration data."""
     if step_number not in SHIFT_HANDOFF_STEPS:
@@ -188,7 +147,7 @@ async def start_shift_handoff_wizard():
         }
 
         # Store session
-        await _store_wizard_session(wizard_id, session_data)
+        await _sessions.create(wizard_id, session_data)
 
         # Get first step prompt
         step_data = _get_step_data(1)
@@ -219,7 +178,7 @@ async def submit_shift_handoff_step(wizard_id: str, step_data: Dict[str, Any]):
     """Submit step data and advance wizard."""
     try:
         # Get session
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -241,7 +200,7 @@ async def submit_shift_handoff_step(wizard_id: str, step_data: Dict[str, Any]):
         # Advance to next step or complete
         if current_step < session["total_steps"]:
             session["current_step"] += 1
-            await _store_wizard_session(wizard_id, session)
+            await _sessions.save(wizard_id, session)
 
             next_step_data = _get_step_data(session["current_step"])
 
@@ -264,7 +223,7 @@ async def submit_shift_handoff_step(wizard_id: str, step_data: Dict[str, Any]):
 
             session["completed_at"] = datetime.now().isoformat()
             session["final_report"] = handoff_report
-            await _store_wizard_session(wizard_id, session)
+            await _sessions.save(wizard_id, session)
 
             return create_success_response(
                 data={
@@ -322,7 +281,7 @@ async def enhance_shift_handoff_text(wizard_id: str, text_data: Dict[str, Any]):
 async def get_shift_handoff_report(wizard_id: str):
     """Get completed shift handoff report."""
     try:
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -9,7 +9,7 @@ interprofessional communication and continuity of care.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, status
@@ -17,6 +17,7 @@ from fastapi import APIRouter, HTTPException, status
 from src.services import get_service
 from src.utils.api_responses import create_success_response
 from src.utils.config import get_settings
+from src.utils.wizard_session_store import get_wizard_session_store
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +51,8 @@ router = APIRouter(
     },
 )
 
-# Session storage (Redis in production, memory for development)
-try:
-    from src.utils.redis_cache import get_redis_client
-
-    _has_redis = True
-except ImportError:
-    _has_redis = False
-
-_wizard_sessions: Dict[str, Dict[str, Any]] = {}
+# Wizard session storage (Redis with in-memory fallback)
+_sessions = get_wizard_session_store("soap_note")
 
 
 # SOAP note wizard steps
@@ -131,46 +125,6 @@ Never rely solely on automated tools for clinical decision-making or documentati
 """
 
 
-async def _store_wizard_session(wizard_id: str, session_data: Dict[str, Any]) -> bool:
-    """Store wizard session in Redis (preferred) or memory (fallback)"""
-    try:
-        if _has_redis:
-            redis_client = await get_redis_client()
-            if redis_client:
-                cache_key = f"wizard:soap_note:{wizard_id}"
-                await redis_client.setex(
-                    cache_key, 7200, str(session_data)  # 2 hour TTL
-                )
-                logger.info(f"Stored SOAP note wizard session {wizard_id} in Redis")
-                return True
-    except Exception as e:
-        logger.warning(f"Failed to store session in Redis: {e}, using memory fallback")
-
-    # Memory fallback
-    _wizard_sessions[wizard_id] = session_data
-    logger.info(f"Stored SOAP note wizard session {wizard_id} in memory")
-    return True
-
-
-async def _get_wizard_session(wizard_id: str) -> Optional[Dict[str, Any]]:
-    """Retrieve wizard session from Redis (preferred) or memory (fallback)"""
-    try:
-        if _has_redis:
-            redis_client = await get_redis_client()
-            if redis_client:
-                cache_key = f"wizard:soap_note:{wizard_id}"
-                session_str = await redis_client.get(cache_key)
-                if session_str:
-                    import ast
-
-                    return ast.literal_eval(session_str)
-    except Exception as e:
-        logger.warning(f"Failed to retrieve session from Redis: {e}, checking memory")
-
-    # Memory fallback
-    return _wizard_sessions.get(wizard_id)
-
-
 def _get_step_data(step: int) -> Dict[str, Any]:
     """Get step configuration data"""
     if step not in SOAP_NOTE_STEPS:
@@ -355,7 +309,7 @@ async def start_soap_note_wizard():
         }
 
         # Store session
-        await _store_wizard_session(wizard_id, session_data)
+        await _sessions.create(wizard_id, session_data)
 
         # Get first step data
         step_data = _get_step_data(1)
@@ -390,7 +344,7 @@ async def submit_soap_note_step(wizard_id: str, step_data: Dict[str, Any]):
     """
     try:
         # Retrieve session
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -420,7 +374,7 @@ async def submit_soap_note_step(wizard_id: str, step_data: Dict[str, Any]):
             # Mark session as complete
             session["completed"] = True
             session["completed_at"] = datetime.now().isoformat()
-            await _store_wizard_session(wizard_id, session)
+            await _sessions.save(wizard_id, session)
 
             response_data = {
                 "wizard_session": session,
@@ -440,7 +394,7 @@ async def submit_soap_note_step(wizard_id: str, step_data: Dict[str, Any]):
         # Move to next step
         next_step = current_step + 1
         session["current_step"] = next_step
-        await _store_wizard_session(wizard_id, session)
+        await _sessions.save(wizard_id, session)
 
         # Get next step configuration
         next_step_data = _get_step_data(next_step)
@@ -480,7 +434,7 @@ async def enhance_soap_note_text(wizard_id: str, text_data: Dict[str, Any]):
     """
     try:
         # Verify wizard session exists
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -555,7 +509,7 @@ async def get_soap_note_report(wizard_id: str):
     """
     try:
         # Retrieve session
-        session = await _get_wizard_session(wizard_id)
+        session = await _sessions.get(wizard_id)
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
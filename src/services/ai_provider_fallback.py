@@ -9,12 +9,20 @@ Architecture:
 - Fallback provider: gpt-4o (reliable backup)
 - Circuit breaker: Prevents cascade failures
 - Exponential backoff: Graceful retry logic
+- Latency tracking: EWMA + p95 per provider; the faster provider is tried first.
+  Samples expire after a few minutes, so a demoted provider gets tried again
+  and can win its place back
+- Hedged requests: if the first provider hasn't answered by its p95 latency,
+  the other provider is started too and whichever loses is cancelled
 """
 
 import asyncio
 import logging
+import math
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from src.services.claude_service import claude_service
 from src.services.openai_client import OpenAIService
@@ -22,6 +30,17 @@ from src.utils.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Latency samples kept per provider for the p95 estimate
+LATENCY_WINDOW = 100
+# Samples needed before latency drives routing or hedge timing
+MIN_LATENCY_SAMPLES = 5
+# The fallback is tried first only when its EWMA is this much lower
+# (hysteresis, so routing doesn't flap between similar providers)
+LATENCY_PREFERENCE_RATIO = 0.8
+# Seconds a latency sample counts for. Once a demoted provider's samples have
+# all expired it goes back to its configured place and is measured afresh.
+LATENCY_MAX_AGE = 300.0
+
 
 class CircuitBreaker:
     """
@@ -87,6 +106,73 @@ class CircuitBreaker:
         }
 
 
+class LatencyTracker:
+    """
+    Per-provider latency statistics.
+
+    Keeps an exponentially weighted moving average (for routing) and a
+    window of recent samples (for the p95 hedge delay). Only successful
+    calls are recorded, plus cancelled hedge losers with their elapsed
+    time, a lower bound that still pushes a slow provider's average up.
+
+    Samples older than ``max_age`` seconds are dropped, and the average
+    restarts from the next sample once none are left. A provider that stops
+    getting traffic therefore goes cold instead of keeping a stale average.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        window: int = LATENCY_WINDOW,
+        max_age: float = LATENCY_MAX_AGE,
+    ):
+        self.alpha = alpha
+        self.max_age = max_age
+        self.ewma: Optional[float] = None
+        self.samples: Deque[Tuple[float, float]] = deque(maxlen=window)
+        self.count = 0
+
+    def _expire(self):
+        """Drop samples older than ``max_age``."""
+        cutoff = time.monotonic() - self.max_age
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+
+    def record(self, seconds: float):
+        """Record one call's latency in seconds."""
+        self._expire()
+        if not self.samples:
+            self.ewma = None
+        self.samples.append((time.monotonic(), seconds))
+        self.count += 1
+        if self.ewma is None:
+            self.ewma = seconds
+        else:
+            self.ewma = self.alpha * seconds + (1 - self.alpha) * self.ewma
+
+    @property
+    def warm(self) -> bool:
+        """Whether there are enough recent samples to act on."""
+        self._expire()
+        return len(self.samples) >= MIN_LATENCY_SAMPLES
+
+    def p95(self) -> Optional[float]:
+        """95th percentile of recent latencies (None until warm)."""
+        if not self.warm:
+            return None
+        ordered = sorted(seconds for _, seconds in self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get latency statistics for monitoring."""
+        p95 = self.p95()
+        return {
+            "ewma_ms": round(self.ewma * 1000, 1) if self.ewma is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "samples": self.count,
+        }
+
+
 class AIProviderFallback:
     """
     Unified AI service with automatic fallback and circuit breaker.
@@ -95,6 +181,7 @@ class AIProviderFallback:
     - Automatic retry with exponential backoff
     - Circuit breaker to prevent cascade failures
     - Seamless failover to secondary provider
+    - Latency-aware routing and hedged requests
     - Production-grade error handling
     """
 
@@ -117,6 +204,14 @@ class AIProviderFallback:
             ),
         }
 
+        # Latency statistics for each provider
+        self.latency = {
+            provider: LatencyTracker(alpha=self.settings.AI_LATENCY_EWMA_ALPHA)
+            for provider in ("openai", "anthropic")
+        }
+        self.hedges_started = 0
+        self.hedges_won = 0
+
         logger.info(
             f"AI Fallback Service initialized - Primary: {self.settings.AI_PROVIDER}, "
             f"Fallback: {self.settings.get_fallback_provider() or 'None'}"
@@ -143,41 +238,122 @@ class AIProviderFallback:
         """
         primary_provider = self.settings.get_active_ai_provider()
         fallback_provider = self.settings.get_fallback_provider()
+        if not self.settings.AI_FALLBACK_ENABLED:
+            fallback_provider = None
 
-        # Try primary provider with retry logic
-        result = await self._try_provider_with_retry(
-            provider=primary_provider,
+        call = dict(
             prompt=prompt,
             context=context,
             max_tokens=max_tokens,
             temperature=temperature,
         )
+        first, second = self._route(primary_provider, fallback_provider)
+
+        first_task = asyncio.create_task(self._try_provider_with_retry(provider=first, **call))
+        hedge_delay = self._hedge_delay(first) if second else None
+        if hedge_delay is not None:
+            try:
+                done, _ = await asyncio.wait({first_task}, timeout=hedge_delay)
+            except asyncio.CancelledError:
+                first_task.cancel()
+                raise
+            if not done:
+                # First provider is slower than usual - race the other one
+                return await self._hedge(first, first_task, second, hedge_delay, call)
 
-        # If primary succeeded, return result
+        result = await first_task
+
+        # If the first provider succeeded, return result
         if result and not result.get("error"):
             return result
 
-        # Primary failed - try fallback if available
-        if fallback_provider and self.settings.AI_FALLBACK_ENABLED:
-            logger.warning(
-                f"Primary provider ({primary_provider}) failed, "
-                f"falling back to {fallback_provider}"
-            )
+        # First provider failed - try the other one if available
+        if second:
+            logger.warning(f"Provider ({first}) failed, falling back to {second}")
 
-            fallback_result = await self._try_provider_with_retry(
-                provider=fallback_provider,
-                prompt=prompt,
-                context=context,
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
+            fallback_result = await self._try_provider_with_retry(provider=second, **call)
 
             if fallback_result and not fallback_result.get("error"):
                 fallback_result["fallback_used"] = True
-                fallback_result["primary_provider_failed"] = primary_provider
+                fallback_result["primary_provider_failed"] = first
                 return fallback_result
 
         # Both failed or no fallback - return error
+        return self._all_failed(first, second)
+
+    def _route(self, primary: str, fallback: Optional[str]) -> List[Optional[str]]:
+        """
+        Order the providers for this request.
+
+        The configured primary goes first unless the fallback has been
+        clearly faster lately; providers with an open circuit go last.
+        Both need recent samples to compare, so a demoted primary whose
+        samples have expired is tried first again and re-measured.
+        """
+        if not fallback:
+            return [primary, None]
+
+        primary_latency = self.latency[primary]
+        fallback_latency = self.latency[fallback]
+        faster_fallback = (
+            primary_latency.warm
+            and fallback_latency.warm
+            and fallback_latency.ewma < primary_latency.ewma * LATENCY_PREFERENCE_RATIO
+        )
+        primary_open = self.circuit_breakers[primary].state == "OPEN"
+        fallback_open = self.circuit_breakers[fallback].state == "OPEN"
+
+        if (faster_fallback and not fallback_open) or (primary_open and not fallback_open):
+            return [fallback, primary]
+        return [primary, fallback]
+
+    def _hedge_delay(self, provider: str) -> Optional[float]:
+        """Seconds to wait on ``provider`` before hedging (None: don't hedge)."""
+        if not self.settings.AI_HEDGING_ENABLED:
+            return None
+        p95 = self.latency[provider].p95()
+        if p95 is None:
+            return self.settings.AI_HEDGE_DEFAULT_DELAY
+        return max(p95, self.settings.AI_HEDGE_MIN_DELAY)
+
+    async def _hedge(
+        self,
+        first: str,
+        first_task: "asyncio.Task",
+        second: str,
+        hedge_delay: float,
+        call: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Race ``second`` against the in-flight ``first`` request."""
+        if not self.circuit_breakers[second].can_attempt():
+            result = await first_task
+            if result and not result.get("error"):
+                return result
+            return self._all_failed(first, second)
+
+        logger.info(f"{first} slower than {hedge_delay:.1f}s - hedging with {second}")
+        self.hedges_started += 1
+        second_task = asyncio.create_task(self._try_provider_with_retry(provider=second, **call))
+        pending = {first_task, second_task}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result and not result.get("error"):
+                        if task is second_task:
+                            self.hedges_won += 1
+                        result["hedged"] = True
+                        result["hedge_delay_ms"] = round(hedge_delay * 1000, 1)
+                        return result
+        finally:
+            # Cancel whichever request lost (or both, if our caller went away)
+            for task in pending:
+                task.cancel()
+        return self._all_failed(first, second)
+
+    def _all_failed(self, primary_provider: str, fallback_provider: Optional[str]) -> Dict[str, Any]:
+        """Error response when no provider produced a result."""
         return {
             "error": "All AI providers unavailable",
             "primary_provider": primary_provider,
@@ -222,19 +398,30 @@ class AIProviderFallback:
 
         max_retries = self.settings.AI_MAX_RETRIES
 
+        latency = self.latency[provider]
+
         for attempt in range(max_retries):
+            started = time.perf_counter()
             try:
                 # Call provider
-                result = await self._call_provider(
-                    provider=provider,
-                    prompt=prompt,
-                    context=context,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
+                try:
+                    result = await self._call_provider(
+                        provider=provider,
+                        prompt=prompt,
+                        context=context,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                    )
+                except asyncio.CancelledError:
+                    # A hedge cancelled this call: its elapsed time is a lower bound
+                    latency.record(time.perf_counter() - started)
+                    raise
 
                 # Success - reset circuit breaker
                 if result and not result.get("error"):
+                    # Only successes are latency samples; a provider that fails
+                    # fast must not look fast to the router
+                    latency.record(time.perf_counter() - started)
                     circuit_breaker.record_success()
                     result["provider"] = provider
                     result["attempts"] = attempt + 1
@@ -316,6 +503,15 @@ class AIProviderFallback:
                 "openai": self.circuit_breakers["openai"].get_state(),
                 "anthropic": self.circuit_breakers["anthropic"].get_state(),
             },
+            "latency": {
+                "openai": self.latency["openai"].get_state(),
+                "anthropic": self.latency["anthropic"].get_state(),
+            },
+            "hedging": {
+                "enabled": self.settings.AI_HEDGING_ENABLED,
+                "hedges_started": self.hedges_started,
+                "hedges_won_by_second_provider": self.hedges_won,
+            },
             "providers_available": {
                 "openai": self.settings.has_openai(),
                 "anthropic": self.settings.has_anthropic(),
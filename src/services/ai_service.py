@@ -5,11 +5,18 @@ Smart AI service that automatically selects the best available AI provider:
 1. Claude (Anthropic) - Primary choice for medical content
 2. OpenAI (GPT-4) - Fallback option
 
-Provides transparent failover and consistent API.
+Provides transparent failover and consistent API, including streaming
+(``stream_response``) for routes that send tokens as they arrive. The
+templated generators (patient education, SBAR, discharge instructions, FDA
+label simplification) go through the AI generation cache
+(``src.utils.ai_generation_cache``).
 """
 
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.ai_generation_cache import get_ai_generation_cache
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +62,21 @@ class UnifiedAIService:
         if not self.primary_provider:
             logger.error("❌ No AI providers available!")
 
+    def _providers(self, prefer_provider: Optional[str] = None) -> List[Tuple[str, Any]]:
+        """Providers to try, in order."""
+        if prefer_provider == "claude" and self.claude:
+            return [("claude", self.claude)]
+        if prefer_provider == "openai" and self.openai:
+            return [("openai", self.openai)]
+
+        # Auto-select based on availability
+        providers = []
+        if self.claude:
+            providers.append(("claude", self.claude))
+        if self.openai:
+            providers.append(("openai", self.openai))
+        return providers
+
     async def generate_response(
         self,
         prompt: str,
@@ -72,19 +94,7 @@ class UnifiedAIService:
         Returns:
             AI response with metadata
         """
-        # Determine which provider to use
-        providers_to_try = []
-
-        if prefer_provider == "claude" and self.claude:
-            providers_to_try = [("claude", self.claude)]
-        elif prefer_provider == "openai" and self.openai:
-            providers_to_try = [("openai", self.openai)]
-        else:
-            # Auto-select based on availability
-            if self.claude:
-                providers_to_try.append(("claude", self.claude))
-            if self.openai:
-                providers_to_try.append(("openai", self.openai))
+        providers_to_try = self._providers(prefer_provider)
 
         # Try each provider
         last_error = None
@@ -116,26 +126,152 @@ class UnifiedAIService:
             "service_note": "All AI providers unavailable. Please configure ANTHROPIC_API_KEY or OPENAI_API_KEY",
         }
 
+    async def stream_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        prefer_provider: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream an AI response with automatic provider selection.
+
+        A provider that fails before its first token is skipped for the next
+        one; after text has been sent the stream ends with an ``error`` event.
+
+        Yields:
+            ``{"type": "delta", "text": ...}`` events, then one
+            ``{"type": "done", ...}`` event with provider, model, token usage,
+            time to first token and total latency, or ``{"type": "error", ...}``
+        """
+        started = time.perf_counter()
+        last_error = None
+
+        for provider_name, provider in self._providers(prefer_provider):
+            usage: Dict[str, Any] = {}
+            first_token_at = None
+            try:
+                logger.info(f"Streaming from AI provider: {provider_name}")
+                async for text in provider.stream_response(prompt, context=context, usage=usage):
+                    if not text:
+                        continue
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    yield {"type": "delta", "text": text}
+            except Exception as e:
+                logger.warning(f"{provider_name} streaming failed: {e}")
+                last_error = str(e)
+                if first_token_at is not None:
+                    yield {"type": "error", "provider_used": provider_name, "error": last_error}
+                    return
+                continue
+
+            if first_token_at is None:
+                last_error = f"{provider_name} returned an empty response"
+                continue
+
+            finished = time.perf_counter()
+            yield {
+                "type": "done",
+                "provider_used": provider_name,
+                "model": usage.get("model"),
+                "usage": {
+                    "input_tokens": usage.get("input_tokens", 0),
+                    "output_tokens": usage.get("output_tokens", 0),
+                },
+                "time_to_first_token_ms": round((first_token_at - started) * 1000, 1),
+                "latency_ms": round((finished - started) * 1000, 1),
+            }
+            return
+
+        # All providers failed
+        yield {
+            "type": "error",
+            "error": last_error or "No AI providers available",
+            "service_note": "All AI providers unavailable. Please configure ANTHROPIC_API_KEY or OPENAI_API_KEY",
+        }
+
+    def _generation_model(self) -> str:
+        """Provider/model the templated generators will use (part of cache keys)."""
+        if self.claude:
+            from src.services.claude_service import DEFAULT_MODEL
+
+            return f"claude:{DEFAULT_MODEL}"
+        if self.openai:
+            return f"openai:{self.openai.config.get('model')}"
+        return "none"
+
+    async def _embed(self, text: str) -> List[float]:
+        """Embedding for the semantic cache tier (OpenAI embeddings API)."""
+        model = "text-embedding-3-small"
+        try:
+            from src.utils.config import get_settings
+
+            model = getattr(get_settings(), "AI_CACHE_EMBEDDING_MODEL", model)
+        except Exception:
+            pass
+        return await self.openai.create_embedding(text, model=model)
+
+    async def _cached_generation(
+        self,
+        template: str,
+        inputs: Dict[str, Any],
+        generate: Callable[[], Awaitable[Dict[str, Any]]],
+        params: Dict[str, Any],
+        semantic_field: Optional[str] = None,
+        shared: bool = True,
+    ) -> Dict[str, Any]:
+        """Serve ``generate()`` through the AI generation cache."""
+        if not self.primary_provider:
+            return await generate()
+        embedder = self._embed if self.openai and hasattr(self.openai, "create_embedding") else None
+        return await get_ai_generation_cache(embedder).get_or_generate(
+            template,
+            inputs,
+            generate,
+            model=self._generation_model(),
+            params=params,
+            semantic_field=semantic_field,
+            shared=shared,
+        )
+
     async def generate_patient_education(
         self,
         condition: str,
         patient_context: Optional[Dict[str, Any]] = None,
         language: str = "en",
     ) -> Dict[str, Any]:
-        """Generate patient education material."""
-        # Prefer Claude for medical content
-        if self.claude:
-            return await self.claude.generate_patient_education(
-                condition, patient_context, language
-            )
-        elif self.openai:
-            # Fallback to OpenAI with custom prompt
-            prompt = f"Create patient education material for {condition} at 8th grade reading level."
-            return await self.openai.generate_response(
-                prompt, "Patient education material"
-            )
-
-        return {"response": "", "error": "No AI provider available"}
+        """Generate patient education material (cached; similar conditions may match)."""
+
+        async def generate() -> Dict[str, Any]:
+            # Prefer Claude for medical content
+            if self.claude:
+                return await self.claude.generate_patient_education(
+                    condition, patient_context, language
+                )
+            elif self.openai:
+                # Fallback to OpenAI with custom prompt
+                prompt = f"Create patient education material for {condition} at 8th grade reading level."
+                return await self.openai.generate_response(
+                    prompt, "Patient education material"
+                )
+
+            return {"response": "", "error": "No AI provider available"}
+
+        # Only the fields the prompt uses; no identifiers reach the key
+        patient_context = patient_context or {}
+        inputs = {
+            "condition": condition,
+            "language": language,
+            "age": patient_context.get("age"),
+            "reading_level": patient_context.get("reading_level"),
+        }
+        return await self._cached_generation(
+            "patient_education",
+            inputs,
+            generate,
+            params={"temperature": 0.7},
+            semantic_field="condition",
+        )
 
     async def generate_sbar_report(
         self,
@@ -144,16 +280,28 @@ class UnifiedAIService:
         assessment: str,
         recommendations: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Generate SBAR report."""
-        if self.claude:
-            return await self.claude.generate_sbar_report(
-                situation, background, assessment, recommendations
-            )
-        elif self.openai:
-            prompt = f"Create SBAR report:\nS: {situation}\nB: {background}\nA: {assessment}\nR: {recommendations}"
-            return await self.openai.generate_response(prompt, "SBAR report generation")
+        """Generate SBAR report (cached in-process only - inputs are patient-specific)."""
 
-        return {"response": "", "error": "No AI provider available"}
+        async def generate() -> Dict[str, Any]:
+            if self.claude:
+                return await self.claude.generate_sbar_report(
+                    situation, background, assessment, recommendations
+                )
+            elif self.openai:
+                prompt = f"Create SBAR report:\nS: {situation}\nB: {background}\nA: {assessment}\nR: {recommendations}"
+                return await self.openai.generate_response(prompt, "SBAR report generation")
+
+            return {"response": "", "error": "No AI provider available"}
+
+        inputs = {
+            "situation": situation,
+            "background": background,
+            "assessment": assessment,
+            "recommendations": recommendations,
+        }
+        return await self._cached_generation(
+            "sbar_report", inputs, generate, params={"temperature": 0.3}, shared=False
+        )
 
     async def generate_discharge_instructions(
         self,
@@ -162,31 +310,52 @@ class UnifiedAIService:
         follow_up: str,
         restrictions: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Generate discharge instructions."""
-        if self.claude:
-            return await self.claude.generate_discharge_instructions(
-                diagnosis, medications, follow_up, restrictions
-            )
-        elif self.openai:
-            meds = ", ".join(medications)
-            prompt = f"Create discharge instructions for {diagnosis}. Meds: {meds}. Follow-up: {follow_up}."
-            return await self.openai.generate_response(prompt, "Discharge instructions")
+        """Generate discharge instructions (cached in-process only)."""
 
-        return {"response": "", "error": "No AI provider available"}
+        async def generate() -> Dict[str, Any]:
+            if self.claude:
+                return await self.claude.generate_discharge_instructions(
+                    diagnosis, medications, follow_up, restrictions
+                )
+            elif self.openai:
+                meds = ", ".join(medications)
+                prompt = f"Create discharge instructions for {diagnosis}. Meds: {meds}. Follow-up: {follow_up}."
+                return await self.openai.generate_response(prompt, "Discharge instructions")
+
+            return {"response": "", "error": "No AI provider available"}
+
+        inputs = {
+            "diagnosis": diagnosis,
+            "medications": list(medications),
+            "follow_up": follow_up,
+            "restrictions": restrictions,
+        }
+        return await self._cached_generation(
+            "discharge_instructions", inputs, generate, params={"temperature": 0.7}, shared=False
+        )
 
     async def simplify_fda_label(
         self, fda_text: str, section: str = "general"
     ) -> Dict[str, Any]:
-        """Simplify FDA label to plain language."""
-        if self.claude:
-            return await self.claude.simplify_fda_label(fda_text, section)
-        elif self.openai:
-            prompt = f"Simplify this FDA text to 8th grade reading level:\n\n{fda_text}"
-            return await self.openai.generate_response(
-                prompt, "FDA label simplification"
-            )
-
-        return {"response": "", "error": "No AI provider available"}
+        """Simplify FDA label to plain language (cached)."""
+
+        async def generate() -> Dict[str, Any]:
+            if self.claude:
+                return await self.claude.simplify_fda_label(fda_text, section)
+            elif self.openai:
+                prompt = f"Simplify this FDA text to 8th grade reading level:\n\n{fda_text}"
+                return await self.openai.generate_response(
+                    prompt, "FDA label simplification"
+                )
+
+            return {"response": "", "error": "No AI provider available"}
+
+        return await self._cached_generation(
+            "fda_label_simplification",
+            {"fda_text": fda_text, "section": section},
+            generate,
+            params={"temperature": 0.7},
+        )
 
     def get_status(self) -> Dict[str, Any]:
         """Get AI service status."""
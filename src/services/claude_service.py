@@ -8,17 +8,31 @@ and longer context windows (200K tokens) compared to other models.
 
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from src.utils.metrics import record_ai_request, upstream_event_hooks, upstream_transport
 
 logger = logging.getLogger(__name__)
 
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
     _has_anthropic = True
 except ImportError:
     _has_anthropic = False
-    Anthropic = None  # type: ignore
+    AsyncAnthropic = None  # type: ignore
+    DefaultAsyncHttpxClient = None  # type: ignore
+
+DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+
+# Connection pool defaults - will be loaded from settings
+ANTHROPIC_MAX_CONNECTIONS = 20
+ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS = 10
+
+SYSTEM_PROMPT = "You are a highly knowledgeable medical AI assistant helping nurses and healthcare providers. Provide accurate, evidence-based information. Be clear, professional, and concise."
 
 
 class ClaudeService:
@@ -32,6 +46,11 @@ class ClaudeService:
     - SBAR report generation
     - Discharge instructions
     - 200K token context window
+
+    Uses ``AsyncAnthropic`` so a completion never blocks the event loop. One
+    pooled HTTP client (keep-alive connections, upstream latency hooks) is
+    shared by every request on the worker; ``stream_response`` yields text
+    as Claude produces it.
     """
 
     def __init__(self):
@@ -52,17 +71,54 @@ class ClaudeService:
             return
 
         try:
-            self.client = Anthropic(api_key=self.api_key)
+            try:
+                http_client = self._build_http_client()
+            except Exception as e:
+                logger.warning(f"Claude connection pool unavailable, using SDK defaults: {e}")
+                http_client = None
+            self.client = AsyncAnthropic(api_key=self.api_key, http_client=http_client)
             self.available = True
             logger.info("✓ Claude AI service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Claude client: {e}")
 
+    @staticmethod
+    def _build_http_client():
+        """Shared connection pool for all Claude requests on this worker."""
+        max_connections = ANTHROPIC_MAX_CONNECTIONS
+        max_keepalive = ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS
+        try:
+            from src.utils.config import get_settings
+
+            settings = get_settings()
+            max_connections = getattr(settings, "ANTHROPIC_MAX_CONNECTIONS", max_connections)
+            max_keepalive = getattr(
+                settings, "ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS", max_keepalive
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load Anthropic pool settings: {e}, using defaults")
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+        )
+        return DefaultAsyncHttpxClient(
+            limits=limits,
+            transport=upstream_transport(limits=limits),
+            event_hooks=upstream_event_hooks() or None,
+        )
+
+    @staticmethod
+    def _system_message(context: Optional[str]) -> str:
+        if context:
+            return f"{SYSTEM_PROMPT}\n\nContext: {context}"
+        return SYSTEM_PROMPT
+
     async def generate_response(
         self,
         prompt: str,
         context: Optional[str] = None,
-        model: str = "claude-3-5-sonnet-20241022",
+        model: str = DEFAULT_MODEL,
         max_tokens: int = 4000,
         temperature: float = 0.7,
     ) -> Dict[str, Any]:
@@ -87,19 +143,25 @@ class ClaudeService:
             }
 
         try:
-            # Build messages
-            system_message = "You are a highly knowledgeable medical AI assistant helping nurses and healthcare providers. Provide accurate, evidence-based information. Be clear, professional, and concise."
-
-            if context:
-                system_message += f"\n\nContext: {context}"
-
             # Call Claude API
-            message = self.client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_message,
-                messages=[{"role": "user", "content": prompt}],
+            started = time.perf_counter()
+            try:
+                message = await self.client.messages.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=self._system_message(context),
+                    messages=[{"role": "user", "content": prompt}],
+                )
+            except Exception:
+                record_ai_request("anthropic", model, time.perf_counter() - started, success=False)
+                raise
+            record_ai_request(
+                "anthropic",
+                model,
+                time.perf_counter() - started,
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
             )
 
             # Extract response
@@ -124,6 +186,64 @@ class ClaudeService:
                 "service_note": "Claude API request failed",
             }
 
+    async def stream_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        usage: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an AI response from Claude as text chunks.
+
+        Same arguments as ``generate_response``. Unlike it, failures are raised
+        (``RuntimeError`` when the service is unavailable, the Anthropic error
+        otherwise) so the caller can end its own stream cleanly. When given,
+        ``usage`` is filled with the model and token counts once the stream ends.
+
+        Yields:
+            Text deltas in the order Claude produces them
+        """
+        if not self.available:
+            raise RuntimeError("Claude AI service not available. Check API key.")
+
+        started = time.perf_counter()
+        try:
+            async with self.client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=self._system_message(context),
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                message = await stream.get_final_message()
+        except Exception as e:
+            record_ai_request("anthropic", model, time.perf_counter() - started, success=False)
+            logger.error(f"Claude streaming error: {e}")
+            raise
+        record_ai_request(
+            "anthropic",
+            model,
+            time.perf_counter() - started,
+            input_tokens=message.usage.input_tokens,
+            output_tokens=message.usage.output_tokens,
+        )
+        if usage is not None:
+            usage.update(
+                model=model,
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections (application shutdown)."""
+        if self.client is not None:
+            await self.client.close()
+
     async def generate_patient_education(
         self,
         condition: str,
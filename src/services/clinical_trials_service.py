@@ -11,6 +11,9 @@ Key Features:
     - Redis caching with 1-hour TTL
     - Comprehensive trial data extraction (contact, sponsor, summary)
     - Status filtering support (recruiting, completed, etc.)
+    - Cursor-based paging over the API v2 ``pageToken``/``nextPageToken``
+    - Async iterator that yields trials page by page as they arrive
+    - Grid geo-index of site coordinates for "trials within N miles" queries
     - Educational banners for compliance
 
 Architecture Patterns:
@@ -39,6 +42,13 @@ Examples:
     >>> # Functional API (standalone function)
     >>> trials = await search_clinical_trials("hypertension", max_studies=5)
 
+    >>> # Stream trials across pages without materializing every page
+    >>> async for trial in iter_clinical_trials("asthma", max_pages=3):
+    ...     print(trial["nct_id"])
+
+    >>> # Trials with a site within 25 miles of a point
+    >>> nearby = await search_trials_near("stroke", 44.02, -92.47, radius_miles=25)
+
 Self-Improvement Checklist:
     [ ] Add unit tests for _extract_locations() helper
     [ ] Add integration tests with mocked ClinicalTrials.gov responses
@@ -54,11 +64,15 @@ Last Updated: 2025-10-04
 """
 
 import asyncio
+import contextlib
 import logging
-from typing import Any, Dict, List, Optional
+import math
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from src.utils.config import get_educational_banner, get_settings
 from src.utils.exceptions import ExternalServiceException
+from src.utils.metrics import upstream_event_hooks, upstream_transport
 from src.utils.redis_cache import cached
 
 logger = logging.getLogger(__name__)
@@ -100,6 +114,11 @@ except Exception:
     _has_httpx = False
     httpx = None
 
+# ClinicalTrials.gov API v2 endpoint and paging limits
+CLINICAL_TRIALS_API_URL = "https://clinicaltrials.gov/api/v2/studies"
+MAX_PAGE_SIZE = 100  # API v2 hard limit per page
+EARTH_RADIUS_MILES = 3958.8
+
 
 class ClinicalTrialsService:
     """
@@ -163,7 +182,11 @@ class ClinicalTrialsService:
 
     @cached(ttl_seconds=3600)
     async def search_trials(
-        self, query: str, limit: int = 10, status: Optional[str] = None
+        self,
+        query: str,
+        limit: int = 10,
+        status: Optional[str] = None,
+        page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Search clinical trials by condition or intervention using live ClinicalTrials.gov API v2.
@@ -180,6 +203,8 @@ class ClinicalTrialsService:
                 Valid values: "RECRUITING", "ACTIVE_NOT_RECRUITING", "COMPLETED",
                 "ENROLLING_BY_INVITATION", "NOT_YET_RECRUITING", "SUSPENDED",
                 "TERMINATED", "WITHDRAWN". Case-insensitive. Defaults to None (all statuses).
+            page_token (Optional[str], optional): Cursor returned as
+                ``next_page_token`` by a previous call. Defaults to None (first page).
 
         Returns:
             Dict[str, Any]: Search results with structure:
@@ -191,7 +216,8 @@ class ClinicalTrialsService:
                     "studies_summary": str,  # Human-readable summary
                     "trials": List[Dict],  # Trial details (see _search_live_trials)
                     "sources": List[str],  # Data sources used
-                    "needs_clarification": bool  # If query needs refinement
+                    "needs_clarification": bool,  # If query needs refinement
+                    "next_page_token": Optional[str]  # Cursor for the next page
                 }
 
         Raises:
@@ -217,7 +243,7 @@ class ClinicalTrialsService:
             - Status filter is case-insensitive and hyphens converted to underscores
         """
         try:
-            return await self._search_live_trials(query, limit, status)
+            return await self._search_live_trials(query, limit, status, page_token)
         except Exception as e:
             logger.error(f"Clinical trials search error: {e}")
             return self._create_error_response(query, str(e))
@@ -267,7 +293,11 @@ class ClinicalTrialsService:
             return None
 
     async def _search_live_trials(
-        self, query: str, limit: int, status: Optional[str] = None
+        self,
+        query: str,
+        limit: int,
+        status: Optional[str] = None,
+        page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Internal method to search live ClinicalTrials.gov API v2.
@@ -276,6 +306,7 @@ class ClinicalTrialsService:
             query (str): Medical condition or intervention
             limit (int): Maximum results to return (capped at 100)
             status (Optional[str]): Status filter (will be uppercased)
+            page_token (Optional[str]): API v2 cursor for the requested page
 
         Returns:
             Dict[str, Any]: Parsed API response with trial details
@@ -285,20 +316,22 @@ class ClinicalTrialsService:
         """
         try:
             # ClinicalTrials.gov API v2 endpoint
-            base_url = "https://clinicaltrials.gov/api/v2/studies"
+            base_url = CLINICAL_TRIALS_API_URL
 
             params = {
                 "query.cond": query,
-                "pageSize": min(limit, 100),  # Max 100 per page
+                "pageSize": min(limit, MAX_PAGE_SIZE),  # Max 100 per page
                 "format": "json",
             }
 
             # Add status filter if provided
             if status:
                 params["filter.overallStatus"] = status
+            if page_token:
+                params["pageToken"] = page_token
 
             if _has_httpx:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=30.0) as client:
                     response = await client.get(base_url, params=params)
                     response.raise_for_status()
                     data = response.json()
@@ -354,6 +387,7 @@ class ClinicalTrialsService:
                 "trials": trials,
                 "sources": ["ClinicalTrials.gov API v2"],
                 "needs_clarification": False,
+                "next_page_token": data.get("nextPageToken"),
             }
 
         except Exception as e:
@@ -362,7 +396,7 @@ class ClinicalTrialsService:
 
     def _extract_locations(
         self, contacts_locations: Dict[str, Any]
-    ) -> List[Dict[str, str]]:
+    ) -> List[Dict[str, Any]]:
         """
         Extract and format location information from trial contact/location data.
 
@@ -376,7 +410,9 @@ class ClinicalTrialsService:
                         "facility": str,  # Hospital/clinic name
                         "city": str,
                         "state": str,
-                        "country": str
+                        "country": str,
+                        "latitude": float,  # Only when the site has a geoPoint
+                        "longitude": float
                     },
                     ...
                 ]
@@ -397,6 +433,9 @@ class ClinicalTrialsService:
                 "state": location.get("state", ""),
                 "country": location.get("country", ""),
             }
+            coordinates = _site_coordinates(location)
+            if coordinates:
+                loc_info["latitude"], loc_info["longitude"] = coordinates
             locations.append(loc_info)
         return locations
 
@@ -417,7 +456,7 @@ class ClinicalTrialsService:
             base_url = f"https://clinicaltrials.gov/api/v2/studies/{nct_id}"
 
             if _has_httpx:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=30.0) as client:
                     response = await client.get(base_url)
                     response.raise_for_status()
                     data = response.json()
@@ -674,7 +713,10 @@ def create_clinical_trials_service() -> Optional[ClinicalTrialsService]:
 
 
 async def search_clinical_trials(
-    condition: str, max_studies: int = 10, status: Optional[str] = None
+    condition: str,
+    max_studies: int = 10,
+    status: Optional[str] = None,
+    page_token: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Functional API for searching clinical trials (router-friendly interface).
@@ -693,6 +735,8 @@ async def search_clinical_trials(
             "enrolling-by-invitation", "not-yet-recruiting", "suspended",
             "terminated", "withdrawn". Case-insensitive, hyphens converted to
             underscores for API. Defaults to None (all statuses).
+        page_token (Optional[str], optional): Cursor from a previous response's
+            ``next_page_token`` to fetch the following page. Defaults to None.
 
     Returns:
         Dict[str, Any]: Search results with structure:
@@ -704,7 +748,8 @@ async def search_clinical_trials(
                 "studies_summary": str,  # Human-readable summary
                 "trials": List[Dict],  # Trial details array
                 "sources": List[str],  # ["ClinicalTrials.gov API v2"]
-                "needs_clarification": bool  # True if query ambiguous
+                "needs_clarification": bool,  # True if query ambiguous
+                "next_page_token": Optional[str]  # Cursor for the next page
             }
 
             Each trial in "trials" array contains:
@@ -772,7 +817,9 @@ async def search_clinical_trials(
             effective_condition = condition
 
         # Use live ClinicalTrials.gov API v2
-        result = await _search_trials_live(effective_condition, max_studies, status)
+        result = await _search_trials_live(
+            effective_condition, max_studies, status, page_token
+        )
         result["banner"] = banner
         result["query"] = condition
         result["condition"] = condition
@@ -785,8 +832,260 @@ async def search_clinical_trials(
         )
 
 
+def _site_coordinates(location: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """Return ``(lat, lon)`` from an API v2 location ``geoPoint``, if present."""
+    geo_point = location.get("geoPoint") or {}
+    lat, lon = geo_point.get("lat"), geo_point.get("lon")
+    if lat is None or lon is None:
+        return None
+    try:
+        return float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+
+
+def _haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in miles between two coordinates."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+class TrialSiteGeoIndex:
+    """
+    Grid index of clinical trial site coordinates for radius queries.
+
+    Sites are bucketed into fixed-size latitude/longitude cells as trials are
+    added, so a "within N miles" query only computes distances for sites in
+    the handful of cells that overlap the search circle instead of scanning
+    every location of every trial.
+
+    Examples:
+        >>> index = TrialSiteGeoIndex()
+        >>> index.add_sites("NCT04567890", study_locations)
+        >>> index.query(44.02, -92.47, radius_miles=25)
+        [("NCT04567890", 0.8)]
+    """
+
+    MILES_PER_DEGREE_LAT = 69.0
+
+    def __init__(self, cell_degrees: float = 1.0) -> None:
+        self.cell_degrees = cell_degrees
+        self._lon_cells = int(math.ceil(360.0 / cell_degrees))
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, str]]] = (
+            defaultdict(list)
+        )
+        self._indexed: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (
+            int(math.floor(lat / self.cell_degrees)),
+            int(math.floor((lon + 180.0) / self.cell_degrees)) % self._lon_cells,
+        )
+
+    def add_sites(self, nct_id: str, locations: List[Dict[str, Any]]) -> int:
+        """Index every site of a trial that carries coordinates.
+
+        Args:
+            nct_id: Trial identifier the sites belong to
+            locations: Raw API v2 ``contactsLocationsModule.locations`` entries
+
+        Returns:
+            int: Number of sites indexed (0 if the trial was already indexed)
+        """
+        if nct_id in self._indexed:
+            return 0
+        self._indexed.add(nct_id)
+
+        added = 0
+        for location in locations:
+            coordinates = _site_coordinates(location)
+            if coordinates is None:
+                continue
+            lat, lon = coordinates
+            self._cells[self._cell(lat, lon)].append((lat, lon, nct_id))
+            added += 1
+        return added
+
+    def query(
+        self, latitude: float, longitude: float, radius_miles: float
+    ) -> List[Tuple[str, float]]:
+        """Find trials with at least one site within ``radius_miles``.
+
+        Returns:
+            List[Tuple[str, float]]: ``(nct_id, nearest_site_miles)`` pairs
+                sorted by distance, nearest first
+        """
+        lat_span = radius_miles / self.MILES_PER_DEGREE_LAT
+        cos_lat = max(
+            math.cos(math.radians(min(89.9, abs(latitude) + lat_span))), 1e-6
+        )
+        lon_span = min(180.0, lat_span / cos_lat)
+
+        lat_min, _ = self._cell(max(-90.0, latitude - lat_span), longitude)
+        lat_max, _ = self._cell(min(90.0, latitude + lat_span), longitude)
+        lon_steps = int(math.ceil(lon_span / self.cell_degrees))
+        _, lon_center = self._cell(latitude, longitude)
+        lon_cells = {
+            (lon_center + step) % self._lon_cells
+            for step in range(-lon_steps, lon_steps + 1)
+        }
+
+        nearest: Dict[str, float] = {}
+        for lat_cell in range(lat_min, lat_max + 1):
+            for lon_cell in lon_cells:
+                for site_lat, site_lon, nct_id in self._cells.get(
+                    (lat_cell, lon_cell), ()
+                ):
+                    distance = _haversine_miles(
+                        latitude, longitude, site_lat, site_lon
+                    )
+                    if distance <= radius_miles and distance < nearest.get(
+                        nct_id, math.inf
+                    ):
+                        nearest[nct_id] = distance
+
+        return sorted(nearest.items(), key=lambda item: item[1])
+
+
+def _build_search_params(
+    condition: str,
+    page_size: int,
+    status: Optional[str] = None,
+    page_token: Optional[str] = None,
+    geo: Optional[Tuple[float, float, float]] = None,
+) -> Dict[str, Any]:
+    """Build API v2 query parameters for one page of a condition search."""
+    params: Dict[str, Any] = {
+        "query.cond": condition,
+        "pageSize": max(1, min(page_size, MAX_PAGE_SIZE)),
+        "format": "json",
+    }
+
+    # Add status filter if provided
+    if status:
+        params["filter.overallStatus"] = status.upper().replace("-", "_")
+    if page_token:
+        params["pageToken"] = page_token
+    if geo:
+        # Server-side pre-filter so far-away studies never reach us
+        latitude, longitude, radius_miles = geo
+        params["filter.geo"] = f"distance({latitude},{longitude},{radius_miles}mi)"
+    return params
+
+
+async def _fetch_studies_page(
+    params: Dict[str, Any], client: Optional[Any] = None
+) -> Dict[str, Any]:
+    """Fetch one raw API v2 page, reusing ``client`` when one is supplied."""
+    if client is not None:
+        response = await client.get(CLINICAL_TRIALS_API_URL, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    if _has_httpx:
+        async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(30.0)) as new_client:
+            response = await new_client.get(CLINICAL_TRIALS_API_URL, params=params)
+            response.raise_for_status()
+            return response.json()
+
+    # Synchronous fallback for environments without httpx
+    # Use asyncio.to_thread to avoid blocking the event loop
+    response = await asyncio.to_thread(
+        requests.get, CLINICAL_TRIALS_API_URL, params=params, timeout=15
+    )
+    # If the requests stub raises, it will surface here
+    response.raise_for_status()
+    return response.json()
+
+
+async def _iter_study_pages(
+    params: Dict[str, Any], max_pages: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield raw API v2 pages by following ``nextPageToken`` cursors.
+
+    A single HTTP client is kept open for the whole walk so consecutive pages
+    reuse the same connection. Iteration stops when the API stops returning a
+    cursor, ``max_pages`` is reached, or the consumer stops iterating.
+    """
+    pages = 0
+
+    client_context = (
+        httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(30.0))
+        if _has_httpx
+        else contextlib.nullcontext()
+    )
+    async with client_context as client:
+        while max_pages is None or pages < max_pages:
+            data = await _fetch_studies_page(params, client)
+            pages += 1
+            yield data
+
+            next_token = data.get("nextPageToken")
+            if not next_token or next_token == params.get("pageToken"):
+                return
+            params = {**params, "pageToken": next_token}
+
+
+def _parse_study(study: Dict[str, Any], condition: str) -> Dict[str, Any]:
+    """Convert one API v2 study into the router-facing trial dict."""
+    protocol = study.get("protocolSection", {})
+    identification = protocol.get("identificationModule", {})
+    status_module = protocol.get("statusModule", {})
+    design_module = protocol.get("designModule", {})
+    conditions_module = protocol.get("conditionsModule", {})
+    description_module = protocol.get("descriptionModule", {})
+    sponsor_module = protocol.get("sponsorCollaboratorsModule", {})
+    contacts_module = protocol.get("contactsLocationsModule", {})
+    eligibility_module = protocol.get("eligibilityModule", {})
+
+    # Get NCT ID for URL
+    nct_id = identification.get("nctId", "Unknown")
+
+    # Extract contact information
+    central_contacts = contacts_module.get("centralContacts", [])
+    contact_info = None
+    if central_contacts:
+        contact = central_contacts[0]
+        contact_info = {
+            "name": contact.get("name", "Not provided"),
+            "email": contact.get("email"),
+            "phone": contact.get("phone"),
+        }
+
+    return {
+        "nct_id": nct_id,
+        "title": identification.get("briefTitle", "No title available"),
+        "summary": description_module.get("briefSummary", "No summary available"),
+        "phase": (
+            design_module.get("phases", ["N/A"])[0]
+            if design_module.get("phases")
+            else "N/A"
+        ),
+        "status": status_module.get("overallStatus", "Unknown"),
+        "study_type": design_module.get("studyType", "Unknown"),
+        "condition": ", ".join(conditions_module.get("conditions", [condition])),
+        "sponsor": sponsor_module.get("leadSponsor", {}).get("name", "Not provided"),
+        "enrollment": eligibility_module.get("maximumAge", "Not specified"),
+        "contact": contact_info,
+        "url": f"https://clinicaltrials.gov/study/{nct_id}",
+    }
+
+
 async def _search_trials_live(
-    condition: str, max_studies: int, status: Optional[str] = None
+    condition: str,
+    max_studies: int,
+    status: Optional[str] = None,
+    page_token: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Internal helper to search ClinicalTrials.gov API v2 with comprehensive parsing.
@@ -799,9 +1098,11 @@ async def _search_trials_live(
         condition (str): Medical condition to search
         max_studies (int): Maximum trials to return (capped at 100 by API)
         status (Optional[str]): Status filter (will be uppercased and hyphen-converted)
+        page_token (Optional[str]): Cursor from a previous ``next_page_token``
 
     Returns:
         Dict[str, Any]: Parsed search results with comprehensive trial information
+            and ``next_page_token`` (None on the last page)
 
     Raises:
         requests.HTTPError: If API returns error status
@@ -814,94 +1115,131 @@ async def _search_trials_live(
         sponsor details, and generates direct URLs to ClinicalTrials.gov.
         Uses async httpx if available, falls back to sync requests with thread pool.
     """
+    params = _build_search_params(condition, max_studies, status, page_token)
+    data = await _fetch_studies_page(params)
 
-    # ClinicalTrials.gov API v2 endpoint
-    base_url = "https://clinicaltrials.gov/api/v2/studies"
+    # Parse API v2 response
+    studies = data.get("studies", [])
+    total_studies = data.get("totalCount", len(studies))
+    trials = [_parse_study(study, condition) for study in studies[:max_studies]]
 
-    params = {
-        "query.cond": condition,
-        "pageSize": min(max_studies, 100),
-        "format": "json",
+    return {
+        "total_studies": total_studies,
+        "studies_summary": f"Found {len(trials)} clinical trials related to '{condition}' from ClinicalTrials.gov API v2",
+        "trials": trials,
+        "sources": ["ClinicalTrials.gov API v2"],
+        "next_page_token": data.get("nextPageToken"),
     }
 
-    # Add status filter if provided
-    if status:
-        params["filter.overallStatus"] = status.upper().replace("-", "_")
 
-    if _has_httpx:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-            response = await client.get(base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-    else:
-        # Synchronous fallback for environments without httpx
-        # Use asyncio.to_thread to avoid blocking the event loop
-        response = await asyncio.to_thread(
-            requests.get, base_url, {"params": params, "timeout": 15}
-        )
-        # If the requests stub raises, it will surface here
-        response.raise_for_status()
-        data = response.json()
+async def iter_clinical_trials(
+    condition: str,
+    status: Optional[str] = None,
+    page_size: int = 50,
+    max_pages: Optional[int] = None,
+    page_token: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream parsed trials across ClinicalTrials.gov result pages.
 
-    # Parse API v2 response
-    studies = data.get("studies", [])
-    total_studies = data.get("totalCount", len(studies))
+    Trials are yielded as soon as their page arrives, so callers can stop
+    early (e.g. once they have enough matches) without fetching or parsing
+    the remaining pages.
 
-    trials = []
-    for study in studies[:max_studies]:
-        protocol = study.get("protocolSection", {})
-        identification = protocol.get("identificationModule", {})
-        status_module = protocol.get("statusModule", {})
-        design_module = protocol.get("designModule", {})
-        conditions_module = protocol.get("conditionsModule", {})
-        description_module = protocol.get("descriptionModule", {})
-        sponsor_module = protocol.get("sponsorCollaboratorsModule", {})
-        contacts_module = protocol.get("contactsLocationsModule", {})
-        eligibility_module = protocol.get("eligibilityModule", {})
-
-        # Get NCT ID for URL
-        nct_id = identification.get("nctId", "Unknown")
-
-        # Extract contact information
-        central_contacts = contacts_module.get("centralContacts", [])
-        contact_info = None
-        if central_contacts:
-            contact = central_contacts[0]
-            contact_info = {
-                "name": contact.get("name", "Not provided"),
-                "email": contact.get("email"),
-                "phone": contact.get("phone"),
-            }
+    Args:
+        condition (str): Medical condition to search
+        status (Optional[str]): Status filter (case-insensitive)
+        page_size (int): Studies per API request (capped at 100)
+        max_pages (Optional[int]): Stop after this many pages. Defaults to all.
+        page_token (Optional[str]): Resume from a previous ``next_page_token``
 
-        trials.append(
-            {
-                "nct_id": nct_id,
-                "title": identification.get("briefTitle", "No title available"),
-                "summary": description_module.get(
-                    "briefSummary", "No summary available"
-                ),
-                "phase": (
-                    design_module.get("phases", ["N/A"])[0]
-                    if design_module.get("phases")
-                    else "N/A"
-                ),
-                "status": status_module.get("overallStatus", "Unknown"),
-                "study_type": design_module.get("studyType", "Unknown"),
-                "condition": ", ".join(
-                    conditions_module.get("conditions", [condition])
-                ),
-                "sponsor": sponsor_module.get("leadSponsor", {}).get(
-                    "name", "Not provided"
-                ),
-                "enrollment": eligibility_module.get("maximumAge", "Not specified"),
-                "contact": contact_info,
-                "url": f"https://clinicaltrials.gov/study/{nct_id}",
-            }
-        )
+    Yields:
+        Dict[str, Any]: Trial dicts in the same shape as search_clinical_trials()
+
+    Examples:
+        >>> async for trial in iter_clinical_trials("asthma", status="recruiting"):
+        ...     if trial["phase"] == "PHASE3":
+        ...         break
+    """
+    params = _build_search_params(condition, page_size, status, page_token)
+    async with contextlib.aclosing(
+        _iter_study_pages(params, max_pages=max_pages)
+    ) as pages:
+        async for page in pages:
+            for study in page.get("studies", []):
+                yield _parse_study(study, condition)
+
+
+async def search_trials_near(
+    condition: str,
+    latitude: float,
+    longitude: float,
+    radius_miles: float = 50.0,
+    max_studies: int = 10,
+    status: Optional[str] = None,
+    max_pages: int = 5,
+) -> Dict[str, Any]:
+    """
+    Find trials with at least one site within ``radius_miles`` of a point.
+
+    The API is asked to pre-filter with ``filter.geo`` and each page's site
+    coordinates are added to a TrialSiteGeoIndex as it streams in, so only
+    sites in nearby grid cells are distance-checked. Paging stops as soon as
+    ``max_studies`` matches are found.
+
+    Args:
+        condition (str): Medical condition to search
+        latitude (float): Search center latitude
+        longitude (float): Search center longitude
+        radius_miles (float): Search radius in miles. Defaults to 50.
+        max_studies (int): Maximum trials to return
+        status (Optional[str]): Status filter (case-insensitive)
+        max_pages (int): Upper bound on API pages to walk. Defaults to 5.
+
+    Returns:
+        Dict[str, Any]: Search results; each trial carries ``nearest_site_miles``
+            and trials are ordered nearest first
+    """
+    params = _build_search_params(
+        condition,
+        MAX_PAGE_SIZE,
+        status,
+        geo=(latitude, longitude, radius_miles),
+    )
+
+    index = TrialSiteGeoIndex()
+    parsed: Dict[str, Dict[str, Any]] = {}
+    matches: List[Tuple[str, float]] = []
+    total_studies = 0
+
+    async with contextlib.aclosing(
+        _iter_study_pages(params, max_pages=max_pages)
+    ) as pages:
+        async for page in pages:
+            total_studies = page.get("totalCount", total_studies)
+            for study in page.get("studies", []):
+                trial = _parse_study(study, condition)
+                locations = (
+                    study.get("protocolSection", {})
+                    .get("contactsLocationsModule", {})
+                    .get("locations", [])
+                )
+                if index.add_sites(trial["nct_id"], locations):
+                    parsed[trial["nct_id"]] = trial
+
+            matches = index.query(latitude, longitude, radius_miles)
+            if len(matches) >= max_studies:
+                break
+
+    trials = []
+    for nct_id, distance in matches[:max_studies]:
+        trial = dict(parsed[nct_id])
+        trial["nearest_site_miles"] = round(distance, 1)
+        trials.append(trial)
 
     return {
         "total_studies": total_studies,
-        "studies_summary": f"Found {len(trials)} clinical trials related to '{condition}' from ClinicalTrials.gov API v2",
+        "studies_summary": f"Found {len(trials)} clinical trials for '{condition}' within {radius_miles:g} miles",
         "trials": trials,
         "sources": ["ClinicalTrials.gov API v2"],
     }
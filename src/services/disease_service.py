@@ -98,6 +98,7 @@ except ImportError:
 
 
 from ..utils.config import get_educational_banner, get_settings
+from ..utils.metrics import upstream_event_hooks, upstream_transport
 from ..utils.exceptions import ExternalServiceException
 
 logger = logging.getLogger(__name__)
@@ -282,7 +283,7 @@ class DiseaseService(BaseService[Dict[str, Any]]):
         search_url = f"{self.base_url}/query"
         params = {"q": query, "fields": "mondo,disgenet,ctd", "size": 5}
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+        async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(10.0)) as client:
             response = await client.get(search_url, params=params)
             response.raise_for_status()
             data = response.json()
@@ -554,7 +555,7 @@ async def _fetch_medlineplus_symptoms(
         return symptoms
 
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+        async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(10.0)) as client:
             # Try SNOMED code first if available, then fall back to disease name search
             urls_to_try = []
 
@@ -653,6 +654,8 @@ async def _lookup_from_medlineplus(query: str) -> Optional[Dict[str, Any]]:
         import xml.etree.ElementTree as ET
 
         async with httpx.AsyncClient(
+            event_hooks=upstream_event_hooks(),
+            transport=upstream_transport(),
             timeout=httpx.Timeout(10.0), follow_redirects=True
         ) as client:
             # Query MedlinePlus health topics
@@ -752,7 +755,7 @@ async def _fetch_related_pubmed_articles(disease_name: str) -> List[Dict[str, An
             "retmode": "json",
         }
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(15.0)) as client:
+        async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(15.0)) as client:
             search_response = await client.get(search_url, params=search_params)
             search_response.raise_for_status()
             search_data = search_response.json()
@@ -877,7 +880,7 @@ async def _lookup_disease_live(query: str) -> Dict[str, Any]:
     logger.info(f"🔍 Looking up disease: {query}")
 
     if _has_httpx:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+        async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(10.0)) as client:
             response = await client.get(base_url, params=params)
             response.raise_for_status()
             data = response.json()
@@ -912,7 +915,7 @@ async def _lookup_disease_live(query: str) -> Dict[str, Any]:
         if mondo_id and _has_httpx:
             try:
                 detailed_url = f"https://mydisease.info/v1/disease/{mondo_id}"
-                async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+                async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(10.0)) as client:
                     detail_response = await client.get(
                         detailed_url, params={"fields": "hpo"}
                     )
@@ -38,6 +38,17 @@ except ImportError:
         )()
 
 
+try:
+    from src.utils.metrics import upstream_event_hooks, upstream_transport
+except ImportError:
+
+    def upstream_event_hooks():  # type: ignore
+        return {}
+
+    def upstream_transport(transport=None, **transport_kwargs):  # type: ignore
+        return transport
+
+
 try:
     import httpx
 
@@ -382,6 +393,8 @@ class DrugInteractionService:
 
         if self.session is None:
             self.session = httpx.AsyncClient(
+                event_hooks=upstream_event_hooks(),
+                transport=upstream_transport(),
                 timeout=httpx.Timeout(30.0),
                 headers={
                     "User-Agent": "AI-Nurse-Florence/2.1.0 (Drug Interaction Checker)",
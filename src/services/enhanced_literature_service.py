@@ -279,6 +279,17 @@ except ImportError:
         )()
 
 
+try:
+    from src.utils.metrics import upstream_event_hooks, upstream_transport
+except ImportError:
+
+    def upstream_event_hooks():  # type: ignore
+        return {}
+
+    def upstream_transport(transport=None, **transport_kwargs):  # type: ignore
+        return transport
+
+
 try:
     import httpx
 
@@ -378,6 +389,8 @@ class EnhancedLiteratureService:
             )
 
             self.session = httpx.AsyncClient(
+                event_hooks=upstream_event_hooks(),
+                transport=upstream_transport(limits=limits),
                 timeout=httpx.Timeout(30.0),
                 limits=limits,
                 headers={
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from src.utils.config import get_settings
+from src.utils.metrics import upstream_event_hooks, upstream_transport
 from src.utils.redis_cache import cached
 
 logger = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ class FDADrugService:
             Dict with drug label information or None if not found
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=self.timeout) as client:
                 # Search drug labels by name
                 url = f"{self.base_url}/label.json"
                 params = {
@@ -124,7 +125,7 @@ class FDADrugService:
             Dict with adverse event statistics or None
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=self.timeout) as client:
                 url = f"{self.base_url}/event.json"
                 params = {
                     "search": f'patient.drug.openfda.brand_name:"{drug_name}" patient.drug.openfda.generic_name:"{drug_name}"',
@@ -6,6 +6,7 @@ Following External Service Integration and Conditional Imports Pattern from codi
 import logging
 from typing import Dict, Any
 from ..utils.config import get_settings, get_educational_banner
+from ..utils.metrics import upstream_event_hooks, upstream_transport
 from ..utils.redis_cache import cached
 
 logger = logging.getLogger(__name__)
@@ -120,7 +121,7 @@ async def _search_pubmed_live(query: str, max_results: int) -> Dict[str, Any]:
     }
     
     if _has_httpx:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+        async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(10.0)) as client:
             search_response = await client.get(search_url, params=search_params)
             search_response.raise_for_status()
             search_data = search_response.json()
@@ -143,7 +144,7 @@ async def _search_pubmed_live(query: str, max_results: int) -> Dict[str, Any]:
         }
         
         if _has_httpx:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+            async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(10.0)) as client:
                 fetch_response = await client.get(fetch_url, params=fetch_params)
                 fetch_response.raise_for_status()
         else:
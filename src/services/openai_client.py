@@ -4,8 +4,10 @@ Following OpenAI Integration pattern with environment-based API key loading
 """
 
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 from src.utils.config import get_settings, get_openai_config
+from src.utils.metrics import record_ai_request, upstream_event_hooks, upstream_transport
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +32,19 @@ class OpenAIService:
                 # Try to import OpenAI following Conditional Imports Pattern
                 try:
                     import openai
-                    # Use AsyncOpenAI for async/await compatibility
-                    self._client = openai.AsyncOpenAI(api_key=self.config["api_key"])
+                    # Use AsyncOpenAI for async/await compatibility; the default
+                    # httpx client gets the upstream latency hooks (and a transport
+                    # that records failed calls) when metrics are on
+                    hooks = upstream_event_hooks()
+                    http_client = (
+                        openai.DefaultAsyncHttpxClient(
+                            event_hooks=hooks,
+                            transport=upstream_transport(limits=openai.DEFAULT_CONNECTION_LIMITS),
+                        )
+                        if hooks and hasattr(openai, "DefaultAsyncHttpxClient")
+                        else None
+                    )
+                    self._client = openai.AsyncOpenAI(api_key=self.config["api_key"], http_client=http_client)
                     logger.info("OpenAI service: Client initialized successfully")
                 except ImportError:
                     logger.info("OpenAI service: openai library not available, using educational stubs")
@@ -70,28 +83,24 @@ class OpenAIService:
     async def _generate_live_response(self, prompt: str, context: Optional[str]) -> Dict[str, Any]:
         """Generate live OpenAI response using actual API."""
         try:
-            # Construct messages following OpenAI best practices
-            messages = []
-            
-            if context:
-                messages.append({
-                    "role": "system",
-                    "content": f"You are a healthcare AI assistant. Context: {context}."
-                })
-            else:
-                messages.append({
-                    "role": "system",
-                    "content": "You are a healthcare AI assistant providing information."
-                })
-            
-            messages.append({"role": "user", "content": prompt})
-            
             # Make API call
-            response = await self._client.chat.completions.create(
-                model=self.config["model"],
-                messages=messages,
-                max_tokens=1000,
-                temperature=0.7
+            started = time.perf_counter()
+            try:
+                response = await self._client.chat.completions.create(
+                    model=self.config["model"],
+                    messages=self._build_messages(prompt, context),
+                    max_tokens=1000,
+                    temperature=0.7
+                )
+            except Exception:
+                record_ai_request("openai", self.config["model"], time.perf_counter() - started, success=False)
+                raise
+            record_ai_request(
+                "openai",
+                self.config["model"],
+                time.perf_counter() - started,
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens,
             )
             
             ai_response = response.choices[0].message.content
@@ -114,6 +123,91 @@ class OpenAIService:
             # Fall back to stub response on API error
             return self._create_stub_response(prompt, context, api_error=str(e))
     
+    @staticmethod
+    def _build_messages(prompt: str, context: Optional[str]) -> List[Dict[str, str]]:
+        """Construct messages following OpenAI best practices."""
+        if context:
+            system = f"You are a healthcare AI assistant. Context: {context}."
+        else:
+            system = "You are a healthcare AI assistant providing information."
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ]
+
+    async def stream_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a live OpenAI response as text chunks.
+
+        Raises instead of returning the educational stub, so callers can fall
+        back or end their stream. When given, ``usage`` is filled with the model
+        and token counts once the stream ends.
+        """
+        if not (self._client and self.config["available"]):
+            raise RuntimeError("OpenAI service not available (no API key configured)")
+
+        model = self.config["model"]
+        started = time.perf_counter()
+        final_usage = None
+        try:
+            stream = await self._client.chat.completions.create(
+                model=model,
+                messages=self._build_messages(prompt, context),
+                max_tokens=1000,
+                temperature=0.7,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    final_usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            record_ai_request("openai", model, time.perf_counter() - started, success=False)
+            logger.error(f"OpenAI streaming error: {e}")
+            raise
+
+        input_tokens = final_usage.prompt_tokens if final_usage else 0
+        output_tokens = final_usage.completion_tokens if final_usage else 0
+        record_ai_request(
+            "openai",
+            model,
+            time.perf_counter() - started,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        if usage is not None:
+            usage.update(model=model, input_tokens=input_tokens, output_tokens=output_tokens)
+
+    async def create_embedding(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
+        """
+        Embed ``text`` with the OpenAI embeddings API.
+
+        Raises when no live client is configured; there is no stub embedding.
+        """
+        if not (self._client and self.config["available"]):
+            raise RuntimeError("OpenAI service not available (no API key configured)")
+
+        started = time.perf_counter()
+        try:
+            response = await self._client.embeddings.create(model=model, input=text)
+        except Exception:
+            record_ai_request("openai", model, time.perf_counter() - started, success=False)
+            raise
+        record_ai_request(
+            "openai",
+            model,
+            time.perf_counter() - started,
+            input_tokens=response.usage.prompt_tokens,
+        )
+        return list(response.data[0].embedding)
+
     def _create_stub_response(self, prompt: str, context: Optional[str], api_error: Optional[str] = None) -> Dict[str, Any]:
         """Create educational stub response following API Design Standards."""
         
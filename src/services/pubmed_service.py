@@ -106,6 +106,7 @@ import logging
 
 from ..utils.config import get_settings
 from ..utils.exceptions import ExternalServiceException
+from ..utils.metrics import upstream_event_hooks, upstream_transport
 from ..utils.redis_cache import cached
 from .base_service import BaseService
 
@@ -269,7 +270,7 @@ class PubMedService(BaseService[Dict[str, Any]]):
         }
 
         if _has_httpx:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(15.0)) as client:
+            async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(15.0)) as client:
                 search_response = await client.get(search_url, params=search_params)
                 search_response.raise_for_status()
                 search_content = search_response.content
@@ -304,7 +305,7 @@ class PubMedService(BaseService[Dict[str, Any]]):
         }
 
         if _has_httpx:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(15.0)) as client:
+            async with httpx.AsyncClient(event_hooks=upstream_event_hooks(), transport=upstream_transport(), timeout=httpx.Timeout(15.0)) as client:
                 fetch_response = await client.get(fetch_url, params=fetch_params)
                 fetch_response.raise_for_status()
                 fetch_content = fetch_response.content
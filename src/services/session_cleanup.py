@@ -7,8 +7,10 @@ Following Service Layer Architecture and Background Tasks patterns from coding i
 """
 
 import asyncio
+import json
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
@@ -29,6 +31,10 @@ except ImportError:
         async def cleanup_expired_sessions(cutoff_time: datetime) -> int:
             return 0
         
+        @staticmethod
+        async def deactivate_expired_sessions() -> int:
+            return 0
+        
         @staticmethod
         async def get_session_stats() -> Dict[str, Any]:
             return {"total_sessions": 0, "active_sessions": 0}
@@ -41,9 +47,40 @@ try:
 except ImportError:
     _has_redis = False
     
-    def get_redis_client():
+    async def get_redis_client():
         return None
 
+# Redis layout: session payloads live under ``session:<id>``; their expiry
+# times (epoch seconds) are indexed in one sorted set so cleanup only ever
+# touches expired entries. Sessions written without ``track_redis_session``
+# are picked up by an incremental SCAN that resumes from a stored cursor on
+# every cleanup pass. Both keys sit outside the ``session:`` prefix so that
+# SCAN never picks them up.
+REDIS_SESSION_PATTERN = "session:*"
+REDIS_SESSION_EXPIRY_INDEX = "sessions:expiry_index"
+REDIS_SESSION_SCAN_CURSOR = "sessions:expiry_index:scan_cursor"
+
+
+def _epoch(value: datetime) -> float:
+    """Epoch seconds; naive datetimes are UTC, as everywhere else in the app."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+async def track_redis_session(key: str, expires_at: datetime) -> None:
+    """
+    Record (or move) a Redis session's expiry in the cleanup index.
+    Call whenever a ``session:*`` key is written or its lifetime extended;
+    sessions written without it are only indexed once the cleanup SCAN
+    reaches them.
+    """
+    redis_client = await get_redis_client()
+    if not redis_client:
+        return
+    await redis_client.zadd(REDIS_SESSION_EXPIRY_INDEX, {key: _epoch(expires_at)})
+
+
 @dataclass
 class SessionCleanupStats:
     """Statistics from session cleanup operations."""
@@ -53,6 +90,7 @@ class SessionCleanupStats:
     total_sessions_after: int
     cleanup_duration_seconds: float
     errors: List[str]
+    redis_sessions_removed: int = 0
 
 class SessionCleanupService:
     """
@@ -94,6 +132,7 @@ class SessionCleanupService:
         start_time = datetime.utcnow()
         errors = []
         expired_count = 0
+        redis_removed = 0
         total_before = 0
         total_after = 0
         
@@ -113,6 +152,15 @@ class SessionCleanupService:
             expiry_hours = getattr(self.settings, 'SESSION_EXPIRY_HOURS', 24)
             cutoff_time = datetime.utcnow() - timedelta(hours=expiry_hours)
             
+            # Mark sessions past their expiry inactive, then remove old ones
+            try:
+                deactivated = await UserDatabase.deactivate_expired_sessions()
+                if deactivated:
+                    logger.info(f"Deactivated {deactivated} expired sessions")
+            except Exception as e:
+                errors.append(f"Failed to deactivate sessions: {str(e)}")
+                logger.warning(f"Could not deactivate expired sessions: {e}")
+            
             # Clean up expired sessions
             try:
                 expired_count = await UserDatabase.cleanup_expired_sessions(cutoff_time)
@@ -130,10 +178,10 @@ class SessionCleanupService:
                 errors.append(f"Failed to get post-cleanup stats: {str(e)}")
                 logger.warning(f"Could not get session stats after cleanup: {e}")
             
-            # Clean up Redis cache if available
+            # Clean up Redis cache if available (each session carries its own expiry)
             if _has_redis:
                 try:
-                    await self._cleanup_redis_sessions(cutoff_time)
+                    redis_removed = await self._cleanup_redis_sessions()
                 except Exception as e:
                     errors.append(f"Redis cleanup failed: {str(e)}")
                     logger.warning(f"Redis session cleanup failed: {e}")
@@ -153,7 +201,8 @@ class SessionCleanupService:
             total_sessions_before=total_before,
             total_sessions_after=total_after,
             cleanup_duration_seconds=duration,
-            errors=errors
+            errors=errors,
+            redis_sessions_removed=redis_removed
         )
         
         # Store in history (keep last 100 entries)
@@ -165,41 +214,132 @@ class SessionCleanupService:
         
         return stats
     
-    async def _cleanup_redis_sessions(self, cutoff_time: datetime):
-        """Clean up expired sessions from Redis cache."""
-        redis_client = get_redis_client()
+    async def _cleanup_redis_sessions(self) -> int:
+        """
+        Clean up expired sessions from Redis cache.
+
+        First indexes any sessions the index doesn't know about yet (one
+        bounded SCAN step), then reads expired keys from the expiry index
+        with ZRANGEBYSCORE and drops them with a pipelined UNLINK + ZREM, in
+        bounded batches. Returns the number removed.
+        """
+        redis_client = await get_redis_client()
         if not redis_client:
-            return
+            return 0
         
         try:
-            # Get all session keys
-            session_keys = await redis_client.keys("session:*")
-            expired_keys = []
+            await self.reconcile_redis_session_index()
             
-            for key in session_keys:
-                try:
-                    # Get session data
-                    session_data = await redis_client.get(key)
-                    if session_data:
-                        import json
-                        session_info = json.loads(session_data)
-                        created_at = datetime.fromisoformat(session_info.get("created_at", ""))
-                        
-                        if created_at < cutoff_time:
-                            expired_keys.append(key)
+            batch_size = getattr(self.settings, 'SESSION_CLEANUP_BATCH_SIZE', 500)
+            max_batches = getattr(self.settings, 'SESSION_CLEANUP_MAX_BATCHES', 100)
+            now = time.time()
+            removed = 0
+            
+            for _ in range(max_batches):
+                expired_keys = await redis_client.zrangebyscore(
+                    REDIS_SESSION_EXPIRY_INDEX, "-inf", now, start=0, num=batch_size
+                )
+                if not expired_keys:
+                    break
                 
-                except Exception as e:
-                    logger.warning(f"Could not process Redis key {key}: {e}")
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.unlink(*expired_keys)
+                    pipe.zrem(REDIS_SESSION_EXPIRY_INDEX, *expired_keys)
+                    await pipe.execute()
+                removed += len(expired_keys)
+                
+                if len(expired_keys) < batch_size:
+                    break
+            else:
+                logger.info("Redis session cleanup hit its batch limit; the rest is left for the next pass")
             
-            # Delete expired keys
-            if expired_keys:
-                await redis_client.delete(*expired_keys)
-                logger.info(f"Cleaned up {len(expired_keys)} expired Redis sessions")
+            if removed:
+                logger.info(f"Cleaned up {removed} expired Redis sessions")
+            return removed
         
         except Exception as e:
             logger.error(f"Redis session cleanup failed: {e}")
             raise
     
+    async def reconcile_redis_session_index(self, max_keys: Optional[int] = None) -> int:
+        """
+        Index ``session:*`` keys that are missing from the expiry index.
+
+        Continues a cursor-based SCAN (never KEYS) from where the previous
+        pass stopped and walks about ``max_keys`` keys per call (default
+        SESSION_INDEX_SCAN_KEYS_PER_PASS), so sessions written without
+        ``track_redis_session`` are indexed within a few passes and a pass
+        never walks the whole keyspace. Already indexed sessions keep their
+        expiry (ZADD NX); 0 turns the SCAN off. Returns the number of
+        sessions newly indexed.
+        """
+        batch_size = getattr(self.settings, 'SESSION_CLEANUP_BATCH_SIZE', 500)
+        if max_keys is None:
+            max_keys = getattr(self.settings, 'SESSION_INDEX_SCAN_KEYS_PER_PASS', 10000)
+        if max_keys <= 0:
+            return 0
+        
+        redis_client = await get_redis_client()
+        if not redis_client:
+            return 0
+        
+        expiry_seconds = getattr(self.settings, 'SESSION_EXPIRY_HOURS', 24) * 3600
+        
+        cursor = int(await redis_client.get(REDIS_SESSION_SCAN_CURSOR) or 0)
+        indexed = 0
+        for _ in range(max(1, max_keys // batch_size)):
+            cursor, keys = await redis_client.scan(
+                cursor=cursor, match=REDIS_SESSION_PATTERN, count=batch_size
+            )
+            cursor = int(cursor)
+            if keys:
+                indexed += await self._index_sessions(redis_client, keys, expiry_seconds)
+            if cursor == 0:
+                break
+        
+        # Resume here next pass; a finished walk starts over from the beginning
+        if cursor:
+            await redis_client.set(REDIS_SESSION_SCAN_CURSOR, cursor)
+        else:
+            await redis_client.delete(REDIS_SESSION_SCAN_CURSOR)
+        
+        if indexed:
+            logger.info(f"Indexed {indexed} untracked Redis sessions by expiry")
+        return indexed
+    
+    async def _index_sessions(self, redis_client: Any, keys: List[Any], expiry_seconds: float) -> int:
+        """Add ``keys`` to the expiry index unless already there (pipelined GET/PTTL)."""
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+                pipe.pttl(key)
+            results = await pipe.execute()
+        
+        now = time.time()
+        scores = {}
+        for key, payload, pttl in zip(keys, results[0::2], results[1::2]):
+            if payload is None:
+                continue
+            scores[key] = self._session_expiry(payload, pttl, now, expiry_seconds)
+        if not scores:
+            return 0
+        return await redis_client.zadd(REDIS_SESSION_EXPIRY_INDEX, scores, nx=True)
+    
+    @staticmethod
+    def _session_expiry(payload: Any, pttl: Optional[int], now: float, expiry_seconds: float) -> float:
+        """Best-known expiry (epoch seconds) for an untracked session payload."""
+        try:
+            session_info = json.loads(payload)
+            if session_info.get("expires_at"):
+                return _epoch(datetime.fromisoformat(session_info["expires_at"]))
+            if session_info.get("created_at"):
+                return _epoch(datetime.fromisoformat(session_info["created_at"])) + expiry_seconds
+        except Exception:
+            pass
+        if pttl is not None and pttl > 0:
+            return now + pttl / 1000
+        return now + expiry_seconds
+    
     async def get_session_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive session statistics.
@@ -215,11 +355,10 @@ class SessionCleanupService:
             redis_stats = {}
             if _has_redis:
                 try:
-                    redis_client = get_redis_client()
+                    redis_client = await get_redis_client()
                     if redis_client:
-                        redis_keys = await redis_client.keys("session:*")
                         redis_stats = {
-                            "redis_sessions": len(redis_keys),
+                            "redis_sessions": await redis_client.zcard(REDIS_SESSION_EXPIRY_INDEX),
                             "redis_available": True
                         }
                 except Exception as e:
@@ -3,14 +3,26 @@ Translation Service for AI Nurse Florence
 Provides multi-language support with fallback strategies.
 
 Supports: English, Spanish, French, German, Italian, Portuguese, Chinese (Simplified)
+
+Translations are remembered in src.utils.translation_memory, and
+``translate_batch`` sends a document's new segments upstream in as few
+requests as each provider's per-request text limit allows.
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
 from enum import Enum
 
+from src.utils.translation_memory import get_translation_memory, memory_key
+
 logger = logging.getLogger(__name__)
 
+# Most texts each provider accepts in one request; larger batches are split
+# into chunks of this size and sent concurrently
+DEEPL_MAX_TEXTS_PER_REQUEST = 50
+GOOGLE_MAX_TEXTS_PER_REQUEST = 128
+
 
 class SupportedLanguage(str, Enum):
     """Supported languages for translation."""
@@ -113,20 +125,83 @@ class TranslationService:
         Returns:
             Dict with translated_text, detected_language, method, success
         """
+        results = await self.translate_batch([text], target_language, source_language, context)
+        return results[0]
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: str = "en",
+        context: str = "medical"
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate several segments (e.g. all of a document's) together.
+
+        Segments are answered from the translation memory where possible;
+        the remaining distinct segments go to DeepL/Google in batched requests.
+
+        Returns:
+            One result dict per input text, in order (same shape as ``translate``)
+        """
         # Normalize language codes
         target_language = self._normalize_language_code(target_language)
         source_language = self._normalize_language_code(source_language)
 
-        # If target is same as source, no translation needed
-        if target_language == source_language or target_language == "en":
+        def result(text: str, method: str, success: bool = True, **extra: Any) -> Dict[str, Any]:
             return {
                 "translated_text": text,
                 "detected_language": source_language,
                 "target_language": target_language,
-                "method": "no_translation_needed",
-                "success": True
+                "method": method,
+                "success": success,
+                **extra,
             }
 
+        # If target is same as source, no translation needed
+        if target_language == source_language or target_language == "en":
+            return [result(text, "no_translation_needed") for text in texts]
+
+        memory = get_translation_memory()
+        keys = {
+            text: memory_key(text, source_language, target_language, context)
+            for text in texts
+            if text and text.strip()
+        }
+        remembered = await memory.get_many(keys.values())
+        pending = [text for text, key in keys.items() if key not in remembered]
+
+        translated: Dict[str, Tuple[str, str]] = {}
+        if pending:
+            translated = await self._translate_upstream(pending, target_language, source_language)
+            await memory.put_many({keys[text]: entry for text, entry in translated.items()})
+
+        results = []
+        for text in texts:
+            key = keys.get(text)
+            if key is None:
+                results.append(result(text, "no_translation_needed"))
+            elif key in remembered:
+                translated_text, method = remembered[key]
+                results.append(result(translated_text, method, cached=True))
+            elif text in translated:
+                translated_text, method = translated[text]
+                results.append(result(translated_text, method))
+            else:
+                results.append(
+                    result(
+                        text,
+                        "none",
+                        success=False,
+                        error="Translation requires API key (DeepL or Google Translate)",
+                    )
+                )
+        return results
+
+    async def _translate_upstream(
+        self, texts: List[str], target: str, source: str
+    ) -> Dict[str, Tuple[str, str]]:
+        """Translate distinct texts in batched requests; ``text -> (translation, method)``."""
         # Try translation methods in order of quality
         methods = [
             ("deepl", self._translate_with_deepl),
@@ -135,35 +210,26 @@ class TranslationService:
 
         for method_name, method_func in methods:
             try:
-                result = await method_func(text, target_language, source_language)
-                if result:
+                translations = await method_func(texts, target, source)
+                if translations and len(translations) == len(texts):
                     return {
-                        "translated_text": result,
-                        "detected_language": source_language,
-                        "target_language": target_language,
-                        "method": method_name,
-                        "success": True
+                        text: (translation, method_name)
+                        for text, translation in zip(texts, translations)
+                        if translation
                     }
             except Exception as e:
                 logger.debug(f"{method_name} translation failed: {e}")
                 continue
 
-        # All methods failed, return original text with note
-        logger.warning(f"Translation unavailable for {source_language} -> {target_language}")
+        # All methods failed, callers return the original text with a note
+        logger.warning(f"Translation unavailable for {source} -> {target}")
         logger.warning("To enable translation, set DEEPL_API_KEY or GOOGLE_APPLICATION_CREDENTIALS")
-        return {
-            "translated_text": text,
-            "detected_language": source_language,
-            "target_language": target_language,
-            "method": "none",
-            "success": False,
-            "error": "Translation requires API key (DeepL or Google Translate)"
-        }
+        return {}
 
     async def _translate_with_deepl(
-        self, text: str, target: str, source: str
-    ) -> Optional[str]:
-        """Translate using DeepL API."""
+        self, texts: List[str], target: str, source: str
+    ) -> Optional[List[str]]:
+        """Translate a batch using DeepL API (one request per 50 texts)."""
         if not self.deepl_client:
             return None
 
@@ -171,27 +237,50 @@ class TranslationService:
         target_deepl = self._to_deepl_code(target)
         source_deepl = self._to_deepl_code(source)
 
-        result = self.deepl_client.translate_text(
-            text,
-            target_lang=target_deepl,
-            source_lang=source_deepl
+        async def translate_chunk(chunk: List[str]) -> List[str]:
+            # The DeepL client is blocking; keep it off the event loop
+            results = await asyncio.to_thread(
+                self.deepl_client.translate_text,
+                chunk,
+                target_lang=target_deepl,
+                source_lang=source_deepl
+            )
+            return [item.text for item in results]
+
+        return await self._translate_in_chunks(
+            translate_chunk, texts, DEEPL_MAX_TEXTS_PER_REQUEST
         )
-        return result.text
 
     async def _translate_with_google(
-        self, text: str, target: str, source: str
-    ) -> Optional[str]:
-        """Translate using Google Translate API."""
+        self, texts: List[str], target: str, source: str
+    ) -> Optional[List[str]]:
+        """Translate a batch using Google Translate API (one request per 128 texts)."""
         if not self.google_client:
             return None
 
-        result = self.google_client.translate(
-            text,
-            target_language=target,
-            source_language=source
+        async def translate_chunk(chunk: List[str]) -> List[str]:
+            results = await asyncio.to_thread(
+                self.google_client.translate,
+                chunk,
+                target_language=target,
+                source_language=source
+            )
+            return [item["translatedText"] for item in results]
+
+        return await self._translate_in_chunks(
+            translate_chunk, texts, GOOGLE_MAX_TEXTS_PER_REQUEST
         )
-        return result["translatedText"]
 
+    @staticmethod
+    async def _translate_in_chunks(
+        translate_chunk: Callable[[List[str]], Awaitable[List[str]]],
+        texts: List[str],
+        chunk_size: int,
+    ) -> List[str]:
+        """Send ``texts`` in chunks of ``chunk_size`` concurrently, keeping order."""
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        translated = await asyncio.gather(*(translate_chunk(chunk) for chunk in chunks))
+        return [text for chunk in translated for text in chunk]
 
     def _normalize_language_code(self, code: str) -> str:
         """Normalize language code to standard format."""
@@ -267,3 +356,25 @@ async def translate_text(
     """
     service = get_translation_service()
     return await service.translate(text, target_language, source_language, context)
+
+
+async def translate_texts(
+    texts: List[str],
+    target_language: str,
+    source_language: str = "en",
+    context: str = "medical"
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to translate several segments in one upstream request.
+
+    Args:
+        texts: Segments to translate
+        target_language: Target language code
+        source_language: Source language code (default: 'en')
+        context: Context for translation (default: 'medical')
+
+    Returns:
+        One translation result dictionary per segment, in order
+    """
+    service = get_translation_service()
+    return await service.translate_batch(texts, target_language, source_language, context)
@@ -1,11 +1,20 @@
 """
 Wizard AI Service using LangChain
 Provides AI-powered assistance for clinical wizards
+
+Wizard screens ask for several field suggestions at once. Field requests
+for the same wizard, patient context and wizard data that arrive within
+``FIELD_BATCH_WINDOW_SECONDS`` of each other are packed into one
+structured-output call (``suggest_wizard_fields``) and the results fanned
+back out. Concurrent identical requests share one in-flight call.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.output_parsers import JsonOutputParser
@@ -14,6 +23,24 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# How long a field suggestion waits for sibling requests before the batch is sent
+FIELD_BATCH_WINDOW_SECONDS = 0.025
+# A batch is sent immediately once it holds this many distinct fields
+MAX_FIELDS_PER_BATCH = 12
+
+
+def _request_key(*parts: Any) -> str:
+    """Stable key for coalescing identical requests."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _manual_field_suggestion() -> Dict[str, Any]:
+    return {
+        "suggested_value": None,
+        "reasoning": "AI suggestion unavailable - manual entry recommended",
+    }
+
 
 # Pydantic models for structured outputs
 class SepsisAssessment(BaseModel):
@@ -68,6 +95,30 @@ class CardiacAssessment(BaseModel):
     clinical_reasoning: str = Field(description="Brief clinical reasoning")
 
 
+class FieldSuggestion(BaseModel):
+    """Suggested value for one wizard field"""
+
+    suggested_value: Any = Field(description="Suggested value for the field")
+    reasoning: str = Field(description="Brief clinical reasoning")
+
+
+class WizardFieldSuggestions(BaseModel):
+    """Structured output for a batch of wizard field suggestions"""
+
+    suggestions: Dict[str, FieldSuggestion] = Field(
+        description="Suggestion for each requested field, keyed by field name"
+    )
+
+
+class _FieldBatch:
+    """Field suggestion requests waiting to be sent together"""
+
+    def __init__(self):
+        self.fields: Dict[str, asyncio.Future] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.sent = False
+
+
 class WizardAIService:
     """
     Service for providing AI-powered assistance to clinical wizards using LangChain
@@ -81,6 +132,21 @@ class WizardAIService:
             temperature=0.3,  # Lower temperature for clinical accuracy
             max_tokens=2000,
         )
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._field_batches: Dict[str, _FieldBatch] = {}
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    async def _coalesce(
+        self, key: str, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``factory`` once for concurrent callers sharing ``key``."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        # A caller that goes away doesn't cancel the call others are waiting on
+        return await asyncio.shield(task)
 
     async def suggest_sepsis_assessment(
         self,
@@ -99,6 +165,19 @@ class WizardAIService:
         Returns:
             SepsisAssessment with AI-generated suggestions
         """
+        return await self._coalesce(
+            _request_key("sepsis", patient_context, current_vitals, recent_labs),
+            lambda: self._suggest_sepsis_assessment(
+                patient_context, current_vitals, recent_labs
+            ),
+        )
+
+    async def _suggest_sepsis_assessment(
+        self,
+        patient_context: Dict[str, Any],
+        current_vitals: Optional[Dict[str, Any]],
+        recent_labs: Optional[Dict[str, Any]],
+    ) -> SepsisAssessment:
         parser = JsonOutputParser(pydantic_object=SepsisAssessment)
 
         prompt = ChatPromptTemplate.from_messages(
@@ -178,6 +257,19 @@ Provide sepsis screening suggestions with clear clinical reasoning.""",
         Returns:
             StrokeAssessment with AI-generated suggestions
         """
+        return await self._coalesce(
+            _request_key("stroke", patient_context, symptom_onset_time, current_symptoms),
+            lambda: self._suggest_stroke_assessment(
+                patient_context, symptom_onset_time, current_symptoms
+            ),
+        )
+
+    async def _suggest_stroke_assessment(
+        self,
+        patient_context: Dict[str, Any],
+        symptom_onset_time: str,
+        current_symptoms: Dict[str, Any],
+    ) -> StrokeAssessment:
         parser = JsonOutputParser(pydantic_object=StrokeAssessment)
 
         prompt = ChatPromptTemplate.from_messages(
@@ -255,6 +347,19 @@ Provide stroke assessment suggestions with focus on tPA eligibility.""",
         Returns:
             CardiacAssessment with AI-generated suggestions
         """
+        return await self._coalesce(
+            _request_key("cardiac", patient_context, chest_pain_characteristics, vital_signs),
+            lambda: self._suggest_cardiac_assessment(
+                patient_context, chest_pain_characteristics, vital_signs
+            ),
+        )
+
+    async def _suggest_cardiac_assessment(
+        self,
+        patient_context: Dict[str, Any],
+        chest_pain_characteristics: Dict[str, Any],
+        vital_signs: Dict[str, Any],
+    ) -> CardiacAssessment:
         parser = JsonOutputParser(pydantic_object=CardiacAssessment)
 
         prompt = ChatPromptTemplate.from_messages(
@@ -324,6 +429,9 @@ Provide cardiac assessment suggestions with HEART score and disposition recommen
         """
         Provide AI suggestion for a specific wizard field
 
+        Concurrent requests for the same wizard, patient context and wizard
+        data are batched into one ``suggest_wizard_fields`` call.
+
         Args:
             wizard_type: Type of wizard (sepsis, stroke, cardiac, etc.)
             field_name: Name of the field to suggest value for
@@ -333,46 +441,155 @@ Provide cardiac assessment suggestions with HEART score and disposition recommen
         Returns:
             Dict with suggested value and reasoning
         """
+        key = _request_key(wizard_type, patient_context, current_wizard_data)
+        batch = self._field_batches.get(key)
+        if batch is None:
+            batch = _FieldBatch()
+            self._field_batches[key] = batch
+            batch.timer = asyncio.get_running_loop().call_later(
+                FIELD_BATCH_WINDOW_SECONDS,
+                self._send_field_batch,
+                key,
+                batch,
+                wizard_type,
+                patient_context,
+                current_wizard_data,
+            )
+
+        # Identical field requests in the same batch share one result
+        future = batch.fields.get(field_name)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            batch.fields[field_name] = future
+            if len(batch.fields) >= MAX_FIELDS_PER_BATCH:
+                self._send_field_batch(
+                    key, batch, wizard_type, patient_context, current_wizard_data
+                )
+
+        return dict(await asyncio.shield(future))
+
+    def _send_field_batch(
+        self,
+        key: str,
+        batch: _FieldBatch,
+        wizard_type: str,
+        patient_context: Dict[str, Any],
+        current_wizard_data: Dict[str, Any],
+    ) -> None:
+        """Close ``batch`` to new fields and request all of its suggestions."""
+        if batch.sent:
+            return
+        batch.sent = True
+        if batch.timer is not None:
+            batch.timer.cancel()
+        if self._field_batches.get(key) is batch:
+            del self._field_batches[key]
+
+        async def run():
+            try:
+                results = await self.suggest_wizard_fields(
+                    wizard_type, list(batch.fields), patient_context, current_wizard_data
+                )
+            except Exception as e:
+                logger.error(f"Error in batched wizard field suggestion: {e}")
+                results = {}
+            for field_name, future in batch.fields.items():
+                if not future.done():
+                    future.set_result(results.get(field_name, _manual_field_suggestion()))
+
+        task = asyncio.ensure_future(run())
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def suggest_wizard_fields(
+        self,
+        wizard_type: str,
+        field_names: List[str],
+        patient_context: Dict[str, Any],
+        current_wizard_data: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Provide AI suggestions for several wizard fields in one call
+
+        Args:
+            wizard_type: Type of wizard (sepsis, stroke, cardiac, etc.)
+            field_names: Names of the fields to suggest values for
+            patient_context: Full patient context
+            current_wizard_data: Data already entered in wizard
+
+        Returns:
+            Dict mapping each field name to its suggested value and reasoning
+        """
+        field_names = list(dict.fromkeys(field_names))
+        return await self._coalesce(
+            _request_key(
+                "fields", wizard_type, sorted(field_names), patient_context, current_wizard_data
+            ),
+            lambda: self._suggest_wizard_fields(
+                wizard_type, field_names, patient_context, current_wizard_data
+            ),
+        )
+
+    async def _suggest_wizard_fields(
+        self,
+        wizard_type: str,
+        field_names: List[str],
+        patient_context: Dict[str, Any],
+        current_wizard_data: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        parser = JsonOutputParser(pydantic_object=WizardFieldSuggestions)
+
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
                     "system",
                     """You are a clinical nurse assistant helping with documentation.
-Provide a concise, evidence-based suggestion for the requested field.
-Return JSON with 'suggested_value' and 'reasoning' keys.""",
+Provide a concise, evidence-based suggestion for each requested field.
+Include every requested field, using the field names exactly as given.
+
+{format_instructions}""",
                 ),
                 (
                     "human",
                     """Wizard Type: {wizard_type}
-Field: {field_name}
+Fields: {field_names}
 Patient Context: {patient_context}
 Current Data: {current_wizard_data}
 
-Suggest an appropriate value for this field with brief clinical reasoning.""",
+Suggest an appropriate value for each field with brief clinical reasoning.""",
                 ),
             ]
         )
 
-        chain = prompt | self.llm | JsonOutputParser()
+        chain = prompt | self.llm | parser
 
         try:
             result = await chain.ainvoke(
                 {
                     "wizard_type": wizard_type,
-                    "field_name": field_name,
+                    "field_names": ", ".join(field_names),
                     "patient_context": str(patient_context),
                     "current_wizard_data": str(current_wizard_data),
+                    "format_instructions": parser.get_format_instructions(),
                 }
             )
-
-            return result
+            suggestions = result.get("suggestions", {}) if isinstance(result, dict) else {}
 
         except Exception as e:
-            logger.error(f"Error suggesting wizard field: {e}")
-            return {
-                "suggested_value": None,
-                "reasoning": "AI suggestion unavailable - manual entry recommended",
-            }
+            logger.error(f"Error suggesting wizard fields: {e}")
+            suggestions = {}
+
+        results = {}
+        for field_name in field_names:
+            suggestion = suggestions.get(field_name)
+            if isinstance(suggestion, dict) and "suggested_value" in suggestion:
+                results[field_name] = {
+                    "suggested_value": suggestion["suggested_value"],
+                    "reasoning": suggestion.get("reasoning", ""),
+                }
+            else:
+                results[field_name] = _manual_field_suggestion()
+        return results
 
 
 # Singleton instance
@@ -0,0 +1,439 @@
+"""
+AI generation cache for AI Nurse Florence
+Following AI Nurse Florence Conditional Imports Pattern
+
+Patient education, SBAR, discharge and FDA-label generations used to cost a
+multi-second LLM call for every request, even for identical inputs. Results
+are now cached in two tiers:
+
+- Exact: key = SHA-256 of the template name, its normalized inputs (the
+  values that shape the prompt, whitespace-normalized), provider, model and
+  generation parameters. Entries live in a bounded in-process LRU and, for
+  templates marked ``shared``, in Redis (``ai_cache:v1:*``) for other workers.
+  Templates carrying patient-specific free text stay process-local.
+- Semantic (optional, ``AI_CACHE_SEMANTIC_ENABLED``): for templates that
+  opt in, the free-text part (e.g. the condition name) is embedded and
+  matched against a local vector index of earlier generations with the same
+  template, model and remaining inputs; a cosine similarity at or above
+  ``AI_CACHE_SEMANTIC_THRESHOLD`` reuses that generation. Keep the threshold
+  high - "Type 1 diabetes" and "Type 2 diabetes" embed close together.
+
+Entries expire after ``AI_CACHE_TTL_SECONDS``. ``invalidate_template()``
+bumps a per-template generation number (kept in one Redis hash and picked
+up by other workers within a second), which retires every cached entry for that
+template - use it after changing a prompt. Concurrent identical requests
+share one in-flight generation.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.redis_cache import get_redis_client
+
+# Conditional numpy import - the vector index falls back to pure Python
+try:
+    import numpy as np
+
+    _has_numpy = True
+except ImportError:
+    np = None  # type: ignore
+    _has_numpy = False
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ai_cache:v1"
+# Hash of template name -> generation number, shared by all workers
+GENERATIONS_KEY = f"{KEY_PREFIX}:generations"
+GENERATION_SYNC_SECONDS = 1.0
+
+Embedder = Callable[[str], Awaitable[List[float]]]
+
+
+def normalize(value: Any) -> Any:
+    """Whitespace/Unicode-normalize strings (recursively); case is kept."""
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFC", value).split())
+    if isinstance(value, dict):
+        return {str(k): normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    return value
+
+
+def _digest(payload: Dict[str, Any]) -> str:
+    canonical = json.dumps(
+        normalize(payload), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LocalVectorIndex:
+    """Bounded in-process cosine-similarity index, partitioned into buckets."""
+
+    def __init__(self, max_entries: int = 2000):
+        self.max_entries = max_entries
+        # key -> (bucket, unit vector); insertion order gives FIFO eviction
+        self._vectors: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._buckets: Dict[str, "OrderedDict[str, None]"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(vector: List[float]) -> Any:
+        if _has_numpy:
+            array = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(array))
+            return array / norm if norm else array
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else list(vector)
+
+    @staticmethod
+    def _dot(a: Any, b: Any) -> float:
+        if _has_numpy:
+            return float(np.dot(a, b))
+        return sum(x * y for x, y in zip(a, b))
+
+    def add(self, bucket: str, key: str, vector: List[float]) -> None:
+        unit = self._unit(vector)
+        with self._lock:
+            self._remove(key)
+            self._vectors[key] = (bucket, unit)
+            self._buckets.setdefault(bucket, OrderedDict())[key] = None
+            while len(self._vectors) > self.max_entries:
+                self._remove(next(iter(self._vectors)))
+
+    def search(self, bucket: str, vector: List[float]) -> Optional[Tuple[str, float]]:
+        """Most similar key in ``bucket`` and its cosine similarity."""
+        unit = self._unit(vector)
+        with self._lock:
+            candidates = [(key, self._vectors[key][1]) for key in self._buckets.get(bucket, ())]
+        best = None
+        for key, other in candidates:
+            score = self._dot(unit, other)
+            if best is None or score > best[1]:
+                best = (key, score)
+        return best
+
+    def remove_prefix(self, bucket_prefix: str) -> None:
+        with self._lock:
+            for bucket in [b for b in self._buckets if b.startswith(bucket_prefix)]:
+                for key in list(self._buckets.get(bucket, ())):
+                    self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._vectors.pop(key, None)
+        if entry is None:
+            return
+        bucket = self._buckets.get(entry[0])
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[entry[0]]
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+
+class AIGenerationCache:
+    """Exact + optional semantic cache of AI generation results."""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        ttl_seconds: float = 86400,
+        semantic_threshold: float = 0.97,
+        embedder: Optional[Embedder] = None,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.semantic_threshold = semantic_threshold
+        self.embedder = embedder
+        self.index = LocalVectorIndex(max_entries)
+
+        # key -> (template, generation, expires_at, response)
+        self._entries: "OrderedDict[str, Tuple[str, int, float, Dict[str, Any]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._last_sync = 0.0
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    # Keys -----------------------------------------------------------------
+
+    @staticmethod
+    def key(template: str, inputs: Dict[str, Any], model: str, params: Dict[str, Any]) -> str:
+        return _digest({"template": template, "inputs": inputs, "model": model, "params": params})
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"{KEY_PREFIX}:entry:{key}"
+
+
+    # Lookup ---------------------------------------------------------------
+
+    async def get_or_generate(
+        self,
+        template: str,
+        inputs: Dict[str, Any],
+        generate: Callable[[], Awaitable[Dict[str, Any]]],
+        model: str,
+        params: Optional[Dict[str, Any]] = None,
+        semantic_field: Optional[str] = None,
+        shared: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Cached result for this generation, or the result of ``generate()``.
+
+        Args:
+            template: Prompt template name (unit of invalidation)
+            inputs: Values that shape the prompt
+            generate: Makes the LLM call on a miss
+            model: Provider/model identifier
+            params: Generation parameters (temperature, max tokens, ...)
+            semantic_field: Key in ``inputs`` eligible for similarity matching
+            shared: Also store in Redis for other workers
+        """
+        if not self.enabled:
+            return await generate()
+
+        params = params or {}
+        key = self.key(template, inputs, model, params)
+        await self._sync_generations()
+
+        cached = await self._get_exact(template, key, shared)
+        if cached is not None:
+            self.hits += 1
+            return {**cached, "cached": True, "cache_tier": "exact"}
+
+        vector = bucket = None
+        if semantic_field and self.embedder and inputs.get(semantic_field):
+            rest = {k: v for k, v in inputs.items() if k != semantic_field}
+            bucket = f"{template}:{self.key(template, rest, model, params)}"
+            try:
+                vector = await self.embedder(normalize(inputs[semantic_field]))
+            except Exception as e:
+                logger.warning(f"⚠️ Embedding for AI cache failed: {e}")
+            if vector is not None:
+                match = self.index.search(bucket, vector)
+                if match and match[1] >= self.semantic_threshold:
+                    similar = await self._get_exact(template, match[0], shared)
+                    if similar is not None:
+                        self.semantic_hits += 1
+                        return {
+                            **similar,
+                            "cached": True,
+                            "cache_tier": "semantic",
+                            "cache_similarity": round(match[1], 4),
+                        }
+
+        # Identical requests already generating share the result
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return dict(await asyncio.shield(inflight))
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await generate()
+            future.set_result(response)
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited isn't logged
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if self._cacheable(response):
+            await self._put(template, key, dict(response), shared)
+            if vector is not None and bucket is not None:
+                self.index.add(bucket, key, vector)
+        return response
+
+    @staticmethod
+    def _cacheable(response: Dict[str, Any]) -> bool:
+        if not isinstance(response, dict) or not response.get("response") or response.get("error"):
+            return False
+        # Educational stub output is a placeholder, not a generation
+        return "stub" not in str(response.get("service_note", "")).lower()
+
+    async def _get_exact(self, template: str, key: str, shared: bool) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        generation = self._generations.get(template, 0)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] == generation and entry[2] > now:
+                    self._entries.move_to_end(key)
+                    return entry[3]
+                del self._entries[key]
+
+        if not shared:
+            return None
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return None
+        try:
+            raw = await redis_client.get(self._redis_key(key))
+        except Exception as e:
+            logger.warning(f"⚠️ AI cache lookup failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            stored = json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+        if stored.get("generation") != generation:
+            return None
+        self._remember(template, key, stored["response"], generation, now + self.ttl_seconds)
+        return stored["response"]
+
+    async def _put(self, template: str, key: str, response: Dict[str, Any], shared: bool) -> None:
+        generation = self._generations.get(template, 0)
+        self._remember(template, key, response, generation, time.time() + self.ttl_seconds)
+        if not shared:
+            return
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            await redis_client.setex(
+                self._redis_key(key),
+                int(self.ttl_seconds),
+                json.dumps({"generation": generation, "response": response}, default=str),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to store AI generation in Redis: {e}")
+
+    def _remember(
+        self, template: str, key: str, response: Dict[str, Any], generation: int, expires_at: float
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (template, generation, expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # Invalidation ---------------------------------------------------------
+
+    async def invalidate_template(self, template: Optional[str] = None) -> List[str]:
+        """Retire cached generations for ``template`` (all templates if ``None``)."""
+        with self._lock:
+            templates = (
+                [template]
+                if template
+                else sorted({entry[0] for entry in self._entries.values()} | set(self._generations))
+            )
+            for name in templates:
+                self._generations[name] = self._generations.get(name, 0) + 1
+                for key in [k for k, entry in self._entries.items() if entry[0] == name]:
+                    del self._entries[key]
+        for name in templates:
+            self.index.remove_prefix(f"{name}:")
+
+        redis_client = await get_redis_client()
+        if redis_client is not None and templates:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for name in templates:
+                        pipe.hincrby(GENERATIONS_KEY, name, 1)
+                    results = await pipe.execute()
+                with self._lock:
+                    for name, generation in zip(templates, results):
+                        self._generations[name] = max(self._generations.get(name, 0), int(generation))
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to publish AI cache invalidation: {e}")
+
+        logger.info(f"🧹 AI generation cache invalidated: {', '.join(templates) or 'nothing cached'}")
+        return templates
+
+    async def _sync_generations(self) -> None:
+        """Pick up invalidations made on other workers (rate limited)."""
+        now = time.time()
+        if now - self._last_sync < GENERATION_SYNC_SECONDS:
+            return
+        self._last_sync = now
+
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            generations = await redis_client.hgetall(GENERATIONS_KEY)
+        except Exception as e:
+            logger.warning(f"⚠️ AI cache generation sync failed: {e}")
+            return
+
+        with self._lock:
+            for name, value in generations.items():
+                if isinstance(name, bytes):
+                    name = name.decode("utf-8")
+                self._generations[name] = max(self._generations.get(name, 0), int(value))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.semantic_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "vectors": len(self.index),
+            "semantic_enabled": self.embedder is not None,
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.semantic_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+_ai_generation_cache: Optional[AIGenerationCache] = None
+_ai_generation_cache_lock = threading.Lock()
+
+
+def get_ai_generation_cache(embedder: Optional[Embedder] = None) -> AIGenerationCache:
+    """Return the process-wide AI generation cache.
+
+    ``embedder`` is only used on first creation, and only when
+    ``AI_CACHE_SEMANTIC_ENABLED`` is set.
+    """
+    global _ai_generation_cache
+    with _ai_generation_cache_lock:
+        if _ai_generation_cache is None:
+            enabled = True
+            max_entries = 2000
+            ttl_seconds = 86400
+            semantic_enabled = False
+            threshold = 0.97
+            try:
+                from src.utils.config import get_settings
+
+                settings = get_settings()
+                enabled = getattr(settings, "AI_CACHE_ENABLED", enabled)
+                max_entries = getattr(settings, "AI_CACHE_MAX_ENTRIES", max_entries)
+                ttl_seconds = getattr(settings, "AI_CACHE_TTL_SECONDS", ttl_seconds)
+                semantic_enabled = getattr(settings, "AI_CACHE_SEMANTIC_ENABLED", semantic_enabled)
+                threshold = getattr(settings, "AI_CACHE_SEMANTIC_THRESHOLD", threshold)
+            except Exception as e:
+                logger.warning(f"Failed to load AI cache settings: {e}, using defaults")
+            _ai_generation_cache = AIGenerationCache(
+                max_entries=max_entries,
+                ttl_seconds=ttl_seconds,
+                semantic_threshold=threshold,
+                embedder=embedder if semantic_enabled else None,
+                enabled=enabled,
+            )
+        return _ai_generation_cache
@@ -32,9 +32,22 @@ async def get_current_user(
     try:
         # Import auth utilities with conditional loading
         from src.utils.auth_enhanced import verify_token
+        from src.utils.token_cache import get_token_cache
         
-        # Verify the access token
-        payload = verify_token(credentials.credentials)
+        token = credentials.credentials
+        token_cache = get_token_cache()
+        
+        # Reuse claims of a recently verified token; verify otherwise
+        payload = await token_cache.get(token)
+        if payload is None:
+            payload = verify_token(token)
+            if token_cache.is_revoked(token, payload):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Session has been revoked",
+                    headers={"WWW-Authenticate": "Bearer"}
+                )
+            token_cache.put(token, payload)
         
         # Extract user information
         user_id = payload.get("sub")
@@ -5,9 +5,12 @@ Phase 3.2: Complete Authentication System Implementation
 Following Conditional Imports Pattern and Security patterns from coding instructions.
 """
 
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import uuid
 
 from fastapi import HTTPException, status
@@ -16,8 +19,38 @@ from jose import JWTError, jwt
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context with bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing defaults - will be loaded from settings
+PASSWORD_HASH_WORKERS = 4
+PASSWORD_HASH_MAX_QUEUE = 256
+
+
+def _build_pwd_context() -> CryptContext:
+    """
+    Password hashing context with bcrypt.
+
+    With PASSWORD_BCRYPT_ROUNDS set, hashes using any other work factor are
+    reported as needing an update, so ``verify_and_update_password_async``
+    rehashes them on the next successful login.
+    """
+    rounds = None
+    try:
+        from src.utils.config import get_settings
+        rounds = get_settings().PASSWORD_BCRYPT_ROUNDS
+    except Exception as e:
+        logger.warning(f"Failed to load password hashing settings: {e}, using defaults")
+
+    if not rounds:
+        return CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+pwd_context = _build_pwd_context()
 
 # JWT Configuration defaults - will be loaded from settings
 JWT_SECRET_KEY = "your-super-secret-jwt-key-change-in-production-min-32-chars"
@@ -54,6 +87,135 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
 
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, size-capped thread pool.
+
+    bcrypt deliberately burns 100-300 ms of CPU per call; running it on the
+    event loop stalls every other request on the worker, which hurts most
+    during shift-change login spikes. Work is queued to at most
+    ``max_workers`` threads; once ``max_queue`` operations are pending new
+    ones fail fast with 503 instead of piling up.
+    """
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+        self._peak_pending = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    def _run(self, func, *args):
+        with self._lock:
+            self._active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    async def submit(self, func, *args):
+        with self._lock:
+            if self._pending >= self.max_queue:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service busy, please retry",
+                    headers={"Retry-After": "1"}
+                )
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), self._run, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue-depth metrics for monitoring."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "active": self._active,
+                "queued": self._pending - self._active,
+                "peak_pending": self._peak_pending,
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+_password_hasher: Optional[PasswordHasher] = None
+_password_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide password hasher."""
+    global _password_hasher
+    with _password_hasher_lock:
+        if _password_hasher is None:
+            workers, max_queue = PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE
+            try:
+                from src.utils.config import get_settings
+                settings = get_settings()
+                workers = settings.PASSWORD_HASH_WORKERS
+                max_queue = settings.PASSWORD_HASH_MAX_QUEUE
+            except Exception as e:
+                logger.warning(f"Failed to load password hashing settings: {e}, using defaults")
+            _password_hasher = PasswordHasher(workers, max_queue)
+        return _password_hasher
+
+
+def get_password_hasher_stats() -> Dict[str, Any]:
+    """Password hashing pool metrics, including the configured work factor."""
+    stats = get_password_hasher().stats()
+    stats["bcrypt_rounds"] = pwd_context.handler("bcrypt").default_rounds
+    return stats
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await get_password_hasher().submit(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    return await get_password_hasher().submit(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if its hash uses an outdated work factor,
+    return a replacement hash to persist. Returns ``(is_valid, new_hash)``.
+    """
+    return await get_password_hasher().submit(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
 def validate_password(password: str) -> Dict[str, Any]:
     """
     Validate password strength for healthcare security compliance.
@@ -58,6 +58,19 @@ class Settings(BaseSettings):
         default=7, description="Refresh token expiration time in days"
     )
 
+    # Verified-token cache for get_current_user
+    AUTH_TOKEN_CACHE_MAX: int = Field(
+        default=10000, description="Max verified access tokens cached per worker"
+    )
+    AUTH_TOKEN_CACHE_MARGIN_SECONDS: float = Field(
+        default=30.0,
+        description="Stop serving a cached token this many seconds before its exp",
+    )
+    AUTH_REVOCATION_SYNC_SECONDS: float = Field(
+        default=1.0,
+        description="How often each worker pulls session revocations from Redis",
+    )
+
     # Password Security Configuration
     PASSWORD_MIN_LENGTH: int = Field(
         default=8, description="Minimum password length for healthcare security"
@@ -74,12 +87,46 @@ class Settings(BaseSettings):
     PASSWORD_REQUIRE_SPECIAL: bool = Field(
         default=True, description="Require special characters in passwords"
     )
+    PASSWORD_BCRYPT_ROUNDS: Optional[int] = Field(
+        default=None,
+        description="bcrypt work factor; when set, hashes with other factors are rehashed on login",
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4, description="Threads dedicated to bcrypt hashing/verification"
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = Field(
+        default=256,
+        description="Max pending hash operations before new ones are rejected with 503",
+    )
 
     # Database Configuration following Database Patterns
     DATABASE_URL: str = Field(
         default="sqlite:///./ai_nurse_florence.db",
         description="Database connection URL",
     )
+    DATABASE_READ_REPLICA_URL: Optional[str] = Field(
+        default=None,
+        description="Optional read replica URL for read-only reference lookups",
+    )
+    DB_POOL_SIZE: int = Field(
+        default=5, description="Persistent connections kept per engine pool"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10, description="Extra connections allowed above DB_POOL_SIZE"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30, description="Seconds to wait for a pooled connection"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800, description="Recycle pooled connections after N seconds"
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=True, description="Check connections for liveness on checkout"
+    )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=100,
+        description="asyncpg prepared statement cache size per connection (0 disables, e.g. behind pgbouncer)",
+    )
 
     # External Services Configuration following External Service Integration
     USE_LIVE: bool = Field(default=False, description="Use live external APIs vs stubs")
@@ -109,6 +156,12 @@ class Settings(BaseSettings):
         default="claude-3-5-sonnet-20241022",
         description="Default Anthropic Claude model (claude-3-5-sonnet for best quality)",
     )
+    ANTHROPIC_MAX_CONNECTIONS: int = Field(
+        default=20, description="Max concurrent Claude API connections per worker"
+    )
+    ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=10, description="Idle Claude API connections kept open for reuse"
+    )
     AI_PROVIDER: str = Field(
         default="openai",
         description="Preferred AI provider: 'openai' or 'anthropic' (openai=cheaper, anthropic=higher quality)",
@@ -139,6 +192,22 @@ class Settings(BaseSettings):
         default=60,
         description="Circuit breaker timeout in seconds (default: 1 minute)",
     )
+    AI_LATENCY_EWMA_ALPHA: float = Field(
+        default=0.2,
+        description="Weight of the newest sample in each provider's latency moving average",
+    )
+    AI_HEDGING_ENABLED: bool = Field(
+        default=True,
+        description="Start the fallback provider when the first one runs past its p95 latency",
+    )
+    AI_HEDGE_MIN_DELAY: float = Field(
+        default=2.0,
+        description="Minimum seconds to wait before sending a hedged request",
+    )
+    AI_HEDGE_DEFAULT_DELAY: float = Field(
+        default=10.0,
+        description="Hedge delay in seconds until a provider has enough latency samples",
+    )
 
     # Redis Configuration following Caching Strategy
     REDIS_URL: Optional[str] = Field(default=None, description="Redis connection URL")
@@ -151,11 +220,29 @@ class Settings(BaseSettings):
     RATE_LIMIT_PER_MINUTE: int = Field(
         default=60, description="Alias for rate limit requests"
     )
+    RATE_LIMIT_USER_PER_MINUTE: Optional[int] = Field(
+        default=None,
+        description="Requests per minute per authenticated user (defaults to RATE_LIMIT_PER_MINUTE)",
+    )
+    RATE_LIMIT_ROUTE_LIMITS: str = Field(
+        default="",
+        description="Per-route quotas as comma-separated prefix=requests_per_minute pairs",
+    )
+    RATE_LIMIT_MEMORY_MAX_CLIENTS: int = Field(
+        default=10000,
+        description="Max client buckets kept by the in-memory rate limit fallback",
+    )
 
     # Feature Flags Configuration following Feature Flags pattern
     ENABLE_DEBUG_ROUTES: bool = Field(default=True, description="Enable debug routes")
     ENABLE_DOCS: bool = Field(default=True, description="Enable API documentation")
     ENABLE_METRICS: bool = Field(default=False, description="Enable Prometheus metrics")
+    LATENCY_WINDOW_SECONDS: int = Field(
+        default=60, description="Rolling window for request latency percentiles in seconds"
+    )
+    LATENCY_MAX_ROUTES: int = Field(
+        default=200, description="Max distinct routes tracked by the latency histograms"
+    )
     ENABLE_HEALTH_CHECKS: bool = Field(
         default=True, description="Enable health check endpoints"
     )
@@ -164,6 +251,67 @@ class Settings(BaseSettings):
     # Cache Configuration following Caching Strategy
     CACHE_TTL_SECONDS: int = Field(default=300, description="Cache TTL in seconds")
 
+    # Wizard session storage (Redis with in-memory fallback)
+    WIZARD_SESSION_TTL_SECONDS: int = Field(
+        default=7200, description="Idle lifetime of a wizard session in seconds"
+    )
+    WIZARD_SESSION_MEMORY_MAX: int = Field(
+        default=1000,
+        description="Max wizard sessions kept per wizard type in the in-memory fallback",
+    )
+
+    # Document rendering (ReportLab / python-docx in a process pool)
+    DOCUMENT_RENDER_WORKERS: int = Field(
+        default=2,
+        description="Worker processes for PDF/DOCX rendering; 0 renders on a thread instead",
+    )
+    DOCUMENT_RENDER_MAX_QUEUE: int = Field(
+        default=32,
+        description="Max pending renders before new ones are rejected with 503",
+    )
+    DOCUMENT_RENDER_TIMEOUT_SECONDS: float = Field(
+        default=30.0, description="Per-document render timeout in seconds"
+    )
+
+    # Generated document store (content-addressed, TTL + LRU size budget)
+    GENERATED_DOCUMENTS_MAX_MB: int = Field(
+        default=512, description="Size budget for stored generated documents in MB"
+    )
+    GENERATED_DOCUMENTS_TTL_HOURS: float = Field(
+        default=168, description="Hours a generated document is kept after rendering"
+    )
+    GENERATED_DOCUMENTS_SWEEP_INTERVAL_SECONDS: int = Field(
+        default=900, description="Interval of the generated document retention sweep"
+    )
+
+    # Translation memory (in-process LRU backed by Redis)
+    TRANSLATION_MEMORY_MAX_ENTRIES: int = Field(
+        default=20000, description="Translations kept in each worker's in-process LRU"
+    )
+    TRANSLATION_MEMORY_TTL_DAYS: float = Field(
+        default=30, description="Days a translation is kept in the shared Redis store"
+    )
+
+    # AI generation cache (exact LRU/Redis tier + optional semantic tier)
+    AI_CACHE_ENABLED: bool = Field(
+        default=True, description="Cache templated AI generations (patient education, SBAR, ...)"
+    )
+    AI_CACHE_TTL_SECONDS: int = Field(
+        default=86400, description="Seconds a cached AI generation stays valid"
+    )
+    AI_CACHE_MAX_ENTRIES: int = Field(
+        default=2000, description="AI generations kept in each worker's in-process LRU"
+    )
+    AI_CACHE_SEMANTIC_ENABLED: bool = Field(
+        default=False, description="Reuse generations for semantically similar inputs (needs OpenAI embeddings)"
+    )
+    AI_CACHE_SEMANTIC_THRESHOLD: float = Field(
+        default=0.97, description="Minimum cosine similarity for a semantic cache hit"
+    )
+    AI_CACHE_EMBEDDING_MODEL: str = Field(
+        default="text-embedding-3-small", description="OpenAI embedding model for the semantic tier"
+    )
+
     # Monitoring Configuration
     GRAFANA_ADMIN_USER: str = Field(default="admin", description="Grafana admin user")
     GRAFANA_ADMIN_PASSWORD: str = Field(
@@ -17,7 +17,10 @@ from src.models.database import (
     User, 
     UserSession
 )
-from src.utils.auth_enhanced import hash_password, verify_password
+from src.utils.auth_enhanced import (
+    hash_password_async,
+    verify_and_update_password_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +48,7 @@ class DatabaseAuthIntegration:
         try:
             # Hash password
             if "password" in user_data:
-                user_data["password_hash"] = hash_password(user_data.pop("password"))
+                user_data["password_hash"] = await hash_password_async(user_data.pop("password"))
             
             # Set default values
             user_data.setdefault("role", "user")
@@ -106,14 +109,19 @@ class DatabaseAuthIntegration:
                     "message": "Account is not active"
                 }
             
-            # Verify password
-            if not verify_password(password, user.password_hash):
+            # Verify password (off the event loop), upgrading outdated hashes
+            is_valid, new_hash = await verify_and_update_password_async(password, user.password_hash)
+            if not is_valid:
                 return {
                     "success": False,
                     "error": "Invalid password",
                     "message": "Invalid credentials"
                 }
             
+            if new_hash:
+                await UserDatabase.update_user(user.id, {"password_hash": new_hash})
+                logger.info(f"🔐 Password hash upgraded for user {user.id}")
+            
             # Update last login time
             await UserDatabase.update_login_time(user.id)
             
@@ -149,7 +157,7 @@ class DatabaseAuthIntegration:
         try:
             # Handle password updates
             if "password" in update_data:
-                update_data["password_hash"] = hash_password(update_data.pop("password"))
+                update_data["password_hash"] = await hash_password_async(update_data.pop("password"))
                 update_data["password_changed_at"] = datetime.utcnow()
             
             # Remove sensitive fields from direct updates
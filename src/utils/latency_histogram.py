@@ -0,0 +1,317 @@
+"""
+Fixed-memory latency histograms for AI Nurse Florence
+Following AI Nurse Florence Conditional Imports Pattern
+
+Latencies used to be kept as Python lists (``PerformanceMonitor.response_times``
+re-sliced to the last 1000 values, unbounded ``values`` lists in the memory
+metrics store). They are now counted into log-linear buckets in the style of
+HdrHistogram:
+
+- values are recorded as whole microseconds
+- the first ``2**sub_bucket_bits`` microseconds get one bucket each, every
+  following power of two is split into ``2**(sub_bucket_bits - 1)`` buckets,
+  so the relative error of any reported percentile is at most
+  ``2**-(sub_bucket_bits - 1)`` (about 3% with the default of 6 bits)
+- counts live in a preallocated ``array('q')``: recording is O(1) and the
+  memory footprint never changes (about 5.6 KB per histogram for 1 us - 60 s)
+
+``RollingLatencyHistogram`` keeps a ring of histograms, one per time slot,
+to answer "p99 over the last minute" without storing samples, and
+``RouteLatencyTracker`` keeps a cumulative and a rolling histogram per route.
+"""
+
+import math
+import threading
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Percentiles reported everywhere (label -> percentile)
+DEFAULT_PERCENTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50", 50.0),
+    ("p95", 95.0),
+    ("p99", 99.0),
+    ("p999", 99.9),
+)
+
+# Requests that did not match a route share one label (bounded cardinality)
+UNMATCHED_ROUTE = "unmatched"
+OVERFLOW_ROUTE = "other"
+
+
+class LatencyHistogram:
+    """Log-linear bucketed histogram of durations in seconds."""
+
+    __slots__ = (
+        "sub_bucket_bits",
+        "max_value_seconds",
+        "_sub_bucket_count",
+        "_half_count",
+        "_max_us",
+        "_counts",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(self, max_value_seconds: float = 60.0, sub_bucket_bits: int = 6):
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be at least 2")
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_value_seconds = max_value_seconds
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._max_us = max(int(max_value_seconds * 1_000_000), self._sub_bucket_count)
+        self._counts = array("q", bytes(8 * (self._index(self._max_us) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    # Bucket arithmetic ----------------------------------------------------
+
+    def _index(self, value_us: int) -> int:
+        if value_us < self._sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - self.sub_bucket_bits
+        return (
+            self._sub_bucket_count
+            + (shift - 1) * self._half_count
+            + (value_us >> shift)
+            - self._half_count
+        )
+
+    def _bucket_bounds_us(self, index: int) -> Tuple[int, int]:
+        """Lowest and highest microsecond value counted in ``index``."""
+        if index < self._sub_bucket_count:
+            return index, index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._half_count + 1
+        lower = (offset % self._half_count + self._half_count) << shift
+        return lower, lower + (1 << shift) - 1
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._counts)
+
+    # Recording ------------------------------------------------------------
+
+    def record(self, seconds: float) -> None:
+        """Count one duration; values above the range land in the last bucket."""
+        if seconds < 0:
+            seconds = 0.0
+        value_us = int(seconds * 1_000_000)
+        if value_us > self._max_us:
+            value_us = self._max_us
+        self._counts[self._index(value_us)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add ``other``'s counts (histograms must share the same layout)."""
+        if other.bucket_count != self.bucket_count or other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        if not other.count:
+            return
+        counts = self._counts
+        for index, value in enumerate(other._counts):
+            if value:
+                counts[index] += value
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        counts = self._counts
+        for index in range(len(counts)):
+            counts[index] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def empty_copy(self) -> "LatencyHistogram":
+        return LatencyHistogram(self.max_value_seconds, self.sub_bucket_bits)
+
+    # Queries --------------------------------------------------------------
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Duration in seconds at ``percentile`` (0-100), ``0.0`` when empty."""
+        return self.percentiles([percentile])[0]
+
+    def percentiles(self, percentiles: Iterable[float]) -> List[float]:
+        """Several percentiles in one pass over the buckets."""
+        wanted = list(percentiles)
+        if not self.count:
+            return [0.0] * len(wanted)
+
+        targets = sorted(
+            (max(1, math.ceil(p / 100.0 * self.count)), position)
+            for position, p in enumerate(wanted)
+        )
+        results = [0.0] * len(wanted)
+        pending = 0
+        seen = 0
+        for index, value in enumerate(self._counts):
+            if not value:
+                continue
+            seen += value
+            while pending < len(targets) and targets[pending][0] <= seen:
+                lower, upper = self._bucket_bounds_us(index)
+                estimate = (lower + upper + 1) / 2_000_000
+                results[targets[pending][1]] = min(max(estimate, self.min), self.max)
+                pending += 1
+            if pending == len(targets):
+                break
+        return results
+
+    def cumulative_counts(self, bounds_seconds: Iterable[float]) -> List[int]:
+        """Number of recorded values ``<=`` each bound (Prometheus ``le`` buckets)."""
+        bounds = list(bounds_seconds)
+        results = [0] * len(bounds)
+        seen = 0
+        order = sorted(range(len(bounds)), key=lambda i: bounds[i])
+        pending = 0
+        for index, value in enumerate(self._counts):
+            if not value:
+                continue
+            lower, upper = self._bucket_bounds_us(index)
+            while pending < len(order) and bounds[order[pending]] * 1_000_000 < upper:
+                results[order[pending]] = seen
+                pending += 1
+            seen += value
+        while pending < len(order):
+            results[order[pending]] = seen
+            pending += 1
+        return results
+
+    def summary(self, percentiles: Tuple[Tuple[str, float], ...] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """Count, mean, max and percentiles in milliseconds."""
+        values = self.percentiles([p for _, p in percentiles])
+        summary: Dict[str, Any] = {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+        }
+        for (label, _), value in zip(percentiles, values):
+            summary[f"{label}_ms"] = round(value * 1000, 2)
+        return summary
+
+
+class RollingLatencyHistogram:
+    """Histogram over the last ``window_seconds``, kept as a ring of slot histograms."""
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        slots: int = 6,
+        max_value_seconds: float = 60.0,
+        sub_bucket_bits: int = 6,
+    ):
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        self.window_seconds = window_seconds
+        self.slot_seconds = window_seconds / slots
+        self._slots = [LatencyHistogram(max_value_seconds, sub_bucket_bits) for _ in range(slots)]
+        self._slot_epochs = [-1] * slots
+
+    def _current(self, now: float) -> LatencyHistogram:
+        epoch = int(now // self.slot_seconds)
+        position = epoch % len(self._slots)
+        if self._slot_epochs[position] != epoch:
+            self._slots[position].reset()
+            self._slot_epochs[position] = epoch
+        return self._slots[position]
+
+    def record(self, seconds: float, now: Optional[float] = None) -> None:
+        self._current(time.time() if now is None else now).record(seconds)
+
+    def snapshot(self, now: Optional[float] = None) -> LatencyHistogram:
+        """Merge the slots still inside the window into a new histogram."""
+        epoch = int((time.time() if now is None else now) // self.slot_seconds)
+        oldest = epoch - len(self._slots) + 1
+        merged = self._slots[0].empty_copy()
+        for slot_epoch, histogram in zip(self._slot_epochs, self._slots):
+            if oldest <= slot_epoch <= epoch:
+                merged.merge(histogram)
+        return merged
+
+
+class RouteLatencyTracker:
+    """Cumulative and rolling latency histograms per route label."""
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        max_routes: int = 200,
+        max_value_seconds: float = 60.0,
+    ):
+        self.window_seconds = window_seconds
+        self.max_routes = max_routes
+        self.max_value_seconds = max_value_seconds
+        self._routes: Dict[str, Tuple[LatencyHistogram, RollingLatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def _histograms(self, route: str) -> Tuple[LatencyHistogram, RollingLatencyHistogram]:
+        histograms = self._routes.get(route)
+        if histograms is None:
+            if len(self._routes) >= self.max_routes and route != OVERFLOW_ROUTE:
+                return self._histograms(OVERFLOW_ROUTE)
+            histograms = (
+                LatencyHistogram(self.max_value_seconds),
+                RollingLatencyHistogram(self.window_seconds, max_value_seconds=self.max_value_seconds),
+            )
+            self._routes[route] = histograms
+        return histograms
+
+    def record(self, route: str, seconds: float, now: Optional[float] = None) -> None:
+        with self._lock:
+            cumulative, rolling = self._histograms(route or UNMATCHED_ROUTE)
+            cumulative.record(seconds)
+            rolling.record(seconds, now)
+
+    def routes(self) -> List[str]:
+        with self._lock:
+            return sorted(self._routes)
+
+    def histograms(self, now: Optional[float] = None) -> Dict[str, Tuple[LatencyHistogram, LatencyHistogram]]:
+        """``route -> (cumulative, window snapshot)``; the cumulative one is copied."""
+        with self._lock:
+            result = {}
+            for route, (cumulative, rolling) in self._routes.items():
+                copy = cumulative.empty_copy()
+                copy.merge(cumulative)
+                result[route] = (copy, rolling.snapshot(now))
+            return result
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        return {
+            route: {
+                "all_time": cumulative.summary(),
+                "window": window.summary(),
+            }
+            for route, (cumulative, window) in sorted(self.histograms(now).items())
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "LatencyHistogram",
+    "RollingLatencyHistogram",
+    "RouteLatencyTracker",
+    "UNMATCHED_ROUTE",
+]
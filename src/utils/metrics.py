@@ -5,11 +5,23 @@ metrics store. Exposes compatibility functions used throughout the codebase.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 import threading
 
+from src.utils.latency_histogram import DEFAULT_PERCENTILES, LatencyHistogram
+
 logger = logging.getLogger(__name__)
 
+try:
+    import httpx
+
+    _has_httpx = True
+except ImportError:
+    httpx = None  # type: ignore
+    _has_httpx = False
+
 # Read settings flag (best-effort)
 try:
     from src.utils.config import get_settings
@@ -31,23 +43,83 @@ try:
 except Exception:
     logger.debug("prometheus_client not available; falling back to memory metrics")
 
-# In-memory store used as fallback
+# Request ID of the request being served (set by RequestContextMiddleware);
+# attached to latency observations as an exemplar so slow traces can be found
+current_request_id: ContextVar[Optional[str]] = ContextVar("ai_nurse_request_id", default=None)
+
+# Latency histogram families are created once, up front, so every label set
+# shares one bucket layout (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ROUTE_LATENCY = None
+_UPSTREAM_LATENCY = None
+_AI_LATENCY = None
+_AI_TOKENS = None
+if _METRICS_ENABLED and _PROM_AVAILABLE:
+    try:
+        _ROUTE_LATENCY = Histogram(  # type: ignore
+            "ai_nurse_http_request_duration_seconds",
+            "HTTP request duration by route template",
+            ["method", "route", "status"],
+            buckets=LATENCY_BUCKETS,
+        )
+        _UPSTREAM_LATENCY = Histogram(  # type: ignore
+            "ai_nurse_upstream_request_duration_seconds",
+            "Outbound HTTP request duration by upstream host",
+            ["host", "method", "status"],
+            buckets=LATENCY_BUCKETS,
+        )
+        _AI_LATENCY = Histogram(  # type: ignore
+            "ai_nurse_ai_request_duration_seconds",
+            "AI provider call duration",
+            ["provider", "model", "outcome"],
+            buckets=LATENCY_BUCKETS,
+        )
+        _AI_TOKENS = Counter(  # type: ignore
+            "ai_nurse_ai_tokens_total",
+            "AI provider tokens used",
+            ["provider", "model", "type"],
+        )
+    except ValueError as e:
+        # Already registered (module reloaded in the same process)
+        logger.debug("Latency histograms already registered: %s", e)
+
+# In-memory store used as fallback. Counters keep a running total and count;
+# timings (``_memory_metrics_observe``) go into fixed-size latency histograms
+# rather than a list of every value.
 _metrics_lock = threading.RLock()
 _metrics_store: Dict[str, Dict[str, Any]] = {}
 
 
+def _label_key(labels: Dict[str, str]) -> str:
+    return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+
 def _memory_metrics_update(name: str, value: Any = 1, labels: Optional[Dict[str, str]] = None) -> None:
     with _metrics_lock:
-        if name not in _metrics_store:
-            _metrics_store[name] = {"total": 0, "values": [], "by_label": {}}
-        _metrics_store[name]["total"] += value
-        _metrics_store[name]["values"].append(value)
+        metric = _metrics_store.get(name)
+        if metric is None:
+            metric = _metrics_store[name] = {"total": 0, "count": 0, "histogram": None, "by_label": {}}
+        metric["total"] += value
+        metric["count"] += 1
         if labels:
-            key = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-            if key not in _metrics_store[name]["by_label"]:
-                _metrics_store[name]["by_label"][key] = {"total": 0, "values": []}
-            _metrics_store[name]["by_label"][key]["total"] += value
-            _metrics_store[name]["by_label"][key]["values"].append(value)
+            key = _label_key(labels)
+            if key not in metric["by_label"]:
+                metric["by_label"][key] = {"total": 0, "count": 0, "histogram": None}
+            metric["by_label"][key]["total"] += value
+            metric["by_label"][key]["count"] += 1
+
+
+def _memory_metrics_observe(name: str, seconds: float, labels: Optional[Dict[str, str]] = None) -> None:
+    """Record a duration into the metric's (and label set's) latency histogram."""
+    with _metrics_lock:
+        _memory_metrics_update(name, value=seconds, labels=labels)
+        metric = _metrics_store[name]
+        entries = [metric, metric["by_label"][_label_key(labels)]] if labels else [metric]
+        for entry in entries:
+            if entry["histogram"] is None:
+                entry["histogram"] = LatencyHistogram()
+            entry["histogram"].record(seconds)
 
 
 def record_cache_hit(cache_key: str, cache_type: str = "redis") -> None:
@@ -150,6 +222,143 @@ def record_gpt_usage(*args, **kwargs) -> None:
         logger.debug("record_gpt_usage failed: %s", e)
 
 
+def _status_class(status_code: Optional[int]) -> str:
+    return f"{status_code // 100}xx" if status_code else "error"
+
+
+def _exemplar(request_id: Optional[str] = None) -> Optional[Dict[str, str]]:
+    request_id = request_id or current_request_id.get()
+    return {"request_id": request_id} if request_id else None
+
+
+def _observe(
+    histogram: Any,
+    memory_name: str,
+    seconds: float,
+    labels: Dict[str, str],
+    request_id: Optional[str] = None,
+) -> None:
+    if histogram is not None:
+        histogram.labels(**labels).observe(seconds, exemplar=_exemplar(request_id))
+    else:
+        _memory_metrics_observe(memory_name, seconds, labels=labels)
+
+
+def record_route_latency(
+    method: str, route: str, status_code: int, seconds: float, request_id: Optional[str] = None
+) -> None:
+    """Observe one served request (called by ``RequestContextMiddleware``)."""
+    if not _METRICS_ENABLED:
+        return
+    try:
+        labels = {"method": method, "route": route, "status": _status_class(status_code)}
+        _observe(_ROUTE_LATENCY, "http_request_duration_seconds", seconds, labels, request_id)
+    except Exception as e:
+        logger.debug("record_route_latency failed: %s", e)
+
+
+def record_upstream_latency(host: str, method: str, status_code: Optional[int], seconds: float) -> None:
+    """Observe one outbound HTTP call (MyDisease, PubMed, FDA, OpenAI, ...)."""
+    if not _METRICS_ENABLED:
+        return
+    try:
+        labels = {"host": host, "method": method, "status": _status_class(status_code)}
+        _observe(_UPSTREAM_LATENCY, "upstream_request_duration_seconds", seconds, labels)
+    except Exception as e:
+        logger.debug("record_upstream_latency failed: %s", e)
+
+
+def record_ai_request(
+    provider: str,
+    model: str,
+    seconds: float,
+    input_tokens: Optional[int] = None,
+    output_tokens: Optional[int] = None,
+    success: bool = True,
+) -> None:
+    """Observe one AI provider call and the tokens it used."""
+    if not _METRICS_ENABLED:
+        return
+    try:
+        labels = {"provider": provider, "model": model, "outcome": "success" if success else "error"}
+        _observe(_AI_LATENCY, "ai_request_duration_seconds", seconds, labels)
+        for token_type, tokens in (("input", input_tokens), ("output", output_tokens)):
+            if not tokens:
+                continue
+            token_labels = {"provider": provider, "model": model, "type": token_type}
+            if _AI_TOKENS is not None:
+                _AI_TOKENS.labels(**token_labels).inc(tokens)
+            else:
+                _memory_metrics_update("ai_tokens", value=tokens, labels=token_labels)
+    except Exception as e:
+        logger.debug("record_ai_request failed: %s", e)
+
+
+_UPSTREAM_START = "ai_nurse_start"
+
+
+async def _on_upstream_request(request: Any) -> None:
+    request.extensions[_UPSTREAM_START] = time.perf_counter()
+
+
+async def _on_upstream_response(response: Any) -> None:
+    request = response.request
+    started = request.extensions.get(_UPSTREAM_START)
+    if started is not None:
+        record_upstream_latency(
+            request.url.host, request.method, response.status_code, time.perf_counter() - started
+        )
+
+
+def upstream_event_hooks() -> Dict[str, List[Any]]:
+    """``event_hooks`` for ``httpx.AsyncClient`` recording upstream host, status and latency.
+
+    Response hooks never run for calls that fail (timeouts, connection
+    errors); pass ``upstream_transport()`` as the client's transport too so
+    those are recorded with an ``error`` status.
+    """
+    if not _METRICS_ENABLED:
+        return {}
+    return {"request": [_on_upstream_request], "response": [_on_upstream_response]}
+
+
+class _UpstreamMetricsTransport(httpx.AsyncBaseTransport if _has_httpx else object):
+    """Transport wrapper recording upstream calls that raise instead of responding."""
+
+    def __init__(self, transport: Any):
+        self._transport = transport
+
+    async def handle_async_request(self, request: Any) -> Any:
+        try:
+            return await self._transport.handle_async_request(request)
+        except Exception:
+            started = request.extensions.get(_UPSTREAM_START)
+            if started is not None:
+                record_upstream_latency(
+                    request.url.host, request.method, None, time.perf_counter() - started
+                )
+            raise
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def upstream_transport(transport: Any = None, **transport_kwargs: Any) -> Any:
+    """Transport for ``httpx.AsyncClient`` that records failed upstream calls.
+
+    Wraps ``transport`` (default: ``httpx.AsyncHTTPTransport(**transport_kwargs)``;
+    pass ``limits`` here, a client ignores its own once given a transport).
+    Failures are observed with status ``error`` using the start time set by
+    ``upstream_event_hooks()``. Returns ``transport`` unchanged when metrics
+    are off.
+    """
+    if not _METRICS_ENABLED or not _has_httpx:
+        return transport
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(**transport_kwargs)
+    return _UpstreamMetricsTransport(transport)
+
+
 def timing_metric(name: str, labels_func=None):
     import time
     from functools import wraps
@@ -165,11 +374,11 @@ def timing_metric(name: str, labels_func=None):
                 try:
                     result = await func(*args, **kwargs)
                     duration = time.time() - start
-                    _memory_metrics_update(name, value=duration, labels=labels)
+                    _memory_metrics_observe(name, duration, labels=labels)
                     return result
                 except Exception:
                     duration = time.time() - start
-                    _memory_metrics_update(name, value=duration, labels=labels)
+                    _memory_metrics_observe(name, duration, labels=labels)
                     raise
 
             return wraps(func)(async_wrapper)
@@ -182,11 +391,11 @@ def timing_metric(name: str, labels_func=None):
                 try:
                     result = func(*args, **kwargs)
                     duration = time.time() - start
-                    _memory_metrics_update(name, value=duration, labels=labels)
+                    _memory_metrics_observe(name, duration, labels=labels)
                     return result
                 except Exception:
                     duration = time.time() - start
-                    _memory_metrics_update(name, value=duration, labels=labels)
+                    _memory_metrics_observe(name, duration, labels=labels)
                     raise
 
             return wraps(func)(sync_wrapper)
@@ -194,6 +403,13 @@ def timing_metric(name: str, labels_func=None):
     return decorator
 
 
+def _memory_metric_summary(metric: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {"total": metric["total"], "count": metric["count"], "labels": len(metric["by_label"])}
+    if metric["histogram"] is not None:
+        summary["latency"] = metric["histogram"].summary()
+    return summary
+
+
 def get_metrics_summary() -> Dict[str, Any]:
     if not _METRICS_ENABLED:
         return {"status": "disabled"}
@@ -202,47 +418,92 @@ def get_metrics_summary() -> Dict[str, Any]:
     with _metrics_lock:
         return {
             "status": "memory_only",
-            "metrics": {k: {"total": v["total"], "count": len(v["values"]), "labels": len(v["by_label"])} for k, v in _metrics_store.items()}
+            "metrics": {k: _memory_metric_summary(v) for k, v in _metrics_store.items()}
         }
 
 
+def _format_labels(labels: Dict[str, str]) -> str:
+    def _escape(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _route_latency_samples() -> List[Any]:
+    """``(name, labels, value)`` samples for per-route request latency.
+
+    Exported as a Prometheus summary: quantiles over the rolling window
+    (``window`` label) and all-time, plus all-time ``_count`` / ``_sum``.
+    """
+    from src.utils.monitoring import performance_monitor
+
+    name = "ai_nurse_request_latency_seconds"
+    samples = []
+    for route, (cumulative, window) in sorted(performance_monitor.route_latency.histograms().items()):
+        for scope, histogram in (("all", cumulative), ("rolling", window)):
+            values = histogram.percentiles([p for _, p in DEFAULT_PERCENTILES])
+            for (_, percentile), value in zip(DEFAULT_PERCENTILES, values):
+                labels = {"route": route, "window": scope, "quantile": f"{percentile / 100:g}"}
+                samples.append((name, labels, value))
+        samples.append((f"{name}_count", {"route": route}, cumulative.count))
+        samples.append((f"{name}_sum", {"route": route}, cumulative.total))
+    return samples
+
+
+def render_latency_metrics() -> str:
+    """Per-route latency in the Prometheus text exposition format."""
+    lines = [
+        "# HELP ai_nurse_request_latency_seconds Request latency by route",
+        "# TYPE ai_nurse_request_latency_seconds summary",
+    ]
+    for name, labels, value in _route_latency_samples():
+        lines.append(f"{name}{_format_labels(labels)} {float(value)!r}")
+    return "\n".join(lines) + "\n"
+
+
+class _RouteLatencyCollector:
+    """Custom Prometheus collector exposing ``performance_monitor`` route histograms."""
+
+    def collect(self):
+        from prometheus_client.core import Metric
+
+        metric = Metric("ai_nurse_request_latency_seconds", "Request latency by route", "summary")
+        for name, labels, value in _route_latency_samples():
+            metric.add_sample(name, labels, value)
+        yield metric
+
+
+_latency_collector_registered = False
+
+
+def _register_latency_collector() -> None:
+    global _latency_collector_registered
+    if _latency_collector_registered:
+        return
+    from prometheus_client import REGISTRY
+
+    REGISTRY.register(_RouteLatencyCollector())
+    _latency_collector_registered = True
+
+
 def setup_metrics(app, metrics_route: str = "/metrics") -> None:
     if not _METRICS_ENABLED:
         logger.debug("Metrics disabled; setup_metrics no-op")
         return
     if not _PROM_AVAILABLE:
-        logger.info("Prometheus client not available; using memory metrics")
+        from starlette.responses import PlainTextResponse
+
+        async def _latency_metrics(request):
+            return PlainTextResponse(render_latency_metrics(), media_type="text/plain; version=0.0.4")
+
+        app.add_route(metrics_route, _latency_metrics, methods=["GET"], include_in_schema=False)
+        logger.info("Prometheus client not available; serving memory latency metrics at %s", metrics_route)
         return
     try:
         from prometheus_client import make_asgi_app
+        _register_latency_collector()
         metrics_app = make_asgi_app()
         app.mount(metrics_route, metrics_app)
         logger.info("Prometheus metrics mounted at %s", metrics_route)
     except Exception as e:
         logger.warning("Failed to mount prometheus ASGI app: %s", e)
-
-
-
-    def get_metrics_summary() -> Dict[str, Any]:
-        if not _METRICS_ENABLED:
-            return {"status": "disabled"}
-        if _PROM_AVAILABLE:
-            return {"status": "prometheus_enabled", "endpoint": "/metrics"}
-        with _metrics_lock:
-            return {"status": "memory_only", "metrics": {k: {"total": v["total"], "count": len(v["values"]), "labels": len(v["by_label"])} for k, v in _metrics_store.items()}}
-
-
-    def setup_metrics(app, metrics_route: str = "/metrics") -> None:
-        if not _METRICS_ENABLED:
-            logger.debug("Metrics disabled; setup_metrics no-op")
-            return
-        if not _PROM_AVAILABLE:
-            logger.info("Prometheus client not available; using memory metrics")
-            return
-        try:
-            from prometheus_client import make_asgi_app
-            metrics_app = make_asgi_app()
-            app.mount(metrics_route, metrics_app)
-            logger.info("Prometheus metrics mounted at %s", metrics_route)
-        except Exception as e:
-            logger.warning("Failed to mount prometheus ASGI app: %s", e)
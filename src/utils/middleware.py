@@ -1,144 +1,267 @@
 """
 Middleware components for AI Nurse Florence
 Following middleware stack order from coding instructions
+
+Security headers, request IDs, request logging and rate limiting run as a
+single pure-ASGI middleware (``RequestContextMiddleware``). Stacking one
+``BaseHTTPMiddleware`` per concern costs an extra task and memory stream
+per layer on every request and buffers streaming responses; this version
+only wraps ``send`` to add headers to ``http.response.start`` and passes
+body chunks straight through.
 """
 
-import uuid
-import time
+import json
 import logging
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.latency_histogram import UNMATCHED_ROUTE
+from src.utils.metrics import current_request_id, record_route_latency
+from src.utils.monitoring import performance_monitor
+from src.utils.rate_limit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """
-    Security headers middleware following coding instructions.
-    First in middleware stack - CSP, HSTS headers.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Security headers for healthcare applications
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # HSTS for production
-        if request.url.hostname not in ["localhost", "127.0.0.1"]:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # CSP for healthcare application
-        csp = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "connect-src 'self' https:; "
-            "font-src 'self'; "
-            "object-src 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
-        response.headers["Content-Security-Policy"] = csp
-        
-        return response
+RawHeaders = List[Tuple[bytes, bytes]]
+
+# CSP for healthcare application
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data: https:; "
+    "connect-src 'self' https:; "
+    "font-src 'self'; "
+    "object-src 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+SECURITY_HEADERS: Dict[str, str] = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Content-Security-Policy": CONTENT_SECURITY_POLICY,
+}
+
+HSTS_HEADER = ("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
+
+# HSTS is skipped for local development hosts
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1"})
+
+
+def _encode_headers(headers: Iterable[Tuple[str, str]]) -> RawHeaders:
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+def _merge_headers(existing: RawHeaders, extra: RawHeaders) -> RawHeaders:
+    """Return ``existing`` with every header named in ``extra`` replaced."""
+    names = {name for name, _ in extra}
+    merged = [(name, value) for name, value in existing if name.lower() not in names]
+    merged.extend(extra)
+    return merged
+
+
+def route_label(scope: Dict[str, Any]) -> str:
+    """``"METHOD /path/{template}"`` for the matched route, so IDs don't explode cardinality."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    return f"{scope.get('method', '')} {path}"
+
+
+def _record_latency(scope: Dict[str, Any], status_code: int, seconds: float) -> None:
+    """Feed the in-process route histograms and the Prometheus route histogram."""
+    performance_monitor.record_request(seconds, status_code, route_label(scope))
+    path = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+    record_route_latency(
+        scope.get("method", ""), path, status_code, seconds, scope["state"].get("request_id")
+    )
+
+
+def _hostname(host: bytes) -> str:
+    host_str = host.decode("latin-1")
+    if host_str.startswith("["):
+        return host_str[1:host_str.find("]")]
+    return host_str.split(":", 1)[0]
+
+
+class RequestContextMiddleware:
     """
-    Request ID middleware following coding instructions.
-    Second in middleware stack - UUID generation for tracing.
+    Request context middleware following coding instructions.
+
+    Covers the whole middleware stack in one pass, in the original order:
+    security headers (CSP, HSTS), request ID (UUID for tracing, exposed as
+    ``request.state.request_id`` and ``X-Request-ID``), structured
+    request/response logging with ``X-Process-Time``, and rate limiting
+    (conditional, via ``RateLimiter.check``). Each request's duration is
+    recorded per route in ``performance_monitor`` and the Prometheus route
+    histogram, with the request ID available to other metrics as an exemplar.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate UUID for request tracing
+
+    def __init__(
+        self,
+        app: Any,
+        requests_per_minute: Optional[int] = None,
+        exempt_paths: Optional[List[str]] = None,
+        rate_limit_enabled: Optional[bool] = None,
+    ):
+        self.app = app
+
+        if rate_limit_enabled is None or requests_per_minute is None:
+            from src.utils.config import get_settings
+
+            settings = get_settings()
+            if rate_limit_enabled is None:
+                rate_limit_enabled = bool(settings.RATE_LIMIT_ENABLED)
+            if requests_per_minute is None:
+                requests_per_minute = settings.RATE_LIMIT_PER_MINUTE
+
+        self.rate_limiter: Optional[RateLimiter] = None
+        if rate_limit_enabled and requests_per_minute > 0:
+            self.rate_limiter = RateLimiter(
+                None, requests_per_minute=requests_per_minute, exempt_paths=exempt_paths
+            )
+
+        # Encoded once; only the per-request values are built per call
+        self._security_headers = _encode_headers(SECURITY_HEADERS.items())
+        self._security_headers_hsts = self._security_headers + _encode_headers([HSTS_HEADER])
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        
-        # Add to response headers
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        
-        return response
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Structured logging middleware following coding instructions.
-    Third in middleware stack - request/response logging.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
-        # Get request ID from previous middleware
-        request_id = getattr(request.state, 'request_id', 'unknown')
-        
-        # Log request
-        logger.info(
-            "Request started",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client_ip": request.client.host if request.client else "unknown",
-                "user_agent": request.headers.get("user-agent", "unknown")
-            }
-        )
-        
-        try:
-            response = await call_next(request)
-            
-            # Calculate response time
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                "Request completed",
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        host = b""
+        user_agent = b"unknown"
+        for name, value in scope.get("headers", ()):
+            if name == b"host":
+                host = value
+            elif name == b"user-agent":
+                user_agent = value
+
+        path = scope.get("path", "")
+        method = scope.get("method", "")
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request started",
                 extra={
                     "request_id": request_id,
-                    "status_code": response.status_code,
-                    "process_time": round(process_time, 4),
-                    "path": request.url.path
-                }
+                    "method": method,
+                    "path": path,
+                    "client_ip": client_ip,
+                    "user_agent": user_agent.decode("latin-1"),
+                },
             )
-            
-            # Add process time header
-            response.headers["X-Process-Time"] = str(round(process_time, 4))
-            
-            return response
-            
+
+        extra_headers = list(
+            self._security_headers
+            if _hostname(host) in LOCAL_HOSTS
+            else self._security_headers_hsts
+        )
+        extra_headers.append((b"x-request-id", request_id.encode("latin-1")))
+
+        blocked = None
+        if self.rate_limiter is not None:
+            decision = await self.rate_limiter.check(scope)
+            if decision is not None:
+                rate_headers, retry_after = decision
+                extra_headers.extend(_encode_headers(rate_headers.items()))
+                if retry_after > 0:
+                    blocked = self.rate_limiter.too_many_requests_body(retry_after)
+
+        response_started = False
+        status_code = 500
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal response_started, status_code
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                process_time = round(time.perf_counter() - start_time, 4)
+                message["headers"] = _merge_headers(
+                    list(message.get("headers", ())),
+                    extra_headers + [(b"x-process-time", str(process_time).encode("latin-1"))],
+                )
+            await send(message)
+
+        request_id_token = current_request_id.set(request_id)
+        try:
+            if blocked is not None:
+                await self._send_json(send_wrapper, 429, blocked)
+            else:
+                await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Log error
-            process_time = time.time() - start_time
             logger.error(
                 "Request failed",
                 extra={
                     "request_id": request_id,
                     "error": str(e),
-                    "process_time": round(process_time, 4),
-                    "path": request.url.path
+                    "process_time": round(time.perf_counter() - start_time, 4),
+                    "path": path,
                 },
-                exc_info=True
+                exc_info=True,
             )
-            
-            # Return error response
-            return JSONResponse(
-                status_code=500,
-                content={
+            if response_started:
+                _record_latency(scope, 500, time.perf_counter() - start_time)
+                raise
+            await self._send_json(
+                send_wrapper,
+                500,
+                {
                     "error": "Internal server error",
                     "request_id": request_id,
-                    "message": "An error occurred processing your request"
-                }
+                    "message": "An error occurred processing your request",
+                },
             )
+            _record_latency(scope, 500, time.perf_counter() - start_time)
+            return
+        finally:
+            current_request_id.reset(request_id_token)
+
+        process_time = time.perf_counter() - start_time
+        _record_latency(scope, status_code, process_time)
+        logger.info(
+            "Request completed",
+            extra={
+                "request_id": request_id,
+                "method": method,
+                "status_code": status_code,
+                "process_time": round(process_time, 4),
+                "path": path,
+                "client_ip": client_ip,
+            },
+        )
+
+    @staticmethod
+    async def _send_json(send: Any, status_code: int, content: Dict[str, Any]) -> None:
+        body = json.dumps(content).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
 
 # Export middleware classes following coding instructions
 __all__ = [
-    'SecurityHeadersMiddleware',
-    'RequestIdMiddleware', 
-    'LoggingMiddleware'
+    "RequestContextMiddleware",
+    "SECURITY_HEADERS",
     # RateLimiter is exported from rate_limit.py
 ]
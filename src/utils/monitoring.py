@@ -5,12 +5,20 @@ Provides comprehensive monitoring, logging, and alerting capabilities
 
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 import requests
 
+from src.utils.latency_histogram import (
+    LatencyHistogram,
+    RollingLatencyHistogram,
+    RouteLatencyTracker,
+    UNMATCHED_ROUTE,
+)
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -22,34 +30,51 @@ except ImportError:
 
 
 class PerformanceMonitor:
-    """Monitor application performance metrics"""
+    """Monitor application performance metrics
     
-    def __init__(self):
+    Response times are counted into fixed-size log-bucketed histograms
+    (``src.utils.latency_histogram``) - overall and per route, all-time and
+    over a rolling window - instead of a list of raw samples.
+    """
+    
+    def __init__(self, window_seconds: Optional[float] = None, max_routes: Optional[int] = None):
+        if window_seconds is None or max_routes is None:
+            try:
+                from src.utils.config import get_settings
+                settings = get_settings()
+            except Exception:
+                settings = None
+            if window_seconds is None:
+                window_seconds = getattr(settings, "LATENCY_WINDOW_SECONDS", 60)
+            if max_routes is None:
+                max_routes = getattr(settings, "LATENCY_MAX_ROUTES", 200)
+        
         self.start_time = datetime.now()
         self.request_count = 0
         self.error_count = 0
-        self.response_times = []
+        self.window_seconds = window_seconds
+        self.response_times = LatencyHistogram()
+        self.recent_response_times = RollingLatencyHistogram(window_seconds)
+        self.route_latency = RouteLatencyTracker(window_seconds, max_routes=max_routes)
+        self._lock = threading.Lock()
         
-    def record_request(self, response_time: float, status_code: int):
-        """Record a request for performance tracking"""
-        self.request_count += 1
-        self.response_times.append(response_time)
-        
-        if status_code >= 400:
-            self.error_count += 1
-            
-        # Keep only last 1000 response times
-        if len(self.response_times) > 1000:
-            self.response_times = self.response_times[-1000:]
+    def record_request(self, response_time: float, status_code: int, route: Optional[str] = None):
+        """Record a request for performance tracking (``response_time`` in seconds)"""
+        with self._lock:
+            self.request_count += 1
+            if status_code >= 400:
+                self.error_count += 1
+            self.response_times.record(response_time)
+            self.recent_response_times.record(response_time)
+        self.route_latency.record(route or UNMATCHED_ROUTE, response_time)
     
     def get_metrics(self) -> Dict:
         """Get current performance metrics"""
         uptime = datetime.now() - self.start_time
         
-        avg_response_time = (
-            sum(self.response_times) / len(self.response_times)
-            if self.response_times else 0
-        )
+        with self._lock:
+            recent = self.recent_response_times.snapshot()
+            all_time = self.response_times.summary()
         
         error_rate = (
             (self.error_count / self.request_count * 100)
@@ -62,11 +87,18 @@ class PerformanceMonitor:
             "total_requests": self.request_count,
             "error_count": self.error_count,
             "error_rate_percent": round(error_rate, 2),
-            "average_response_time_ms": round(avg_response_time * 1000, 2),
+            "average_response_time_ms": round(recent.mean * 1000, 2),
+            "latency_window_seconds": self.window_seconds,
+            "latency_ms": recent.summary(),
+            "latency_all_time_ms": all_time,
             "requests_per_minute": round(
                 self.request_count / (uptime.total_seconds() / 60), 2
             ) if uptime.total_seconds() > 0 else 0
         }
+    
+    def get_route_metrics(self) -> Dict:
+        """Per-route latency percentiles (all-time and rolling window)"""
+        return self.route_latency.summary()
 
 
 class SystemMonitor:
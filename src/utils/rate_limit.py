@@ -1,13 +1,22 @@
 """
 Rate limiting middleware for AI Nurse Florence
-IP-based rate limiting with Redis backend
+IP- and user-based rate limiting with Redis backend
+
+Uses GCRA (generic cell rate algorithm): each client bucket is a single
+"theoretical arrival time" (TAT) value, so state is O(1) per client in
+both Redis (one string key with a TTL) and the in-memory fallback (one
+float in a bounded LRU). Idle buckets expire on their own once their TAT
+has passed.
 """
 
+import hashlib
+import math
 import time
 import logging
-from typing import Callable, Dict, Optional, List, Any, Tuple
-from fastapi import Request, Response, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from collections import OrderedDict
+from typing import Dict, Optional, List, Any, Tuple
+from fastapi import status
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
 import threading
 
@@ -22,173 +31,235 @@ except ImportError:
 from src.utils.config import get_settings
 from src.utils.exceptions import ServiceException, ErrorType
 
+# Verified-token cache - user buckets are keyed on verified user IDs only
+try:
+    from src.utils.token_cache import get_token_cache
+    _has_token_cache = True
+except ImportError:
+    _has_token_cache = False
+    get_token_cache = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
-# Global state for memory fallback
-_memory_rate_limit: Dict[str, Dict[str, Any]] = {}
+# Global state for memory fallback: bucket key -> TAT (epoch seconds), LRU ordered
+_memory_rate_limit: "OrderedDict[str, float]" = OrderedDict()
 _rate_limit_lock = threading.RLock()
 
 # Constants
+# GCRA. ARGV[1] = emission interval (ms per request), ARGV[2] = window (ms),
+# ARGV[3] = current time (ms). Returns {remaining, retry_after_seconds}.
 RATE_LIMIT_SCRIPT = """
 local key = KEYS[1]
-local limit = tonumber(ARGV[1])
+local interval = tonumber(ARGV[1])
 local window = tonumber(ARGV[2])
-local current_time = tonumber(ARGV[3])
+local now = tonumber(ARGV[3])
 
--- Clean old requests
-redis.call('ZREMRANGEBYSCORE', key, 0, current_time - window)
-
--- Count requests in current window
-local count = redis.call('ZCARD', key)
+local tat = tonumber(redis.call('GET', key)) or now
+if tat < now then
+    tat = now
+end
 
--- If under limit, add new request and return count
-if count < limit then
-    redis.call('ZADD', key, current_time, current_time .. "-" .. math.random())
-    redis.call('EXPIRE', key, window)
-    return {count + 1, limit, 0}
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if now < allow_at then
+    return {0, math.ceil((allow_at - now) / 1000)}
 end
 
--- Return time to wait until oldest request expires
-local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')[2]
-local ttl = math.ceil(window - (current_time - oldest))
-return {count, limit, ttl}
+-- Key expires exactly when the bucket would be full again
+redis.call('SET', key, new_tat, 'PX', math.ceil(new_tat - now))
+return {math.floor((window - (new_tat - now)) / interval), 0}
 """
 
 
+def gcra(tat: Optional[float], now: float, interval: float, window: float) -> Tuple[Optional[float], int, int]:
+    """
+    One GCRA step.
+
+    Returns ``(new_tat, remaining, retry_after)``; ``new_tat`` is ``None``
+    when the request is rejected (state must not change).
+    """
+    tat = max(tat or now, now)
+    new_tat = tat + interval
+    allow_at = new_tat - window
+    if now < allow_at:
+        return None, 0, max(1, math.ceil(allow_at - now))
+    # Small epsilon so float drift never costs a whole request
+    remaining = int((window - (new_tat - now)) / interval + 1e-9)
+    return new_tat, max(0, remaining), 0
+
+
+def parse_route_limits(value: str) -> Dict[str, int]:
+    """Parse ``"/api/v1/chat=20,/api/v1/documents=30"`` into a prefix -> limit map."""
+    limits: Dict[str, int] = {}
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        prefix, _, limit = item.rpartition("=")
+        try:
+            limits[prefix.strip()] = int(limit)
+        except ValueError:
+            logger.warning(f"Ignoring malformed rate limit route quota: {item!r}")
+    return limits
+
+
 async def get_redis_client():
     """Get Redis client with graceful fallback"""
     from src.utils.redis_cache import get_redis_client as get_cache_redis_client
     return await get_cache_redis_client()
 
 
-class RateLimiter(BaseHTTPMiddleware):
+class RateLimiter:
     """
     Rate limiting middleware following coding instructions.
     Fourth in middleware stack - request throttling (conditional).
+
+    Pure ASGI, so it can be mounted on its own with ``app.add_middleware``
+    or used through ``check()`` by ``RequestContextMiddleware``.
     """
     
     def __init__(
         self, 
         app: Any,
         requests_per_minute: int = 60,
-        exempt_paths: Optional[List[str]] = None
+        exempt_paths: Optional[List[str]] = None,
+        user_requests_per_minute: Optional[int] = None,
+        route_limits: Optional[Dict[str, int]] = None,
+        max_memory_clients: Optional[int] = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.settings = get_settings()
         self.requests_per_minute = requests_per_minute
         self.window_seconds = 60  # 1 minute window
         self.exempt_paths = exempt_paths or ["/docs", "/redoc", "/openapi.json", "/api/v1/health", "/metrics"]
+
+        # Clients with a verified bearer token get their own per-user quota
+        if user_requests_per_minute is None:
+            user_requests_per_minute = self.settings.RATE_LIMIT_USER_PER_MINUTE or requests_per_minute
+        self.user_requests_per_minute = user_requests_per_minute
+
+        # Per-route quotas, matched by longest path prefix
+        if route_limits is None:
+            route_limits = parse_route_limits(self.settings.RATE_LIMIT_ROUTE_LIMITS)
+        self.route_limits = sorted(route_limits.items(), key=lambda item: len(item[0]), reverse=True)
+
+        if max_memory_clients is None:
+            max_memory_clients = self.settings.RATE_LIMIT_MEMORY_MAX_CLIENTS
+        self.max_memory_clients = max_memory_clients
+
         self._limiter_script_sha = None
         logger.info(f"Rate limiter initialized: {self.requests_per_minute} requests per minute")
     
-    def _should_be_rate_limited(self, request: Request) -> bool:
+    def _should_be_rate_limited(self, path: str) -> bool:
         """Determine if request should be rate limited based on path"""
-        path = request.url.path
-        
         # Never rate limit exempt paths
         if any(path.startswith(exempt) for exempt in self.exempt_paths):
             return False
             
         return True
     
-    def _get_client_identifier(self, request: Request) -> str:
-        """Extract client identifier for rate limiting"""
-        # Default to IP address
-        client_id = request.client.host if request.client else "unknown"
+    def _get_client_identifier(self, scope: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Extract client identifier for rate limiting.
+        Returns: (identifier, is_user)
+        """
+        # Bearer token holders are limited per user, but only once
+        # get_current_user has verified the token (it is then in the token
+        # cache). Unverified tokens are limited per IP, so sending a fresh
+        # random token per request doesn't buy a fresh quota.
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                scheme, _, token = value.partition(b" ")
+                if scheme.lower() == b"bearer" and token and _has_token_cache:
+                    claims = get_token_cache().peek(token.decode("latin-1"))
+                    user_id = claims.get("sub") if claims else None
+                    if user_id:
+                        return f"user:{hashlib.sha256(str(user_id).encode('utf-8')).hexdigest()[:32]}", True
+                break
         
-        # Add prefix for Redis key namespace
-        return f"rate_limit:{client_id}"
+        # Default to IP address
+        client = scope.get("client")
+        client_id = client[0] if client else "unknown"
+        return f"ip:{client_id}", False
+    
+    def _resolve_quota(self, path: str, is_user: bool) -> Tuple[str, int]:
+        """Pick the bucket name and limit for a request. Returns: (bucket, limit)"""
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "*", self.user_requests_per_minute if is_user else self.requests_per_minute
     
     async def _check_rate_limit_redis(
-        self, client_id: str, redis_client: Any
-    ) -> Tuple[int, int, int]:
+        self, key: str, limit: int, redis_client: Any
+    ) -> Tuple[int, int]:
         """
         Check rate limit using Redis
-        Returns: (current_count, limit, retry_after)
+        Returns: (remaining, retry_after)
         """
+        window_ms = self.window_seconds * 1000
+        args = (
+            window_ms / limit,  # ARGV[1] - emission interval in ms
+            window_ms,  # ARGV[2] - window in ms
+            int(time.time() * 1000),  # ARGV[3] - current time
+        )
         try:
             # Load the script if needed
             if not self._limiter_script_sha:
                 try:
                     self._limiter_script_sha = await redis_client.script_load(RATE_LIMIT_SCRIPT)
                 except Exception:
-                    logger.warning("Failed to load rate limiting script, using evalsha directly")
-            
-            # Current time in milliseconds
-            current_time = int(time.time() * 1000)
+                    logger.warning("Failed to load rate limiting script, using eval directly")
             
             # Try to use the loaded script
             if self._limiter_script_sha:
                 try:
-                    result = await redis_client.evalsha(
-                        self._limiter_script_sha,
-                        1,  # Number of keys
-                        client_id,  # KEYS[1]
-                        self.requests_per_minute,  # ARGV[1] - limit
-                        self.window_seconds * 1000,  # ARGV[2] - window in ms
-                        current_time,  # ARGV[3] - current time
-                    )
-                    return int(result[0]), int(result[1]), int(result[2])
+                    result = await redis_client.evalsha(self._limiter_script_sha, 1, key, *args)
+                    return int(result[0]), int(result[1])
                 except Exception as e:
                     logger.warning(f"Script execution failed: {e}, falling back to direct eval")
                     self._limiter_script_sha = None
             
             # Fallback to direct eval if script loading fails
-            result = await redis_client.eval(
-                RATE_LIMIT_SCRIPT,
-                1,  # Number of keys
-                client_id,  # KEYS[1]
-                self.requests_per_minute,  # ARGV[1] - limit
-                self.window_seconds * 1000,  # ARGV[2] - window in ms
-                current_time,  # ARGV[3] - current time
-            )
-            return int(result[0]), int(result[1]), int(result[2])
+            result = await redis_client.eval(RATE_LIMIT_SCRIPT, 1, key, *args)
+            return int(result[0]), int(result[1])
             
         except Exception as e:
             logger.error(f"Redis rate limiting failed: {e}")
             # Fallback to memory-based rate limiting
-            return self._check_rate_limit_memory(client_id)
+            return self._check_rate_limit_memory(key, limit)
     
-    def _check_rate_limit_memory(self, client_id: str) -> Tuple[int, int, int]:
+    def _check_rate_limit_memory(self, key: str, limit: int) -> Tuple[int, int]:
         """
         Memory-based fallback for rate limiting
-        Returns: (current_count, limit, retry_after)
+        Returns: (remaining, retry_after)
         """
         with _rate_limit_lock:
-            current_time = time.time()
-            window_start = current_time - self.window_seconds
-            
-            # Initialize or get client's request history
-            if client_id not in _memory_rate_limit:
-                _memory_rate_limit[client_id] = {"requests": [], "last_cleanup": current_time}
-            
-            client_data = _memory_rate_limit[client_id]
-            requests = client_data["requests"]
-            
-            # Clean old requests (once per second at most)
-            if current_time - client_data["last_cleanup"] > 1:
-                requests = [ts for ts in requests if ts > window_start]
-                client_data["requests"] = requests
-                client_data["last_cleanup"] = current_time
-            
-            # Count current requests in window
-            count = len(requests)
-            
-            # If under limit, add new timestamp
-            if count < self.requests_per_minute:
-                requests.append(current_time)
-                return count + 1, self.requests_per_minute, 0
+            now = time.time()
+            new_tat, remaining, retry_after = gcra(
+                _memory_rate_limit.get(key), now, self.window_seconds / limit, self.window_seconds
+            )
+            if new_tat is not None:
+                _memory_rate_limit[key] = new_tat
+                _memory_rate_limit.move_to_end(key)
             
-            # Calculate time until oldest request expires
-            if requests:
-                oldest = min(requests)
-                retry_after = max(1, int(self.window_seconds - (current_time - oldest)))
-                return count, self.requests_per_minute, retry_after
+            # Evict idle buckets: least recently used first, stopping at the
+            # first one still holding state, then enforce the size bound
+            while _memory_rate_limit:
+                oldest_key, oldest_tat = next(iter(_memory_rate_limit.items()))
+                if oldest_tat > now and len(_memory_rate_limit) <= self.max_memory_clients:
+                    break
+                del _memory_rate_limit[oldest_key]
             
-            # Should never reach here
-            return self.requests_per_minute, self.requests_per_minute, self.window_seconds
+            return remaining, retry_after
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def check(self, scope: Dict[str, Any]) -> Optional[Tuple[Dict[str, str], int]]:
+        """
+        Count one request against the client's quota.
+
+        Returns ``None`` when the request is not rate limited at all
+        (limiting disabled or exempt path), otherwise the rate limit headers
+        and ``retry_after`` (> 0 means the request must be rejected).
+        """
         # Determine if rate limiting is enabled. Honor settings, but also
         # enable the middleware when it's explicitly configured via the
         # middleware args (requests_per_minute > 0). This makes tests that
@@ -196,62 +267,87 @@ class RateLimiter(BaseHTTPMiddleware):
         # when a repository .env disables rate limiting globally.
         enabled = bool(self.settings.RATE_LIMIT_ENABLED) or bool(getattr(self, "requests_per_minute", 0) > 0)
         if not enabled:
-            return await call_next(request)
+            return None
         
         # Skip exempt paths
-        if not self._should_be_rate_limited(request):
-            return await call_next(request)
+        path = scope.get("path", "")
+        if not self._should_be_rate_limited(path):
+            return None
         
-        # Get client identifier
-        client_id = self._get_client_identifier(request)
+        # Get client identifier and the quota that applies
+        identifier, is_user = self._get_client_identifier(scope)
+        bucket, limit = self._resolve_quota(path, is_user)
+        if limit <= 0:
+            return None
+        key = f"rate_limit:{bucket}:{identifier}"
         
         # Check rate limit
         redis_client = await get_redis_client()
         
         if redis_client:
             # Use Redis-based rate limiting
-            current, limit, retry_after = await self._check_rate_limit_redis(client_id, redis_client)
+            remaining, retry_after = await self._check_rate_limit_redis(key, limit, redis_client)
         else:
             # Use memory-based fallback
-            current, limit, retry_after = self._check_rate_limit_memory(client_id)
+            remaining, retry_after = self._check_rate_limit_memory(key, limit)
         
         # Set rate limit headers
         headers = {
             "X-RateLimit-Limit": str(limit),
-            "X-RateLimit-Remaining": str(max(0, limit - current)),
+            "X-RateLimit-Remaining": str(remaining),
             "X-RateLimit-Reset": str(retry_after)
         }
         
-        # If rate limited (retry_after > 0 indicates the window is full), return 429 response
-        # The rate limiting backends return a non-zero retry_after when the request
-        # would exceed the configured limit (Redis eval returns ttl>0, memory fallback
-        # returns retry_after>0). Use that value rather than comparing counts which
-        # can be ambiguous between the "new request allowed" and "blocked" cases.
-        if retry_after and int(retry_after) > 0:
-            error_response = {
-                "error": "Too many requests",
-                "error_type": ErrorType.RATE_LIMIT_ERROR,
-                "message": f"Rate limit exceeded. Try again in {retry_after} seconds.",
-                "retry_after": retry_after
-            }
-
+        # Both backends return a non-zero retry_after exactly when the request
+        # would exceed the configured limit.
+        retry_after = int(retry_after or 0)
+        if retry_after > 0:
             # Add Retry-After header
             headers["Retry-After"] = str(retry_after)
-
-            return JSONResponse(
+        
+        return headers, retry_after
+    
+    @staticmethod
+    def too_many_requests_body(retry_after: int) -> Dict[str, Any]:
+        """Error body for a rejected (429) request"""
+        return {
+            "error": "Too many requests",
+            "error_type": ErrorType.RATE_LIMIT_ERROR,
+            "message": f"Rate limit exceeded. Try again in {retry_after} seconds.",
+            "retry_after": retry_after
+        }
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        decision = await self.check(scope)
+        if decision is None:
+            await self.app(scope, receive, send)
+            return
+        
+        headers, retry_after = decision
+        
+        # If rate limited, return 429 response
+        if retry_after > 0:
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content=error_response,
+                content=self.too_many_requests_body(retry_after),
                 headers=headers
             )
-
-        # Process request normally
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        for key, value in headers.items():
-            response.headers[key] = value
-
-        return response
+            await response(scope, receive, send)
+            return
+        
+        # Add rate limit headers to the response without buffering the body
+        async def send_with_headers(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for key, value in headers.items():
+                    response_headers[key] = value
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
 
 # Export classes
-__all__ = ['RateLimiter']
+__all__ = ['RateLimiter', 'gcra', 'parse_route_limits']
@@ -11,11 +11,15 @@ import hashlib
 import json
 import logging
 import re
+import time
+from array import array
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from src.utils.latency_histogram import LatencyHistogram
+
 # Conditional imports following AI Nurse Florence patterns
 try:
     import redis.asyncio as redis
@@ -148,16 +152,82 @@ CACHE_STRATEGIES = {
 }
 
 
-@dataclass
-class CacheMetrics:
-    """Cache performance metrics."""
+class CacheMetricsRing:
+    """
+    Fixed-size ring of recent cache accesses, stored column-wise in arrays.
+
+    Recording overwrites the oldest slot (no list shifting, no per-access
+    objects); ``summarize`` scans at most ``capacity`` slots and is only used
+    for time-window queries.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._response_ms = array("d", bytes(8 * capacity))
+        self._hits = array("b", bytes(capacity))
+        self._strategies = array("B", bytes(capacity))
+        self._next = 0
+        self.size = 0
+
+    def record(self, strategy_index: int, hit: bool, response_time_ms: float, timestamp: float) -> None:
+        position = self._next
+        self._timestamps[position] = timestamp
+        self._response_ms[position] = response_time_ms
+        self._hits[position] = hit
+        self._strategies[position] = strategy_index
+        self._next = (position + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def oldest_timestamp(self) -> Optional[float]:
+        if not self.size:
+            return None
+        return self._timestamps[(self._next - self.size) % self.capacity]
+
+    def summarize(self, since: float = 0.0) -> Dict[str, Any]:
+        """Requests, hits and mean response time of entries newer than ``since``."""
+        requests = hits = 0
+        total_ms = 0.0
+        for offset in range(self.size):
+            position = (self._next - 1 - offset) % self.capacity
+            if self._timestamps[position] <= since:
+                break
+            requests += 1
+            hits += self._hits[position]
+            total_ms += self._response_ms[position]
+        return {
+            "total_requests": requests,
+            "cache_hits": hits,
+            "cache_misses": requests - hits,
+            "hit_rate": hits / requests if requests else 0,
+            "avg_response_time_ms": total_ms / requests if requests else 0,
+        }
+
+
+class StrategyCacheStats:
+    """Running aggregates for one cache strategy."""
+
+    __slots__ = ("requests", "hits", "similarity_hits", "response_ms_total", "latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.hits = 0
+        self.similarity_hits = 0
+        self.response_ms_total = 0.0
+        self.latency = LatencyHistogram()
+
+    def record(self, hit: bool, response_time_ms: float, similarity: bool = False) -> None:
+        self.requests += 1
+        if hit:
+            self.hits += 1
+            if similarity:
+                self.similarity_hits += 1
+        self.response_ms_total += response_time_ms
+        self.latency.record(response_time_ms / 1000)
 
-    cache_key: str
-    strategy: CacheStrategy
-    hit: bool
-    response_time_ms: float
-    cache_size_bytes: Optional[int]
-    timestamp: datetime
+
+_STRATEGY_INDEX = {strategy: index for index, strategy in enumerate(CacheStrategy)}
 
 
 class SmartCacheManager:
@@ -171,7 +241,13 @@ class SmartCacheManager:
             except Exception:
                 pass
 
-        self.metrics_history: List[CacheMetrics] = []
+        # Recent accesses (time-window queries) plus all-time running
+        # aggregates per strategy, so recording and statistics never scan
+        self.metrics_history = CacheMetricsRing(capacity=1000)
+        self.strategy_stats: Dict[CacheStrategy, StrategyCacheStats] = {
+            strategy: StrategyCacheStats() for strategy in CacheStrategy
+        }
+        self.metrics_since: Optional[datetime] = None
         self.cache_warming_tasks: Dict[str, asyncio.Task] = {}
         self.common_medical_terms = [
             "hypertension",
@@ -246,7 +322,7 @@ class SmartCacheManager:
         **kwargs,
     ) -> Optional[Any]:
         """Get from cache with smart key matching and similarity checking."""
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
 
         try:
             # Generate primary cache key
@@ -402,27 +478,21 @@ class SmartCacheManager:
         cache_key: str,
         strategy: CacheStrategy,
         hit: bool,
-        start_time: datetime,
+        start_time: float,
         note: Optional[str] = None,
     ):
-        """Record cache performance metrics."""
+        """Record cache performance metrics (``start_time`` from ``time.perf_counter()``)."""
         try:
-            end_time = datetime.utcnow()
-            response_time_ms = (end_time - start_time).total_seconds() * 1000
-
-            metrics = CacheMetrics(
-                cache_key=cache_key,
-                strategy=strategy,
-                hit=hit,
-                response_time_ms=response_time_ms,
-                cache_size_bytes=None,  # Could be calculated if needed
-                timestamp=end_time,
-            )
+            response_time_ms = (time.perf_counter() - start_time) * 1000
 
-            # Keep last 1000 metrics for analysis
-            self.metrics_history.append(metrics)
-            if len(self.metrics_history) > 1000:
-                self.metrics_history.pop(0)
+            if self.metrics_since is None:
+                self.metrics_since = datetime.utcnow()
+            self.metrics_history.record(
+                _STRATEGY_INDEX[strategy], hit, response_time_ms, time.time()
+            )
+            self.strategy_stats[strategy].record(
+                hit, response_time_ms, similarity=note == "similarity_match"
+            )
 
             if _has_metrics:
                 record_cache_performance(
@@ -506,33 +576,33 @@ class SmartCacheManager:
     def get_cache_statistics(self) -> Dict[str, Any]:
         """Get comprehensive cache performance statistics."""
         try:
-            if not self.metrics_history:
+            if self.metrics_since is None:
                 return {"message": "No cache metrics available"}
 
-            # Calculate statistics by strategy
+            # Read straight from the running aggregates: O(strategies)
             stats_by_strategy = {}
-            total_requests = len(self.metrics_history)
-            total_hits = sum(1 for m in self.metrics_history if m.hit)
-
-            for strategy in CacheStrategy:
-                strategy_metrics = [
-                    m for m in self.metrics_history if m.strategy == strategy
-                ]
-                if strategy_metrics:
-                    hits = sum(1 for m in strategy_metrics if m.hit)
-                    avg_response_time = sum(
-                        m.response_time_ms for m in strategy_metrics
-                    ) / len(strategy_metrics)
-
-                    stats_by_strategy[strategy.value] = {
-                        "total_requests": len(strategy_metrics),
-                        "cache_hits": hits,
-                        "hit_rate": (
-                            hits / len(strategy_metrics) if strategy_metrics else 0
-                        ),
-                        "avg_response_time_ms": round(avg_response_time, 2),
-                        "config": asdict(CACHE_STRATEGIES[strategy]),
-                    }
+            total_requests = 0
+            total_hits = 0
+
+            for strategy, stats in self.strategy_stats.items():
+                if not stats.requests:
+                    continue
+                total_requests += stats.requests
+                total_hits += stats.hits
+                latency = stats.latency.summary()
+
+                stats_by_strategy[strategy.value] = {
+                    "total_requests": stats.requests,
+                    "cache_hits": stats.hits,
+                    "similarity_hits": stats.similarity_hits,
+                    "hit_rate": stats.hits / stats.requests,
+                    "avg_response_time_ms": round(
+                        stats.response_ms_total / stats.requests, 2
+                    ),
+                    "p95_response_time_ms": latency["p95_ms"],
+                    "p99_response_time_ms": latency["p99_ms"],
+                    "config": asdict(CACHE_STRATEGIES[strategy]),
+                }
 
             return {
                 "overall_statistics": {
@@ -541,11 +611,7 @@ class SmartCacheManager:
                     "overall_hit_rate": (
                         total_hits / total_requests if total_requests > 0 else 0
                     ),
-                    "metrics_collected_since": (
-                        self.metrics_history[0].timestamp.isoformat()
-                        if self.metrics_history
-                        else None
-                    ),
+                    "metrics_collected_since": self.metrics_since.isoformat(),
                 },
                 "strategy_statistics": stats_by_strategy,
                 "cache_warming": {
@@ -558,6 +624,12 @@ class SmartCacheManager:
             logger.error(f"Failed to get cache statistics: {e}")
             return {"error": str(e)}
 
+    def get_recent_performance(self, since: datetime) -> Dict[str, Any]:
+        """Hit rate and mean response time of the recent accesses after ``since`` (UTC)."""
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return self.metrics_history.summarize(since.timestamp())
+
 
 # Global smart cache manager instance
 smart_cache_manager = SmartCacheManager()
@@ -0,0 +1,50 @@
+"""
+Streaming response helpers for AI Nurse Florence
+
+Token streams are sent as either:
+- Server-sent events (``text/event-stream``): ``event: <type>`` plus a JSON
+  ``data:`` line per event, for ``EventSource``-style clients
+- NDJSON (``application/x-ndjson``): one JSON object per line, for clients
+  reading the body incrementally with ``fetch``
+
+Every event is a dict with a ``type`` key (``start``, ``delta``, ``done``,
+``error``); both formats carry the same JSON.
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi.responses import StreamingResponse
+
+STREAM_MEDIA_TYPES = {
+    "sse": "text/event-stream",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def encode_event(event: Dict[str, Any], stream_format: str = "sse") -> bytes:
+    """Serialize one stream event in ``stream_format``."""
+    data = json.dumps(event, ensure_ascii=False, default=str)
+    if stream_format == "ndjson":
+        return f"{data}\n".encode("utf-8")
+    return f"event: {event.get('type', 'message')}\ndata: {data}\n\n".encode("utf-8")
+
+
+def event_stream_response(
+    events: AsyncIterator[Dict[str, Any]], stream_format: str = "sse"
+) -> StreamingResponse:
+    """Send ``events`` as they are produced, without proxy buffering."""
+
+    async def body():
+        async for event in events:
+            yield encode_event(event, stream_format)
+
+    return StreamingResponse(
+        body(),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx / Railway edge: flush each event instead of buffering
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,240 @@
+"""
+Verified-token cache for AI Nurse Florence authentication
+Following AI Nurse Florence Conditional Imports Pattern
+
+``get_current_user`` used to run a full JWT decode and signature check on
+every request. Verified claims are now kept in a bounded LRU keyed by a
+SHA-256 of the token, until shortly before the token's ``exp``.
+
+Revocation:
+- ``revoke_session()`` (called from ``SessionDatabase.invalidate_session``)
+  drops matching entries locally and records the revocation in the Redis
+  sorted set ``auth:revoked`` (member = identifier hash, score = time).
+- Every worker pulls new revocations from that set at most once per
+  ``AUTH_REVOCATION_SYNC_SECONDS``, so a revoked session stops working on
+  all workers within that interval - without a Redis round trip per request.
+- An identifier may be the raw token, its ``session_id`` or its ``jti``.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from src.utils.redis_cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_KEY = "auth:revoked"
+
+# Used when a token carries no ``exp`` claim
+DEFAULT_CACHE_SECONDS = 300
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of ``token hash -> (claims, cache_until)`` with revocation."""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        expiry_margin_seconds: float = 30.0,
+        revocation_ttl_seconds: float = 3600.0,
+        sync_interval_seconds: float = 1.0,
+    ):
+        self.max_entries = max_entries
+        self.expiry_margin_seconds = expiry_margin_seconds
+        self.revocation_ttl_seconds = revocation_ttl_seconds
+        self.sync_interval_seconds = sync_interval_seconds
+
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float, Tuple[str, ...]]]" = OrderedDict()
+        # session_id / jti hash -> token hashes cached under it
+        self._by_identifier: Dict[str, Set[str]] = {}
+        # identifier hash -> revoked until (epoch seconds)
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+        self._last_sync = 0.0
+        self._sync_from = time.time() - revocation_ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+
+    # Cache ----------------------------------------------------------------
+
+    async def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return cached claims for a verified, unrevoked token, or ``None``."""
+        await self.sync_revocations()
+
+        token_hash = _hash(token)
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                self.misses += 1
+                return None
+            claims, cache_until, _ = entry
+            if cache_until <= time.time():
+                self._drop(token_hash)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token_hash)
+            self.hits += 1
+            return claims
+
+    def peek(self, token: str) -> Optional[Dict[str, Any]]:
+        """Cached claims for ``token`` without counting a lookup (rate limiter)."""
+        with self._lock:
+            entry = self._entries.get(_hash(token))
+            if entry is None or entry[1] <= time.time():
+                return None
+            return entry[0]
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        """Cache claims for a token that ``verify_token`` just accepted."""
+        now = time.time()
+        exp = claims.get("exp")
+        cache_until = (
+            float(exp) - self.expiry_margin_seconds
+            if isinstance(exp, (int, float))
+            else now + DEFAULT_CACHE_SECONDS
+        )
+        if cache_until <= now:
+            return
+
+        token_hash = _hash(token)
+        identifiers = tuple(
+            _hash(str(claims[name])) for name in ("session_id", "jti") if claims.get(name)
+        )
+        with self._lock:
+            self._drop(token_hash)
+            self._entries[token_hash] = (claims, cache_until, identifiers)
+            for identifier in identifiers:
+                self._by_identifier.setdefault(identifier, set()).add(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, token_hash: str) -> None:
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+        for identifier in entry[2]:
+            tokens = self._by_identifier.get(identifier)
+            if tokens is not None:
+                tokens.discard(token_hash)
+                if not tokens:
+                    del self._by_identifier[identifier]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_identifier.clear()
+            self._revoked.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Revocation -----------------------------------------------------------
+
+    def is_revoked(self, token: str, claims: Dict[str, Any]) -> bool:
+        """Check a freshly verified token against known revocations."""
+        candidates = [_hash(token)] + [
+            _hash(str(claims[name])) for name in ("session_id", "jti") if claims.get(name)
+        ]
+        now = time.time()
+        with self._lock:
+            return any(self._revoked.get(candidate, 0) > now for candidate in candidates)
+
+    def _revoke_local(self, identifier_hash: str, revoked_at: float) -> None:
+        with self._lock:
+            self._revoked[identifier_hash] = revoked_at + self.revocation_ttl_seconds
+            self._drop(identifier_hash)
+            for token_hash in list(self._by_identifier.get(identifier_hash, ())):
+                self._drop(token_hash)
+
+    async def revoke(self, identifier: str) -> None:
+        """Revoke a token, session ID or jti on this worker and, via Redis, on all others."""
+        identifier_hash = _hash(identifier)
+        now = time.time()
+        self._revoke_local(identifier_hash, now)
+
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(REVOCATION_KEY, {identifier_hash: now})
+                pipe.zremrangebyscore(REVOCATION_KEY, "-inf", now - self.revocation_ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to publish token revocation to Redis: {e}")
+
+    async def sync_revocations(self, force: bool = False) -> None:
+        """Pull revocations recorded by other workers (rate limited)."""
+        now = time.time()
+        if not force and now - self._last_sync < self.sync_interval_seconds:
+            return
+        self._last_sync = now
+
+        with self._lock:
+            # Forget revocations that outlived any token they could match
+            for identifier_hash in [h for h, until in self._revoked.items() if until <= now]:
+                del self._revoked[identifier_hash]
+
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            revoked = await redis_client.zrangebyscore(
+                REVOCATION_KEY, self._sync_from, "+inf", withscores=True
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Token revocation sync failed: {e}")
+            return
+
+        for member, revoked_at in revoked:
+            if isinstance(member, bytes):
+                member = member.decode("utf-8")
+            self._revoke_local(member, float(revoked_at))
+            # Inclusive bound: re-applying the newest revocation is harmless
+            self._sync_from = max(self._sync_from, float(revoked_at))
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "revoked": len(self._revoked),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_token_cache: Optional[VerifiedTokenCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """Return the process-wide verified-token cache."""
+    global _token_cache
+    with _token_cache_lock:
+        if _token_cache is None:
+            from src.utils.config import get_settings
+
+            settings = get_settings()
+            _token_cache = VerifiedTokenCache(
+                max_entries=settings.AUTH_TOKEN_CACHE_MAX,
+                expiry_margin_seconds=settings.AUTH_TOKEN_CACHE_MARGIN_SECONDS,
+                revocation_ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                sync_interval_seconds=settings.AUTH_REVOCATION_SYNC_SECONDS,
+            )
+        return _token_cache
+
+
+async def revoke_session(identifier: str) -> None:
+    """Revoke a session token, ``session_id`` or ``jti`` everywhere."""
+    await get_token_cache().revoke(identifier)
@@ -0,0 +1,171 @@
+"""
+Translation memory for AI Nurse Florence
+Following AI Nurse Florence Conditional Imports Pattern
+
+Patient documents repeat the same headers and instructions over and over, and
+``TranslationService`` used to send every one of them to DeepL or Google.
+Successful translations are now remembered, keyed by
+``(sha256(source text), source language, target language, context)``:
+
+- a bounded in-process LRU answers repeats without any I/O
+- Redis (``translation:v1:*`` keys, ``TRANSLATION_MEMORY_TTL_DAYS``) shares
+  translations between workers and survives restarts; without Redis the
+  memory is per-process only
+- lookups and stores take whole batches, so a document's segments cost one
+  Redis ``MGET``/pipeline rather than a round trip per string
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.utils.redis_cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "translation:v1"
+
+# (source hash, source language, target language, context)
+MemoryKey = Tuple[str, str, str, str]
+
+
+def memory_key(text: str, source_language: str, target_language: str, context: str) -> MemoryKey:
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return (text_hash, source_language, target_language, context or "")
+
+
+def _redis_key(key: MemoryKey) -> str:
+    text_hash, source_language, target_language, context = key
+    return f"{KEY_PREFIX}:{source_language}:{target_language}:{context}:{text_hash}"
+
+
+class TranslationMemory:
+    """Bounded LRU of ``key -> (translated text, method)`` backed by Redis."""
+
+    def __init__(self, max_entries: int = 20000, ttl_seconds: int = 30 * 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[MemoryKey, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get_many(self, keys: Iterable[MemoryKey]) -> Dict[MemoryKey, Tuple[str, str]]:
+        """Remembered translations for ``keys`` (missing keys are left out)."""
+        found: Dict[MemoryKey, Tuple[str, str]] = {}
+        missing: List[MemoryKey] = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = entry
+            self.hits += len(found)
+
+        if missing:
+            remote = await self._redis_get(missing)
+            if remote:
+                self._remember(remote)
+                found.update(remote)
+            with self._lock:
+                self.redis_hits += len(remote)
+                self.misses += len(missing) - len(remote)
+        return found
+
+    async def put_many(self, entries: Dict[MemoryKey, Tuple[str, str]]) -> None:
+        """Remember translations locally and in Redis."""
+        if not entries:
+            return
+        self._remember(entries)
+
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, (text, method) in entries.items():
+                    pipe.setex(
+                        _redis_key(key),
+                        self.ttl_seconds,
+                        json.dumps({"text": text, "method": method}, ensure_ascii=False),
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to store translations in Redis: {e}")
+
+    async def _redis_get(self, keys: List[MemoryKey]) -> Dict[MemoryKey, Tuple[str, str]]:
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return {}
+        try:
+            values = await redis_client.mget([_redis_key(key) for key in keys])
+        except Exception as e:
+            logger.warning(f"⚠️ Translation memory lookup failed: {e}")
+            return {}
+
+        found = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            try:
+                entry = json.loads(value)
+                found[key] = (entry["text"], entry.get("method", "memory"))
+            except (ValueError, KeyError, TypeError):
+                continue
+        return found
+
+    def _remember(self, entries: Dict[MemoryKey, Tuple[str, str]]) -> None:
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+_translation_memory: Optional[TranslationMemory] = None
+_translation_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationMemory:
+    """Return the process-wide translation memory."""
+    global _translation_memory
+    with _translation_memory_lock:
+        if _translation_memory is None:
+            max_entries = 20000
+            ttl_days = 30
+            try:
+                from src.utils.config import get_settings
+
+                settings = get_settings()
+                max_entries = getattr(settings, "TRANSLATION_MEMORY_MAX_ENTRIES", max_entries)
+                ttl_days = getattr(settings, "TRANSLATION_MEMORY_TTL_DAYS", ttl_days)
+            except Exception as e:
+                logger.warning(f"Failed to load translation memory settings: {e}, using defaults")
+            _translation_memory = TranslationMemory(
+                max_entries=max_entries, ttl_seconds=int(ttl_days * 24 * 3600)
+            )
+        return _translation_memory
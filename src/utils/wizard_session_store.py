@@ -0,0 +1,300 @@
+"""
+Wizard session storage with Redis persistence and in-memory fallback
+Following AI Nurse Florence Conditional Imports Pattern
+
+Multi-step wizards keep state between requests. A module-level dict pins
+that state to one worker process and never expires it, so every wizard
+router uses a ``WizardSessionStore`` instead:
+
+- Sessions live in Redis (shared by all workers) under
+  ``wizard:<wizard_type>:<session_id>`` with a sliding TTL.
+- Payloads use a compact JSON encoding; large payloads are zlib-compressed.
+- Every write bumps a version number. ``save()`` is a compare-and-set on
+  the version the caller loaded, so two workers editing the same session
+  cannot silently overwrite each other (``WizardSessionConflict``, a 409).
+- When Redis is unavailable the same API is served from a bounded,
+  TTL-evicting in-process map.
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from src.utils.exceptions import ErrorType, ServiceException
+from src.utils.redis_cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "wizard"
+
+# Payloads larger than this (bytes of JSON) are stored zlib-compressed
+COMPRESS_THRESHOLD = 1024
+
+_JSON_TAG = "j:"
+_ZLIB_TAG = "z:"
+
+# Compare-and-set write. ARGV[1] is the expected version (-1 = unconditional,
+# 0 = key must not exist), ARGV[2] the payload, ARGV[3] the TTL in seconds.
+# Returns the new version, or -1 when the stored version did not match.
+_SAVE_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'v')) or 0
+local expected = tonumber(ARGV[1])
+if expected >= 0 and current ~= expected then
+  return -1
+end
+local version = current + 1
+redis.call('HSET', KEYS[1], 'v', version, 'd', ARGV[2])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+return version
+"""
+
+
+class WizardSessionConflict(HTTPException):
+    """
+    Raised when a session was modified by another request since it was loaded.
+
+    An ``HTTPException`` so routers' existing ``except HTTPException: raise``
+    blocks surface it to the client as 409 without extra handling.
+    """
+
+    def __init__(self, wizard_type: str, session_id: str):
+        error = ServiceException(
+            message="Wizard session was modified by another request; reload and retry",
+            error_type=ErrorType.VALIDATION_ERROR,
+            details={"wizard_type": wizard_type, "wizard_id": session_id},
+            status_code=status.HTTP_409_CONFLICT,
+        )
+        super().__init__(status_code=error.status_code, detail=error.to_dict())
+
+
+class WizardSession(dict):
+    """Session data as a plain dict, carrying the version it was loaded at."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, version: int = 0):
+        super().__init__(data or {})
+        self.version = version
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+
+def serialize_session(data: Dict[str, Any]) -> str:
+    """Encode session data as compact JSON, compressing large payloads."""
+    raw = json.dumps(data, separators=(",", ":"), default=_json_default)
+    if len(raw) > COMPRESS_THRESHOLD:
+        packed = base64.b85encode(zlib.compress(raw.encode("utf-8"))).decode("ascii")
+        if len(packed) < len(raw):
+            return _ZLIB_TAG + packed
+    return _JSON_TAG + raw
+
+
+def deserialize_session(payload: Any) -> Dict[str, Any]:
+    """Decode a payload produced by ``serialize_session``."""
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8")
+    if payload.startswith(_ZLIB_TAG):
+        raw = zlib.decompress(base64.b85decode(payload[len(_ZLIB_TAG):])).decode("utf-8")
+    elif payload.startswith(_JSON_TAG):
+        raw = payload[len(_JSON_TAG):]
+    else:
+        raw = payload
+    return json.loads(raw)
+
+
+class _MemoryBackend:
+    """Bounded LRU of ``key -> (version, payload, expires_at)``."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, str, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _live(self, key: str) -> Optional[Tuple[int, str, float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[Tuple[int, str]]:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], entry[1]
+
+    def save(self, key: str, payload: str, expected: int, ttl_seconds: int) -> int:
+        with self._lock:
+            entry = self._live(key)
+            current = entry[0] if entry else 0
+            if expected >= 0 and current != expected:
+                return -1
+            version = current + 1
+            self._entries[key] = (version, payload, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return version
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class WizardSessionStore:
+    """
+    Versioned wizard session storage for one wizard type.
+
+    Typical router usage::
+
+        _sessions = get_wizard_session_store("care_plan")
+
+        session = await _sessions.get(wizard_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="Wizard session not found")
+        session["current_step"] += 1
+        await _sessions.save(wizard_id, session)   # 409 if changed meanwhile
+    """
+
+    def __init__(
+        self,
+        wizard_type: str,
+        ttl_seconds: Optional[int] = None,
+        max_memory_sessions: Optional[int] = None,
+    ):
+        if ttl_seconds is None or max_memory_sessions is None:
+            from src.utils.config import get_settings
+
+            settings = get_settings()
+            if ttl_seconds is None:
+                ttl_seconds = settings.WIZARD_SESSION_TTL_SECONDS
+            if max_memory_sessions is None:
+                max_memory_sessions = settings.WIZARD_SESSION_MEMORY_MAX
+
+        self.wizard_type = wizard_type
+        self.ttl_seconds = ttl_seconds
+        self._memory = _MemoryBackend(max_memory_sessions)
+
+    def _key(self, session_id: str) -> str:
+        return f"{KEY_PREFIX}:{self.wizard_type}:{session_id}"
+
+    async def _write(self, session_id: str, data: Dict[str, Any], expected: int) -> int:
+        key = self._key(session_id)
+        payload = serialize_session(data)
+
+        redis_client = await get_redis_client()
+        if redis_client is not None:
+            try:
+                return int(
+                    await redis_client.eval(
+                        _SAVE_SCRIPT, 1, key, expected, payload, self.ttl_seconds
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Redis wizard session write failed ({e}), using memory")
+
+        return self._memory.save(key, payload, expected, self.ttl_seconds)
+
+    async def create(self, session_id: str, data: Dict[str, Any]) -> WizardSession:
+        """Store a new session; raises ``WizardSessionConflict`` if the ID exists."""
+        version = await self._write(session_id, data, expected=0)
+        if version < 0:
+            raise WizardSessionConflict(self.wizard_type, session_id)
+        return WizardSession(data, version)
+
+    async def get(self, session_id: str) -> Optional[WizardSession]:
+        """Load a session, or ``None`` if it does not exist or has expired."""
+        key = self._key(session_id)
+
+        redis_client = await get_redis_client()
+        if redis_client is not None:
+            try:
+                version, payload = await redis_client.hmget(key, "v", "d")
+                if payload is not None:
+                    return WizardSession(deserialize_session(payload), int(version))
+            except Exception as e:
+                logger.warning(f"⚠️ Redis wizard session read failed ({e}), using memory")
+
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        version, payload = entry
+        return WizardSession(deserialize_session(payload), version)
+
+    async def save(
+        self,
+        session_id: str,
+        data: Dict[str, Any],
+        expected_version: Optional[int] = None,
+    ) -> int:
+        """
+        Persist session data and refresh its TTL.
+
+        The write only succeeds if the stored version still equals
+        ``expected_version`` (defaulting to ``data.version`` for a
+        ``WizardSession`` from ``get()``); otherwise ``WizardSessionConflict``
+        is raised. Plain dicts without an expected version are written
+        unconditionally. Returns the new version.
+        """
+        if expected_version is None:
+            expected_version = getattr(data, "version", -1)
+
+        version = await self._write(session_id, data, expected=expected_version)
+        if version < 0:
+            raise WizardSessionConflict(self.wizard_type, session_id)
+        if isinstance(data, WizardSession):
+            data.version = version
+        return version
+
+    async def delete(self, session_id: str) -> bool:
+        """Remove a session from Redis and the memory fallback."""
+        key = self._key(session_id)
+        deleted = False
+
+        redis_client = await get_redis_client()
+        if redis_client is not None:
+            try:
+                deleted = bool(await redis_client.delete(key))
+            except Exception as e:
+                logger.warning(f"⚠️ Redis wizard session delete failed ({e})")
+
+        return self._memory.delete(key) or deleted
+
+
+_stores: Dict[str, WizardSessionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_wizard_session_store(
+    wizard_type: str, ttl_seconds: Optional[int] = None
+) -> WizardSessionStore:
+    """Return the shared store for a wizard type."""
+    with _stores_lock:
+        store = _stores.get(wizard_type)
+        if store is None:
+            store = _stores[wizard_type] = WizardSessionStore(wizard_type, ttl_seconds)
+        return store
@@ -0,0 +1,44 @@
+"""
+Application entry point for ``run_performance_tests.py --local-stack``
+
+Routes outbound upstream calls to the stub in ``tests/mock_upstream_server.py``
+(see ``install_stub_routing``) and then imports ``app:app``. The stub URL comes
+from ``BENCHMARK_UPSTREAM_STUB_URL``; this module refuses to load outside
+development/test (``PYTHON_ENV``) or on Railway.
+
+Usage:
+    BENCHMARK_UPSTREAM_STUB_URL=http://127.0.0.1:8899 PYTHON_ENV=test \\
+        uvicorn tests.benchmark_app:app
+"""
+
+import logging
+import os
+
+from tests.mock_upstream_server import install_stub_routing, load_fixtures
+
+logger = logging.getLogger(__name__)
+
+STUB_URL_ENV = "BENCHMARK_UPSTREAM_STUB_URL"
+ALLOWED_ENVIRONMENTS = ("development", "test")
+
+
+def require_benchmark_environment() -> str:
+    """Stub URL for this process; refuses outside development/test."""
+    stub_url = os.getenv(STUB_URL_ENV)
+    if not stub_url:
+        raise RuntimeError(f"{STUB_URL_ENV} is not set")
+    environment = os.getenv("PYTHON_ENV", "development")
+    if environment not in ALLOWED_ENVIRONMENTS or os.getenv("RAILWAY_ENVIRONMENT"):
+        raise RuntimeError(
+            f"Refusing to route upstream calls to {stub_url} in the {environment!r} environment"
+        )
+    return stub_url
+
+
+_stub_url = require_benchmark_environment()
+install_stub_routing(_stub_url, load_fixtures())
+logger.warning(f"🧪 Upstream APIs routed to benchmark stub {_stub_url}")
+
+from app import app  # noqa: E402
+
+__all__ = ["app"]
@@ -0,0 +1,231 @@
+"""
+Mock Upstream API Server for Benchmarks
+Replays recorded MyDisease, PubMed, MedlinePlus, FDA and ClinicalTrials.gov
+responses with configurable latency, so load tests measure this application
+rather than the public APIs.
+
+The application is pointed at it by ``tests/benchmark_app.py`` (the app
+entry point ``run_performance_tests.py --local-stack`` starts), which calls
+``install_stub_routing``: httpx and ``requests`` calls to
+``https://<host>/<path>`` go to ``<stub>/<host>/<path>`` for every host with
+fixtures, and calls to any other outbound host fail immediately. Nothing in
+the application itself knows about the stub.
+
+Fixtures live in ``tests/fixtures/upstream/<host>.json``::
+
+    {
+      "latency_ms": 180,
+      "routes": [
+        {"method": "GET", "path": "/v1/query", "body": {...}},
+        {"method": "GET", "path": "/v1/disease/*", "body": {...}},
+        {"method": "GET", "path": "/ws/query", "content_type": "text/xml", "body": "<xml/>"}
+      ]
+    }
+
+A trailing ``*`` matches any path suffix, and a route with a ``query`` object
+only matches requests carrying those query parameters (first match wins). Latency per request is the host's
+``latency_ms`` (or the ``latency_ms`` override) plus uniform jitter, drawn
+from a seeded RNG so runs are reproducible.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+import requests
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from requests.adapters import HTTPAdapter
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "upstream"
+# The app and the stub themselves; never rewritten or blocked
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def load_fixtures(fixtures_dir: Path = FIXTURES_DIR) -> Dict[str, Dict[str, Any]]:
+    """Load ``<host>.json`` fixture files keyed by host."""
+    fixtures = {}
+    for path in sorted(Path(fixtures_dir).glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            fixtures[path.stem] = json.load(f)
+    return fixtures
+
+
+def _match(
+    routes: List[Dict[str, Any]], method: str, path: str, query: Optional[Dict[str, str]] = None
+) -> Optional[Dict[str, Any]]:
+    for route in routes:
+        if route.get("method", "GET").upper() != method:
+            continue
+        if any((query or {}).get(key) != value for key, value in route.get("query", {}).items()):
+            continue
+        pattern = route["path"]
+        if pattern.endswith("*"):
+            if path.startswith(pattern[:-1]):
+                return route
+        elif path == pattern:
+            return route
+    return None
+
+
+def create_app(
+    fixtures_dir: Path = FIXTURES_DIR,
+    latency_ms: Optional[float] = None,
+    jitter_ms: float = 0.0,
+    seed: int = 42,
+) -> FastAPI:
+    """
+    Build the stub app.
+
+    Args:
+        fixtures_dir: Directory of ``<host>.json`` fixture files
+        latency_ms: Override every host's recorded latency (``None`` keeps them)
+        jitter_ms: Uniform random jitter added to each response, in ms
+        seed: RNG seed for the jitter
+    """
+    fixtures = load_fixtures(fixtures_dir)
+    rng = random.Random(seed)
+    app = FastAPI(title="Mock Upstream API Server")
+    app.state.request_counts = {}
+
+    @app.get("/health")
+    async def health_check():
+        return {
+            "status": "healthy",
+            "server": "Mock Upstream APIs",
+            "hosts": sorted(fixtures),
+            "requests": app.state.request_counts,
+        }
+
+    @app.api_route("/{host}/{path:path}", methods=["GET", "POST"])
+    async def replay(host: str, path: str, request: Request):
+        fixture = fixtures.get(host)
+        if fixture is None:
+            return JSONResponse({"error": f"No fixtures for host {host}"}, status_code=404)
+
+        route = _match(
+            fixture.get("routes", []), request.method, f"/{path}", dict(request.query_params)
+        )
+        if route is None:
+            return JSONResponse({"error": f"No fixture for {request.method} /{path}"}, status_code=404)
+
+        app.state.request_counts[host] = app.state.request_counts.get(host, 0) + 1
+        delay_ms = fixture.get("latency_ms", 0) if latency_ms is None else latency_ms
+        if jitter_ms:
+            delay_ms += rng.uniform(0, jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        body = route.get("body", {})
+        status_code = route.get("status", 200)
+        content_type = route.get("content_type", "application/json")
+        if content_type == "application/json":
+            return JSONResponse(body, status_code=status_code)
+        return Response(body, status_code=status_code, media_type=content_type)
+
+    return app
+
+
+class UnstubbedUpstreamError(ConnectionError):
+    """An outbound call to a host the benchmark stub has no fixtures for."""
+
+
+def stub_url_for(url: str, stub_url: str, hosts: Collection[str]) -> Optional[str]:
+    """
+    Where an outbound ``url`` goes under the benchmark stub.
+
+    Returns the rewritten stub URL for hosts with fixtures, ``None`` for local
+    addresses (the app and the stub themselves), and raises
+    ``UnstubbedUpstreamError`` for any other host.
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if host in hosts:
+        stub = urlsplit(stub_url)
+        path = f"{stub.path.rstrip('/')}/{host}{parts.path}"
+        return urlunsplit((stub.scheme, stub.netloc, path, parts.query, parts.fragment))
+    if host in LOCAL_HOSTS:
+        return None
+    raise UnstubbedUpstreamError(f"Benchmark stack has no upstream fixtures for {host}")
+
+
+def install_stub_routing(stub_url: str, hosts: Collection[str]) -> None:
+    """
+    Route httpx and ``requests`` traffic for ``hosts`` to ``stub_url``.
+
+    Patches the httpx transports and ``requests``' HTTPAdapter for the whole
+    process, so only call it in a benchmark process. Calls to other outbound
+    hosts (AI providers included) raise a connection error instead of leaving
+    the machine.
+    """
+    hosts = frozenset(hosts)
+
+    def rewrite(request: httpx.Request) -> httpx.Request:
+        try:
+            target = stub_url_for(str(request.url), stub_url, hosts)
+        except UnstubbedUpstreamError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+        if target is None:
+            return request
+        url = httpx.URL(target)
+        headers = request.headers.copy()
+        headers["host"] = url.netloc.decode("ascii")
+        # A copy, so response.request (and the upstream metrics) keep the real host
+        return httpx.Request(
+            request.method, url, headers=headers, stream=request.stream, extensions=request.extensions
+        )
+
+    handle_async_request = httpx.AsyncHTTPTransport.handle_async_request
+    handle_request = httpx.HTTPTransport.handle_request
+    send = HTTPAdapter.send
+
+    async def stubbed_handle_async_request(self, request):
+        return await handle_async_request(self, rewrite(request))
+
+    def stubbed_handle_request(self, request):
+        return handle_request(self, rewrite(request))
+
+    def stubbed_send(self, request: requests.PreparedRequest, **kwargs):
+        try:
+            target = stub_url_for(request.url, stub_url, hosts)
+        except UnstubbedUpstreamError as e:
+            raise requests.ConnectionError(str(e), request=request) from e
+        if target is not None:
+            request = request.copy()
+            request.url = target
+        return send(self, request, **kwargs)
+
+    httpx.AsyncHTTPTransport.handle_async_request = stubbed_handle_async_request
+    httpx.HTTPTransport.handle_request = stubbed_handle_request
+    HTTPAdapter.send = stubbed_send
+
+
+def start_mock_server(
+    port: int = 8899,
+    latency_ms: Optional[float] = None,
+    jitter_ms: float = 0.0,
+    seed: int = 42,
+):
+    """Start the mock upstream server for benchmarks"""
+    app = create_app(latency_ms=latency_ms, jitter_ms=jitter_ms, seed=seed)
+    print(f"\n🧪 Mock upstream server starting on http://127.0.0.1:{port}")
+    print(f"📋 Hosts: {', '.join(sorted(load_fixtures()))}")
+    print(f"🔗 Set BENCHMARK_UPSTREAM_STUB_URL=http://127.0.0.1:{port} for tests.benchmark_app\n")
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock upstream API server")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency-ms", type=float, default=None, help="Override recorded latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    start_mock_server(args.port, args.latency_ms, args.jitter_ms, args.seed)
@@ -0,0 +1,174 @@
+"""
+Tests for the AI generation cache (src.utils.ai_generation_cache) and its use
+in UnifiedAIService
+"""
+
+import asyncio
+
+import pytest
+
+import src.utils.ai_generation_cache as ai_generation_cache
+from src.services.ai_service import UnifiedAIService
+from src.utils.ai_generation_cache import AIGenerationCache, LocalVectorIndex
+
+
+class FakeClaude:
+    available = True
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_patient_education(self, condition, patient_context=None, language="en"):
+        self.calls.append(condition)
+        await asyncio.sleep(0.01)
+        return {"response": f"About {condition}", "service": "claude"}
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    monkeypatch.setenv("AI_NURSE_DISABLE_REDIS", "1")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(ai_generation_cache, "_ai_generation_cache", AIGenerationCache())
+    service = UnifiedAIService.__new__(UnifiedAIService)
+    service.claude, service.openai, service.primary_provider = FakeClaude(), None, "claude"
+    return service
+
+
+@pytest.mark.asyncio
+async def test_repeat_and_concurrent_requests_share_one_generation(service):
+    results = await asyncio.gather(
+        *(service.generate_patient_education("Asthma", {"age": "adult"}) for _ in range(3))
+    )
+    again = await service.generate_patient_education(" Asthma ", {"age": "adult", "mrn": "123"})
+    other = await service.generate_patient_education("asthma", {"age": "adult"})
+
+    # Whitespace is normalized and unused context fields are ignored; case is not folded
+    assert service.claude.calls == ["Asthma", "asthma"]
+    assert [r["response"] for r in results] == ["About Asthma"] * 3
+    assert again["cached"] is True and again["cache_tier"] == "exact"
+    assert "cached" not in other
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached_and_invalidation_retires_entries():
+    cache = AIGenerationCache()
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return {"response": "" if len(calls) == 1 else "ok"}
+
+    args = ("sbar_report", {"situation": "hypotension"}, generate)
+    await cache.get_or_generate(*args, model="m")
+    await cache.get_or_generate(*args, model="m")
+    assert (await cache.get_or_generate(*args, model="m"))["cached"] is True
+
+    assert await cache.invalidate_template("sbar_report") == ["sbar_report"]
+    assert "cached" not in await cache.get_or_generate(*args, model="m")
+    assert len(calls) == 3
+
+
+class FakeRedis:
+    """The handful of commands the cache uses; SCAN/KEYS must not be needed."""
+
+    def __init__(self):
+        self.strings, self.hashes = {}, {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.strings[key] = value
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=False):
+        redis, ops = self, []
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def hincrby(self, key, field, amount):
+                ops.append((key, field, amount))
+
+            async def execute(self):
+                results = []
+                for key, field, amount in ops:
+                    fields = redis.hashes.setdefault(key, {})
+                    fields[field] = fields.get(field, 0) + amount
+                    results.append(fields[field])
+                return results
+
+        return Pipeline()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_workers_through_one_hash(monkeypatch):
+    redis = FakeRedis()
+
+    async def client():
+        return redis
+
+    monkeypatch.setattr(ai_generation_cache, "get_redis_client", client)
+    monkeypatch.setattr(ai_generation_cache, "GENERATION_SYNC_SECONDS", 0)
+    worker_a, worker_b = AIGenerationCache(), AIGenerationCache()
+
+    async def generate():
+        return {"response": "About asthma"}
+
+    args = ("patient_education", {"condition": "Asthma"}, generate)
+    await worker_a.get_or_generate(*args, model="m")
+    assert (await worker_b.get_or_generate(*args, model="m"))["cached"] is True
+
+    await worker_a.invalidate_template("patient_education")
+
+    assert redis.hashes == {ai_generation_cache.GENERATIONS_KEY: {"patient_education": 1}}
+    assert "cached" not in await worker_b.get_or_generate(*args, model="m")
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier_matches_close_inputs_in_same_bucket():
+    vectors = {"heart failure": [1.0, 0.0], "CHF": [0.99, 0.05], "gout": [0.0, 1.0]}
+
+    async def embed(text):
+        return vectors[text]
+
+    cache = AIGenerationCache(embedder=embed, semantic_threshold=0.97)
+
+    async def generate_for(condition, language="en"):
+        async def generate():
+            return {"response": f"About {condition}"}
+
+        return await cache.get_or_generate(
+            "patient_education",
+            {"condition": condition, "language": language},
+            generate,
+            model="m",
+            semantic_field="condition",
+        )
+
+    await generate_for("heart failure")
+    similar = await generate_for("CHF")
+
+    assert similar["cache_tier"] == "semantic"
+    assert similar["response"] == "About heart failure"
+    assert "cached" not in await generate_for("gout")
+    assert "cached" not in await generate_for("CHF", language="es")
+
+
+def test_vector_index_is_bounded():
+    index = LocalVectorIndex(max_entries=2)
+    for key in "abc":
+        index.add("bucket", key, [1.0, 0.0])
+
+    assert len(index) == 2
+    assert index.search("bucket", [1.0, 0.0])[0] in {"b", "c"}
+    assert index.search("other", [1.0, 0.0]) is None
@@ -0,0 +1,141 @@
+"""
+Tests for latency-aware routing and hedged requests in
+src.services.ai_provider_fallback
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.ai_provider_fallback import (
+    AIProviderFallback,
+    CircuitBreaker,
+    LatencyTracker,
+)
+
+
+def _service(delays, hedge_delay=0.05, failing=()):
+    """Fallback service whose providers answer after ``delays[provider]`` seconds.
+
+    Providers in ``failing`` answer with an error dict instead.
+    """
+    service = AIProviderFallback.__new__(AIProviderFallback)
+    service.settings = SimpleNamespace(
+        AI_PROVIDER="anthropic",
+        AI_FALLBACK_ENABLED=True,
+        AI_MAX_RETRIES=1,
+        AI_HEDGING_ENABLED=True,
+        AI_HEDGE_MIN_DELAY=hedge_delay,
+        AI_HEDGE_DEFAULT_DELAY=hedge_delay,
+        get_active_ai_provider=lambda: "anthropic",
+        get_fallback_provider=lambda: "openai",
+    )
+    service.circuit_breakers = {p: CircuitBreaker(threshold=5, timeout=60) for p in delays}
+    service.latency = {p: LatencyTracker() for p in delays}
+    service.hedges_started = service.hedges_won = 0
+    service.calls = []
+    service.cancelled = []
+
+    async def call_provider(provider, **kwargs):
+        service.calls.append(provider)
+        try:
+            await asyncio.sleep(delays[provider])
+        except asyncio.CancelledError:
+            service.cancelled.append(provider)
+            raise
+        if provider in failing:
+            return {"error": f"{provider}: 401 invalid API key"}
+        return {"response": f"from {provider}"}
+
+    service._call_provider = call_provider
+    return service
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_does_not_hedge():
+    service = _service({"anthropic": 0.0, "openai": 0.0})
+
+    result = await service.generate_response("BP goals?")
+
+    assert result["provider"] == "anthropic"
+    assert "hedged" not in result
+    assert service.calls == ["anthropic"]
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cancelled():
+    service = _service({"anthropic": 1.0, "openai": 0.0})
+
+    result = await service.generate_response("BP goals?")
+
+    assert result["provider"] == "openai"
+    assert result["hedged"] is True
+    await asyncio.sleep(0.01)  # let the cancelled loser unwind
+    assert service.cancelled == ["anthropic"]
+    assert service.hedges_won == 1
+    # The cancelled call still counts as (at least) its elapsed latency
+    assert service.latency["anthropic"].count == 1
+    assert service.circuit_breakers["anthropic"].failure_count == 0
+
+
+@pytest.mark.asyncio
+async def test_routes_to_clearly_faster_provider():
+    service = _service({"anthropic": 0.0, "openai": 0.0})
+    for _ in range(5):
+        service.latency["anthropic"].record(4.0)
+        service.latency["openai"].record(1.0)
+
+    result = await service.generate_response("BP goals?")
+
+    assert result["provider"] == "openai"
+    assert service.calls == ["openai"]
+
+
+@pytest.mark.asyncio
+async def test_demoted_primary_is_retried_once_its_samples_expire():
+    service = _service({"anthropic": 0.0, "openai": 0.0})
+    service.latency = {p: LatencyTracker(max_age=0.05) for p in service.latency}
+    for _ in range(5):
+        service.latency["anthropic"].record(4.0)
+        service.latency["openai"].record(1.0)
+    assert (await service.generate_response("BP goals?"))["provider"] == "openai"
+
+    # The primary recovers; once its slow samples age out it is tried again
+    await asyncio.sleep(0.06)
+    for _ in range(5):
+        service.latency["openai"].record(1.0)
+    results = [await service.generate_response("BP goals?") for _ in range(6)]
+
+    assert [r["provider"] for r in results] == ["anthropic"] * 6
+    assert service.latency["anthropic"].warm
+    assert service.latency["anthropic"].ewma < 1.0
+
+
+@pytest.mark.asyncio
+async def test_fast_failing_fallback_is_not_preferred():
+    service = _service({"anthropic": 0.03, "openai": 0.0}, hedge_delay=0.01, failing={"openai"})
+    # Keep the breaker closed so routing alone decides the order
+    service.circuit_breakers = {p: CircuitBreaker(threshold=100, timeout=60) for p in service.latency}
+
+    first_calls = []
+    for _ in range(8):
+        service.calls.clear()
+        result = await service.generate_response("BP goals?")
+        first_calls.append(service.calls[0])
+        assert result["provider"] == "anthropic"
+
+    assert first_calls == ["anthropic"] * 8
+    assert service.latency["openai"].count == 0
+    assert service.latency["anthropic"].warm
+
+
+def test_latency_tracker_ewma_and_p95():
+    tracker = LatencyTracker(alpha=0.5)
+    for seconds in [1.0] * 19 + [9.0]:
+        tracker.record(seconds)
+
+    assert tracker.p95() == 1.0
+    assert tracker.ewma == pytest.approx(5.0)
+    tracker.record(9.0)
+    assert tracker.p95() == 9.0
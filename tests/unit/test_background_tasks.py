@@ -0,0 +1,203 @@
+"""
+Tests for the background job queue in utils.background_tasks (in-process backend)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from utils import background_tasks
+from utils.background_tasks import JobWorker, _MemoryJobBackend, register_job
+
+_calls = []
+_flaky_attempts = {}
+
+
+@register_job("test.record")
+async def _record(label):
+    _calls.append(label)
+    return label
+
+
+@register_job("test.flaky")
+def _flaky(key, fail_times):
+    _flaky_attempts[key] = _flaky_attempts.get(key, 0) + 1
+    if _flaky_attempts[key] <= fail_times:
+        raise RuntimeError(f"boom {_flaky_attempts[key]}")
+    return {"attempts": _flaky_attempts[key]}
+
+
+_running = []
+_peak = []
+
+
+@register_job("test.slow")
+async def _slow():
+    _running.append(1)
+    _peak.append(len(_running))
+    await asyncio.sleep(0.05)
+    _running.pop()
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    """Fresh in-process backend with fast retries; the worker is started per test."""
+    backend = _MemoryJobBackend()
+    monkeypatch.setattr(background_tasks, "_backend", backend)
+    monkeypatch.setattr(background_tasks.settings, "JOB_RETRY_BACKOFF_SECONDS", 0.01)
+    _calls.clear()
+    _flaky_attempts.clear()
+    _peak.clear()
+    return backend
+
+
+async def _wait_for(task_id, statuses=("completed", "failed"), timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = await background_tasks.get_task_status(task_id)
+        if status["status"] in statuses:
+            return status
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"task {task_id} did not finish: {status}")
+
+
+@pytest.mark.asyncio
+async def test_enqueue_runs_job_and_reports_status(queue):
+    try:
+        queued = await background_tasks.enqueue_job(_record, "a")
+        assert queued["status"] == "queued"
+
+        status = await _wait_for(queued["task_id"])
+        assert status["status"] == "completed"
+        assert status["result"] == "a"
+        assert status["attempts"] == 1
+        assert "args" not in status
+
+        missing = await background_tasks.get_task_status("does-not-exist")
+        assert missing["status"] == "not_found"
+    finally:
+        await background_tasks.stop_worker()
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_jobs_run_first(queue):
+    # Queue everything before a worker exists so ordering is decided by priority
+    for label, priority in [("low", "low"), ("normal", "normal"), ("high", "high")]:
+        await queue.save(
+            {
+                "task_id": label,
+                "name": "test.record",
+                "args": [label],
+                "kwargs": {},
+                "priority": priority,
+                "status": "queued",
+                "attempts": 0,
+                "max_retries": 0,
+                "result_ttl": 60,
+            },
+            60,
+        )
+        await queue.push(label, priority)
+
+    worker = JobWorker(queue, concurrency=1)
+    task = asyncio.create_task(worker.run())
+    try:
+        await _wait_for("low")
+        assert _calls == ["high", "normal", "low"]
+    finally:
+        await worker.stop()
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff(queue):
+    try:
+        queued = await background_tasks.enqueue_job(_flaky, "retry", 2, max_retries=3)
+        status = await _wait_for(queued["task_id"])
+        assert status["status"] == "completed"
+        assert status["attempts"] == 3
+        assert status["result"] == {"attempts": 3}
+
+        queued = await background_tasks.enqueue_job(_flaky, "exhausted", 5, max_retries=1)
+        status = await _wait_for(queued["task_id"])
+        assert status["status"] == "failed"
+        assert status["attempts"] == 2
+        assert "boom 2" in status["error"]
+    finally:
+        await background_tasks.stop_worker()
+
+
+@pytest.mark.asyncio
+async def test_worker_concurrency_limit(queue):
+    await background_tasks.start_worker(concurrency=2)
+    try:
+        ids = [(await background_tasks.enqueue_job(_slow))["task_id"] for _ in range(6)]
+        for task_id in ids:
+            await _wait_for(task_id)
+        assert max(_peak) == 2
+    finally:
+        await background_tasks.stop_worker()
+
+
+@pytest.mark.asyncio
+async def test_results_expire_after_ttl(queue):
+    try:
+        queued = await background_tasks.enqueue_job(_record, "ttl", result_ttl=1)
+        await _wait_for(queued["task_id"])
+
+        await asyncio.sleep(1.05)
+        status = await background_tasks.get_task_status(queued["task_id"])
+        assert status["status"] == "not_found"
+    finally:
+        await background_tasks.stop_worker()
+
+
+class _LeaseRecordingBackend(_MemoryJobBackend):
+    def __init__(self):
+        super().__init__()
+        self.renewals = []
+
+    async def renew(self, token, consumer):
+        self.renewals.append(time.monotonic())
+        return True
+
+
+@pytest.mark.asyncio
+async def test_long_running_job_renews_its_lease(monkeypatch):
+    backend = _LeaseRecordingBackend()
+    monkeypatch.setattr(background_tasks, "_backend", backend)
+    await backend.save(
+        {
+            "task_id": "slow",
+            "name": "test.slow",
+            "args": [],
+            "kwargs": {},
+            "priority": "normal",
+            "status": "queued",
+            "attempts": 0,
+            "max_retries": 0,
+            "result_ttl": 60,
+        },
+        60,
+    )
+    await backend.push("slow", "normal")
+
+    worker = JobWorker(backend, concurrency=1, visibility_timeout=0.03)
+    task = asyncio.create_task(worker.run())
+    try:
+        await _wait_for("slow")
+        renewed_while_running = len(backend.renewals)
+
+        # At least a few renewals during the 50 ms job, none once it is done
+        assert renewed_while_running >= 2
+        await asyncio.sleep(0.05)
+        assert len(backend.renewals) == renewed_while_running
+    finally:
+        await worker.stop()
+        task.cancel()
+
+
+def test_unknown_priority_is_rejected(queue):
+    with pytest.raises(ValueError):
+        asyncio.run(background_tasks.enqueue_job(_record, "x", priority="urgent"))
@@ -0,0 +1,136 @@
+"""
+Tests for the benchmark harness: the upstream stub server, stub routing for
+the benchmark app (tests/benchmark_app.py) and baseline comparison in
+run_performance_tests
+"""
+
+import importlib
+import sys
+
+import httpx
+import pytest
+import requests
+from fastapi.testclient import TestClient
+from requests.adapters import HTTPAdapter
+
+import src.utils.metrics as metrics
+from run_performance_tests import compare_with_baseline
+from tests.mock_upstream_server import (
+    create_app,
+    install_stub_routing,
+    load_fixtures,
+    stub_url_for,
+)
+
+STUB = "http://stub.local:8899"
+
+
+def test_stub_replays_fixtures_for_every_host():
+    hosts = load_fixtures()
+    assert {"mydisease.info", "eutils.ncbi.nlm.nih.gov", "api.fda.gov", "clinicaltrials.gov"} <= set(hosts)
+
+    client = TestClient(create_app(latency_ms=0))
+    response = client.get("/mydisease.info/v1/query", params={"q": "hypertension"})
+    assert response.status_code == 200
+    assert response.json()["hits"]
+
+    assert client.get("/mydisease.info/not/recorded").status_code == 404
+    assert client.get("/health").json()["requests"] == {"mydisease.info": 1}
+
+
+def test_stub_matches_query_specific_routes():
+    client = TestClient(create_app(latency_ms=0))
+
+    as_json = client.get("/connect.medlineplus.gov/service", params={"knowledgeResponseType": "application/json"})
+    as_xml = client.get("/connect.medlineplus.gov/service", params={"mainSearchCriteria.v.c": "I10"})
+
+    assert as_json.json()["feed"]["entry"]
+    assert as_xml.headers["content-type"].startswith("text/xml")
+
+
+def test_stub_urls_cover_fixture_hosts_only():
+    hosts = {"api.fda.gov"}
+
+    assert stub_url_for("https://api.fda.gov/drug/label.json?limit=1", STUB, hosts) == (
+        "http://stub.local:8899/api.fda.gov/drug/label.json?limit=1"
+    )
+    assert stub_url_for("http://127.0.0.1:8000/api/v1/health", STUB, hosts) is None
+    with pytest.raises(ConnectionError):
+        stub_url_for("https://api.anthropic.com/v1/messages", STUB, hosts)
+
+
+@pytest.fixture
+def routed(monkeypatch):
+    """Install stub routing over recording fakes; monkeypatch restores the originals."""
+    seen = []
+
+    async def handle_async_request(self, request):
+        seen.append((str(request.url), request.headers["host"]))
+        return httpx.Response(200, json={})
+
+    def send(self, request, **kwargs):
+        seen.append((request.url, None))
+        response = requests.Response()
+        response.status_code, response._content = 200, b"{}"
+        return response
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request)
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", httpx.HTTPTransport.handle_request)
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    install_stub_routing(STUB, {"mydisease.info", "api.fda.gov"})
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_httpx_calls_are_routed_and_keep_the_real_host_for_metrics(routed, monkeypatch):
+    hosts = []
+    monkeypatch.setattr(metrics, "_METRICS_ENABLED", True)
+    monkeypatch.setattr(metrics, "record_upstream_latency", lambda host, *args: hosts.append(host))
+
+    async with httpx.AsyncClient(event_hooks=metrics.upstream_event_hooks()) as client:
+        await client.get("https://mydisease.info/v1/query", params={"q": "flu"})
+        with pytest.raises(httpx.ConnectError):
+            await client.post("https://api.openai.com/v1/chat/completions", json={})
+
+    assert routed == [("http://stub.local:8899/mydisease.info/v1/query?q=flu", "stub.local:8899")]
+    assert hosts == ["mydisease.info"]
+
+
+def test_requests_calls_are_routed(routed):
+    requests.get("https://api.fda.gov/drug/label.json", params={"limit": 1})
+
+    assert routed == [("http://stub.local:8899/api.fda.gov/drug/label.json?limit=1", None)]
+
+
+@pytest.mark.parametrize("env", [{"PYTHON_ENV": "production"}, {"RAILWAY_ENVIRONMENT": "prod"}])
+def test_benchmark_app_refuses_outside_development_and_test(monkeypatch, env):
+    monkeypatch.setenv("BENCHMARK_UPSTREAM_STUB_URL", STUB)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delitem(sys.modules, "tests.benchmark_app", raising=False)
+
+    with pytest.raises(RuntimeError, match="Refusing"):
+        importlib.import_module("tests.benchmark_app")
+
+
+def _report(p95, rps, error_rate=0.0):
+    return {
+        "scenarios": {
+            "disease_lookup": {
+                "p95_response_time": p95,
+                "requests_per_second": rps,
+                "error_rate": error_rate,
+            }
+        }
+    }
+
+
+def test_compare_with_baseline_flags_regressions_beyond_tolerance():
+    baseline = _report(p95=100.0, rps=50.0)
+
+    assert compare_with_baseline(_report(120.0, 45.0), baseline, tolerance=0.25) == []
+
+    regressions = compare_with_baseline(_report(150.0, 30.0, error_rate=5.0), baseline, tolerance=0.25)
+    assert len(regressions) == 3
+    assert regressions[0].startswith("disease_lookup: p95")
+    assert compare_with_baseline(_report(500.0, 1.0), {"scenarios": {}}) == []
@@ -0,0 +1,110 @@
+"""
+Tests for streamed AI responses: UnifiedAIService.stream_response and the
+/chat/stream endpoint (SSE and NDJSON)
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.routers.chat as chat
+from src.services.ai_service import UnifiedAIService
+
+
+class FakeProvider:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    async def stream_response(self, prompt, context=None, usage=None):
+        for index, chunk in enumerate(self.chunks):
+            if index == self.fail_after:
+                raise RuntimeError("upstream closed")
+            yield chunk
+        usage.update(model="fake-model", input_tokens=5, output_tokens=len(self.chunks))
+
+
+def _service(claude=None, openai=None):
+    service = UnifiedAIService.__new__(UnifiedAIService)
+    service.claude, service.openai = claude, openai
+    service.primary_provider = "claude" if claude else "openai"
+    return service
+
+
+async def _collect(service):
+    return [event async for event in service.stream_response("Sepsis signs?")]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_before_first_token_and_reports_usage():
+    service = _service(
+        claude=FakeProvider(["never"], fail_after=0),
+        openai=FakeProvider(["Check ", "lactate."]),
+    )
+
+    events = await _collect(service)
+
+    assert [e["text"] for e in events if e["type"] == "delta"] == ["Check ", "lactate."]
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["provider_used"] == "openai"
+    assert done["usage"] == {"input_tokens": 5, "output_tokens": 2}
+    assert 0 <= done["time_to_first_token_ms"] <= done["latency_ms"]
+
+
+@pytest.mark.asyncio
+async def test_failure_after_text_ends_with_error_event():
+    service = _service(
+        claude=FakeProvider(["Check ", "lactate."], fail_after=1),
+        openai=FakeProvider(["unused"]),
+    )
+
+    events = await _collect(service)
+
+    assert [e["type"] for e in events] == ["delta", "error"]
+    assert events[-1]["provider_used"] == "claude"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    app = FastAPI()
+    app.include_router(chat.router)
+    monkeypatch.setattr(chat, "_has_prompt_enhancement", False)
+    return TestClient(app)
+
+
+def _sse_events(body):
+    return [
+        json.loads(block.split("data: ", 1)[1])
+        for block in body.strip().split("\n\n")
+    ]
+
+
+def test_stream_endpoint_sends_sse_with_banner(client, monkeypatch):
+    monkeypatch.setattr(chat, "_has_ai_service", True)
+    monkeypatch.setattr(chat, "ai_service", _service(claude=FakeProvider(["Fluids ", "first."])))
+
+    response = client.post("/chat/stream", json={"message": "Sepsis bundle?"})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.startswith("event: start\n")
+    events = _sse_events(response.text)
+    assert events[0]["educational_banner"]
+    assert "".join(e["text"] for e in events if e["type"] == "delta") == "Fluids first."
+    assert events[-1]["type"] == "done"
+    assert events[-1]["educational_banner"] == events[0]["educational_banner"]
+
+
+def test_stream_endpoint_ndjson_falls_back_without_providers(client, monkeypatch):
+    monkeypatch.setattr(chat, "_has_ai_service", True)
+    monkeypatch.setattr(chat, "ai_service", _service())
+
+    response = client.post("/chat/stream?format=ndjson", json={"message": "sepsis?"})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["type"] for e in events] == ["start", "delta", "done"]
+    assert events[1]["text"].startswith("**Sepsis Recognition Protocol:**")
+    assert events[2]["provider_used"] == "fallback"
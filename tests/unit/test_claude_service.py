@@ -0,0 +1,87 @@
+"""
+Tests for the async Claude client usage in src.services.claude_service
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.claude_service import ClaudeService
+
+USAGE = SimpleNamespace(input_tokens=12, output_tokens=3)
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=USAGE)
+
+
+class FakeMessages:
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0.2)
+        return SimpleNamespace(content=[SimpleNamespace(text="Drink fluids.")], usage=USAGE)
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeStream(["Drink ", "fluids."])
+
+
+@pytest.fixture
+def service():
+    service = ClaudeService()
+    service.client = SimpleNamespace(messages=FakeMessages())
+    service.available = True
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_do_not_block_each_other(service):
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(service.generate_response("Flu care?", context="Discharge") for _ in range(3))
+    )
+    elapsed = time.perf_counter() - started
+
+    assert [r["response"] for r in results] == ["Drink fluids."] * 3
+    assert results[0]["usage"] == {"input_tokens": 12, "output_tokens": 3}
+    assert service.client.messages.calls[0]["system"].endswith("Context: Discharge")
+    # Three 0.2s calls overlap instead of running back to back
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_stream_response_yields_text_deltas(service):
+    chunks = [chunk async for chunk in service.stream_response("Flu care?", temperature=0.2)]
+
+    assert chunks == ["Drink ", "fluids."]
+    assert service.client.messages.calls[0]["temperature"] == 0.2
+
+
+@pytest.mark.asyncio
+async def test_stream_response_raises_when_unavailable(service):
+    service.available = False
+
+    with pytest.raises(RuntimeError):
+        async for _ in service.stream_response("Flu care?"):
+            pass
@@ -27,11 +27,45 @@ import pytest
 
 from src.services.clinical_trials_service import (
     ClinicalTrialsService,
+    TrialSiteGeoIndex,
     create_clinical_trials_service,
+    iter_clinical_trials,
     search_clinical_trials,
+    search_trials_near,
 )
 
 
+def _study(nct_id, sites):
+    """Minimal API v2 study with geo-tagged sites."""
+    return {
+        "protocolSection": {
+            "identificationModule": {"nctId": nct_id, "briefTitle": nct_id},
+            "contactsLocationsModule": {
+                "locations": [
+                    {"facility": name, "geoPoint": {"lat": lat, "lon": lon}}
+                    for name, lat, lon in sites
+                ]
+            },
+        }
+    }
+
+
+def _paged_client(pages):
+    """AsyncClient mock returning ``pages`` in order, one per GET."""
+    responses = []
+    for page in pages:
+        response = Mock()
+        response.json = Mock(return_value=page)
+        response.raise_for_status = Mock()
+        responses.append(response)
+
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=responses)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
 @pytest.fixture
 def mock_settings():
     """Mock application settings."""
@@ -618,3 +652,124 @@ class TestDeprecatedMethods:
 
         assert stub_details["nct_id"] == "NCT12345678"
         assert "educational_note" in stub_details
+
+
+class TestPaging:
+    """Test cursor-based paging and streaming iteration."""
+
+    @pytest.mark.asyncio
+    @patch("src.services.clinical_trials_service._has_httpx", True)
+    @patch("src.services.clinical_trials_service.httpx")
+    async def test_iter_follows_next_page_token(self, mock_httpx):
+        """Iterator walks pages via nextPageToken on a single client."""
+        client = _paged_client(
+            [
+                {"studies": [_study("NCT1", [])], "nextPageToken": "abc"},
+                {"studies": [_study("NCT2", [])]},
+            ]
+        )
+        mock_httpx.AsyncClient.return_value = client
+
+        nct_ids = [t["nct_id"] async for t in iter_clinical_trials("asthma")]
+
+        assert nct_ids == ["NCT1", "NCT2"]
+        assert mock_httpx.AsyncClient.call_count == 1
+        assert "pageToken" not in client.get.call_args_list[0][1]["params"]
+        assert client.get.call_args_list[1][1]["params"]["pageToken"] == "abc"
+
+    @pytest.mark.asyncio
+    @patch("src.services.clinical_trials_service._has_httpx", True)
+    @patch("src.services.clinical_trials_service.httpx")
+    async def test_iter_respects_max_pages(self, mock_httpx):
+        """No further pages are fetched once max_pages is reached."""
+        client = _paged_client(
+            [{"studies": [_study("NCT1", [])], "nextPageToken": "abc"}]
+        )
+        mock_httpx.AsyncClient.return_value = client
+
+        trials = [t async for t in iter_clinical_trials("asthma", max_pages=1)]
+
+        assert len(trials) == 1
+        assert client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("src.services.clinical_trials_service._has_httpx", True)
+    @patch("src.services.clinical_trials_service.httpx")
+    @patch("src.services.clinical_trials_service.get_educational_banner")
+    async def test_search_returns_next_page_token(
+        self, mock_banner_fn, mock_httpx, sample_api_v2_response
+    ):
+        """Functional API forwards page_token and exposes next_page_token."""
+        mock_banner_fn.return_value = "Banner"
+        client = _paged_client([{**sample_api_v2_response, "nextPageToken": "p2"}])
+        mock_httpx.AsyncClient.return_value = client
+
+        result = await search_clinical_trials("diabetes", page_token="p1")
+
+        assert result["next_page_token"] == "p2"
+        assert client.get.call_args[1]["params"]["pageToken"] == "p1"
+
+
+class TestGeoIndex:
+    """Test site coordinate indexing and radius queries."""
+
+    def test_query_returns_nearest_site_per_trial(self):
+        """Only trials with a site inside the radius are returned, nearest first."""
+        index = TrialSiteGeoIndex()
+        index.add_sites(
+            "NCT_ROCHESTER",
+            [{"geoPoint": {"lat": 44.0121, "lon": -92.4802}}],
+        )
+        index.add_sites(
+            "NCT_MULTI",
+            [
+                {"geoPoint": {"lat": 39.2904, "lon": -76.6122}},  # Baltimore
+                {"geoPoint": {"lat": 44.9778, "lon": -93.2650}},  # Minneapolis
+            ],
+        )
+        index.add_sites("NCT_NO_GEO", [{"facility": "Unknown"}])
+
+        matches = index.query(44.0121, -92.4802, radius_miles=100)
+
+        assert [nct_id for nct_id, _ in matches] == ["NCT_ROCHESTER", "NCT_MULTI"]
+        assert matches[0][1] == pytest.approx(0.0, abs=0.01)
+        assert 70 < matches[1][1] < 80
+
+    def test_query_across_antimeridian(self):
+        """Cells wrap around longitude 180."""
+        index = TrialSiteGeoIndex()
+        index.add_sites("NCT_FIJI", [{"geoPoint": {"lat": -17.7, "lon": 179.9}}])
+
+        matches = index.query(-17.7, -179.9, radius_miles=50)
+
+        assert [nct_id for nct_id, _ in matches] == ["NCT_FIJI"]
+
+    @pytest.mark.asyncio
+    @patch("src.services.clinical_trials_service._has_httpx", True)
+    @patch("src.services.clinical_trials_service.httpx")
+    async def test_search_trials_near_stops_paging_when_filled(self, mock_httpx):
+        """Paging stops once enough nearby trials are found."""
+        client = _paged_client(
+            [
+                {
+                    "totalCount": 3,
+                    "studies": [
+                        _study("NCT_FAR", [("Boston", 42.36, -71.06)]),
+                        _study("NCT_NEAR", [("Mayo", 44.02, -92.47)]),
+                    ],
+                    "nextPageToken": "more",
+                },
+            ]
+        )
+        mock_httpx.AsyncClient.return_value = client
+
+        result = await search_trials_near(
+            "stroke", 44.0, -92.5, radius_miles=25, max_studies=1
+        )
+
+        assert [t["nct_id"] for t in result["trials"]] == ["NCT_NEAR"]
+        assert result["trials"][0]["nearest_site_miles"] < 25
+        assert client.get.call_count == 1
+        assert client.get.call_args[1]["params"]["filter.geo"].startswith(
+            "distance(44.0,-92.5,25"
+        )
@@ -0,0 +1,120 @@
+"""
+Tests for async engine options and read-replica routing in src.models.database
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.database as database
+from src.models.database import (
+    Base,
+    CachedDrugList,
+    DiseaseAlias,
+    RoutingSession,
+    _engine_options,
+    _to_async_url,
+)
+
+
+def test_async_url_conversion():
+    assert _to_async_url("sqlite:///./x.db") == "sqlite+aiosqlite:///./x.db"
+    assert _to_async_url("postgresql://u@h/db") == "postgresql+asyncpg://u@h/db"
+    assert _to_async_url("postgres://u@h/db") == "postgresql+asyncpg://u@h/db"
+
+
+def test_engine_options_pool_and_statement_cache():
+    settings = SimpleNamespace(
+        DB_POOL_SIZE=20,
+        DB_MAX_OVERFLOW=5,
+        DB_POOL_TIMEOUT=10,
+        DB_POOL_RECYCLE=600,
+        DB_POOL_PRE_PING=True,
+        DB_STATEMENT_CACHE_SIZE=0,
+    )
+
+    options = _engine_options("postgresql+asyncpg://u@h/db", settings)
+
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 5
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+    }
+
+
+def test_engine_options_sqlite_keeps_default_pool():
+    options = _engine_options("sqlite+aiosqlite:///./x.db")
+
+    assert "pool_size" not in options
+    assert "connect_args" not in options
+
+
+def _alias(name):
+    return DiseaseAlias(
+        id=str(uuid.uuid4()),
+        alias=name,
+        alias_display=name,
+        mondo_id="MONDO:0005148",
+        canonical_name="type 2 diabetes mellitus",
+    )
+
+
+@pytest.mark.asyncio
+async def test_reference_reads_use_replica(tmp_path, monkeypatch):
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for eng in (primary, replica):
+        async with eng.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    # Only the replica has the alias row
+    async with replica.begin() as conn:
+        await conn.execute(
+            DiseaseAlias.__table__.insert().values(
+                id="a1",
+                alias="t2dm",
+                alias_display="T2DM",
+                mondo_id="MONDO:0005148",
+                canonical_name="type 2 diabetes mellitus",
+                alias_type="abbreviation",
+                search_weight=1,
+                is_preferred=False,
+                source="test",
+                created_at=func.now(),
+                updated_at=func.now(),
+            )
+        )
+
+    monkeypatch.setattr(database, "engine", primary)
+    monkeypatch.setattr(database, "read_engine", replica)
+    sessions = async_sessionmaker(
+        primary, class_=AsyncSession, sync_session_class=RoutingSession
+    )
+
+    try:
+        async with sessions() as session:
+            # Reference SELECT goes to the replica
+            result = await session.execute(
+                select(DiseaseAlias.alias_display).where(DiseaseAlias.alias == "t2dm")
+            )
+            assert result.scalar_one_or_none() == "T2DM"
+
+            # Non-reference tables stay on the primary
+            count = await session.execute(select(func.count(CachedDrugList.id)))
+            assert count.scalar_one() == 0
+
+            # Writes always go to the primary
+            session.add(_alias("dm2"))
+            await session.commit()
+
+        async with primary.connect() as conn:
+            rows = await conn.execute(select(DiseaseAlias.__table__.c.alias))
+            assert [row[0] for row in rows] == ["dm2"]
+    finally:
+        await primary.dispose()
+        await replica.dispose()
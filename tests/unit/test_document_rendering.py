@@ -0,0 +1,129 @@
+"""
+Tests for the process-pool document renderer (services.document_rendering_service)
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import services.document_rendering_service as rendering
+from services.document_rendering_service import DocumentRenderer
+
+DISCHARGE = {
+    "patient_name": "Test Patient",
+    "primary_diagnosis": "Pneumonia",
+    "medications": [{"name": "Amoxicillin", "dosage": "500 mg", "frequency": "TID"}],
+    "warning_signs": ["Fever over 101°F"],
+}
+
+
+def _hanging_render(doc_type, data):
+    """Stand-in for render_sync that never finishes (importable by spawned workers)."""
+    time.sleep(60)
+
+
+@pytest.mark.asyncio
+async def test_process_pool_renders_pdf_and_docx():
+    renderer = DocumentRenderer(max_workers=1, max_queue=8, timeout_seconds=60)
+    try:
+        await renderer.start()
+        pdf, docx = await asyncio.gather(
+            renderer.render("discharge_instructions", DISCHARGE),
+            renderer.render("discharge_instructions_docx", DISCHARGE),
+        )
+    finally:
+        renderer.shutdown()
+
+    assert pdf.startswith(b"%PDF")
+    assert docx.startswith(b"PK")
+    stats = renderer.stats()
+    assert stats["mode"] == "process"
+    assert stats["completed"] == 2
+    assert stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_thread_fallback_renders_patient_education():
+    renderer = DocumentRenderer(max_workers=0)
+    content = {
+        "title": "Understanding Hypertension",
+        "diagnosis_name": "Hypertension",
+        "sections": [
+            {"title": "What is it?", "content": "High blood pressure."},
+            {"title": "Warning Signs", "bullet_points": ["Chest pain"], "style": "warning"},
+        ],
+    }
+
+    pdf = await renderer.render(
+        "patient_education", {"content": content, "patient_name": "Test", "language": "en"}
+    )
+
+    assert pdf.startswith(b"%PDF")
+    assert renderer.stats()["mode"] == "thread"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_and_unknown_type_errors():
+    renderer = DocumentRenderer(max_workers=0, max_queue=0)
+    with pytest.raises(HTTPException) as exc:
+        await renderer.render("disease_education", {})
+    assert exc.value.status_code == 503
+    assert renderer.stats()["rejected"] == 1
+
+    with pytest.raises(ValueError):
+        await renderer.render("unknown", {})
+
+
+@pytest.mark.asyncio
+async def test_render_timeout(monkeypatch):
+    monkeypatch.setattr(rendering, "render_sync", lambda doc_type, data: time.sleep(0.5))
+    renderer = DocumentRenderer(max_workers=0, timeout_seconds=0.05)
+
+    with pytest.raises(HTTPException) as exc:
+        await renderer.render("disease_education", {})
+
+    assert exc.value.status_code == 504
+    assert renderer.stats()["timeouts"] == 1
+    assert renderer.stats()["completed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_process_render_timeout_kills_the_stuck_worker(monkeypatch):
+    renderer = DocumentRenderer(max_workers=1, timeout_seconds=0.5)
+    try:
+        await renderer.start()
+        workers = list(renderer._executor._processes.values())
+        monkeypatch.setattr(rendering, "render_sync", _hanging_render)
+
+        with pytest.raises(HTTPException) as exc:
+            await renderer.render("disease_education", {})
+
+        for worker in workers:
+            worker.join(timeout=5)
+    finally:
+        renderer.shutdown()
+
+    assert exc.value.status_code == 504
+    assert workers and not any(worker.is_alive() for worker in workers)
+    stats = renderer.stats()
+    assert stats["timeouts"] == 1 and stats["pool_restarts"] == 1
+    assert stats["completed"] == 0
+
+
+def test_templates_are_shared_and_output_is_unchanged(monkeypatch):
+    from reportlab import rl_config
+
+    from services import pdf_generation_service as pdf
+
+    monkeypatch.setattr(rl_config, "invariant", 1)
+
+    pdf.clear_template_cache()
+    first = pdf.generate_discharge_instructions(DISCHARGE).getvalue()
+    pdf.clear_template_cache()
+    rebuilt = pdf.generate_discharge_instructions(DISCHARGE).getvalue()
+    cached = pdf.generate_discharge_instructions(DISCHARGE).getvalue()
+
+    assert first == rebuilt == cached
+    assert pdf.DischargeInstructionsPDF().templates is pdf.MedicationGuidePDF().templates
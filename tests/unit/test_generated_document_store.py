@@ -0,0 +1,122 @@
+"""
+Tests for the content-addressed generated document store
+(services.generated_document_store) and the download/preview endpoints
+"""
+
+import os
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import services.generated_document_store as document_store
+from services.generated_document_store import GeneratedDocumentStore, cache_key
+
+
+def test_cache_key_is_canonical():
+    a = cache_key({"patient_name": "Ana", "content": {"title": "Flu", "sections": []}})
+    b = cache_key({"content": {"sections": [], "title": "Flu"}, "patient_name": "Ana"})
+    assert a == b
+    assert a != cache_key({"patient_name": "Ben", "content": {"title": "Flu", "sections": []}})
+
+
+def test_lookup_store_and_resolve(tmp_path):
+    store = GeneratedDocumentStore(tmp_path)
+    key = cache_key({"x": 1})
+
+    assert store.lookup("patient_education", key, "pdf") is None
+    path = store.store("patient_education", key, "pdf", b"%PDF-1.4 test")
+    assert store.lookup("patient_education", key, "pdf") == path
+    assert (store.hits, store.misses) == (1, 1)
+
+    assert store.resolve(path.name) == path
+    assert store.resolve("../secrets.pdf") is None
+    assert store.resolve("missing.pdf") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_concurrent_writers_of_one_key_never_publish_partial_files(tmp_path):
+    store = GeneratedDocumentStore(tmp_path)
+    key = cache_key({"patient_name": "Benchmark Patient"})
+    documents = [bytes([65 + i]) * 200_000 for i in range(4)]
+    errors = []
+
+    def write(data):
+        try:
+            for _ in range(50):
+                store.store("patient_education", key, "pdf", data)
+        except Exception as e:  # pragma: no cover - the failure being tested
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(data,)) for data in documents]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert store.path_for("patient_education", key, "pdf").read_bytes() in documents
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sweep_removes_expired_then_least_recently_used(tmp_path):
+    store = GeneratedDocumentStore(tmp_path, max_bytes=250, ttl_seconds=3600)
+    now = time.time()
+    for name, created, used in (
+        ("expired", now - 7200, now - 7200),
+        ("old_use", now - 600, now - 500),
+        ("recent_use", now - 600, now - 10),
+        ("new", now - 5, now - 5),
+    ):
+        path = store.store("doc", name, "pdf", b"x" * 100)
+        os.utime(path, (used, created))
+
+    result = store.sweep()
+
+    assert result["removed_expired"] == 1
+    assert result["removed_lru"] == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["doc_new.pdf", "doc_recent_use.pdf"]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    from routers.patient_education_documents import router
+
+    store = GeneratedDocumentStore(tmp_path)
+    monkeypatch.setattr(document_store, "_document_store", store)
+    store.store("patient_education", "abc123", "pdf", b"%PDF-" + bytes(range(256)) * 4)
+    store.store("patient_education", "abc123", "html", b"<html>preview</html>")
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_download_supports_etag_and_range(client):
+    response = client.get("/documents/download/patient_education_abc123.pdf")
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    etag = response.headers["etag"]
+
+    not_modified = client.get(
+        "/documents/download/patient_education_abc123.pdf", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    partial = client.get(
+        "/documents/download/patient_education_abc123.pdf", headers={"Range": "bytes=0-4"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == b"%PDF-"
+
+    assert client.get("/documents/download/nope.pdf").status_code == 404
+
+
+def test_preview_serves_html(client):
+    response = client.get("/documents/preview/patient_education_abc123.html")
+    assert response.status_code == 200
+    assert response.text == "<html>preview</html>"
+    assert client.get("/documents/preview/patient_education_abc123.pdf").status_code == 400
@@ -0,0 +1,121 @@
+"""
+Tests for fixed-memory latency histograms (src.utils.latency_histogram) and
+their use in PerformanceMonitor and the /metrics export
+"""
+
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.utils.metrics as metrics
+import src.utils.middleware as middleware_module
+from src.utils.latency_histogram import (
+    LatencyHistogram,
+    RollingLatencyHistogram,
+    RouteLatencyTracker,
+)
+from src.utils.middleware import RequestContextMiddleware
+from src.utils.monitoring import PerformanceMonitor
+
+
+def test_percentiles_within_bucket_precision():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-4, 1) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    ordered = sorted(samples)
+    for percentile in (50, 95, 99, 99.9):
+        exact = ordered[int(len(ordered) * percentile / 100) - 1]
+        assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.04)
+    assert histogram.count == len(samples)
+    assert histogram.mean == pytest.approx(sum(samples) / len(samples))
+
+
+def test_memory_is_fixed_and_out_of_range_values_are_clamped():
+    histogram = LatencyHistogram(max_value_seconds=1.0)
+    buckets = histogram.bucket_count
+    for value in (0.0, -1.0, 0.5, 10.0, 1e9):
+        histogram.record(value)
+    assert histogram.bucket_count == buckets
+    assert histogram.count == 5
+    assert histogram.percentile(100) == pytest.approx(1.0, rel=0.04)
+
+
+def test_rolling_window_forgets_old_slots():
+    rolling = RollingLatencyHistogram(window_seconds=60, slots=6)
+    rolling.record(0.5, now=1000.0)
+    rolling.record(0.01, now=1055.0)
+
+    assert rolling.snapshot(now=1055.0).count == 2
+    window = rolling.snapshot(now=1065.0)
+    assert window.count == 1
+    assert window.max == 0.01
+
+
+def test_route_tracker_caps_cardinality():
+    tracker = RouteLatencyTracker(max_routes=2)
+    for route in ("GET /a", "GET /b", "GET /c", "GET /d"):
+        tracker.record(route, 0.01)
+    assert tracker.routes() == ["GET /a", "GET /b", "other"]
+    assert tracker.summary()["other"]["all_time"]["count"] == 2
+
+
+def test_performance_monitor_reports_percentiles():
+    monitor = PerformanceMonitor(window_seconds=60, max_routes=10)
+    for _ in range(99):
+        monitor.record_request(0.010, 200, "GET /fast")
+    monitor.record_request(1.0, 500, "GET /fast")
+
+    result = monitor.get_metrics()
+    assert result["total_requests"] == 100
+    assert result["error_count"] == 1
+    assert result["latency_ms"]["p50_ms"] == pytest.approx(10, rel=0.04)
+    assert result["latency_ms"]["p999_ms"] == pytest.approx(1000, rel=0.04)
+    assert monitor.get_route_metrics()["GET /fast"]["window"]["count"] == 100
+
+
+def test_middleware_records_route_templates_and_metrics_export(monkeypatch):
+    monitor = PerformanceMonitor(window_seconds=60, max_routes=10)
+    monkeypatch.setattr(middleware_module, "performance_monitor", monitor)
+    monkeypatch.setattr("src.utils.monitoring.performance_monitor", monitor)
+    monkeypatch.setattr(metrics, "_METRICS_ENABLED", True)
+    monkeypatch.setattr(metrics, "_PROM_AVAILABLE", False)
+
+    app = FastAPI()
+
+    @app.get("/patients/{patient_id}")
+    async def read_patient(patient_id: str):
+        return {"id": patient_id}
+
+    metrics.setup_metrics(app)
+    app.add_middleware(RequestContextMiddleware, rate_limit_enabled=False)
+    client = TestClient(app)
+
+    for patient_id in ("1", "2", "3"):
+        assert client.get(f"/patients/{patient_id}").status_code == 200
+
+    assert monitor.route_latency.routes() == ["GET /patients/{patient_id}"]
+
+    body = client.get("/metrics").text
+    assert 'ai_nurse_request_latency_seconds_count{route="GET /patients/{patient_id}"} 3' in body
+    assert 'quantile="0.99"' in body
+
+
+def test_memory_timing_metrics_use_histograms(monkeypatch):
+    monkeypatch.setattr(metrics, "_METRICS_ENABLED", True)
+    monkeypatch.setattr(metrics, "_PROM_AVAILABLE", False)
+    monkeypatch.setattr(metrics, "_metrics_store", {})
+
+    for value in (0.1, 0.2, 0.3):
+        metrics._memory_metrics_observe("pdf_render", value, labels={"kind": "care_plan"})
+    metrics._memory_metrics_update("cache_hits")
+
+    summary = metrics.get_metrics_summary()["metrics"]
+    assert summary["pdf_render"]["count"] == 3
+    assert summary["pdf_render"]["latency"]["p50_ms"] == pytest.approx(200, rel=0.04)
+    assert "latency" not in summary["cache_hits"]
+    assert "values" not in metrics._metrics_store["pdf_render"]
@@ -0,0 +1,119 @@
+"""
+Tests for route, upstream and AI-provider latency histograms with request-ID
+exemplars (src.utils.metrics)
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+prometheus_client = pytest.importorskip("prometheus_client")
+from prometheus_client import CollectorRegistry, Counter, Histogram  # noqa: E402
+from prometheus_client.openmetrics.exposition import generate_latest  # noqa: E402
+
+import src.utils.metrics as metrics  # noqa: E402
+from src.utils.middleware import RequestContextMiddleware  # noqa: E402
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = CollectorRegistry()
+    monkeypatch.setattr(metrics, "_METRICS_ENABLED", True)
+    monkeypatch.setattr(
+        metrics,
+        "_ROUTE_LATENCY",
+        Histogram("route_seconds", "", ["method", "route", "status"], registry=registry),
+    )
+    monkeypatch.setattr(
+        metrics,
+        "_UPSTREAM_LATENCY",
+        Histogram("upstream_seconds", "", ["host", "method", "status"], registry=registry),
+    )
+    monkeypatch.setattr(
+        metrics,
+        "_AI_LATENCY",
+        Histogram("ai_seconds", "", ["provider", "model", "outcome"], registry=registry),
+    )
+    monkeypatch.setattr(
+        metrics, "_AI_TOKENS", Counter("ai_tokens", "", ["provider", "model", "type"], registry=registry)
+    )
+    return registry
+
+
+def test_route_histogram_uses_template_and_request_id_exemplar(registry):
+    app = FastAPI()
+
+    @app.get("/diseases/{name}")
+    async def lookup(name: str):
+        return {"name": name}
+
+    app.add_middleware(RequestContextMiddleware, rate_limit_enabled=False)
+    client = TestClient(app)
+
+    request_ids = [client.get(f"/diseases/{name}").headers["x-request-id"] for name in ("flu", "copd")]
+
+    labels = {"method": "GET", "route": "/diseases/{name}", "status": "2xx"}
+    assert registry.get_sample_value("route_seconds_count", labels) == 2
+    exposition = generate_latest(registry).decode()
+    assert f'request_id="{request_ids[-1]}"' in exposition
+
+
+@pytest.mark.asyncio
+async def test_httpx_event_hooks_record_upstream_host_and_status(registry):
+    def handler(request):
+        return httpx.Response(404 if request.url.path == "/missing" else 200, json={})
+
+    metrics.current_request_id.set("req-123")
+    async with httpx.AsyncClient(
+        event_hooks=metrics.upstream_event_hooks(), transport=httpx.MockTransport(handler)
+    ) as client:
+        await client.get("https://mydisease.info/v1/query")
+        await client.get("https://mydisease.info/missing")
+        await client.get("https://api.fda.gov/drug/label.json")
+
+    def count(host, status):
+        return registry.get_sample_value(
+            "upstream_seconds_count", {"host": host, "method": "GET", "status": status}
+        )
+
+    assert count("mydisease.info", "2xx") == 1
+    assert count("mydisease.info", "4xx") == 1
+    assert count("api.fda.gov", "2xx") == 1
+    assert 'request_id="req-123"' in generate_latest(registry).decode()
+
+
+@pytest.mark.asyncio
+async def test_failed_upstream_calls_are_recorded_as_errors(registry):
+    def handler(request):
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    async with httpx.AsyncClient(
+        event_hooks=metrics.upstream_event_hooks(),
+        transport=metrics.upstream_transport(httpx.MockTransport(handler)),
+    ) as client:
+        with pytest.raises(httpx.ConnectTimeout):
+            await client.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi")
+
+    labels = {"host": "eutils.ncbi.nlm.nih.gov", "method": "GET", "status": "error"}
+    assert registry.get_sample_value("upstream_seconds_count", labels) == 1
+
+
+def test_ai_provider_latency_and_tokens(registry):
+    metrics.record_ai_request("anthropic", "claude", 1.5, input_tokens=120, output_tokens=480)
+    metrics.record_ai_request("anthropic", "claude", 0.2, success=False)
+
+    success = {"provider": "anthropic", "model": "claude", "outcome": "success"}
+    assert registry.get_sample_value("ai_seconds_sum", success) == 1.5
+    assert registry.get_sample_value(
+        "ai_seconds_count", {**success, "outcome": "error"}
+    ) == 1
+    assert registry.get_sample_value(
+        "ai_tokens_total", {"provider": "anthropic", "model": "claude", "type": "output"}
+    ) == 480
+
+
+def test_hooks_are_disabled_with_metrics(monkeypatch):
+    monkeypatch.setattr(metrics, "_METRICS_ENABLED", False)
+    assert metrics.upstream_event_hooks() == {}
+    assert metrics.upstream_transport() is None
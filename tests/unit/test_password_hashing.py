@@ -0,0 +1,95 @@
+"""
+Tests for async password hashing on the bounded executor (src.utils.auth_enhanced)
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+import src.utils.auth_enhanced as auth_enhanced
+from src.utils.auth_enhanced import PasswordHasher
+
+
+def _context(rounds, pinned=False):
+    # pbkdf2 keeps the tests fast; the rounds/rehash logic is scheme-agnostic
+    options = {"pbkdf2_sha256__default_rounds": rounds}
+    if pinned:
+        options.update(pbkdf2_sha256__min_rounds=rounds, pbkdf2_sha256__max_rounds=rounds)
+    return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto", **options)
+
+
+@pytest.fixture
+def hasher(monkeypatch):
+    hasher = PasswordHasher(max_workers=2, max_queue=4)
+    monkeypatch.setattr(auth_enhanced, "_password_hasher", hasher)
+    monkeypatch.setattr(auth_enhanced, "pwd_context", _context(1000))
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop(hasher):
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    await hasher.submit(time.sleep, 0.2)
+    ticking.cancel()
+
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    assert len(ticks) > 5
+    assert max(gaps) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_round_trip(hasher):
+    hashed = await auth_enhanced.hash_password_async("Nurse-Pass1!")
+    assert await auth_enhanced.verify_password_async("Nurse-Pass1!", hashed)
+    assert not await auth_enhanced.verify_password_async("wrong", hashed)
+    assert hasher.stats()["completed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_is_capped_and_reported(monkeypatch):
+    hasher = PasswordHasher(max_workers=1, max_queue=2)
+    try:
+        running = [asyncio.create_task(hasher.submit(time.sleep, 0.1)) for _ in range(2)]
+        await asyncio.sleep(0.02)
+
+        stats = hasher.stats()
+        assert stats["active"] == 1
+        assert stats["queued"] == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await hasher.submit(time.sleep, 0)
+        assert exc_info.value.status_code == 503
+
+        await asyncio.gather(*running)
+        stats = hasher.stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 2
+        assert stats["peak_pending"] == 2
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_outdated_work_factor_is_rehashed_on_login(hasher, monkeypatch):
+    old_hash = await auth_enhanced.hash_password_async("Nurse-Pass1!")
+
+    # Same work factor: nothing to upgrade
+    assert await auth_enhanced.verify_and_update_password_async("Nurse-Pass1!", old_hash) == (True, None)
+
+    monkeypatch.setattr(auth_enhanced, "pwd_context", _context(2000, pinned=True))
+    is_valid, new_hash = await auth_enhanced.verify_and_update_password_async("Nurse-Pass1!", old_hash)
+    assert is_valid
+    assert new_hash and "$2000$" in new_hash
+
+    assert await auth_enhanced.verify_and_update_password_async("wrong", old_hash) == (False, None)
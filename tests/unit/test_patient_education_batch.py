@@ -0,0 +1,143 @@
+"""
+Tests for the batch patient-education packet endpoint
+(POST /documents/patient-education/batch)
+"""
+
+import io
+import json
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import routers.patient_education_documents as documents
+import services.document_rendering_service as rendering
+import services.generated_document_store as document_store
+from services.document_rendering_service import DocumentRenderer
+from services.generated_document_store import GeneratedDocumentStore
+from src.database import get_db
+
+
+def _diagnosis(diagnosis_id, display):
+    return SimpleNamespace(
+        id=diagnosis_id,
+        diagnosis_display=display,
+        patient_friendly_description=None,
+        standard_warning_signs=["Chest pain"],
+        standard_medications=[],
+        standard_diet_instructions="Low salt diet.",
+        standard_follow_up_instructions=None,
+    )
+
+
+def _patient(name, diagnosis_id, **overrides):
+    return {
+        "patient_name": name,
+        "diagnosis_id": diagnosis_id,
+        "icd10_code": diagnosis_id.upper(),
+        **overrides,
+    }
+
+
+@pytest.fixture
+def calls(tmp_path, monkeypatch):
+    calls = {"ai": [], "medlineplus": []}
+
+    async def fake_generate(condition, patient_context, language):
+        calls["ai"].append((condition, patient_context.get("context"), language))
+        return {"response": f"About {condition}"}
+
+    def fake_fetch(self, icd10_code, language):
+        calls["medlineplus"].append((icd10_code, language))
+        return {"title": icd10_code, "url": "https://medlineplus.gov/"}
+
+    monkeypatch.setattr(documents.claude_service, "generate_patient_education", fake_generate)
+    monkeypatch.setattr(documents.MedlinePlusClient, "fetch_content", fake_fetch)
+    monkeypatch.setattr(document_store, "_document_store", GeneratedDocumentStore(tmp_path))
+    monkeypatch.setattr(rendering, "_document_renderer", DocumentRenderer(max_workers=0))
+    return calls
+
+
+@pytest.fixture
+def client(calls):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        _diagnosis("i10", "Hypertension"),
+        _diagnosis("e11", "Type 2 Diabetes"),
+    ]
+
+    app = FastAPI()
+    app.include_router(documents.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def test_batch_shares_lookups_and_returns_zip(client, calls):
+    patients = [
+        _patient("Ana Lopez", "i10"),
+        _patient("Ben Ray", "i10"),
+        _patient("Cy Moss", "e11"),
+        _patient("Di Park", "i10", preferred_language="es"),
+        _patient("Ed Fox", "missing"),
+    ]
+
+    response = client.post("/documents/patient-education/batch", json={"patients": patients})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    manifest = json.loads(archive.read("manifest.json"))
+    pdfs = sorted(name for name in archive.namelist() if name.endswith(".pdf"))
+
+    assert pdfs == [
+        "001_Ana_Lopez_i10.pdf",
+        "002_Ben_Ray_i10.pdf",
+        "003_Cy_Moss_e11.pdf",
+        "004_Di_Park_i10.pdf",
+    ]
+    assert all(archive.read(name).startswith(b"%PDF") for name in pdfs)
+    assert (manifest["generated"], manifest["failed"]) == (4, 1)
+    assert "error" in manifest["documents"][4]
+
+    # Description + follow-up per (diagnosis, language), not per patient
+    assert len(calls["ai"]) == 6 == manifest["ai_generations"]
+    assert sorted(calls["medlineplus"]) == [("E11", "en"), ("I10", "en"), ("I10", "es")]
+
+
+def test_batch_job_delivery_queues_packet(client, monkeypatch):
+    queued = {}
+
+    async def fake_enqueue(func, *args, **kwargs):
+        queued["func"], queued["args"] = func, args
+        return {"task_id": "abc", "status": "queued"}
+
+    monkeypatch.setattr(documents, "enqueue_job", fake_enqueue)
+
+    response = client.post(
+        "/documents/patient-education/batch",
+        json={"patients": [_patient("Ana Lopez", "i10")], "delivery": "job"},
+    )
+
+    assert response.status_code == 202
+    assert response.json()["status_url"] == "/api/v1/tasks/abc"
+    assert queued["func"] is documents.generate_patient_education_packet_job
+    assert queued["args"][0][0]["patient_name"] == "Ana Lopez"
+
+
+@pytest.mark.asyncio
+async def test_packet_job_stores_downloadable_zip(calls, monkeypatch):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [_diagnosis("i10", "Hypertension")]
+    monkeypatch.setattr(documents, "SessionLocal", lambda: db)
+
+    result = await documents.generate_patient_education_packet_job(
+        [_patient("Ana Lopez", "i10")]
+    )
+
+    assert result["generated"] == 1
+    filename = result["zip_url"].rsplit("/", 1)[1]
+    assert document_store.get_document_store().resolve(filename) is not None
+    db.close.assert_called_once()
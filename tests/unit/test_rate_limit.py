@@ -12,6 +12,10 @@ from src.utils.config import get_settings
 
 # Create a test app
 def create_test_app(rate_limit: int = 5, window_seconds: int = 60):
+    # Clear in-memory rate limit state shared with other apps in this process
+    from src.utils import rate_limit as _rl
+    _rl._memory_rate_limit.clear()
+
     app = FastAPI()
     
     app.add_middleware(
@@ -82,6 +86,100 @@ def test_exempt_paths():
     assert response.status_code == 200
     assert response.json() == {"message": "Exempt Path"}
 
+def test_gcra_state_is_constant_size():
+    """GCRA keeps one TAT per bucket regardless of request volume"""
+    from src.utils.rate_limit import gcra
+
+    tat = None
+    now = 1000.0
+    for expected_remaining in (2, 1, 0):
+        tat, remaining, retry_after = gcra(tat, now, 20.0, 60.0)
+        assert (remaining, retry_after) == (expected_remaining, 0)
+
+    blocked_tat, remaining, retry_after = gcra(tat, now, 20.0, 60.0)
+    assert blocked_tat is None
+    assert retry_after == 20
+
+    # One emission interval later exactly one request is allowed again
+    tat, remaining, retry_after = gcra(tat, now + 20.0, 20.0, 60.0)
+    assert tat is not None and remaining == 0 and retry_after == 0
+
+
+def test_per_route_and_per_user_quotas():
+    """Route quotas and authenticated users get their own buckets and limits"""
+    from src.utils import rate_limit as _rl
+    _rl._memory_rate_limit.clear()
+
+    app = FastAPI()
+    app.add_middleware(
+        RateLimiter,
+        requests_per_minute=2,
+        exempt_paths=["/exempt"],
+        user_requests_per_minute=4,
+        route_limits={"/expensive": 1},
+    )
+
+    @app.get("/")
+    def read_root():
+        return {"message": "Hello World"}
+
+    @app.get("/expensive")
+    def expensive():
+        return {"message": "Expensive"}
+
+    client = TestClient(app)
+
+    assert client.get("/expensive").headers["X-RateLimit-Limit"] == "1"
+    assert client.get("/expensive").status_code == 429
+    # The default bucket is unaffected by the route bucket
+    assert client.get("/").status_code == 200
+
+    # Only tokens get_current_user has verified (i.e. cached) get a user bucket
+    from src.utils.token_cache import get_token_cache
+    get_token_cache().put("nurse-token", {"sub": "nurse-1", "exp": time.time() + 3600})
+
+    token = {"Authorization": "Bearer nurse-token"}
+    for _ in range(4):
+        response = client.get("/", headers=token)
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "4"
+    assert client.get("/", headers=token).status_code == 429
+
+    # User IDs are hashed in the bucket keys
+    assert not any("nurse-1" in key for key in _rl._memory_rate_limit)
+
+
+def test_unverified_tokens_share_the_ip_bucket():
+    """A fresh random token per request doesn't escape the per-IP limit"""
+    client = TestClient(create_test_app(rate_limit=2))
+
+    statuses = [
+        client.get("/", headers={"Authorization": f"Bearer random-{i}"}).status_code
+        for i in range(3)
+    ]
+
+    assert statuses == [200, 200, 429]
+
+
+def test_memory_fallback_evicts_idle_and_is_bounded(monkeypatch):
+    """Idle buckets are dropped and the in-memory table never exceeds its bound"""
+    from src.utils import rate_limit as _rl
+    _rl._memory_rate_limit.clear()
+
+    limiter = RateLimiter(None, requests_per_minute=60, max_memory_clients=3)
+    now = [1000.0]
+    monkeypatch.setattr(_rl.time, "time", lambda: now[0])
+
+    for i in range(5):
+        limiter._check_rate_limit_memory(f"rate_limit:*:ip:{i}", 60)
+    assert list(_rl._memory_rate_limit) == [f"rate_limit:*:ip:{i}" for i in (2, 3, 4)]
+
+    # After one emission interval every bucket is back to full and idle
+    now[0] += 1.0
+    limiter._check_rate_limit_memory("rate_limit:*:ip:new", 60)
+    assert list(_rl._memory_rate_limit) == ["rate_limit:*:ip:new"]
+
+
 if __name__ == "__main__":
     # Run tests manually
     test_rate_limiting()
@@ -0,0 +1,119 @@
+"""
+Tests for the single-pass request context middleware (src.utils.middleware)
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.utils import rate_limit as _rl
+from src.utils.middleware import SECURITY_HEADERS, RequestContextMiddleware
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    async def _no_client():
+        return None
+
+    monkeypatch.setattr(_rl, "get_redis_client", _no_client)
+    _rl._memory_rate_limit.clear()
+
+
+def create_test_app(**middleware_kwargs):
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, **middleware_kwargs)
+
+    @app.get("/")
+    def root(request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def test_headers_request_id_and_timing():
+    client = TestClient(create_test_app(rate_limit_enabled=False))
+
+    response = client.get("/", headers={"host": "example.org"})
+    assert response.status_code == 200
+    for name, value in SECURITY_HEADERS.items():
+        assert response.headers[name] == value
+    assert "max-age" in response.headers["Strict-Transport-Security"]
+    assert response.headers["X-Request-ID"] == response.json()["request_id"]
+    assert float(response.headers["X-Process-Time"]) >= 0
+    assert "X-RateLimit-Limit" not in response.headers
+
+    local = client.get("/", headers={"host": "localhost:8000"})
+    assert "Strict-Transport-Security" not in local.headers
+    assert local.headers["X-Request-ID"] != response.headers["X-Request-ID"]
+
+
+def test_rate_limit_enforced_in_same_pass():
+    client = TestClient(
+        create_test_app(rate_limit_enabled=True, requests_per_minute=2, exempt_paths=["/docs"])
+    )
+
+    for remaining in (1, 0):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Remaining"] == str(remaining)
+
+    blocked = client.get("/")
+    assert blocked.status_code == 429
+    assert "Retry-After" in blocked.headers
+    assert "X-Request-ID" in blocked.headers
+    assert blocked.headers["X-Content-Type-Options"] == "nosniff"
+    assert blocked.json()["error_type"] == "rate_limit_error"
+
+
+def test_unhandled_error_returns_json_500():
+    client = TestClient(create_test_app(rate_limit_enabled=False), raise_server_exceptions=False)
+
+    response = client.get("/boom")
+    assert response.status_code == 500
+    assert response.json()["request_id"] == response.headers["X-Request-ID"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_not_buffered():
+    first_chunk_sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def chunks():
+        yield b"first"
+        first_chunk_sent.set()
+        await release.wait()
+        yield b"second"
+
+    async def app(scope, receive, send):
+        await StreamingResponse(chunks())(scope, receive, send)
+
+    middleware = RequestContextMiddleware(app, rate_limit_enabled=False)
+    messages = []
+
+    async def receive():
+        await asyncio.sleep(10)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "client": ("1.2.3.4", 1)}
+    task = asyncio.create_task(middleware(scope, receive, send))
+
+    await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+    await asyncio.sleep(0)
+    # Headers and the first chunk reached the server before the body finished
+    assert messages[0]["type"] == "http.response.start"
+    assert (b"x-request-id", scope["state"]["request_id"].encode()) in messages[0]["headers"]
+    assert messages[1]["body"] == b"first"
+
+    release.set()
+    await asyncio.wait_for(task, timeout=1)
+    assert [m.get("body") for m in messages[1:] if m.get("body")] == [b"first", b"second"]
@@ -0,0 +1,129 @@
+"""
+Tests for set-based UserSession cleanup and statistics in src.models.database
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.database as database
+from src.models.database import Base, User, UserDatabase, UserSession
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sessions.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    monkeypatch.setattr(
+        database, "SessionLocal", async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    yield engine, statements
+    await engine.dispose()
+
+
+async def _add_sessions(engine, user_id, count, expires_in, created_offset=0, active=True):
+    now = datetime.utcnow()
+    async with async_sessionmaker(engine)() as session:
+        if await session.get(User, user_id) is None:
+            session.add(
+                User(id=user_id, email=f"{user_id}@example.org", password_hash="x", full_name=user_id)
+            )
+        for i in range(count):
+            session.add(
+                UserSession(
+                    id=str(uuid.uuid4()),
+                    user_id=user_id,
+                    session_token=str(uuid.uuid4()),
+                    created_at=now - timedelta(minutes=created_offset + i),
+                    expires_at=now + expires_in,
+                    is_active=active,
+                )
+            )
+        await session.commit()
+
+
+def test_user_session_has_cleanup_indexes():
+    indexes = {index.name: [c.name for c in index.columns] for index in UserSession.__table__.indexes}
+    assert indexes["ix_user_sessions_expires_at_is_active"] == ["expires_at", "is_active"]
+    assert indexes["ix_user_sessions_user_id_created_at"] == ["user_id", "created_at"]
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_deleted_in_chunks(db):
+    engine, statements = db
+    await _add_sessions(engine, "u1", 7, timedelta(days=-2))
+    await _add_sessions(engine, "u1", 2, timedelta(hours=1))
+
+    statements.clear()
+    removed = await UserDatabase.cleanup_expired_sessions(datetime.utcnow() - timedelta(days=1), chunk_size=3)
+
+    assert removed == 7
+    deletes = [s for s in statements if s.lstrip().upper().startswith("DELETE")]
+    assert len(deletes) == 3  # 3 + 3 + 1
+    assert not any(s.lstrip().upper().startswith("SELECT user_sessions.id".upper()) for s in statements)
+
+    stats = await UserDatabase.get_session_stats()
+    assert stats["total_sessions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_deactivate_and_stats_use_bulk_statements(db):
+    engine, statements = db
+    await _add_sessions(engine, "u1", 3, timedelta(minutes=-5))
+    await _add_sessions(engine, "u2", 2, timedelta(hours=1))
+    await _add_sessions(engine, "u2", 1, timedelta(hours=1), active=False)
+
+    assert await UserDatabase.deactivate_expired_sessions(chunk_size=2) == 3
+
+    statements.clear()
+    stats = await UserDatabase.get_session_stats()
+    assert len(statements) == 1
+    assert stats["total_sessions"] == 6
+    assert stats["active_sessions"] == 2
+    assert stats["expired_sessions"] == 3
+    assert stats["inactive_sessions"] == 4
+    assert stats["users_with_sessions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_excess_sessions_trimmed_to_newest(db):
+    engine, statements = db
+    await _add_sessions(engine, "u1", 8, timedelta(hours=1))
+    await _add_sessions(engine, "u2", 2, timedelta(hours=1))
+
+    async with async_sessionmaker(engine)() as session:
+        newest = (
+            await session.execute(
+                select(UserSession.id)
+                .where(UserSession.user_id == "u1")
+                .order_by(UserSession.created_at.desc())
+                .limit(3)
+            )
+        ).scalars().all()
+
+    statements.clear()
+    assert await UserDatabase.cleanup_user_excess_sessions("u1", max_sessions=3) == 5
+    assert len(statements) == 1
+
+    async with async_sessionmaker(engine)() as session:
+        remaining = (
+            await session.execute(select(UserSession.id).where(UserSession.user_id == "u1"))
+        ).scalars().all()
+        others = (
+            await session.execute(select(UserSession.id).where(UserSession.user_id == "u2"))
+        ).scalars().all()
+    assert set(remaining) == set(newest)
+    assert len(others) == 2
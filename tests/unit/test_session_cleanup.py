@@ -0,0 +1,199 @@
+"""
+Tests for the Redis expiry index used by SessionCleanupService (src.services.session_cleanup)
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.services.session_cleanup as cleanup_module
+from src.services.session_cleanup import (
+    REDIS_SESSION_EXPIRY_INDEX,
+    REDIS_SESSION_SCAN_CURSOR,
+    SessionCleanupService,
+    track_redis_session,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the handful of commands the cleanup uses."""
+
+    def __init__(self):
+        self.strings = {}
+        self.ttls = {}
+        self.zsets = {}
+        self.calls = []
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value):
+        self.strings[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.strings.pop(key, None)
+
+    async def zadd(self, key, mapping, nx=False):
+        zset = self.zsets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if member not in zset:
+                added += 1
+            elif nx:
+                continue
+            zset[member] = score
+        return added
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def zrangebyscore(self, key, minimum, maximum, start=None, num=None):
+        self.calls.append("zrangebyscore")
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        members = [member for member, score in items if score <= float(maximum)]
+        return members[start:start + num] if num is not None else members
+
+    async def scan(self, cursor=0, match=None, count=10):
+        # Cursor = position in insertion order; walks ``count`` keys per call
+        self.calls.append("scan")
+        keys = list(self.strings)
+        prefix = match.rstrip("*")
+        page = keys[cursor:cursor + count]
+        next_cursor = cursor + count if cursor + count < len(keys) else 0
+        return next_cursor, [key for key in page if key.startswith(prefix)]
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+
+    def pipeline(self, transaction=False):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.ops.append(lambda: self.redis.strings.get(key))
+
+    def pttl(self, key):
+        self.ops.append(lambda: self.redis.ttls.get(key, -1))
+
+    def unlink(self, *keys):
+        def _unlink():
+            for key in keys:
+                self.redis.strings.pop(key, None)
+        self.ops.append(_unlink)
+
+    def zrem(self, name, *keys):
+        def _zrem():
+            for key in keys:
+                self.redis.zsets.get(name, {}).pop(key, None)
+        self.ops.append(_zrem)
+
+    async def execute(self):
+        self.redis.calls.append("pipeline")
+        return [op() for op in self.ops]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+
+    async def _client():
+        return fake
+
+    monkeypatch.setattr(cleanup_module, "get_redis_client", _client)
+    return fake
+
+
+@pytest.fixture
+def service():
+    service = SessionCleanupService()
+    service.settings = type(
+        "Settings", (), {"SESSION_EXPIRY_HOURS": 24, "SESSION_CLEANUP_BATCH_SIZE": 2}
+    )()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_only_expired_sessions_in_batches(redis, service):
+    now = datetime.utcnow()
+    for i in range(5):
+        redis.strings[f"session:old{i}"] = "{}"
+        await track_redis_session(f"session:old{i}", now - timedelta(minutes=i + 1))
+    redis.strings["session:live"] = "{}"
+    await track_redis_session("session:live", now + timedelta(hours=1))
+
+    service.settings.SESSION_INDEX_SCAN_KEYS_PER_PASS = 0  # SCAN off
+
+    removed = await service._cleanup_redis_sessions()
+
+    assert removed == 5
+    assert set(redis.strings) == {"session:live"}
+    assert list(redis.zsets[REDIS_SESSION_EXPIRY_INDEX]) == ["session:live"]
+    # Batch size 2: three range reads, three pipelined deletes, no keyspace scan
+    assert redis.calls.count("zrangebyscore") == 3
+    assert redis.calls.count("pipeline") == 3
+    assert "scan" not in redis.calls
+
+
+@pytest.mark.asyncio
+async def test_untracked_sessions_are_indexed_with_scan(redis, service):
+    now = time.time()
+    redis.strings["session:expired"] = json.dumps(
+        {"created_at": (datetime.utcnow() - timedelta(hours=25)).isoformat()}
+    )
+    redis.strings["session:explicit"] = json.dumps(
+        {"expires_at": (datetime.utcnow() + timedelta(hours=2)).isoformat()}
+    )
+    redis.strings["session:opaque"] = "not json"
+    redis.ttls["session:opaque"] = 60_000
+    redis.strings["other:key"] = "{}"
+
+    removed = await service._cleanup_redis_sessions()
+
+    assert removed == 1
+    assert "session:expired" not in redis.strings
+    assert "other:key" in redis.strings
+    index = redis.zsets[REDIS_SESSION_EXPIRY_INDEX]
+    assert set(index) == {"session:explicit", "session:opaque"}
+    assert index["session:explicit"] == pytest.approx(now + 7200, abs=5)
+    assert index["session:opaque"] == pytest.approx(now + 60, abs=5)
+
+
+
+@pytest.mark.asyncio
+async def test_scan_resumes_across_passes_and_keeps_indexing_new_sessions(redis, service):
+    service.settings.SESSION_INDEX_SCAN_KEYS_PER_PASS = 2  # one SCAN call per pass
+    tracked_expiry = time.time() + 3600
+    redis.strings["session:a"] = "{}"
+    await track_redis_session("session:a", datetime.utcfromtimestamp(tracked_expiry))
+    redis.strings["session:b"] = "{}"
+    redis.strings["session:c"] = "{}"
+
+    assert await service.reconcile_redis_session_index() == 1  # a, b: only b is new
+    assert REDIS_SESSION_SCAN_CURSOR in redis.strings
+    assert await service.reconcile_redis_session_index() == 1  # c (walk finished)
+    assert REDIS_SESSION_SCAN_CURSOR not in redis.strings
+
+    index = redis.zsets[REDIS_SESSION_EXPIRY_INDEX]
+    assert set(index) == {"session:a", "session:b", "session:c"}
+    # Tracked sessions keep the expiry their writer recorded
+    assert index["session:a"] == pytest.approx(tracked_expiry, abs=1)
+
+    # Sessions written after a full walk are still picked up
+    redis.strings["session:late"] = "{}"
+    for _ in range(3):
+        await service.reconcile_redis_session_index()
+    assert "session:late" in index
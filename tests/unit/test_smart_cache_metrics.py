@@ -0,0 +1,77 @@
+"""
+Tests for the fixed-size metrics ring and per-strategy aggregates in
+SmartCacheManager (src.utils.smart_cache)
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.utils.smart_cache as smart_cache
+from src.utils.smart_cache import CacheMetricsRing, CacheStrategy, SmartCacheManager
+
+
+def test_ring_overwrites_oldest_without_growing():
+    ring = CacheMetricsRing(capacity=4)
+    for i in range(10):
+        ring.record(0, i % 2 == 0, float(i), timestamp=1000.0 + i)
+
+    assert ring.size == 4
+    assert ring.oldest_timestamp() == 1006.0
+    summary = ring.summarize()
+    assert summary["total_requests"] == 4
+    assert summary["cache_hits"] == 2
+    assert summary["avg_response_time_ms"] == pytest.approx((6 + 7 + 8 + 9) / 4)
+
+    recent = ring.summarize(since=1007.5)
+    assert recent["total_requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_statistics_come_from_running_aggregates(monkeypatch):
+    store = {"medical_ref:hit": {"cached": True}}
+
+    async def fake_get(key):
+        return store.get(key)
+
+    manager = SmartCacheManager()
+    monkeypatch.setattr(smart_cache, "cache_get", fake_get)
+    monkeypatch.setattr(manager, "_generate_smart_cache_key", lambda strategy, query, **kw: query)
+
+    assert manager.get_cache_statistics() == {"message": "No cache metrics available"}
+
+    for _ in range(3):
+        await manager.smart_cache_get(CacheStrategy.MEDICAL_REFERENCE, "medical_ref:hit")
+    await manager.smart_cache_get(
+        CacheStrategy.CLINICAL_TRIALS, "missing", similarity_check=False
+    )
+
+    stats = manager.get_cache_statistics()
+    overall = stats["overall_statistics"]
+    assert overall["total_requests"] == 4
+    assert overall["total_hits"] == 3
+    by_strategy = stats["strategy_statistics"]
+    assert by_strategy[CacheStrategy.MEDICAL_REFERENCE.value]["hit_rate"] == 1.0
+    assert by_strategy[CacheStrategy.CLINICAL_TRIALS.value]["cache_hits"] == 0
+    assert "p99_response_time_ms" in by_strategy[CacheStrategy.MEDICAL_REFERENCE.value]
+
+    recent = manager.get_recent_performance(datetime.utcnow() - timedelta(hours=1))
+    assert recent["total_requests"] == 4
+    assert recent["cache_misses"] == 1
+
+
+def test_recording_cost_does_not_grow_with_history():
+    manager = SmartCacheManager()
+    strategy = CacheStrategy.LITERATURE_SEARCH
+
+    def timed(count):
+        start = time.perf_counter()
+        for _ in range(count):
+            manager._record_cache_metrics("k", strategy, True, time.perf_counter())
+        return time.perf_counter() - start
+
+    timed(5000)  # fill the ring
+    assert manager.metrics_history.size == 1000
+    assert manager.strategy_stats[strategy].requests == 5000
+    assert timed(5000) < 1.0
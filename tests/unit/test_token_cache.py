@@ -0,0 +1,135 @@
+"""
+Tests for the verified-token cache used by get_current_user (src.utils.token_cache)
+"""
+
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+import src.utils.auth_enhanced as auth_enhanced
+import src.utils.token_cache as token_cache_module
+from src.utils.auth_dependencies import get_current_user
+from src.utils.token_cache import VerifiedTokenCache
+
+
+class FakeRedis:
+    """Just enough of a sorted set for the revocation log."""
+
+    def __init__(self):
+        self.zsets = {}
+
+    def pipeline(self, transaction=False):
+        return _FakePipeline(self)
+
+    async def zrangebyscore(self, key, minimum, maximum, withscores=False):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [(member, score) for member, score in items if score >= float(minimum)]
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def zadd(self, key, mapping):
+        self.redis.zsets.setdefault(key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, minimum, maximum):
+        zset = self.redis.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= float(maximum)]:
+            del zset[member]
+
+    async def execute(self):
+        return []
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    async def _no_client():
+        return None
+
+    monkeypatch.setattr(token_cache_module, "get_redis_client", _no_client)
+    cache = VerifiedTokenCache(max_entries=3, expiry_margin_seconds=30, sync_interval_seconds=0)
+    monkeypatch.setattr(token_cache_module, "_token_cache", cache)
+    return cache
+
+
+def _credentials(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_verifies_each_token_once(cache, monkeypatch):
+    token = auth_enhanced.create_access_token({"sub": "nurse-1", "session_id": "s1", "role": "nurse"})
+
+    calls = []
+    real_verify = auth_enhanced.verify_token
+
+    def counting_verify(value):
+        calls.append(value)
+        return real_verify(value)
+
+    monkeypatch.setattr(auth_enhanced, "verify_token", counting_verify)
+
+    for _ in range(5):
+        user = await get_current_user(_credentials(token))
+        assert user["user_id"] == "nurse-1"
+        assert user["role"] == "nurse"
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 4
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_before_exp_and_lru_is_bounded(cache):
+    now = time.time()
+    cache.put("almost-expired", {"sub": "a", "exp": now + 10})
+    assert await cache.get("almost-expired") is None
+
+    for i in range(4):
+        cache.put(f"t{i}", {"sub": str(i), "exp": now + 3600})
+    assert len(cache) == 3
+    assert await cache.get("t0") is None
+    assert (await cache.get("t3"))["sub"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_revoked_session_is_rejected(cache):
+    token = auth_enhanced.create_access_token({"sub": "nurse-1", "session_id": "s-revoke"})
+    await get_current_user(_credentials(token))
+    assert len(cache) == 1
+
+    await token_cache_module.revoke_session("s-revoke")
+    assert len(cache) == 0
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(_credentials(token))
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_revocations_propagate_between_workers(monkeypatch):
+    redis = FakeRedis()
+
+    async def _client():
+        return redis
+
+    monkeypatch.setattr(token_cache_module, "get_redis_client", _client)
+    worker_a = VerifiedTokenCache(sync_interval_seconds=0)
+    worker_b = VerifiedTokenCache(sync_interval_seconds=0)
+
+    claims = {"sub": "nurse-1", "session_id": "shared", "exp": time.time() + 3600}
+    worker_b.put("token", claims)
+    assert await worker_b.get("token") == claims
+
+    await worker_a.revoke("shared")
+
+    assert await worker_b.get("token") is None
+    assert worker_b.is_revoked("token", claims)
@@ -0,0 +1,92 @@
+"""
+Tests for the translation memory (src.utils.translation_memory) and batch
+translation in TranslationService
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import src.utils.translation_memory as translation_memory
+from src.services.translation_service import DEEPL_MAX_TEXTS_PER_REQUEST, TranslationService
+from src.utils.translation_memory import TranslationMemory, memory_key
+
+
+class FakeDeepL:
+    def __init__(self):
+        self.calls = []
+
+    def translate_text(self, texts, target_lang, source_lang):
+        self.calls.append(list(texts))
+        return [SimpleNamespace(text=f"[{target_lang}] {text}") for text in texts]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("AI_NURSE_DISABLE_REDIS", "1")
+    monkeypatch.setattr(translation_memory, "_translation_memory", TranslationMemory())
+    service = TranslationService()
+    service.deepl_client = FakeDeepL()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setenv("AI_NURSE_DISABLE_REDIS", "1")
+    memory = TranslationMemory(max_entries=2)
+    a, b, c = (memory_key(text, "en", "es", "medical") for text in "abc")
+
+    await memory.put_many({a: ("A", "deepl"), b: ("B", "deepl")})
+    assert await memory.get_many([a]) == {a: ("A", "deepl")}
+    await memory.put_many({c: ("C", "deepl")})
+
+    assert set(await memory.get_many([a, b, c])) == {a, c}
+    assert memory_key("a", "en", "es", "clinical") != a
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_distinct_new_segments_in_one_request(service):
+    texts = ["Take with food", "Call 911", "Take with food", ""]
+
+    first = await service.translate_batch(texts, "es")
+
+    assert service.deepl_client.calls == [["Take with food", "Call 911"]]
+    assert [r["translated_text"] for r in first] == [
+        "[ES] Take with food",
+        "[ES] Call 911",
+        "[ES] Take with food",
+        "",
+    ]
+    assert all(r["success"] for r in first)
+
+    second = await service.translate_batch(["Call 911", "Rest"], "es")
+
+    assert service.deepl_client.calls[-1] == ["Rest"]
+    assert second[0]["cached"] is True
+    assert second[0]["method"] == "deepl"
+    assert "cached" not in second[1]
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_split_to_the_provider_limit(service):
+    texts = [f"Dose {i}" for i in range(DEEPL_MAX_TEXTS_PER_REQUEST * 2 + 1)]
+
+    results = await service.translate_batch(texts, "es")
+
+    assert [len(call) for call in service.deepl_client.calls] == [
+        DEEPL_MAX_TEXTS_PER_REQUEST,
+        DEEPL_MAX_TEXTS_PER_REQUEST,
+        1,
+    ]
+    assert [r["translated_text"] for r in results] == [f"[ES] {text}" for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_failed_translations_are_not_remembered(service):
+    service.deepl_client = None
+
+    result = await service.translate("Call 911", "fr")
+
+    assert result["success"] is False
+    assert result["translated_text"] == "Call 911"
+    assert len(translation_memory.get_translation_memory()) == 0
@@ -0,0 +1,99 @@
+"""
+Tests for batched and coalesced suggestions in src.services.wizard_ai_service
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("langchain_anthropic")
+
+from src.services.wizard_ai_service import (  # noqa: E402
+    MAX_FIELDS_PER_BATCH,
+    SepsisAssessment,
+    WizardAIService,
+)
+
+PATIENT = {"age": 67, "chief_complaint": "fever"}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    service = WizardAIService()
+    service.calls = []
+
+    async def suggest_fields(wizard_type, field_names, patient_context, current_wizard_data):
+        service.calls.append(list(field_names))
+        await asyncio.sleep(0.01)
+        return {
+            name: {"suggested_value": f"{name}-value", "reasoning": "fits"}
+            for name in field_names
+            if name != "unknown"
+        }
+
+    service._suggest_wizard_fields = suggest_fields
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_field_requests_share_one_call(service):
+    fields = ["heart_rate", "temperature", "heart_rate", "unknown"]
+
+    results = await asyncio.gather(
+        *(service.suggest_wizard_field("sepsis", name, PATIENT, {}) for name in fields)
+    )
+
+    assert service.calls == [["heart_rate", "temperature", "unknown"]]
+    assert [r["suggested_value"] for r in results] == [
+        "heart_rate-value",
+        "temperature-value",
+        "heart_rate-value",
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_different_wizard_data_is_not_batched_together(service):
+    await asyncio.gather(
+        service.suggest_wizard_field("sepsis", "heart_rate", PATIENT, {}),
+        service.suggest_wizard_field("sepsis", "heart_rate", PATIENT, {"step": 2}),
+    )
+
+    assert service.calls == [["heart_rate"], ["heart_rate"]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting(service):
+    names = [f"field_{i}" for i in range(MAX_FIELDS_PER_BATCH + 1)]
+
+    await asyncio.gather(
+        *(service.suggest_wizard_field("stroke", name, PATIENT, {}) for name in names)
+    )
+
+    assert [len(call) for call in service.calls] == [MAX_FIELDS_PER_BATCH, 1]
+
+
+@pytest.mark.asyncio
+async def test_identical_assessments_are_coalesced(service):
+    calls = []
+
+    async def assess(patient_context, current_vitals, recent_labs):
+        calls.append(patient_context)
+        await asyncio.sleep(0.01)
+        return SepsisAssessment(
+            suspected_infection_source="urinary",
+            risk_factors_present=[],
+            qsofa_prediction={},
+            recommended_interventions=[],
+            clinical_reasoning="",
+        )
+
+    service._suggest_sepsis_assessment = assess
+
+    results = await asyncio.gather(
+        *(service.suggest_sepsis_assessment(PATIENT, {"hr": 112}) for _ in range(3))
+    )
+
+    assert len(calls) == 1
+    assert {r.suspected_infection_source for r in results} == {"urinary"}
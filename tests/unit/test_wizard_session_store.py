@@ -0,0 +1,128 @@
+"""
+Tests for the shared wizard session store (src.utils.wizard_session_store)
+"""
+
+from datetime import datetime
+
+import pytest
+
+import src.utils.wizard_session_store as store_module
+from src.utils.wizard_session_store import (
+    WizardSession,
+    WizardSessionConflict,
+    WizardSessionStore,
+    deserialize_session,
+    serialize_session,
+)
+
+
+@pytest.fixture
+def no_redis(monkeypatch):
+    async def _no_client():
+        return None
+
+    monkeypatch.setattr(store_module, "get_redis_client", _no_client)
+
+
+def test_serializer_round_trip_and_compression():
+    small = {"wizard_id": "w1", "created_at": datetime(2024, 1, 2, 3, 4, 5), "steps": {1, 2}}
+    payload = serialize_session(small)
+    assert payload.startswith("j:")
+    assert deserialize_session(payload) == {
+        "wizard_id": "w1",
+        "created_at": "2024-01-02T03:04:05",
+        "steps": [1, 2],
+    }
+
+    large = {"notes": "patient stable " * 200}
+    payload = serialize_session(large)
+    assert payload.startswith("z:")
+    assert len(payload) < len(large["notes"])
+    assert deserialize_session(payload) == large
+
+
+@pytest.mark.asyncio
+async def test_memory_create_get_save_delete(no_redis):
+    store = WizardSessionStore("test_basic", ttl_seconds=60, max_memory_sessions=10)
+
+    created = await store.create("w1", {"current_step": 1, "data": {}})
+    assert created.version == 1
+
+    session = await store.get("w1")
+    assert isinstance(session, WizardSession)
+    assert session == {"current_step": 1, "data": {}}
+
+    # Stored state is a copy, not the caller's dict
+    session["current_step"] = 2
+    assert (await store.get("w1"))["current_step"] == 1
+
+    assert await store.save("w1", session) == 2
+    assert session.version == 2
+    assert (await store.get("w1"))["current_step"] == 2
+
+    assert await store.delete("w1") is True
+    assert await store.get("w1") is None
+    assert await store.delete("w1") is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_edit_raises_conflict(no_redis):
+    store = WizardSessionStore("test_conflict", ttl_seconds=60, max_memory_sessions=10)
+    await store.create("w1", {"current_step": 1})
+
+    first = await store.get("w1")
+    second = await store.get("w1")
+
+    first["current_step"] = 2
+    await store.save("w1", first)
+
+    second["current_step"] = 3
+    with pytest.raises(WizardSessionConflict) as exc_info:
+        await store.save("w1", second)
+    assert exc_info.value.status_code == 409
+
+    with pytest.raises(WizardSessionConflict):
+        await store.create("w1", {})
+
+    assert (await store.get("w1"))["current_step"] == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_fallback_expires_and_is_bounded(no_redis):
+    expired = WizardSessionStore("test_ttl", ttl_seconds=0, max_memory_sessions=10)
+    await expired.create("w1", {"a": 1})
+    assert await expired.get("w1") is None
+
+    bounded = WizardSessionStore("test_lru", ttl_seconds=60, max_memory_sessions=2)
+    await bounded.create("w1", {})
+    await bounded.create("w2", {})
+    await bounded.get("w1")  # w2 becomes least recently used
+    await bounded.create("w3", {})
+
+    assert await bounded.get("w1") is not None
+    assert await bounded.get("w2") is None
+    assert await bounded.get("w3") is not None
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_memory(monkeypatch):
+    class BrokenRedis:
+        async def eval(self, *args):
+            raise ConnectionError("redis down")
+
+        async def hmget(self, *args):
+            raise ConnectionError("redis down")
+
+        async def delete(self, *args):
+            raise ConnectionError("redis down")
+
+    async def _broken_client():
+        return BrokenRedis()
+
+    monkeypatch.setattr(store_module, "get_redis_client", _broken_client)
+    store = WizardSessionStore("test_broken", ttl_seconds=60, max_memory_sessions=10)
+
+    await store.create("w1", {"current_step": 1})
+    session = await store.get("w1")
+    assert session == {"current_step": 1}
+    assert await store.delete("w1") is True
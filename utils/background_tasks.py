@@ -1,39 +1,531 @@
 """
 Background task utilities for the application.
 
-This module provides functionality for running tasks in the background
-using FastAPI's background tasks feature.
+Jobs are queued on Redis streams (one stream per priority) and executed by
+queue workers with a bounded concurrency, so long PDF or AI jobs do not take
+capacity away from request handling. Job state is stored in Redis with a TTL,
+so any worker process can answer a status query, and unacknowledged jobs of
+a crashed worker are reclaimed by the others. Without Redis the same API runs
+on an in-process queue.
+
+Delivery is at-least-once. A running job renews its stream entry every
+third of ``JOB_VISIBILITY_TIMEOUT_SECONDS``, so long jobs are not reclaimed
+while their worker is alive; only the jobs of a dead or stalled worker are
+run again, so job functions must tolerate being re-run.
+
+Job functions are referenced by import path (``module:qualname``) so that a
+different worker process can run them: they must be module-level functions
+and their arguments must be JSON-serializable.
 """
-import uuid
-from typing import Dict, Any, Optional, Callable
 import asyncio
+import heapq
+import importlib
+import itertools
+import json
+import os
+import random
+import socket
 import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from fastapi import BackgroundTasks
 
+from utils.config import settings
 from utils.logging import get_logger
 
+# Conditional Redis import - graceful degradation to the in-process queue
+try:
+    import redis.asyncio as aioredis
+    _has_redis = True
+except ImportError:
+    aioredis = None
+    _has_redis = False
+
 logger = get_logger(__name__)
 
-# In-memory store for task results
-# For production, use a persistent store like Redis
-_task_results: Dict[str, Dict[str, Any]] = {}
-_task_callbacks: Dict[str, Callable] = {}
+# Highest priority first; workers always drain higher priorities first
+PRIORITIES = ("high", "normal", "low")
+KEY_PREFIX = "jobs"
+CONSUMER_GROUP = "workers"
+
+# How long queued/running job records are kept before a result TTL applies
+PENDING_TTL_SECONDS = 24 * 3600
+
+# Move due retries from the delayed ZSET back onto their priority stream
+_PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, member in ipairs(due) do
+  redis.call('ZREM', KEYS[1], member)
+  local sep = string.find(member, '|', 1, true)
+  local priority = string.sub(member, 1, sep - 1)
+  local job_id = string.sub(member, sep + 1)
+  redis.call('XADD', ARGV[2] .. priority, '*', 'job_id', job_id)
+end
+return #due
+"""
+
+# Reset a pending entry's idle time, but only while ``consumer`` still owns it
+# (a worker whose job was already reclaimed must not take it back)
+_RENEW_SCRIPT = """
+local pending = redis.call('XPENDING', KEYS[1], ARGV[1], ARGV[2], ARGV[2], 1)
+if #pending == 0 or pending[1][2] ~= ARGV[3] then
+  return 0
+end
+redis.call('XCLAIM', KEYS[1], ARGV[1], ARGV[3], 0, ARGV[2], 'JUSTID')
+return 1
+"""
+
+_job_registry: Dict[str, Callable] = {}
+
+
+def register_job(name: Optional[str] = None) -> Callable:
+    """
+    Register a function as a queue job under an explicit name.
+
+    Registration is optional - any module-level function can be queued by
+    import path - but a stable name survives refactors that move the function.
+
+    Args:
+        name: Job name (default: ``module:qualname`` of the function)
+    """
+    def decorator(func: Callable) -> Callable:
+        job_name = name or _job_name(func)
+        _job_registry[job_name] = func
+        func.__job_name__ = job_name
+        return func
+    return decorator
+
+
+def _job_name(func: Callable) -> str:
+    explicit = getattr(func, "__job_name__", None)
+    if explicit:
+        return explicit
+    return f"{func.__module__}:{func.__qualname__}"
+
+
+def _resolve_job(name: str) -> Callable:
+    if name in _job_registry:
+        return _job_registry[name]
+
+    module_name, _, qualname = name.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        target = getattr(target, attr)
+    if not callable(target):
+        raise TypeError(f"Job {name} is not callable")
+    return target
+
+
+class _RedisJobBackend:
+    """Job records as JSON strings, one stream per priority, a ZSET of delayed retries."""
+
+    def __init__(self, client: Any):
+        self._redis = client
+
+    @staticmethod
+    def _stream(priority: str) -> str:
+        return f"{KEY_PREFIX}:stream:{priority}"
+
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return f"{KEY_PREFIX}:job:{job_id}"
+
+    async def setup(self) -> None:
+        for priority in PRIORITIES:
+            try:
+                await self._redis.xgroup_create(
+                    self._stream(priority), CONSUMER_GROUP, id="0", mkstream=True
+                )
+            except Exception as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    async def save(self, job: Dict[str, Any], ttl_seconds: int) -> None:
+        await self._redis.set(
+            self._job_key(job["task_id"]), json.dumps(job, default=str), ex=ttl_seconds
+        )
+
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(self._job_key(job_id))
+        return json.loads(raw) if raw else None
+
+    async def push(self, job_id: str, priority: str) -> None:
+        await self._redis.xadd(self._stream(priority), {"job_id": job_id})
+
+    async def fetch(self, consumer: str, count: int, block_ms: int) -> List[Tuple[Any, str]]:
+        # Non-blocking pass in priority order so "high" is always drained first
+        for priority in PRIORITIES:
+            response = await self._redis.xreadgroup(
+                CONSUMER_GROUP, consumer, {self._stream(priority): ">"}, count=count
+            )
+            if response:
+                return self._entries(response)
+
+        response = await self._redis.xreadgroup(
+            CONSUMER_GROUP,
+            consumer,
+            {self._stream(priority): ">" for priority in PRIORITIES},
+            count=count,
+            block=block_ms,
+        )
+        return self._entries(response or [])
+
+    @staticmethod
+    def _entries(response: List[Any]) -> List[Tuple[Any, str]]:
+        entries = []
+        for stream, messages in response:
+            for entry_id, fields in messages:
+                entries.append(((stream, entry_id), fields["job_id"]))
+        return entries
+
+    async def ack(self, token: Any) -> None:
+        stream, entry_id = token
+        await self._redis.xack(stream, CONSUMER_GROUP, entry_id)
+        await self._redis.xdel(stream, entry_id)
+
+    async def renew(self, token: Any, consumer: str) -> bool:
+        """Reset the entry's idle time; ``False`` if another consumer has claimed it."""
+        stream, entry_id = token
+        renewed = await self._redis.eval(
+            _RENEW_SCRIPT, 1, stream, CONSUMER_GROUP, entry_id, consumer
+        )
+        return bool(renewed)
+
+    async def schedule_retry(self, job_id: str, priority: str, delay_seconds: float) -> None:
+        await self._redis.zadd(
+            f"{KEY_PREFIX}:delayed", {f"{priority}|{job_id}": time.time() + delay_seconds}
+        )
+
+    async def promote_due(self) -> None:
+        await self._redis.eval(
+            _PROMOTE_SCRIPT, 1, f"{KEY_PREFIX}:delayed", time.time(), f"{KEY_PREFIX}:stream:"
+        )
+
+    async def reclaim(self, consumer: str, idle_ms: int, count: int) -> List[Tuple[Any, str]]:
+        """Take over entries another (likely dead) consumer has held for too long."""
+        entries = []
+        for priority in PRIORITIES:
+            stream = self._stream(priority)
+            response = await self._redis.xautoclaim(
+                stream, CONSUMER_GROUP, consumer, min_idle_time=idle_ms, count=count
+            )
+            for entry_id, fields in response[1]:
+                if fields:
+                    entries.append(((stream, entry_id), fields["job_id"]))
+        return entries
+
+
+class _MemoryJobBackend:
+    """Single-process stand-in for the Redis backend with the same semantics."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._ready: List[Tuple[int, int, str]] = []
+        self._delayed: List[Tuple[float, str, str]] = []
+        self._seq = itertools.count()
+
+    async def setup(self) -> None:
+        return None
+
+    async def save(self, job: Dict[str, Any], ttl_seconds: int) -> None:
+        self._prune()
+        self._jobs[job["task_id"]] = (dict(job), time.monotonic() + ttl_seconds)
+
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._jobs.get(job_id)
+        if entry is None or entry[1] <= time.monotonic():
+            self._jobs.pop(job_id, None)
+            return None
+        return dict(entry[0])
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for job_id in [k for k, (_, expires) in self._jobs.items() if expires <= now]:
+            del self._jobs[job_id]
+
+    async def push(self, job_id: str, priority: str) -> None:
+        heapq.heappush(self._ready, (PRIORITIES.index(priority), next(self._seq), job_id))
+
+    async def fetch(self, consumer: str, count: int, block_ms: int) -> List[Tuple[Any, str]]:
+        deadline = time.monotonic() + block_ms / 1000
+        while not self._ready and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+            await self.promote_due()
+        entries = []
+        while self._ready and len(entries) < count:
+            _, _, job_id = heapq.heappop(self._ready)
+            entries.append((None, job_id))
+        return entries
+
+    async def ack(self, token: Any) -> None:
+        return None
+
+    async def renew(self, token: Any, consumer: str) -> bool:
+        return True
+
+    async def schedule_retry(self, job_id: str, priority: str, delay_seconds: float) -> None:
+        heapq.heappush(self._delayed, (time.monotonic() + delay_seconds, priority, job_id))
+
+    async def promote_due(self) -> None:
+        now = time.monotonic()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, priority, job_id = heapq.heappop(self._delayed)
+            await self.push(job_id, priority)
+
+    async def reclaim(self, consumer: str, idle_ms: int, count: int) -> List[Tuple[Any, str]]:
+        return []
+
+
+class JobWorker:
+    """
+    Pulls jobs from the queue and runs at most ``concurrency`` at a time.
+
+    Jobs are acknowledged only after their new state has been saved, so a
+    worker that dies mid-job leaves the entry pending; another worker
+    reclaims it after ``visibility_timeout`` seconds (at-least-once delivery).
+    While a job runs, its entry is renewed every ``visibility_timeout / 3``
+    seconds so a long job is not reclaimed from a live worker.
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        concurrency: Optional[int] = None,
+        visibility_timeout: Optional[int] = None,
+    ):
+        self.backend = backend
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.visibility_timeout = visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._active: set = set()
+        self._stopping = False
+
+    @property
+    def active_jobs(self) -> int:
+        return len(self._active)
+
+    async def run(self) -> None:
+        """Run the fetch loop until ``stop()`` is called."""
+        await self.backend.setup()
+        logger.info(f"Job worker {self.consumer} started (concurrency={self.concurrency})")
+
+        last_reclaim = 0.0
+        while not self._stopping:
+            try:
+                await self.backend.promote_due()
+
+                free = self.concurrency - len(self._active)
+                if free <= 0:
+                    await asyncio.wait(self._active, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                entries: List[Tuple[Any, str]] = []
+                if time.monotonic() - last_reclaim > self.visibility_timeout / 2:
+                    last_reclaim = time.monotonic()
+                    entries = await self.backend.reclaim(
+                        self.consumer, self.visibility_timeout * 1000, free
+                    )
+                if not entries:
+                    entries = await self.backend.fetch(self.consumer, free, block_ms=1000)
+
+                for token, job_id in entries:
+                    task = asyncio.create_task(self._process(token, job_id))
+                    self._active.add(task)
+                    task.add_done_callback(self._active.discard)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker loop error: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop fetching and wait for running jobs to finish."""
+        self._stopping = True
+        if self._active:
+            await asyncio.wait(self._active, timeout=timeout)
+
+    async def _process(self, token: Any, job_id: str) -> None:
+        job = await self.backend.load(job_id)
+        if job is None:
+            await self.backend.ack(token)
+            return
+
+        job["status"] = "running"
+        job["attempts"] = job.get("attempts", 0) + 1
+        job["started_at"] = time.time()
+        await self.backend.save(job, PENDING_TTL_SECONDS)
+
+        lease = asyncio.create_task(self._renew_lease(token, job_id))
+        try:
+            func = _resolve_job(job["name"])
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*job["args"], **job["kwargs"])
+            else:
+                result = await asyncio.to_thread(func, *job["args"], **job["kwargs"])
+        except Exception as e:
+            await self._handle_failure(token, job, e)
+            return
+        finally:
+            lease.cancel()
 
+        job["status"] = "completed"
+        job["completed_at"] = time.time()
+        job["result"] = result
+        job.pop("error", None)
+        await self.backend.save(job, job["result_ttl"])
+        await self.backend.ack(token)
+        logger.info(f"Task completed: {job_id}")
 
-def get_task_status(task_id: str) -> Dict[str, Any]:
+        if job.get("callback_url"):
+            await _call_callback(job_id, job["callback_url"], result)
+
+    async def _renew_lease(self, token: Any, job_id: str) -> None:
+        """Keep a running job's entry from looking abandoned to other workers."""
+        interval = self.visibility_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.backend.renew(token, self.consumer):
+                    logger.warning(f"Task {job_id} was reclaimed by another worker while running")
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to renew lease for task {job_id}: {e}")
+
+    async def _handle_failure(self, token: Any, job: Dict[str, Any], error: Exception) -> None:
+        job_id = job["task_id"]
+        job["error"] = str(error)
+
+        if job["attempts"] <= job["max_retries"]:
+            # Exponential backoff with a little jitter so retries do not align
+            delay = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (job["attempts"] - 1))
+            delay *= 1 + random.random() * 0.1
+            job["status"] = "retrying"
+            job["next_attempt_at"] = time.time() + delay
+            await self.backend.save(job, PENDING_TTL_SECONDS)
+            await self.backend.schedule_retry(job_id, job["priority"], delay)
+            await self.backend.ack(token)
+            logger.warning(
+                f"Task {job_id} failed (attempt {job['attempts']}), retrying in {delay:.1f}s",
+                extra={"task_id": job_id, "error": str(error)},
+            )
+            return
+
+        job["status"] = "failed"
+        job["completed_at"] = time.time()
+        await self.backend.save(job, job["result_ttl"])
+        await self.backend.ack(token)
+        logger.error(
+            f"Task failed: {job_id}",
+            extra={"task_id": job_id, "error": str(error)},
+            exc_info=error,
+        )
+
+        if job.get("callback_url"):
+            await _call_callback(job_id, job["callback_url"], {"error": str(error)})
+
+
+_backend: Optional[Any] = None
+_worker: Optional[JobWorker] = None
+_worker_task: Optional[asyncio.Task] = None
+
+
+async def _get_backend() -> Any:
+    """Use Redis when configured and reachable, otherwise the in-process queue."""
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    redis_disabled = os.environ.get("AI_NURSE_DISABLE_REDIS", "0") in ("1", "true", "True")
+    if _has_redis and settings.REDIS_URL and not redis_disabled:
+        try:
+            client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+            await client.ping()
+            _backend = _RedisJobBackend(client)
+            logger.info("Background job queue using Redis streams")
+            return _backend
+        except Exception as e:
+            logger.warning(f"Redis unavailable for job queue ({e}), using in-process queue")
+
+    _backend = _MemoryJobBackend()
+    return _backend
+
+
+async def enqueue_job(
+    task_func: Callable,
+    *args: Any,
+    priority: str = "normal",
+    max_retries: Optional[int] = None,
+    result_ttl: Optional[int] = None,
+    callback_url: Optional[str] = None,
+    job_id: Optional[str] = None,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """
+    Queue a job for a worker to run.
+
+    Args:
+        task_func: Module-level function (sync or async) to run
+        *args: JSON-serializable positional arguments for the function
+        priority: One of "high", "normal" or "low"
+        max_retries: Retries after the first failure (default: JOB_MAX_RETRIES)
+        result_ttl: Seconds to keep the result after completion (default: JOB_RESULT_TTL_SECONDS)
+        callback_url: Optional URL to call when the task completes
+        job_id: Optional pre-allocated task ID
+        **kwargs: JSON-serializable keyword arguments for the function
+
+    Returns:
+        A dictionary with task_id and status
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}; expected one of {PRIORITIES}")
+
+    task_id = job_id or str(uuid.uuid4())
+    job = {
+        "task_id": task_id,
+        "name": _job_name(task_func),
+        "args": list(args),
+        "kwargs": kwargs,
+        "priority": priority,
+        "status": "queued",
+        "attempts": 0,
+        "max_retries": settings.JOB_MAX_RETRIES if max_retries is None else max_retries,
+        "result_ttl": result_ttl or settings.JOB_RESULT_TTL_SECONDS,
+        "callback_url": callback_url,
+        "created_at": time.time(),
+    }
+
+    backend = await _get_backend()
+    await backend.save(job, PENDING_TTL_SECONDS)
+    await backend.push(task_id, priority)
+
+    # The in-process queue is only drained by this process
+    if isinstance(backend, _MemoryJobBackend):
+        await start_worker()
+
+    return {"task_id": task_id, "status": "queued"}
+
+
+async def get_task_status(task_id: str) -> Dict[str, Any]:
     """
     Get the status of a background task.
-    
+
+    Works from any worker process when the queue is backed by Redis.
+
     Args:
         task_id: The ID of the task
-        
+
     Returns:
         A dictionary with task status information
     """
-    if task_id not in _task_results:
+    backend = await _get_backend()
+    job = await backend.load(task_id)
+    if job is None:
         return {"task_id": task_id, "status": "not_found"}
-    
-    return _task_results[task_id]
+
+    for internal in ("name", "args", "kwargs", "callback_url", "result_ttl"):
+        job.pop(internal, None)
+    return job
 
 
 def schedule_task(
@@ -45,101 +537,68 @@ def schedule_task(
 ) -> Dict[str, Any]:
     """
     Schedule a task to run in the background.
-    
+
+    The task is put on the job queue once the response has been sent and is
+    run by a queue worker, not by the request worker. Async handlers can
+    call ``enqueue_job`` directly to choose a priority or retry policy.
+
     Args:
         background_tasks: FastAPI BackgroundTasks instance
         task_func: The function to run in the background
         *args: Positional arguments to pass to the task function
         callback_url: Optional URL to call when the task completes
         **kwargs: Keyword arguments to pass to the task function
-        
+
     Returns:
         A dictionary with task_id and status
     """
     task_id = str(uuid.uuid4())
-    
-    # Create initial task status
-    _task_results[task_id] = {
-        "task_id": task_id,
-        "status": "scheduled",
-        "created_at": time.time(),
-    }
-    
-    # Store callback if provided
-    if callback_url:
-        _task_callbacks[task_id] = callback_url
-    
-    # Add the task to the background tasks
+
     background_tasks.add_task(
-        _run_task_with_status_tracking,
-        task_id,
+        enqueue_job,
         task_func,
         *args,
+        callback_url=callback_url,
+        job_id=task_id,
         **kwargs
     )
-    
+
     return {"task_id": task_id, "status": "scheduled"}
 
 
-async def _run_task_with_status_tracking(
-    task_id: str,
-    task_func: Callable,
-    *args: Any,
-    **kwargs: Any
-) -> None:
-    """
-    Run a task and track its status.
-    
-    Args:
-        task_id: The ID of the task
-        task_func: The function to run
-        *args: Positional arguments to pass to the task function
-        **kwargs: Keyword arguments to pass to the task function
-    """
-    try:
-        # Update status to running
-        _task_results[task_id]["status"] = "running"
-        _task_results[task_id]["started_at"] = time.time()
-        
-        # Run the task
-        if asyncio.iscoroutinefunction(task_func):
-            result = await task_func(*args, **kwargs)
-        else:
-            result = task_func(*args, **kwargs)
-        
-        # Update status to completed
-        _task_results[task_id]["status"] = "completed"
-        _task_results[task_id]["completed_at"] = time.time()
-        _task_results[task_id]["result"] = result
-        
-        logger.info(f"Task completed: {task_id}")
-        
-        # Call callback if registered
-        if task_id in _task_callbacks:
-            await _call_callback(task_id, _task_callbacks[task_id], result)
-            
-    except Exception as e:
-        # Update status to failed
-        _task_results[task_id]["status"] = "failed"
-        _task_results[task_id]["completed_at"] = time.time()
-        _task_results[task_id]["error"] = str(e)
-        
-        logger.error(
-            f"Task failed: {task_id}", 
-            extra={"task_id": task_id, "error": str(e)},
-            exc_info=True
-        )
-        
-        # Call callback with error if registered
-        if task_id in _task_callbacks:
-            error_result = {"error": str(e)}
-            await _call_callback(task_id, _task_callbacks[task_id], error_result)
+async def start_worker(concurrency: Optional[int] = None) -> JobWorker:
+    """Start the queue worker for this process if it is not already running."""
+    global _worker, _worker_task
+
+    loop = asyncio.get_running_loop()
+    if _worker_task is not None and not _worker_task.done() and _worker_task.get_loop() is loop:
+        return _worker
+
+    _worker = JobWorker(await _get_backend(), concurrency=concurrency)
+    _worker_task = loop.create_task(_worker.run())
+    return _worker
+
+
+async def stop_worker(timeout: float = 30.0) -> None:
+    """Stop this process's queue worker, letting running jobs finish."""
+    global _worker, _worker_task
+
+    if _worker is not None:
+        await _worker.stop(timeout=timeout)
+    if _worker_task is not None and not _worker_task.done():
+        _worker_task.cancel()
+        try:
+            await _worker_task
+        except (asyncio.CancelledError, Exception):
+            pass
+    _worker = None
+    _worker_task = None
 
 
 async def _call_callback(task_id: str, callback_url: str, result: Any) -> None:
     """
     Call a callback URL with the task result.
-    
+
     Args:
         task_id: The ID of the task
         callback_url: The URL to call
@@ -147,13 +606,13 @@ async def _call_callback(task_id: str, callback_url: str, result: Any) -> None:
     """
     try:
         import aiohttp
-        
+
         async with aiohttp.ClientSession() as session:
             payload = {
                 "task_id": task_id,
                 "result": result
             }
-            
+
             async with session.post(callback_url, json=payload) as response:
                 if response.status >= 400:
                     logger.error(
@@ -173,4 +632,17 @@ async def _call_callback(task_id: str, callback_url: str, result: Any) -> None:
             f"Error calling callback: {str(e)}",
             extra={"task_id": task_id, "callback_url": callback_url, "error": str(e)},
             exc_info=True
-        )
\ No newline at end of file
+        )
+
+
+async def _run_standalone_worker() -> None:
+    worker = await start_worker()
+    try:
+        await _worker_task
+    finally:
+        await worker.stop()
+
+
+if __name__ == "__main__":
+    # Dedicated worker process: python -m utils.background_tasks
+    asyncio.run(_run_standalone_worker())
@@ -55,6 +55,14 @@ class Settings(BaseSettings):
     
     # Cache Configuration (Redis)
     REDIS_URL: Optional[str] = None
+
+    # Background job queue (Redis streams, in-process fallback)
+    JOB_WORKER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 4
+    JOB_MAX_RETRIES: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: float = 2.0
+    JOB_RESULT_TTL_SECONDS: int = 3600
+    JOB_VISIBILITY_TIMEOUT_SECONDS: int = 300
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60